@@ -15,7 +15,21 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from backend.ollama_backend import OllamaBackend
-from backend.routes import generate, parameters, reference
+from backend.routes import (
+    bom,
+    clearance,
+    equations,
+    fasteners,
+    fits,
+    gears,
+    generate,
+    mates,
+    normalize,
+    parameters,
+    reference,
+    tolerance,
+)
+from backend.template_router import TemplateRouter
 
 logger = logging.getLogger("sw_semantic_engine")
 logging.basicConfig(
@@ -37,6 +51,7 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     ollama_url = os.environ.get("SWSE_OLLAMA_URL", "http://localhost:11434")
     backend = OllamaBackend(model_name=model, base_url=ollama_url)
     app.state.ollama = backend
+    app.state.templates = TemplateRouter()
 
     available = await backend.check_availability()
     if available:
@@ -92,6 +107,15 @@ app.add_middleware(
 app.include_router(generate.router)
 app.include_router(reference.router)
 app.include_router(parameters.router)
+app.include_router(normalize.router)
+app.include_router(tolerance.router)
+app.include_router(fits.router)
+app.include_router(fasteners.router)
+app.include_router(gears.router)
+app.include_router(clearance.router)
+app.include_router(bom.router)
+app.include_router(mates.router)
+app.include_router(equations.router)
 
 
 # ---------------------------------------------------------------------------
@@ -65,6 +65,14 @@ class CodeGenerationResponse(BaseModel):
         default_factory=list,
         description="Non-fatal warnings about the generated code.",
     )
+    source: Literal["llm", "template", "hybrid"] = Field(
+        default="llm",
+        description=(
+            "How the code was produced: 'llm' (Ollama), 'template' "
+            "(deterministic fast path for structured prompts) or 'hybrid' "
+            "(templates plus the model for clauses they could not parse)."
+        ),
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -122,3 +130,508 @@ class ParameterResolveResponse(BaseModel):
         default_factory=list,
         description="Validation issues encountered during resolution.",
     )
+
+
+# ---------------------------------------------------------------------------
+# Batch Normalization
+# ---------------------------------------------------------------------------
+
+class NormalizeBatchRequest(BaseModel):
+    """Request payload for the /api/normalize/* batch endpoints."""
+
+    items: list[str] = Field(
+        ...,
+        max_length=200_000,
+        description="Raw strings to normalise (GD&T frames or sketch constraint phrases).",
+    )
+    validate_results: bool = Field(
+        default=True,
+        description="Also run rule validation on every parsed item.",
+    )
+
+
+class NormalizedItem(BaseModel):
+    """Normalisation result for one input string."""
+
+    input: str = Field(..., description="The raw input string.")
+    normalized: dict[str, Any] | None = Field(
+        default=None,
+        description="Structured specification / constraint, or null if unparseable.",
+    )
+    errors: list[str] = Field(
+        default_factory=list,
+        description="Parse or validation errors (empty when valid).",
+    )
+
+
+class NormalizeBatchResponse(BaseModel):
+    """Result of a batch normalisation request."""
+
+    results: list[NormalizedItem] = Field(
+        default_factory=list,
+        description="One result per input item, in request order.",
+    )
+    parsed_count: int = Field(..., description="Number of items that parsed.")
+    valid_count: int = Field(
+        ...,
+        description="Number of items that parsed with no validation errors.",
+    )
+
+
+# ---------------------------------------------------------------------------
+# Tolerance Stack-up
+# ---------------------------------------------------------------------------
+
+class FeatureOfSizeModel(BaseModel):
+    """Size tolerance of the feature a geometric tolerance applies to."""
+
+    nominal: float = Field(..., description="Nominal size of the feature.")
+    tol_plus: float = Field(..., ge=0, description="Upper deviation.")
+    tol_minus: float = Field(..., ge=0, description="Lower deviation magnitude.")
+    is_external: bool = Field(
+        default=True,
+        description="True for pins/shafts, false for holes/slots.",
+    )
+
+
+class StackContributorModel(BaseModel):
+    """One dimension or geometric tolerance in a stack."""
+
+    name: str = Field(..., description="Contributor label.")
+    nominal: float = Field(default=0.0, description="Nominal value.")
+    tol_plus: float = Field(default=0.0, ge=0, description="Upper deviation.")
+    tol_minus: float = Field(default=0.0, ge=0, description="Lower deviation magnitude.")
+    direction: Literal[1, -1] = Field(
+        default=1,
+        description="+1 if the dimension adds to the result, -1 if it subtracts.",
+    )
+    distribution: Literal["normal", "uniform"] = Field(
+        default="normal",
+        description="Sampling distribution for Monte Carlo.",
+    )
+    sigma: float = Field(
+        default=3.0,
+        gt=0,
+        description="Standard deviations per half-band (normal distribution).",
+    )
+    gdt: str | None = Field(
+        default=None,
+        description="Optional GD&T frame, e.g. 'position DIA 0.1 MMC A B'.",
+    )
+    feature_size: FeatureOfSizeModel | None = Field(
+        default=None,
+        description="Feature of size for MMC/LMC bonus tolerance.",
+    )
+
+
+class StackupRequest(BaseModel):
+    """Request payload for POST /api/tolerance/stackup."""
+
+    contributors: list[StackContributorModel] = Field(
+        ...,
+        min_length=1,
+        max_length=1000,
+        description="Dimensions in the loop.",
+    )
+    lower_limit: float | None = Field(default=None, description="Minimum acceptable result.")
+    upper_limit: float | None = Field(default=None, description="Maximum acceptable result.")
+    samples: int = Field(
+        default=1_000_000,
+        ge=0,
+        le=10_000_000,
+        description="Monte Carlo samples (0 to skip the simulation).",
+    )
+    seed: int | None = Field(default=0, description="Random seed (null for a fresh one).")
+
+
+class MonteCarloSummary(BaseModel):
+    """Monte Carlo statistics of a stack result."""
+
+    samples: int
+    mean: float
+    std: float
+    min: float
+    max: float
+    percentiles: dict[str, float] = Field(default_factory=dict)
+    in_spec_fraction: float | None = None
+    ppm_out_of_spec: float | None = None
+
+
+class StackupResponse(BaseModel):
+    """Result of a tolerance stack-up analysis."""
+
+    nominal: float
+    mean: float
+    worst_case_min: float
+    worst_case_max: float
+    worst_case_ok: bool | None = Field(
+        default=None,
+        description="Worst-case range within limits (null without limits).",
+    )
+    rss_min: float
+    rss_max: float
+    contributions: list[dict[str, Any]] = Field(default_factory=list)
+    monte_carlo: MonteCarloSummary | None = None
+
+
+# ---------------------------------------------------------------------------
+# ISO Fits
+# ---------------------------------------------------------------------------
+
+class ToleranceZoneModel(BaseModel):
+    """Limit deviations of one hole or shaft tolerance class (mm)."""
+
+    designation: str = Field(..., description="Tolerance class, e.g. 'H7' or 'g6'.")
+    upper_deviation: float
+    lower_deviation: float
+    max_size: float
+    min_size: float
+
+
+class FitResponse(BaseModel):
+    """Limits and clearance of one fit at one nominal size (mm)."""
+
+    fit: str = Field(..., description="Fit designation, e.g. 'H7/g6'.")
+    nominal: float
+    hole: ToleranceZoneModel
+    shaft: ToleranceZoneModel
+    min_clearance: float = Field(..., description="Negative values are interference.")
+    max_clearance: float = Field(..., description="Negative values are interference.")
+    fit_type: Literal["clearance", "transition", "interference"]
+
+
+class FitBatchRequest(BaseModel):
+    """Request payload for POST /api/fits/batch."""
+
+    nominals: list[float] = Field(
+        ...,
+        min_length=1,
+        max_length=100_000,
+        description="Nominal sizes in mm (0 < size <= 500).",
+    )
+    fits: list[str] = Field(
+        ...,
+        min_length=1,
+        max_length=200,
+        description="Fit designations, e.g. ['H7/g6', 'H7/k6'].",
+    )
+
+
+class FitBatchResponse(BaseModel):
+    """Every fit evaluated at every nominal size, row-major."""
+
+    results: list[dict[str, Any]] = Field(
+        default_factory=list,
+        description="One record per (nominal, fit) with deviations, clearances and fit type.",
+    )
+
+
+# ---------------------------------------------------------------------------
+# Fastener Data
+# ---------------------------------------------------------------------------
+
+class FastenerSizeModel(BaseModel):
+    """One fastener size from the Hole Wizard tables."""
+
+    designation: str = Field(..., description="Size designation, e.g. 'M8' or '1/4-20'.")
+    system: Literal["metric", "inch"]
+    nominal_mm: float = Field(..., description="Nominal (major) diameter in mm.")
+    cbore_dia_mm: float | None = Field(default=None, description="Counterbore diameter in mm.")
+    cbore_depth_mm: float | None = Field(default=None, description="Counterbore depth in mm.")
+    threads_per_inch: float | None = Field(default=None, description="UNC threads per inch.")
+
+
+class TorqueSpecModel(BaseModel):
+    """Recommended tightening torque for a size and property class."""
+
+    size: str
+    grade: str = Field(..., description="Property class, e.g. '8.8'.")
+    torque_dry_nm: float = Field(..., description="Dry torque (K=0.2) in Nm.")
+    torque_lubricated_nm: float = Field(..., description="Lubricated torque (K=0.15) in Nm.")
+    nominal_mm: float
+
+
+# ---------------------------------------------------------------------------
+# Gear Geometry
+# ---------------------------------------------------------------------------
+
+class GearGeometryResponse(BaseModel):
+    """Standard spur gear geometry (mm)."""
+
+    module: float
+    teeth: int
+    pressure_angle: float = Field(..., description="Pressure angle in degrees.")
+    pitch_dia: float
+    base_dia: float
+    outside_dia: float
+    root_dia: float
+
+
+class GearPairCandidate(BaseModel):
+    """A gear pair near the requested ratio and center distance."""
+
+    module: float
+    pinion_teeth: int
+    gear_teeth: int
+    pressure_angle: float
+    ratio: float = Field(..., description="gear_teeth / pinion_teeth.")
+    center_distance: float = Field(..., description="Standard center distance in mm.")
+    contact_ratio: float
+    ratio_error: float = Field(..., description="Relative ratio error (ratio / target - 1).")
+    center_distance_error: float = Field(..., description="Center distance minus target, mm.")
+
+
+class GearPairResponse(BaseModel):
+    """Gear-pair search result, best candidate first."""
+
+    candidates: list[GearPairCandidate] = Field(default_factory=list)
+    searched_pairs: int = Field(..., description="Size of the precomputed pair grid.")
+
+
+# ---------------------------------------------------------------------------
+# Clearance Broad Phase
+# ---------------------------------------------------------------------------
+
+class ComponentBox(BaseModel):
+    """A component's bounding box and placement exported by the add-in."""
+
+    name: str = Field(..., description="Component name (e.g. 'Bracket-1').")
+    box_min: list[float] = Field(..., min_length=3, max_length=3, description="Box min corner.")
+    box_max: list[float] = Field(..., min_length=3, max_length=3, description="Box max corner.")
+    transform: list[float] | None = Field(
+        default=None,
+        description=(
+            "Component2.Transform2.ArrayData (12 or 16 values). Omit when the "
+            "box is already in assembly space."
+        ),
+    )
+
+
+class BroadPhaseRequest(BaseModel):
+    """Request payload for POST /api/clearance/broadphase."""
+
+    components: list[ComponentBox] = Field(..., max_length=200_000)
+    clearance: float = Field(
+        default=0.0,
+        ge=0,
+        description="Clearance threshold in model units (0 = interference only).",
+    )
+    refine_obb: bool = Field(
+        default=True,
+        description="Run the oriented-box separating-axis test on AABB candidates.",
+    )
+
+
+class CandidatePair(BaseModel):
+    """A component pair that needs an exact interference/clearance check."""
+
+    a: str
+    b: str
+    distance_lower_bound: float = Field(
+        ...,
+        description="Lower bound of the body distance (0 when the boxes overlap).",
+    )
+
+
+class BroadPhaseResponse(BaseModel):
+    """Candidate pairs for the exact SolidWorks check."""
+
+    pairs: list[CandidatePair] = Field(default_factory=list)
+    component_count: int
+    aabb_candidate_count: int = Field(..., description="Pairs surviving sweep and prune.")
+    candidate_count: int
+
+
+# ---------------------------------------------------------------------------
+# BOM Roll-up
+# ---------------------------------------------------------------------------
+
+class BomNodeModel(BaseModel):
+    """One exported component instance of an assembly tree."""
+
+    id: str = Field(..., description="Unique instance id, e.g. 'Bracket-1'.")
+    parent: str | None = Field(default=None, description="Parent id; null for the root.")
+    part_number: str = Field(default="", description="BOM part number.")
+    quantity: float = Field(default=1.0, ge=0)
+    mass: float = Field(default=0.0, ge=0, description="Own mass (0 for assemblies).")
+    center_of_mass: list[float] = Field(
+        default_factory=lambda: [0.0, 0.0, 0.0], min_length=3, max_length=3,
+    )
+    inertia: list[float] | None = Field(
+        default=None,
+        min_length=9,
+        max_length=9,
+        description="Row-major 3x3 inertia about the own center of mass.",
+    )
+    transform: list[float] | None = Field(
+        default=None,
+        description="Placement in the parent (Transform2.ArrayData, 12 or 16 values).",
+    )
+    properties: dict[str, str] = Field(default_factory=dict)
+
+
+class BomRollupRequest(BaseModel):
+    """Request payload for POST /api/bom/rollup."""
+
+    nodes: list[BomNodeModel] = Field(..., min_length=1, max_length=500_000)
+    parts_only: bool = Field(default=True, description="Flatten to leaf parts only.")
+
+
+class MassPropertiesModel(BaseModel):
+    """Rolled-up mass properties in root assembly axes."""
+
+    mass: float
+    center_of_mass: list[float]
+    inertia: list[list[float]] = Field(..., description="3x3 inertia about the center of mass.")
+
+
+class BomLine(BaseModel):
+    """One flattened BOM line."""
+
+    part_number: str
+    quantity: float
+    unit_mass: float
+    total_mass: float
+    properties: dict[str, str] = Field(default_factory=dict)
+
+
+class BomRollupResponse(BaseModel):
+    """Result of a BOM roll-up."""
+
+    tree_id: str = Field(..., description="Handle for incremental updates.")
+    node_count: int
+    mass_properties: MassPropertiesModel
+    bom: list[BomLine] = Field(default_factory=list)
+
+
+class BomNodeUpdate(BaseModel):
+    """Changed own mass properties of one node."""
+
+    mass: float | None = Field(default=None, ge=0)
+    center_of_mass: list[float] | None = Field(default=None, min_length=3, max_length=3)
+    inertia: list[float] | None = Field(default=None, min_length=9, max_length=9)
+
+
+# ---------------------------------------------------------------------------
+# Mate DOF Analysis
+# ---------------------------------------------------------------------------
+
+class MateEntityModel(BaseModel):
+    """One mate entity in assembly coordinates (IMateEntity2)."""
+
+    kind: str = Field(..., description="point, axis or plane (sphere, cylinder, ... accepted).")
+    point: list[float] = Field(
+        default_factory=lambda: [0.0, 0.0, 0.0], min_length=3, max_length=3,
+    )
+    direction: list[float] = Field(
+        default_factory=lambda: [0.0, 0.0, 1.0],
+        min_length=3,
+        max_length=3,
+        description="Plane normal or axis direction.",
+    )
+
+
+class MateModel(BaseModel):
+    """One exported mate."""
+
+    name: str
+    type: str = Field(..., description="swMateType_e name, e.g. 'swMateCONCENTRIC'.")
+    components: list[str | None] = Field(
+        ..., min_length=2, max_length=2, description="Mated components; null for the assembly.",
+    )
+    entities: list[MateEntityModel] = Field(default_factory=list)
+    ratio: float = Field(default=1.0, description="Gear ratio, pinion radius, screw lead, ...")
+
+
+class MateAssemblyModel(BaseModel):
+    """Mate list of one assembly."""
+
+    name: str = Field(default="", description="Assembly name echoed in the result.")
+    mates: list[MateModel] = Field(default_factory=list)
+    fixed: list[str] = Field(default_factory=list, description="Fixed component names.")
+    components: list[str] = Field(
+        default_factory=list, description="All component names (unmated parts are free).",
+    )
+
+
+class MateDofBatchRequest(BaseModel):
+    """Request payload for POST /api/mates/dof."""
+
+    assemblies: list[MateAssemblyModel] = Field(..., min_length=1, max_length=1000)
+    tolerance: float = Field(default=1e-6, gt=0, lt=1, description="Rank tolerance.")
+
+
+class MateReportModel(BaseModel):
+    """Analysis of one mate."""
+
+    name: str
+    type: str
+    group: int = Field(..., description="Mate group index; -1 for ground-only mates.")
+    rows: int
+    independent_rows: int
+    relative_dof: int = Field(..., description="DOF left between the two mated components.")
+    redundant: bool
+
+
+class MateGroupModel(BaseModel):
+    """One independent block of mated components."""
+
+    components: list[str]
+    grounded: bool
+    dof: int
+    rank: int
+    rows: int
+    status: str = Field(..., description="fully_defined, under_defined or over_defined.")
+    component_dof: dict[str, int]
+    rigid_clusters: list[list[str]]
+    redundant_mates: list[str]
+
+
+class MateDofResultModel(BaseModel):
+    """DOF analysis of one assembly."""
+
+    name: str
+    total_dof: int = 0
+    groups: list[MateGroupModel] = Field(default_factory=list)
+    mates: list[MateReportModel] = Field(default_factory=list)
+    redundant_mates: list[str] = Field(default_factory=list)
+    error: str | None = Field(default=None, description="Why the assembly could not be analysed.")
+
+
+class MateDofBatchResponse(BaseModel):
+    """Results in request order."""
+
+    results: list[MateDofResultModel]
+    analysed: int
+    failed: int
+
+
+# ---------------------------------------------------------------------------
+# Equations
+# ---------------------------------------------------------------------------
+
+class EquationEvaluateRequest(BaseModel):
+    """Request payload for POST /api/equations/evaluate."""
+
+    equations: list[str] = Field(
+        ...,
+        min_length=1,
+        max_length=5000,
+        description='SolidWorks equations, e.g. \'"D1@Sketch1" = "Width" / 2\'.',
+    )
+    inputs: dict[str, float | list[float]] = Field(
+        default_factory=dict,
+        description="Input values; lists of equal length form a design-table sweep.",
+    )
+    angle_unit: Literal["deg", "rad"] = Field(
+        default="deg", description="Angle unit of the trigonometric functions.",
+    )
+
+
+class EquationEvaluateResponse(BaseModel):
+    """Evaluated values, one list entry per configuration."""
+
+    values: dict[str, list[float]]
+    order: list[str] = Field(..., description="Equation targets in evaluation order.")
+    inputs: list[str] = Field(..., description="Names referenced but not assigned.")
+    configurations: int
@@ -0,0 +1,107 @@
+"""BOM roll-up and mass-property endpoints.
+
+POST  /api/bom/rollup                      -- ingest a tree, roll it up
+PATCH /api/bom/{tree_id}/nodes/{node_id}   -- change one part, update ancestors
+GET   /api/bom/{tree_id}                   -- current roll-up of a stored tree
+
+Trees are kept in memory (most recently used first) so edits only
+recompute the changed part's ancestor path.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import uuid
+from collections import OrderedDict
+
+from fastapi import APIRouter, HTTPException
+from fastapi.concurrency import run_in_threadpool
+
+from backend.models import (
+    BomLine,
+    BomNodeUpdate,
+    BomRollupRequest,
+    BomRollupResponse,
+    MassPropertiesModel,
+)
+from engineering.bom_rollup import AssemblyTree, BomNode
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/api/bom", tags=["bom"])
+
+_MAX_TREES = 32
+_TREES: OrderedDict[str, tuple[AssemblyTree, bool]] = OrderedDict()
+_LOCK = threading.Lock()
+
+
+def _response(tree_id: str, tree: AssemblyTree, parts_only: bool) -> BomRollupResponse:
+    mp = tree.mass_properties()
+    return BomRollupResponse(
+        tree_id=tree_id,
+        node_count=len(tree.nodes),
+        mass_properties=MassPropertiesModel(
+            mass=mp.mass, center_of_mass=mp.center_of_mass, inertia=mp.inertia,
+        ),
+        bom=[BomLine(**line) for line in tree.flattened_bom(parts_only)],
+    )
+
+
+def _get(tree_id: str) -> tuple[AssemblyTree, bool]:
+    with _LOCK:
+        if tree_id not in _TREES:
+            raise HTTPException(status_code=404, detail=f"Unknown BOM tree '{tree_id}'.")
+        _TREES.move_to_end(tree_id)
+        return _TREES[tree_id]
+
+
+def _ingest(body: BomRollupRequest) -> BomRollupResponse:
+    tree = AssemblyTree([BomNode(**node.model_dump()) for node in body.nodes])
+    tree_id = uuid.uuid4().hex
+    with _LOCK:
+        _TREES[tree_id] = (tree, body.parts_only)
+        while len(_TREES) > _MAX_TREES:
+            _TREES.popitem(last=False)
+    return _response(tree_id, tree, body.parts_only)
+
+
+@router.post("/rollup", response_model=BomRollupResponse, summary="Roll up an assembly tree")
+async def rollup(body: BomRollupRequest) -> BomRollupResponse:
+    """Flattened BOM quantities plus total mass, center of mass and inertia."""
+    try:
+        response = await run_in_threadpool(_ingest, body)
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc))
+
+    logger.info(
+        "[OK] BOM roll-up of %d node(s): %d line(s), mass %.6g",
+        response.node_count,
+        len(response.bom),
+        response.mass_properties.mass,
+    )
+    return response
+
+
+@router.get("/{tree_id}", response_model=BomRollupResponse, summary="Current roll-up")
+async def get_rollup(tree_id: str) -> BomRollupResponse:
+    """Roll-up of a previously ingested tree, including any edits."""
+    tree, parts_only = _get(tree_id)
+    return _response(tree_id, tree, parts_only)
+
+
+@router.patch(
+    "/{tree_id}/nodes/{node_id}",
+    response_model=BomRollupResponse,
+    summary="Change one node and update its ancestors",
+)
+async def update_node(tree_id: str, node_id: str, body: BomNodeUpdate) -> BomRollupResponse:
+    """Apply new own mass properties to *node_id*; only its ancestor path
+    is recomputed."""
+    tree, parts_only = _get(tree_id)
+    if node_id not in tree.index:
+        raise HTTPException(status_code=404, detail=f"Unknown node '{node_id}'.")
+    with _LOCK:
+        tree.update_node(node_id, body.mass, body.center_of_mass, body.inertia)
+    logger.info("[OK] BOM tree %s: updated node %s", tree_id, node_id)
+    return _response(tree_id, tree, parts_only)
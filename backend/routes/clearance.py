@@ -0,0 +1,93 @@
+"""Broad-phase clearance / interference precheck endpoints.
+
+POST /api/clearance/broadphase         -- JSON component boxes
+POST /api/clearance/broadphase/binary  -- packed float64 records
+
+The add-in runs ``ToolsCheckInterference`` / Measure only on the returned
+pairs instead of the whole assembly.
+"""
+
+from __future__ import annotations
+
+import logging
+
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
+
+from backend.models import BroadPhaseRequest, BroadPhaseResponse, CandidatePair
+from engineering.clearance import RECORD_FLOATS, BoxSet, broad_phase
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/api/clearance", tags=["clearance"])
+
+# 200k components x 22 float64
+_MAX_BINARY_BYTES = 200_000 * RECORD_FLOATS * 8
+
+
+def _run(boxes: BoxSet, clearance: float, refine_obb: bool) -> BroadPhaseResponse:
+    """Run the broad phase and build the response (CPU-bound)."""
+    result = broad_phase(boxes, clearance, refine_obb)
+    names = boxes.names
+    pairs = [
+        CandidatePair.model_construct(a=names[i], b=names[j], distance_lower_bound=d)
+        for (i, j), d in zip(result.pairs.tolist(), result.distance.tolist())
+    ]
+    return BroadPhaseResponse(
+        pairs=pairs,
+        component_count=len(boxes),
+        aabb_candidate_count=result.aabb_pairs,
+        candidate_count=len(pairs),
+    )
+
+
+@router.post(
+    "/broadphase",
+    response_model=BroadPhaseResponse,
+    summary="Candidate pairs within a clearance (JSON boxes)",
+)
+async def broadphase_json(body: BroadPhaseRequest) -> BroadPhaseResponse:
+    """Sweep and prune over component boxes, refined by an OBB test."""
+    try:
+        boxes = BoxSet.from_records([c.model_dump() for c in body.components])
+        response = await run_in_threadpool(_run, boxes, body.clearance, body.refine_obb)
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc))
+
+    logger.info(
+        "[OK] Broad phase: %d component(s) -> %d candidate pair(s)",
+        response.component_count,
+        response.candidate_count,
+    )
+    return response
+
+
+@router.post(
+    "/broadphase/binary",
+    response_model=BroadPhaseResponse,
+    summary="Candidate pairs within a clearance (binary boxes)",
+)
+async def broadphase_binary(
+    request: Request,
+    clearance: float = Query(0.0, ge=0),
+    refine_obb: bool = Query(True),
+) -> BroadPhaseResponse:
+    """Body: little-endian float64 records of 22 values per component --
+    the 16 ``Transform2.ArrayData`` values, then the box min and max
+    corners.  Pairs are reported by component index.
+    """
+    data = await request.body()
+    if len(data) > _MAX_BINARY_BYTES:
+        raise HTTPException(status_code=413, detail="Too many components in buffer.")
+    try:
+        boxes = BoxSet.from_buffer(data)
+        response = await run_in_threadpool(_run, boxes, clearance, refine_obb)
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc))
+
+    logger.info(
+        "[OK] Broad phase (binary): %d component(s) -> %d candidate pair(s)",
+        response.component_count,
+        response.candidate_count,
+    )
+    return response
@@ -0,0 +1,61 @@
+"""SolidWorks global-variable equation endpoint.
+
+POST /api/equations/evaluate -- evaluate an equation set for one
+configuration or a whole design-table sweep.
+
+Compiled equation sets are cached by their text, so repeated sweeps over
+the same equations skip parsing and compilation.
+"""
+
+from __future__ import annotations
+
+import logging
+from functools import lru_cache
+
+from fastapi import APIRouter, HTTPException
+from fastapi.concurrency import run_in_threadpool
+
+from backend.models import EquationEvaluateRequest, EquationEvaluateResponse
+from parameterization.equation_engine import EquationSystem
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/api/equations", tags=["equations"])
+
+
+@lru_cache(maxsize=64)
+def _compile(equations: tuple[str, ...], angle_unit: str) -> EquationSystem:
+    return EquationSystem(equations, angle_unit=angle_unit)
+
+
+def _evaluate(body: EquationEvaluateRequest) -> EquationEvaluateResponse:
+    """Compile (cached) and evaluate (CPU-bound)."""
+    system = _compile(tuple(body.equations), body.angle_unit)
+    values = system.evaluate(body.inputs)
+    shape = next(iter(values.values())).shape if values else ()
+    return EquationEvaluateResponse(
+        values={name: v.reshape(-1).tolist() for name, v in values.items()},
+        order=system.order,
+        inputs=system.inputs,
+        configurations=int(shape[0]) if shape else 1,
+    )
+
+
+@router.post(
+    "/evaluate",
+    response_model=EquationEvaluateResponse,
+    summary="Evaluate SolidWorks equations over a batch of inputs",
+)
+async def evaluate_equations(body: EquationEvaluateRequest) -> EquationEvaluateResponse:
+    """Parse, order and evaluate the equations; list inputs sweep configurations."""
+    try:
+        response = await run_in_threadpool(_evaluate, body)
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc))
+
+    logger.info(
+        "[OK] Equations: %d equation(s) x %d configuration(s)",
+        len(response.order),
+        response.configurations,
+    )
+    return response
@@ -0,0 +1,110 @@
+"""Fastener and Hole Wizard data endpoints.
+
+GET /api/fasteners/sizes                -- all sizes, or a range query
+GET /api/fasteners/sizes/{designation}  -- one size (e.g. M8, 1/4-20)
+GET /api/fasteners/torque               -- tightening torques
+
+The tables are immutable, so every row is serialised to JSON once at
+import and responses are assembled from the cached bytes.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from typing import Any, Literal, Optional
+
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import Response
+
+from backend.models import FastenerSizeModel, TorqueSpecModel
+from engineering.fastener_data import FASTENER_DATA
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/api/fasteners", tags=["fasteners"])
+
+_CACHE_HEADERS = {"Cache-Control": "public, max-age=86400"}
+
+
+def _encode(record: dict[str, Any]) -> bytes:
+    return json.dumps(record, separators=(",", ":")).encode("utf-8")
+
+
+_SIZE_ROWS = tuple(_encode(FASTENER_DATA.sizes.record(i)) for i in range(len(FASTENER_DATA.sizes)))
+_TORQUE_ROWS = tuple(
+    _encode(FASTENER_DATA.torques.record(i)) for i in range(len(FASTENER_DATA.torques))
+)
+_ALL_SIZES = b"[" + b",".join(_SIZE_ROWS) + b"]"
+_ALL_TORQUES = b"[" + b",".join(_TORQUE_ROWS) + b"]"
+
+
+def _json(body: bytes) -> Response:
+    return Response(content=body, media_type="application/json", headers=_CACHE_HEADERS)
+
+
+def _json_rows(rows: tuple[bytes, ...], selected: list[int]) -> Response:
+    return _json(b"[" + b",".join(rows[i] for i in selected) + b"]")
+
+
+@router.get(
+    "/sizes",
+    response_model=list[FastenerSizeModel],
+    summary="List or range-query fastener sizes",
+)
+async def list_sizes(
+    system: Optional[Literal["metric", "inch"]] = Query(None),
+    min_nominal_mm: Optional[float] = Query(None),
+    max_nominal_mm: Optional[float] = Query(None),
+    max_cbore_dia_mm: Optional[float] = Query(
+        None, description="Only sizes whose counterbore fits in this diameter."
+    ),
+    max_cbore_depth_mm: Optional[float] = Query(None),
+) -> Response:
+    """Fastener sizes, optionally filtered (all bounds inclusive).
+
+    Sizes without counterbore data never match a counterbore bound.
+    """
+    rows = FASTENER_DATA.sizes.query(
+        {
+            "nominal_mm": (min_nominal_mm, max_nominal_mm),
+            "cbore_dia_mm": (None, max_cbore_dia_mm),
+            "cbore_depth_mm": (None, max_cbore_depth_mm),
+        },
+        system=system,
+    )
+    if len(rows) == len(_SIZE_ROWS):
+        return _json(_ALL_SIZES)
+    return _json_rows(_SIZE_ROWS, rows)
+
+
+@router.get(
+    "/sizes/{designation:path}",
+    response_model=FastenerSizeModel,
+    summary="Look up one fastener size",
+)
+async def get_size(designation: str) -> Response:
+    """Return the size record for *designation* (``M8``, ``1/4-20``, ...)."""
+    rows = FASTENER_DATA.sizes.rows(designation)
+    if not rows:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Unknown fastener size '{designation}'.",
+        )
+    return _json(_SIZE_ROWS[rows[0]])
+
+
+@router.get(
+    "/torque",
+    response_model=list[TorqueSpecModel],
+    summary="Recommended tightening torques",
+)
+async def list_torques(
+    size: Optional[str] = Query(None, description="Size designation, e.g. 'M10'."),
+    grade: Optional[str] = Query(None, description="Property class, e.g. '8.8'."),
+) -> Response:
+    """Tightening torques, optionally filtered by size and property class."""
+    if size is None and grade is None:
+        return _json(_ALL_TORQUES)
+    rows = FASTENER_DATA.torques.query({}, size=size, grade=grade)
+    return _json_rows(_TORQUE_ROWS, rows)
@@ -0,0 +1,70 @@
+"""ISO 286 limits and fits endpoints.
+
+GET  /api/fits        -- limits and clearance of one fit at one size
+POST /api/fits/batch  -- every fit at every size in one call
+"""
+
+from __future__ import annotations
+
+import logging
+
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
+
+from backend.models import FitBatchRequest, FitBatchResponse, FitResponse, ToleranceZoneModel
+from engineering.iso_fits import ToleranceZone, evaluate_fit, evaluate_fits
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/api/fits", tags=["fits"])
+
+
+def _zone(zone: ToleranceZone) -> ToleranceZoneModel:
+    return ToleranceZoneModel(
+        designation=zone.designation,
+        upper_deviation=zone.upper_deviation,
+        lower_deviation=zone.lower_deviation,
+        max_size=round(zone.max_size, 6),
+        min_size=round(zone.min_size, 6),
+    )
+
+
+@router.get("", response_model=FitResponse, summary="Evaluate an ISO 286 fit")
+async def get_fit(
+    fit: str = Query(..., description="Fit designation, e.g. 'H7/g6'."),
+    nominal: float = Query(..., gt=0, description="Nominal size in mm."),
+) -> FitResponse:
+    """Return hole/shaft limits, min/max clearance and the fit type."""
+    try:
+        result = evaluate_fit(nominal, fit)
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc))
+
+    return FitResponse(
+        fit=result.designation,
+        nominal=result.nominal,
+        hole=_zone(result.hole),
+        shaft=_zone(result.shaft),
+        min_clearance=result.min_clearance,
+        max_clearance=result.max_clearance,
+        fit_type=result.fit_type,
+    )
+
+
+@router.post(
+    "/batch",
+    response_model=FitBatchResponse,
+    summary="Evaluate many fits at many sizes",
+)
+async def batch_fits(body: FitBatchRequest) -> FitBatchResponse:
+    """Evaluate ``len(nominals) x len(fits)`` combinations in one vectorised pass."""
+    try:
+        table = evaluate_fits(body.nominals, body.fits)
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc))
+
+    records = await run_in_threadpool(table.to_records)
+    logger.info(
+        "[OK] Evaluated %d fit(s) at %d size(s)", len(body.fits), len(body.nominals)
+    )
+    return FitBatchResponse.model_construct(results=records)
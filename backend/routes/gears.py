@@ -0,0 +1,84 @@
+"""Gear geometry endpoints.
+
+GET /api/gears/geometry -- spur gear diameters for a module / tooth count
+GET /api/gears/pairs    -- gear pairs for a target ratio and center distance
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Query
+
+from backend.models import GearGeometryResponse, GearPairCandidate, GearPairResponse
+from engineering.gear_geometry import GearGrid, spur_geometry
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/api/gears", tags=["gears"])
+
+# Default module x tooth-count x pressure-angle grid.  Reading ``pairs``
+# here intentionally warms its cached pair table at import, so the first
+# /pairs request does not pay for building it.
+_GRID = GearGrid()
+_ = _GRID.pairs
+
+
+@router.get(
+    "/geometry",
+    response_model=GearGeometryResponse,
+    summary="Spur gear geometry",
+)
+async def gear_geometry(
+    module: float = Query(..., gt=0, description="Module in mm."),
+    teeth: int = Query(..., ge=4, le=1000),
+    pressure_angle: float = Query(20.0, gt=0, lt=45, description="Degrees."),
+) -> GearGeometryResponse:
+    """Pitch, base, outside and root diameters of a standard spur gear."""
+    geometry = spur_geometry(module, teeth, pressure_angle).at()
+    geometry["teeth"] = teeth
+    return GearGeometryResponse(**geometry)
+
+
+@router.get(
+    "/pairs",
+    response_model=GearPairResponse,
+    summary="Find gear pairs for a ratio and center distance",
+)
+async def gear_pairs(
+    ratio: float = Query(..., ge=1, description="Target ratio gear/pinion."),
+    center_distance: float = Query(..., gt=0, description="Target center distance in mm."),
+    ratio_tolerance: float = Query(0.02, ge=0, le=1, description="Relative ratio tolerance."),
+    center_distance_tolerance: float = Query(0.5, ge=0, description="Center distance tolerance, mm."),
+    pressure_angle: Optional[float] = Query(None, description="Restrict to one pressure angle."),
+    min_contact_ratio: float = Query(1.2, ge=0),
+    allow_undercut: bool = Query(False),
+    limit: int = Query(20, ge=1, le=500),
+) -> GearPairResponse:
+    """Search the precomputed pair grid (standard modules, 12-120 teeth,
+    14.5/20/25 degree pressure angles) for matching gear pairs."""
+    try:
+        candidates = _GRID.pair_candidates(
+            ratio=ratio,
+            center_distance=center_distance,
+            ratio_tolerance=ratio_tolerance,
+            center_distance_tolerance=center_distance_tolerance,
+            pressure_angle=pressure_angle,
+            min_contact_ratio=min_contact_ratio,
+            allow_undercut=allow_undercut,
+            limit=limit,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc))
+
+    logger.info(
+        "[OK] Gear pair search ratio=%.4g cd=%.4g -> %d candidate(s)",
+        ratio,
+        center_distance,
+        len(candidates),
+    )
+    return GearPairResponse(
+        candidates=[GearPairCandidate(**c) for c in candidates],
+        searched_pairs=len(_GRID.pairs["module"]),
+    )
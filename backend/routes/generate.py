@@ -1,7 +1,9 @@
 """Code-generation endpoint.
 
 POST /api/generate-code -- accepts a natural-language prompt and returns
-generated SolidWorks API code via the Ollama backend.
+generated SolidWorks API code.  Structured prompts are answered by the
+deterministic template fast path; everything else goes to the Ollama
+backend.
 """
 
 from __future__ import annotations
@@ -12,6 +14,7 @@ from fastapi import APIRouter, HTTPException, Request
 
 from backend.models import CodeGenerationRequest, CodeGenerationResponse
 from backend.ollama_backend import OllamaBackend
+from backend.template_router import TemplateRouter
 
 logger = logging.getLogger(__name__)
 
@@ -30,7 +33,12 @@ async def generate_code(
     """Generate SolidWorks API code.
 
     The request *domain* selects a specialised system prompt
-    (api | sketch | gdt | feature) to guide the model.
+    (api | sketch | gdt | feature) to guide the model.  GD&T shorthand
+    such as ``"position DIA 0.25 MMC A B C"`` and sketch clauses such as
+    ``"line L1 is horizontal"`` are rendered from templates without calling
+    the model (``source="template"``); sketch prompts where only some
+    clauses parse send just the remaining clauses to the model
+    (``source="hybrid"``).
 
     Returns:
         CodeGenerationResponse with the generated code, explanation,
@@ -39,8 +47,35 @@ async def generate_code(
     Raises:
         HTTPException 503: If the Ollama backend is unreachable.
     """
+    templates: TemplateRouter = request.app.state.templates
     ollama: OllamaBackend = request.app.state.ollama
 
+    async def llm(llm_request: CodeGenerationRequest) -> CodeGenerationResponse:
+        return await _generate_with_ollama(ollama, llm_request)
+
+    fast = await templates.route(body, llm)
+    if fast is not None:
+        logger.info(
+            "[OK] Template fast path  source=%s  domain=%s  prompt=%s",
+            fast.source,
+            body.domain,
+            body.prompt[:80],
+        )
+        return fast
+
+    return await _generate_with_ollama(ollama, body)
+
+
+async def _generate_with_ollama(
+    ollama: OllamaBackend,
+    body: CodeGenerationRequest,
+) -> CodeGenerationResponse:
+    """Generate code with the model, mapping failures to HTTP errors.
+
+    Raises:
+        HTTPException 503: If the Ollama backend is unreachable.
+        HTTPException 502: If generation fails.
+    """
     if not await ollama.check_availability():
         raise HTTPException(
             status_code=503,
@@ -0,0 +1,96 @@
+"""Mate degree-of-freedom analysis endpoint.
+
+POST /api/mates/dof  -- batch of exported mate lists
+
+Reports remaining DOF per mate group and component, redundant mates and
+rigid clusters without a SolidWorks rebuild.  A malformed assembly gets
+an ``error`` entry instead of failing the whole batch.
+"""
+
+from __future__ import annotations
+
+import logging
+
+from fastapi import APIRouter
+from fastapi.concurrency import run_in_threadpool
+
+from backend.models import (
+    MateAssemblyModel,
+    MateDofBatchRequest,
+    MateDofBatchResponse,
+    MateDofResultModel,
+    MateGroupModel,
+    MateReportModel,
+)
+from engineering.mate_dof import Mate, MateEntity, analyze_mates
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/api/mates", tags=["mates"])
+
+
+def _analyse(assembly: MateAssemblyModel, tolerance: float) -> MateDofResultModel:
+    mates = [
+        Mate(
+            name=m.name,
+            type=m.type,
+            components=(m.components[0], m.components[1]),
+            entities=[MateEntity(e.kind, e.point, e.direction) for e in m.entities],
+            ratio=m.ratio,
+        )
+        for m in assembly.mates
+    ]
+    try:
+        result = analyze_mates(mates, assembly.fixed, assembly.components, tolerance)
+    except ValueError as exc:
+        return MateDofResultModel(name=assembly.name, error=str(exc))
+
+    return MateDofResultModel(
+        name=assembly.name,
+        total_dof=result.total_dof,
+        groups=[
+            MateGroupModel(
+                components=g.components,
+                grounded=g.grounded,
+                dof=g.dof,
+                rank=g.rank,
+                rows=g.rows,
+                status=g.status,
+                component_dof=g.component_dof,
+                rigid_clusters=g.rigid_clusters,
+                redundant_mates=g.redundant_mates,
+            )
+            for g in result.groups
+        ],
+        mates=[
+            MateReportModel(
+                name=m.name,
+                type=m.type,
+                group=m.group,
+                rows=m.rows,
+                independent_rows=m.independent_rows,
+                relative_dof=m.relative_dof,
+                redundant=m.redundant,
+            )
+            for m in result.mates
+        ],
+        redundant_mates=result.redundant_mates,
+    )
+
+
+def _run(body: MateDofBatchRequest) -> MateDofBatchResponse:
+    results = [_analyse(assembly, body.tolerance) for assembly in body.assemblies]
+    failed = sum(r.error is not None for r in results)
+    return MateDofBatchResponse(results=results, analysed=len(results) - failed, failed=failed)
+
+
+@router.post("/dof", response_model=MateDofBatchResponse, summary="Mate DOF analysis (batch)")
+async def mate_dof(body: MateDofBatchRequest) -> MateDofBatchResponse:
+    """Remaining DOF and redundant mates of each assembly's mate list."""
+    response = await run_in_threadpool(_run, body)
+    logger.info(
+        "[OK] Mate DOF: %d assembly(ies) analysed, %d failed",
+        response.analysed,
+        response.failed,
+    )
+    return response
@@ -0,0 +1,142 @@
+"""Batch normalisation endpoints.
+
+POST /api/normalize/gdt    -- parse (and validate) GD&T feature control frames
+POST /api/normalize/sketch -- parse (and validate) sketch constraint phrases
+
+Intended for bulk imports such as legacy drawing callouts; parsing is
+memoised per distinct string by the normalizers.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, Callable, Optional, Sequence
+
+from fastapi import APIRouter
+from fastapi.concurrency import run_in_threadpool
+
+from backend.models import NormalizeBatchRequest, NormalizeBatchResponse, NormalizedItem
+from training_pipeline.normalizers.gdt_normalizer import GDTNormalizer, GDTSpecification
+from training_pipeline.normalizers.sketch_constraint_normalizer import (
+    SketchConstraint,
+    SketchConstraintNormalizer,
+)
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/api/normalize", tags=["normalize"])
+
+_GDT = GDTNormalizer()
+_SKETCH = SketchConstraintNormalizer()
+
+
+# Flat serialisers -- dataclasses.asdict deep-copies recursively and
+# dominates the cost of large batches.
+
+def _gdt_to_dict(spec: GDTSpecification) -> dict[str, Any]:
+    data = dict(vars(spec))
+    data["datum_references"] = [dict(vars(d)) for d in spec.datum_references]
+    return data
+
+
+def _sketch_to_dict(constraint: SketchConstraint) -> dict[str, Any]:
+    return dict(vars(constraint))
+
+
+def _parse_error(normalize: Callable[[str], Any], raw: str) -> str:
+    """Reason *raw* failed to parse (failures are memoised, so this is cheap)."""
+    try:
+        normalize(raw)
+    except (ValueError, KeyError) as exc:
+        return str(exc)
+    return "Could not be parsed."
+
+
+def _batch(
+    items: list[str],
+    validate_results: bool,
+    normalizer: Any,
+    validate_many: Callable[[Sequence[Optional[Any]]], list[list[str]]],
+    to_dict: Callable[[Any], dict[str, Any]],
+) -> NormalizeBatchResponse:
+    """Normalise *items* and assemble the response (runs in a worker thread)."""
+    parsed = normalizer.normalize_many(items)
+    if validate_results:
+        errors = validate_many(parsed)
+    else:
+        errors = [[] for _ in parsed]
+
+    results = []
+    for raw, p, errs in zip(items, parsed, errors):
+        if p is None:
+            errs = [_parse_error(normalizer.normalize, raw)]
+        results.append(NormalizedItem.model_construct(
+            input=raw,
+            normalized=to_dict(p) if p is not None else None,
+            errors=errs,
+        ))
+    parsed_count = sum(p is not None for p in parsed)
+    valid_count = sum(p is not None and not errs for p, errs in zip(parsed, errors))
+    return NormalizeBatchResponse(
+        results=results,
+        parsed_count=parsed_count,
+        valid_count=valid_count,
+    )
+
+
+@router.post(
+    "/gdt",
+    response_model=NormalizeBatchResponse,
+    summary="Normalise a batch of GD&T feature control frame strings",
+)
+async def normalize_gdt(body: NormalizeBatchRequest) -> NormalizeBatchResponse:
+    """Parse GD&T strings such as ``"position DIA 0.25 MMC A B C"``.
+
+    Unparseable items are returned with ``normalized = null`` and a parse
+    error; with ``validate_results`` every parsed item is also checked
+    against the ASME Y14.5 rules in ``GDTNormalizer.validate_specification``.
+    """
+    response = await run_in_threadpool(
+        _batch,
+        body.items,
+        body.validate_results,
+        _GDT,
+        _GDT.validate_many,
+        _gdt_to_dict,
+    )
+    logger.info(
+        "[OK] Normalised %d GD&T item(s): %d parsed, %d valid",
+        len(body.items),
+        response.parsed_count,
+        response.valid_count,
+    )
+    return response
+
+
+@router.post(
+    "/sketch",
+    response_model=NormalizeBatchResponse,
+    summary="Normalise a batch of sketch constraint phrases",
+)
+async def normalize_sketch(body: NormalizeBatchRequest) -> NormalizeBatchResponse:
+    """Parse sketch phrases such as ``"line L1 is horizontal"``.
+
+    Unparseable items are returned with ``normalized = null`` and a parse
+    error; with ``validate_results`` every parsed item is also checked by
+    ``SketchConstraintNormalizer.validate_constraint``.
+    """
+    response = await run_in_threadpool(
+        _batch,
+        body.items,
+        body.validate_results,
+        _SKETCH,
+        _SKETCH.validate_many,
+        _sketch_to_dict,
+    )
+    logger.info(
+        "[OK] Normalised %d sketch item(s): %d parsed, %d valid",
+        len(body.items),
+        response.parsed_count,
+        response.valid_count,
+    )
+    return response
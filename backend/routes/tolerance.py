@@ -0,0 +1,104 @@
+"""Tolerance analysis endpoints.
+
+POST /api/tolerance/stackup -- worst-case, RSS and Monte Carlo stack-up
+"""
+
+from __future__ import annotations
+
+import logging
+
+from fastapi import APIRouter, HTTPException
+from fastapi.concurrency import run_in_threadpool
+
+from backend.models import MonteCarloSummary, StackupRequest, StackupResponse
+from engineering.tolerance_stackup import FeatureOfSize, StackContributor, ToleranceStack
+from training_pipeline.normalizers.gdt_normalizer import GDTNormalizer
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/api/tolerance", tags=["tolerance"])
+
+_GDT = GDTNormalizer()
+
+
+def _build_stack(body: StackupRequest) -> ToleranceStack:
+    """Convert the request into a ``ToleranceStack`` (raises ``ValueError``)."""
+    contributors = []
+    for item in body.contributors:
+        spec = None
+        if item.gdt:
+            try:
+                spec = _GDT.normalize(item.gdt)
+            except ValueError as exc:
+                raise ValueError(f"Contributor '{item.name}': {exc}") from exc
+            errors = _GDT.validate_specification(spec)
+            if errors:
+                raise ValueError(f"Contributor '{item.name}': {'; '.join(errors)}")
+        feature_size = (
+            FeatureOfSize(**item.feature_size.model_dump()) if item.feature_size else None
+        )
+        contributors.append(StackContributor(
+            name=item.name,
+            nominal=item.nominal,
+            tol_plus=item.tol_plus,
+            tol_minus=item.tol_minus,
+            direction=item.direction,
+            distribution=item.distribution,
+            sigma=item.sigma,
+            gdt=spec,
+            feature_size=feature_size,
+        ))
+    return ToleranceStack(contributors, body.lower_limit, body.upper_limit)
+
+
+def _analyze(body: StackupRequest) -> StackupResponse:
+    """Run the analysis (CPU-bound; called in a worker thread)."""
+    result = _build_stack(body).analyze(samples=body.samples, seed=body.seed)
+    mc = result.monte_carlo
+    return StackupResponse(
+        nominal=result.nominal,
+        mean=result.mean,
+        worst_case_min=result.worst_case_min,
+        worst_case_max=result.worst_case_max,
+        worst_case_ok=result.worst_case_ok,
+        rss_min=result.rss_min,
+        rss_max=result.rss_max,
+        contributions=result.contributions,
+        monte_carlo=MonteCarloSummary(
+            samples=mc.samples,
+            mean=mc.mean,
+            std=mc.std,
+            min=mc.min,
+            max=mc.max,
+            percentiles=mc.percentiles,
+            in_spec_fraction=mc.in_spec_fraction,
+            ppm_out_of_spec=mc.ppm_out_of_spec,
+        ) if mc is not None else None,
+    )
+
+
+@router.post(
+    "/stackup",
+    response_model=StackupResponse,
+    summary="Analyse a one-dimensional tolerance stack",
+)
+async def stackup(body: StackupRequest) -> StackupResponse:
+    """Worst-case, RSS and Monte Carlo analysis of a dimension chain.
+
+    Contributors may carry a GD&T frame (``"position DIA 0.1 MMC A B"``);
+    with MMC/LMC and a ``feature_size`` the Monte Carlo includes the bonus
+    tolerance from the sampled actual size.
+    """
+    try:
+        response = await run_in_threadpool(_analyze, body)
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc))
+
+    logger.info(
+        "[OK] Stack-up of %d contributor(s): worst case %.6g..%.6g, %d sample(s)",
+        len(body.contributors),
+        response.worst_case_min,
+        response.worst_case_max,
+        body.samples,
+    )
+    return response
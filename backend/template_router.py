@@ -0,0 +1,373 @@
+"""Deterministic template fast path for structured prompts.
+
+Many requests are compact shorthand that the training-pipeline normalizers
+already parse exactly, e.g. the GD&T feature control frame
+``"position DIA 0.25 MMC A B C"`` or the sketch clauses
+``"line L1 is horizontal. radius of arc A1 = 10"``.  For those the code is
+rendered from the same templates used to build the training data -- no LLM
+call, sub-millisecond latency, confidence 1.0 and ``source="template"``.
+
+Sketch prompts are split into sentences, and a sentence into comma/"and"/
+"then" clauses only when every clause parses on its own; only sentences or
+clauses that do not parse are sent to the LLM and its answer is merged back in (``source="hybrid"``).
+Anything the router is not certain about returns ``None`` and falls through
+to Ollama unchanged.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import logging
+import math
+import re
+import textwrap
+from typing import Any, Awaitable, Callable, Optional
+
+from backend.models import CodeGenerationRequest, CodeGenerationResponse
+from training_pipeline.generators.gdt_code_generator import GDTCodeGenerator
+from training_pipeline.generators.sketch_code_generator import SketchCodeGenerator
+from training_pipeline.normalizers.gdt_normalizer import (
+    ALL_CHARACTERISTICS,
+    GDTNormalizer,
+    GDTSpecification,
+)
+from training_pipeline.normalizers.sketch_constraint_normalizer import (
+    SketchConstraint,
+    SketchConstraintNormalizer,
+)
+
+logger = logging.getLogger(__name__)
+
+LLMCallback = Callable[[CodeGenerationRequest], Awaitable[CodeGenerationResponse]]
+
+# A complete feature control frame and nothing else:
+#   <characteristic> [DIA] <tolerance> [MMC|LMC|RFS] [datum [datum [datum]]]
+# Datums are single upper-case letters, optionally with (M)/(L).  Prompts
+# with any other words are natural language and go to the LLM.
+_GDT_SHORTHAND = re.compile(
+    r"^\s*(?i:[a-z][a-z_\-]*)"
+    r"\s+(?:(?i:DIA)\s+)?\d+\.?\d*"
+    r"(?:\s+(?i:MMC|LMC|RFS))?"
+    r"(?:[\s|,]+[A-Z](?:\([ML]\))?){0,3}"
+    r"\s*$"
+)
+
+# Sentence boundaries in multi-constraint sketch prompts: sentence ends,
+# semicolons and newlines.  A period between digits ("25.0") is not one.
+_SENTENCE_SPLIT = re.compile(r"[.;](?=\s|$)|\n")
+
+# Candidate clause boundaries inside a sentence: commas and "and"/"then".
+# These also join the operands of a binary relation ("line L1 and line L2
+# are perpendicular"), so a sentence is only split at them when every
+# piece parses as a clause by itself.
+_CONJUNCTION_SPLIT = re.compile(
+    r",\s*(?:and\s+|then\s+)?|\s+(?:and|then)\s+",
+    re.IGNORECASE,
+)
+_WORD = re.compile(r"[^\s=,.;:]+(?:\.\d+)?")
+
+# Words a sketch clause may contain besides the parsed constraint itself
+# ("make line L1 horizontal", "set the radius of arc A1 to 10").
+_SKETCH_FILLER = frozenset({
+    "a", "add", "an", "apply", "be", "constrain", "constraint", "dimension",
+    "from", "is", "make", "must", "of", "please", "relation", "set",
+    "should", "sketch", "the", "to", "with",
+})
+
+
+class TemplateRouter:
+    """Answers structured prompts from templates instead of the LLM."""
+
+    def __init__(self) -> None:
+        self.gdt_normalizer = GDTNormalizer()
+        self.gdt_generator = GDTCodeGenerator()
+        self.sketch_normalizer = SketchConstraintNormalizer()
+        self.sketch_generator = SketchCodeGenerator()
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    async def route(
+        self,
+        request: CodeGenerationRequest,
+        llm: LLMCallback,
+    ) -> Optional[CodeGenerationResponse]:
+        """Return a template (or hybrid) response, or ``None`` to use the LLM.
+
+        Args:
+            request: The incoming code-generation request.
+            llm: Coroutine used for sketch clauses the templates cannot
+                 handle; it receives a request for just those clauses.
+        """
+        if request.domain == "gdt":
+            return self.route_gdt(request.prompt)
+        if request.domain == "sketch":
+            return await self.route_sketch(request, llm)
+        return None
+
+    def route_gdt(self, prompt: str) -> Optional[CodeGenerationResponse]:
+        """Render a GD&T feature control frame written in shorthand.
+
+        The prompt must match the shorthand grammar exactly, name a known
+        characteristic, and pass ``validate_specification``; otherwise
+        ``None`` is returned.
+        """
+        spec = self.parse_gdt(prompt)
+        if spec is None:
+            return None
+
+        return CodeGenerationResponse(
+            code=self.gdt_generator.generate(spec).strip(),
+            explanation=(
+                f"Applies a {spec.characteristic} tolerance of "
+                f"{spec.tolerance_value} ({_describe_gdt(spec)}) to the "
+                f"selected feature. Rendered from the GD&T template."
+            ),
+            parameters_used=_gdt_parameters(spec),
+            confidence=1.0,
+            warnings=[],
+            source="template",
+        )
+
+    async def route_sketch(
+        self,
+        request: CodeGenerationRequest,
+        llm: LLMCallback,
+    ) -> Optional[CodeGenerationResponse]:
+        """Render sketch constraint/dimension clauses from templates.
+
+        Clauses that parse are rendered with ``SketchCodeGenerator``; the
+        rest are sent to *llm* in a single request and the generated code is
+        inserted at the position of the first unparsed clause.  Returns
+        ``None`` when no clause parses.
+        """
+        clauses = self.split_sketch_clauses(request.prompt)
+        parsed = [self.parse_sketch_clause(c) for c in clauses]
+        if not clauses or all(p is None for p in parsed):
+            return None
+
+        blocks: list[tuple[str, bool]] = []  # (code, rendered from template)
+        params: list[dict[str, Any]] = []
+        for clause, constraint in zip(clauses, parsed):
+            if constraint is None:
+                continue
+            _, code = self.sketch_generator.generate_training_pair(
+                _to_system_units(constraint)
+            )
+            blocks.append((code.strip(), True))
+            params.append(_sketch_parameters(constraint, clause))
+
+        failed = [c for c, p in zip(clauses, parsed) if p is None]
+        if not failed:
+            return CodeGenerationResponse(
+                code=_join_blocks(blocks),
+                explanation=(
+                    f"Applies {len(blocks)} sketch "
+                    f"{'relation' if len(blocks) == 1 else 'relations/dimensions'}"
+                    " rendered from the sketch constraint templates."
+                ),
+                parameters_used=params,
+                confidence=1.0,
+                warnings=_redundancy_warnings(clauses, parsed),
+                source="template",
+            )
+
+        partial = await llm(request.model_copy(update={"prompt": ". ".join(failed) + "."}))
+
+        # Insert the model's code where the first unparsed clause was.
+        if partial.code:
+            blocks.insert(parsed.index(None), (partial.code.strip(), False))
+        confidence = (len(clauses) - len(failed) + partial.confidence * len(failed)) / len(clauses)
+
+        return CodeGenerationResponse(
+            code=_join_blocks(blocks),
+            explanation=(
+                f"{len(clauses) - len(failed)} of {len(clauses)} clauses rendered "
+                f"from sketch templates; the model generated code for: "
+                f"{'; '.join(failed)}. {partial.explanation}"
+            ).strip(),
+            parameters_used=params + partial.parameters_used,
+            confidence=round(confidence, 3),
+            warnings=_redundancy_warnings(clauses, parsed) + partial.warnings,
+            source="hybrid",
+        )
+
+    def split_sketch_clauses(self, prompt: str) -> list[str]:
+        """Split *prompt* into sentences, and each sentence into clauses.
+
+        A sentence is split at commas and "and"/"then" only when it does
+        not parse as a whole and every piece parses on its own; otherwise
+        it is kept intact, so the LLM sees it unchanged.
+        """
+        clauses: list[str] = []
+        for sentence in split_clauses(prompt):
+            pieces = [
+                c.strip() for c in _CONJUNCTION_SPLIT.split(sentence) if c and c.strip()
+            ]
+            if (
+                len(pieces) > 1
+                and self.parse_sketch_clause(sentence) is None
+                and all(self.parse_sketch_clause(c) is not None for c in pieces)
+            ):
+                clauses.extend(pieces)
+            else:
+                clauses.append(sentence)
+        return clauses
+
+    def parse_sketch_clause(self, clause: str) -> Optional[SketchConstraint]:
+        """Return the constraint for *clause* if it parses with no leftovers.
+
+        A clause parses when ``SketchConstraintNormalizer.normalize``
+        succeeds and every remaining word is either part of the constraint
+        or a filler word -- "line L1 is horizontal with length 50" does not.
+        """
+        try:
+            constraint = self.sketch_normalizer.normalize(clause)
+        except ValueError:
+            return None
+
+        used = {
+            constraint.constraint_type,
+            constraint.entity1_type,
+            constraint.entity1_name.lower(),
+        }
+        if constraint.entity2_type and constraint.entity2_name:
+            used |= {constraint.entity2_type, constraint.entity2_name.lower()}
+
+        for word in _WORD.findall(clause):
+            lower = word.lower()
+            if lower in used or lower in _SKETCH_FILLER:
+                continue
+            if constraint.value is not None and _is_number(word, constraint.value):
+                continue
+            return None
+        return constraint
+
+    def parse_gdt(self, prompt: str) -> Optional[GDTSpecification]:
+        """Return the validated specification for a shorthand *prompt*."""
+        if not _GDT_SHORTHAND.match(prompt):
+            return None
+        try:
+            spec = self.gdt_normalizer.normalize(prompt)
+        except ValueError:
+            return None
+        if spec.characteristic not in ALL_CHARACTERISTICS:
+            return None
+        errors = self.gdt_normalizer.validate_specification(spec)
+        if errors:
+            logger.debug("Template fast path rejected %r: %s", prompt, errors)
+            return None
+        return spec
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def split_clauses(prompt: str) -> list[str]:
+    """Split a multi-constraint prompt into non-empty sentences."""
+    return [c.strip() for c in _SENTENCE_SPLIT.split(prompt) if c and c.strip()]
+
+
+def _is_number(word: str, value: float) -> bool:
+    try:
+        return float(word) == value
+    except ValueError:
+        return False
+
+
+def _to_system_units(constraint: SketchConstraint) -> SketchConstraint:
+    """Copy of *constraint* with its value in API system units.
+
+    Prompts give lengths in mm and angles in degrees; ``dim.SystemValue``
+    takes metres and radians.
+    """
+    if constraint.value is None:
+        return constraint
+    if constraint.constraint_type == "angle":
+        value = math.radians(constraint.value)
+    else:
+        value = constraint.value / 1000.0
+    return dataclasses.replace(constraint, value=value)
+
+
+def _join_blocks(blocks: list[tuple[str, bool]]) -> str:
+    """Concatenate code blocks in clause order.
+
+    Template blocks declare the same locals (``sketchMgr``, ``dim``), so when
+    there is more than one block each template block gets its own C# scope.
+    Model-generated code is inserted verbatim.
+    """
+    if len(blocks) == 1:
+        return blocks[0][0]
+    return "\n\n".join(
+        "{\n" + textwrap.indent(code, "    ") + "\n}" if templated else code
+        for code, templated in blocks
+    )
+
+
+def _sketch_parameters(constraint: SketchConstraint, clause: str) -> dict[str, Any]:
+    """``parameters_used`` entry for one rendered sketch clause."""
+    entry: dict[str, Any] = {
+        "clause": clause,
+        "constraint_type": constraint.constraint_type,
+        "entity1": f"{constraint.entity1_type} {constraint.entity1_name}",
+    }
+    if constraint.entity2_name:
+        entry["entity2"] = f"{constraint.entity2_type} {constraint.entity2_name}"
+    if constraint.value is not None:
+        entry["value"] = constraint.value
+    return entry
+
+
+def _redundancy_warnings(
+    clauses: list[str],
+    parsed: list[Optional[SketchConstraint]],
+) -> list[str]:
+    """Warnings for parsed clauses that add no constraint to earlier ones."""
+    constraints = [c for c in parsed if c is not None]
+    if len(constraints) < 2:
+        return []
+    try:
+        check = SketchConstraintNormalizer.check_fully_defined(constraints)
+    except ValueError:
+        return []
+    used = [clause for clause, c in zip(clauses, parsed) if c is not None]
+    return [
+        f"'{used[i]}' is redundant with the relations before it."
+        for i in check["redundant"]
+    ]
+
+
+def _describe_gdt(spec: GDTSpecification) -> str:
+    """Short human-readable summary of zone, modifier and datums."""
+    parts = [
+        "diametral zone" if spec.tolerance_zone_shape == "cylindrical" else "linear zone",
+        spec.material_modifier or "RFS",
+    ]
+    if spec.datum_references:
+        parts.append("datums " + "|".join(
+            d.label + (f"({d.modifier[0]})" if d.modifier else "")
+            for d in spec.datum_references
+        ))
+    else:
+        parts.append("no datums")
+    return ", ".join(parts)
+
+
+def _gdt_parameters(spec: GDTSpecification) -> list[dict[str, Any]]:
+    """``parameters_used`` entries for a GD&T specification."""
+    params: list[dict[str, Any]] = [
+        {"name": "characteristic", "value": spec.characteristic},
+        {"name": "tolerance_value", "value": spec.tolerance_value},
+        {"name": "tolerance_zone_shape", "value": spec.tolerance_zone_shape},
+        {"name": "material_modifier", "value": spec.material_modifier or "RFS"},
+    ]
+    for datum in spec.datum_references:
+        params.append({
+            "name": f"datum_{datum.order}",
+            "value": datum.label,
+            "modifier": datum.modifier or "RFS",
+        })
+    return params
@@ -0,0 +1,493 @@
+"""Load generator and latency report for the backend request path.
+
+By default the harness starts two subprocesses -- the fake Ollama server
+(``benchmarks.fake_ollama``) and the FastAPI backend pointed at it -- then
+drives each scenario at every requested concurrency level and reports
+p50/p95/p99 latency and throughput.  Results are written as JSON; pass
+``--baseline`` to fail (exit code 1) when p95 latency or throughput
+regresses by more than ``--max-regression``.
+
+Scenarios:
+    generate_code       POST /api/generate-code (backend -> fake Ollama)
+    reference           GET  /api/reference/{method}
+    resolve_parameters  POST /api/resolve-parameters
+    ollama_stream       POST /api/generate with stream=true, straight to the
+                        fake Ollama (reports time-to-first-token as well)
+
+Examples:
+    python -m benchmarks.backend_bench
+    python -m benchmarks.backend_bench --scenarios reference --concurrency 1 16 64
+    python -m benchmarks.backend_bench --backend-url http://localhost:8000 \\
+        --ollama-url http://localhost:11434 --requests 100
+    python -m benchmarks.backend_bench --baseline benchmarks/results/main.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import platform
+import socket
+import subprocess
+import sys
+import time
+from collections import Counter
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional
+
+import httpx
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+_RESULTS_DIR = _PROJECT_ROOT / "benchmarks" / "results"
+
+
+# ---------------------------------------------------------------------------
+# Scenarios
+# ---------------------------------------------------------------------------
+
+_PROMPTS = [
+    ("sketch", "Create a 20mm circle on the Front Plane"),
+    ("feature", "Extrude the active sketch 10mm blind"),
+    ("gdt", "Apply a 0.05mm position tolerance at MMC relative to datums A, B and C"),
+    ("api", "Get the active document and print its title"),
+]
+
+_REFERENCE_METHODS = [
+    "GetActiveDoc",
+    "CreateSketch",
+    "InsertSketch",
+    "FeatureExtrusion3",
+    "CreateCircle",
+    "CreateLine",
+    "AddConstraint",
+    "CreateDimension",
+    "CreateToleranceFeature",
+    "ClearSelection2",
+]
+
+_PARAMETER_REQUESTS = [
+    ("extrusion_depth", {"depth_mm": 40.0, "draft_angle_deg": 2.0}),
+    ("circle_sketch", {"radius_mm": 12.5}),
+    ("rectangle_sketch", {"x2_mm": 30.0, "y2_mm": 15.0}),
+    ("cut_extrude", {"through_all": True}),
+    ("revolve_boss", {"angle_deg": 180.0}),
+    ("fillet_feature", {"radius_mm": 3.0}),
+    ("chamfer_feature", {"distance_mm": 0.5, "angle_deg": 30.0}),
+]
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """One request shape to drive under load.
+
+    Attributes:
+        name: Scenario key used on the CLI and in the report.
+        target: ``"backend"`` or ``"ollama"`` -- which base URL to hit.
+        method: HTTP method.
+        build: Maps the request index to ``(path, json_body)``.
+        stream: Read the response as a stream and record time to first chunk.
+    """
+
+    name: str
+    target: str
+    method: str
+    build: Callable[[int], tuple[str, Optional[dict[str, Any]]]]
+    stream: bool = False
+
+
+def _generate_code(i: int) -> tuple[str, dict[str, Any]]:
+    domain, prompt = _PROMPTS[i % len(_PROMPTS)]
+    return "/api/generate-code", {"prompt": prompt, "domain": domain}
+
+
+def _reference(i: int) -> tuple[str, None]:
+    return f"/api/reference/{_REFERENCE_METHODS[i % len(_REFERENCE_METHODS)]}", None
+
+
+def _resolve_parameters(i: int) -> tuple[str, dict[str, Any]]:
+    name, assignments = _PARAMETER_REQUESTS[i % len(_PARAMETER_REQUESTS)]
+    return "/api/resolve-parameters", {
+        "parameter_space_name": name,
+        "assignments": assignments,
+    }
+
+
+def _ollama_stream(i: int) -> tuple[str, dict[str, Any]]:
+    _, prompt = _PROMPTS[i % len(_PROMPTS)]
+    return "/api/generate", {"model": "sw-semantic-7b", "prompt": prompt, "stream": True}
+
+
+SCENARIOS: dict[str, Scenario] = {
+    s.name: s
+    for s in (
+        Scenario("generate_code", "backend", "POST", _generate_code),
+        Scenario("reference", "backend", "GET", _reference),
+        Scenario("resolve_parameters", "backend", "POST", _resolve_parameters),
+        Scenario("ollama_stream", "ollama", "POST", _ollama_stream, stream=True),
+    )
+}
+
+
+# ---------------------------------------------------------------------------
+# Statistics
+# ---------------------------------------------------------------------------
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an ascending list (0 for an empty list)."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * pct // 100))  # ceil
+    return sorted_values[int(rank) - 1]
+
+
+def summarize_latencies(seconds: list[float]) -> dict[str, float]:
+    """Return min/mean/p50/p95/p99/max in milliseconds."""
+    ms = sorted(s * 1000.0 for s in seconds)
+    if not ms:
+        return {k: 0.0 for k in ("min", "mean", "p50", "p95", "p99", "max")}
+    return {
+        "min": round(ms[0], 3),
+        "mean": round(sum(ms) / len(ms), 3),
+        "p50": round(percentile(ms, 50), 3),
+        "p95": round(percentile(ms, 95), 3),
+        "p99": round(percentile(ms, 99), 3),
+        "max": round(ms[-1], 3),
+    }
+
+
+# ---------------------------------------------------------------------------
+# Load generator
+# ---------------------------------------------------------------------------
+
+async def run_scenario(
+    scenario: Scenario,
+    base_url: str,
+    requests: int,
+    concurrency: int,
+    warmup: int = 10,
+    timeout: float = 60.0,
+) -> dict[str, Any]:
+    """Issue *requests* requests with *concurrency* closed-loop workers.
+
+    Returns:
+        A result dict with status counts, latency percentiles (ms),
+        throughput (requests/s) and, for streaming scenarios,
+        time-to-first-chunk percentiles.
+    """
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(
+        base_url=base_url, timeout=httpx.Timeout(timeout), limits=limits
+    ) as client:
+
+        async def issue(i: int) -> tuple[object, float, Optional[float]]:
+            path, body = scenario.build(i)
+            start = time.perf_counter()
+            first: Optional[float] = None
+            try:
+                if scenario.stream:
+                    async with client.stream(scenario.method, path, json=body) as resp:
+                        async for _ in resp.aiter_bytes():
+                            if first is None:
+                                first = time.perf_counter() - start
+                        status: object = resp.status_code
+                else:
+                    resp = await client.request(scenario.method, path, json=body)
+                    status = resp.status_code
+            except httpx.HTTPError as exc:
+                status = type(exc).__name__
+            return status, time.perf_counter() - start, first
+
+        for i in range(warmup):
+            await issue(i)
+
+        latencies: list[float] = []
+        first_chunk: list[float] = []
+        statuses: Counter[str] = Counter()
+        counter = itertools.count()
+
+        async def worker() -> None:
+            while (i := next(counter)) < requests:
+                status, elapsed, first = await issue(i)
+                statuses[str(status)] += 1
+                latencies.append(elapsed)
+                if first is not None:
+                    first_chunk.append(first)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        wall = time.perf_counter() - start
+
+    errors = sum(n for code, n in statuses.items() if not code.isdigit() or int(code) >= 400)
+    result: dict[str, Any] = {
+        "scenario": scenario.name,
+        "concurrency": concurrency,
+        "requests": requests,
+        "errors": errors,
+        "status_codes": dict(statuses),
+        "wall_s": round(wall, 4),
+        "throughput_rps": round(requests / wall, 2) if wall > 0 else 0.0,
+        "latency_ms": summarize_latencies(latencies),
+    }
+    if scenario.stream:
+        result["first_chunk_ms"] = summarize_latencies(first_chunk)
+    return result
+
+
+# ---------------------------------------------------------------------------
+# Server management
+# ---------------------------------------------------------------------------
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@contextmanager
+def _serve(
+    module_args: list[str],
+    ready_url: str,
+    env: Optional[dict[str, str]] = None,
+    verbose: bool = False,
+    timeout: float = 30.0,
+) -> Iterator[None]:
+    """Run ``python -m <module_args>`` until the block exits.
+
+    Raises:
+        RuntimeError: If *ready_url* does not answer within *timeout*.
+    """
+    output = None if verbose else subprocess.DEVNULL
+    proc = subprocess.Popen(
+        [sys.executable, "-m", *module_args],
+        cwd=_PROJECT_ROOT,
+        env={**os.environ, **(env or {})},
+        stdout=output,
+        stderr=output,
+    )
+    try:
+        deadline = time.monotonic() + timeout
+        while True:
+            if proc.poll() is not None:
+                raise RuntimeError(f"{module_args[0]} exited with code {proc.returncode}")
+            try:
+                if httpx.get(ready_url, timeout=1.0).status_code == 200:
+                    break
+            except httpx.HTTPError:
+                pass
+            if time.monotonic() > deadline:
+                raise RuntimeError(f"{module_args[0]} not ready at {ready_url}")
+            time.sleep(0.1)
+        yield
+    finally:
+        proc.terminate()
+        try:
+            proc.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+
+
+# ---------------------------------------------------------------------------
+# Regression check
+# ---------------------------------------------------------------------------
+
+def compare_to_baseline(
+    results: list[dict[str, Any]],
+    baseline: dict[str, Any],
+    max_regression: float,
+) -> list[str]:
+    """Return a message for every run slower than *baseline* by the margin.
+
+    A run regresses when its p95 latency grows, or its throughput drops, by
+    more than ``max_regression`` (a fraction) relative to the baseline run
+    with the same scenario and concurrency.
+    """
+    previous = {
+        (r["scenario"], r["concurrency"]): r for r in baseline.get("results", [])
+    }
+    failures = []
+    for run in results:
+        old = previous.get((run["scenario"], run["concurrency"]))
+        if old is None:
+            continue
+        label = f"{run['scenario']} @ c={run['concurrency']}"
+        old_p95, new_p95 = old["latency_ms"]["p95"], run["latency_ms"]["p95"]
+        if old_p95 > 0 and new_p95 > old_p95 * (1 + max_regression):
+            failures.append(f"{label}: p95 {old_p95:.2f}ms -> {new_p95:.2f}ms")
+        old_rps, new_rps = old["throughput_rps"], run["throughput_rps"]
+        if old_rps > 0 and new_rps < old_rps * (1 - max_regression):
+            failures.append(f"{label}: throughput {old_rps:.1f} -> {new_rps:.1f} req/s")
+    return failures
+
+
+# ---------------------------------------------------------------------------
+# CLI entry point
+# ---------------------------------------------------------------------------
+
+async def _run_all(
+    scenarios: list[Scenario],
+    urls: dict[str, str],
+    concurrency_levels: list[int],
+    requests: int,
+    warmup: int,
+) -> list[dict[str, Any]]:
+    results = []
+    for scenario in scenarios:
+        for concurrency in concurrency_levels:
+            result = await run_scenario(
+                scenario, urls[scenario.target], requests, concurrency, warmup
+            )
+            lat = result["latency_ms"]
+            status = "[OK]" if result["errors"] == 0 else "[!]"
+            print(
+                f"  {scenario.name:<20} {concurrency:>5} {result['throughput_rps']:>10.1f} "
+                f"{lat['p50']:>9.2f} {lat['p95']:>9.2f} {lat['p99']:>9.2f} "
+                f"{result['errors']:>7}  {status}"
+            )
+            results.append(result)
+    return results
+
+
+def main() -> None:
+    """Parse arguments, run the benchmarks and write the JSON report."""
+    parser = argparse.ArgumentParser(
+        description="Backend request-path benchmarks with a fake Ollama server",
+    )
+    parser.add_argument(
+        "--scenarios", nargs="+", choices=sorted(SCENARIOS), default=list(SCENARIOS),
+        help="Scenarios to run (default: all)",
+    )
+    parser.add_argument(
+        "--concurrency", nargs="+", type=int, default=[1, 8, 32],
+        help="Concurrent clients per run (default: 1 8 32)",
+    )
+    parser.add_argument(
+        "--requests", type=int, default=200,
+        help="Measured requests per scenario and concurrency level (default: 200)",
+    )
+    parser.add_argument(
+        "--warmup", type=int, default=10,
+        help="Unmeasured warm-up requests per run (default: 10)",
+    )
+    parser.add_argument(
+        "--backend-url", default=None,
+        help="Benchmark a running backend instead of starting one",
+    )
+    parser.add_argument(
+        "--ollama-url", default=None,
+        help="Use a running (fake or real) Ollama instead of starting the fake one",
+    )
+    parser.add_argument(
+        "--latency-ms", type=float, default=20.0,
+        help="Fake Ollama delay before the first token (default: 20)",
+    )
+    parser.add_argument(
+        "--tokens-per-s", type=float, default=2000.0,
+        help="Fake Ollama token rate (default: 2000)",
+    )
+    parser.add_argument(
+        "--output", type=Path, default=None,
+        help="JSON report path (default: benchmarks/results/backend_<timestamp>.json)",
+    )
+    parser.add_argument(
+        "--baseline", type=Path, default=None,
+        help="Earlier JSON report to compare against",
+    )
+    parser.add_argument(
+        "--max-regression", type=float, default=0.2,
+        help="Allowed p95/throughput regression vs. --baseline (default: 0.2)",
+    )
+    parser.add_argument(
+        "--verbose", action="store_true",
+        help="Show server logs",
+    )
+    args = parser.parse_args()
+
+    scenarios = [SCENARIOS[name] for name in args.scenarios]
+
+    with ExitStack() as stack:
+        ollama_url = args.ollama_url
+        if ollama_url is None:
+            port = _free_port()
+            ollama_url = f"http://127.0.0.1:{port}"
+            print(f"[->] Starting fake Ollama on {ollama_url}")
+            stack.enter_context(_serve(
+                [
+                    "benchmarks.fake_ollama", "--port", str(port),
+                    "--latency-ms", str(args.latency_ms),
+                    "--tokens-per-s", str(args.tokens_per_s),
+                ],
+                f"{ollama_url}/api/tags",
+                verbose=args.verbose,
+            ))
+
+        backend_url = args.backend_url
+        if backend_url is None:
+            port = _free_port()
+            backend_url = f"http://127.0.0.1:{port}"
+            print(f"[->] Starting backend on {backend_url}")
+            stack.enter_context(_serve(
+                [
+                    "uvicorn", "backend.main:app", "--port", str(port),
+                    "--log-level", "warning", "--no-access-log",
+                ],
+                f"{backend_url}/",
+                env={"SWSE_OLLAMA_URL": ollama_url},
+                verbose=args.verbose,
+            ))
+
+        print(
+            f"\n  {'Scenario':<20} {'Conc':>5} {'Req/s':>10} "
+            f"{'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'Errors':>7}"
+        )
+        print("  " + "-" * 76)
+        results = asyncio.run(_run_all(
+            scenarios,
+            {"backend": backend_url, "ollama": ollama_url},
+            args.concurrency,
+            args.requests,
+            args.warmup,
+        ))
+
+    report = {
+        "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "config": {
+            "backend_url": args.backend_url or "spawned",
+            "ollama_url": args.ollama_url or "fake",
+            "fake_latency_ms": args.latency_ms,
+            "fake_tokens_per_s": args.tokens_per_s,
+            "requests": args.requests,
+            "warmup": args.warmup,
+        },
+        "results": results,
+    }
+
+    output = args.output
+    if output is None:
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        output = _RESULTS_DIR / f"backend_{stamp}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"\n[OK] Results --> {output}")
+
+    if args.baseline is not None:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        failures = compare_to_baseline(results, baseline, args.max_regression)
+        if failures:
+            for message in failures:
+                print(f"[FAIL] Regression: {message}")
+            sys.exit(1)
+        print(f"[OK] No regression beyond {args.max_regression:.0%} vs. {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
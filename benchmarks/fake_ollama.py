@@ -0,0 +1,164 @@
+"""Local stand-in for the Ollama REST API.
+
+Implements just enough of Ollama for the backend benchmarks:
+
+- ``GET  /api/tags``      -- lists the configured models
+- ``POST /api/generate``  -- streaming (NDJSON, Ollama's default) and
+                            non-streaming responses
+
+Latency before the first token and the token rate are configurable, so
+benchmark numbers measure the backend itself rather than a GPU.
+
+Start with:
+    python -m benchmarks.fake_ollama --port 11435 --latency-ms 20 --tokens-per-s 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import re
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator
+
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
+
+DEFAULT_MODEL = "sw-semantic-7b"
+
+DEFAULT_RESPONSE = (
+    "This creates a 20 mm circle on the Front Plane and extrudes it 10 mm.\n\n"
+    "```csharp\n"
+    "ModelDoc2 swModel = (ModelDoc2)swApp.ActiveDoc;\n"
+    "swModel.Extension.SelectByID2(\"Front Plane\", \"PLANE\", 0, 0, 0, false, 0, null, 0);\n"
+    "swModel.SketchManager.InsertSketch(true);\n"
+    "swModel.SketchManager.CreateCircleByRadius(0, 0, 0, 0.010);\n"
+    "swModel.SketchManager.InsertSketch(true);\n"
+    "Feature feat = swModel.FeatureManager.FeatureExtrusion3(\n"
+    "    true, false, false, 0, 0, 0.010, 0, false, false, false, false,\n"
+    "    0, 0, false, false, false, false, true, true, true, 0, 0, false);\n"
+    "```\n"
+)
+
+_TOKEN_RE = re.compile(r"\S+\s*|\s+")
+
+
+@dataclass
+class FakeOllamaConfig:
+    """Behaviour of the fake server.
+
+    Attributes:
+        latency_ms: Delay before the first token (model load / prompt eval).
+        tokens_per_s: Generation rate; ``0`` emits all tokens at once.
+        models: Model names reported by ``/api/tags``.
+        response_text: Text every ``/api/generate`` call produces.
+    """
+
+    latency_ms: float = 20.0
+    tokens_per_s: float = 2000.0
+    models: tuple[str, ...] = (DEFAULT_MODEL,)
+    response_text: str = DEFAULT_RESPONSE
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def create_app(config: FakeOllamaConfig) -> FastAPI:
+    """Build the fake Ollama ASGI application for *config*."""
+    app = FastAPI(title="Fake Ollama")
+    tokens = _TOKEN_RE.findall(config.response_text)
+    token_delay = 1.0 / config.tokens_per_s if config.tokens_per_s > 0 else 0.0
+    first_token_delay = config.latency_ms / 1000.0
+
+    def _final(model: str, prompt: str, started: int, response: str) -> dict[str, Any]:
+        return {
+            "model": model,
+            "created_at": _now(),
+            "response": response,
+            "done": True,
+            "done_reason": "stop",
+            "total_duration": time.perf_counter_ns() - started,
+            "prompt_eval_count": len(prompt.split()),
+            "eval_count": len(tokens),
+        }
+
+    @app.get("/api/tags")
+    async def tags() -> dict[str, Any]:
+        return {
+            "models": [
+                {
+                    "name": name,
+                    "model": name,
+                    "modified_at": _now(),
+                    "size": 0,
+                    "digest": "",
+                    "details": {"format": "gguf", "family": "fake"},
+                }
+                for name in config.models
+            ]
+        }
+
+    @app.post("/api/generate")
+    async def generate(request: Request) -> Any:
+        body = await request.json()
+        model = body.get("model") or config.models[0]
+        prompt = body.get("prompt", "")
+        started = time.perf_counter_ns()
+
+        if not body.get("stream", True):
+            await asyncio.sleep(first_token_delay + len(tokens) * token_delay)
+            return _final(model, prompt, started, config.response_text)
+
+        async def chunks() -> AsyncIterator[str]:
+            await asyncio.sleep(first_token_delay)
+            for token in tokens:
+                if token_delay:
+                    await asyncio.sleep(token_delay)
+                yield json.dumps({
+                    "model": model,
+                    "created_at": _now(),
+                    "response": token,
+                    "done": False,
+                }) + "\n"
+            yield json.dumps(_final(model, prompt, started, "")) + "\n"
+
+        return StreamingResponse(chunks(), media_type="application/x-ndjson")
+
+    return app
+
+
+def main() -> None:
+    """Parse arguments and serve the fake Ollama API."""
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Fake Ollama server for benchmarks")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=11435)
+    parser.add_argument(
+        "--latency-ms", type=float, default=20.0,
+        help="Delay before the first token (default: 20)",
+    )
+    parser.add_argument(
+        "--tokens-per-s", type=float, default=2000.0,
+        help="Token generation rate, 0 for instant (default: 2000)",
+    )
+    parser.add_argument(
+        "--model", nargs="+", default=[DEFAULT_MODEL],
+        help=f"Model names reported by /api/tags (default: {DEFAULT_MODEL})",
+    )
+    args = parser.parse_args()
+
+    config = FakeOllamaConfig(
+        latency_ms=args.latency_ms,
+        tokens_per_s=args.tokens_per_s,
+        models=tuple(args.model),
+    )
+    uvicorn.run(create_app(config), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,232 @@
+"""Benchmark of the precompiled code templates against per-pair dedent.
+
+The training generators used to render every pair with
+``textwrap.dedent(f\"\"\"...\"\"\")``.  This harness runs the migrated
+pipeline stages once while recording every ``CodeTemplate.render`` call,
+then replays the recorded values three ways:
+
+    dedent   textwrap.dedent(source.format_map(values)) -- the old cost
+    render   CodeTemplate.render(values), one call per pair
+    batch    CodeTemplate.render_batch(columns), one call per template
+
+and checks that all three produce identical text.  It then times the
+stages end to end, once as they run now and once with every template
+forced through the dedent path.
+
+Examples:
+    python -m benchmarks.template_bench
+    python -m benchmarks.template_bench --stages gdt sketch --repeat 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+import textwrap
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+_RESULTS_DIR = _PROJECT_ROOT / "benchmarks" / "results"
+
+if str(_PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(_PROJECT_ROOT))
+
+from training_pipeline.code_templates import CodeTemplate  # noqa: E402
+from training_pipeline.run_pipeline import TrainingPipeline  # noqa: E402
+from training_pipeline.stages import select_stages  # noqa: E402
+
+# Stages whose generators were migrated to CodeTemplate
+DEFAULT_STAGES = ["gdt", "sketch", "combined", "feature_code"]
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+@contextmanager
+def _patched_render(replacement: Callable[..., str]) -> Iterator[None]:
+    original = CodeTemplate.render
+    CodeTemplate.render = replacement
+    try:
+        yield
+    finally:
+        CodeTemplate.render = original
+
+
+def _best_of(func: Callable[[], Any], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def record_calls(
+    pipeline: TrainingPipeline, stage_names: list[str]
+) -> dict[CodeTemplate, list[dict[str, Any]]]:
+    """Run the stages once and return the values each template rendered."""
+    calls: dict[CodeTemplate, list[dict[str, Any]]] = defaultdict(list)
+    original = CodeTemplate.render
+
+    def recording(self: CodeTemplate, values: Any) -> str:
+        calls[self].append({name: values[name] for name in self.fields})
+        return original(self, values)
+
+    with _patched_render(recording):
+        for spec in select_stages(stage_names, None):
+            spec.run(pipeline)
+    return calls
+
+
+def _template_label(template: CodeTemplate) -> str:
+    for module_name in (
+        "training_pipeline.run_pipeline",
+        "training_pipeline.generators.gdt_code_generator",
+        "training_pipeline.generators.sketch_code_generator",
+        "training_pipeline.generators.feature_code_generator",
+    ):
+        module = sys.modules.get(module_name)
+        for name, value in vars(module or object()).items():
+            if value is template:
+                return name
+    return repr(template)
+
+
+# ---------------------------------------------------------------------------
+# Benchmarks
+# ---------------------------------------------------------------------------
+
+def bench_templates(
+    calls: dict[CodeTemplate, list[dict[str, Any]]], repeat: int
+) -> list[dict[str, Any]]:
+    """Time dedent / render / render_batch over the recorded values."""
+    results = []
+    for template, rows in calls.items():
+        columns = {name: [row[name] for row in rows] for name in template.fields}
+        source = template.source
+
+        def dedent() -> list[str]:
+            return [textwrap.dedent(source.format_map(row)) for row in rows]
+
+        def render() -> list[str]:
+            return [template.render(row) for row in rows]
+
+        def batch() -> list[str]:
+            return template.render_batch(columns)
+
+        expected = dedent()
+        if render() != expected or batch() != expected:
+            raise AssertionError(f"{_template_label(template)}: output differs from dedent")
+
+        timings = {name: _best_of(func, repeat) for name, func in
+                   (("dedent", dedent), ("render", render), ("batch", batch))}
+        results.append({
+            "template": _template_label(template),
+            "renders": len(rows),
+            **{f"{name}_ms": seconds * 1000.0 for name, seconds in timings.items()},
+            "speedup": timings["dedent"] / timings["batch"] if timings["batch"] else None,
+        })
+    return results
+
+
+def bench_stages(
+    pipeline: TrainingPipeline, stage_names: list[str], repeat: int
+) -> list[dict[str, Any]]:
+    """Time each stage as is and with every template forced through dedent."""
+    results = []
+    for spec in select_stages(stage_names, None):
+        compiled = _best_of(lambda: spec.run(pipeline), repeat)
+        with _patched_render(CodeTemplate._slow):
+            dedent = _best_of(lambda: spec.run(pipeline), repeat)
+        results.append({
+            "stage": spec.name,
+            "pairs": len(spec.run(pipeline)),
+            "dedent_ms": dedent * 1000.0,
+            "compiled_ms": compiled * 1000.0,
+            "speedup": dedent / compiled if compiled else None,
+        })
+    return results
+
+
+# ---------------------------------------------------------------------------
+# Entry point
+# ---------------------------------------------------------------------------
+
+def main() -> None:
+    """Parse arguments, run the benchmarks and write the JSON report."""
+    parser = argparse.ArgumentParser(
+        description="Precompiled code templates vs. per-pair textwrap.dedent",
+    )
+    parser.add_argument(
+        "--stages", nargs="+", default=DEFAULT_STAGES,
+        help=f"Pipeline stages to run (default: {' '.join(DEFAULT_STAGES)})",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=10,
+        help="Timed repetitions; the best one is reported (default: 10)",
+    )
+    parser.add_argument(
+        "--output", type=Path, default=None,
+        help="JSON report path (default: benchmarks/results/templates_<timestamp>.json)",
+    )
+    args = parser.parse_args()
+
+    pipeline = TrainingPipeline()
+    calls = record_calls(pipeline, args.stages)
+    if not calls:
+        print("[FAIL] The selected stages render no code templates")
+        sys.exit(1)
+
+    templates = bench_templates(calls, args.repeat)
+    print(
+        f"\n  {'Template':<28} {'Renders':>8} {'dedent ms':>10} "
+        f"{'render ms':>10} {'batch ms':>9} {'Speedup':>8}"
+    )
+    print("  " + "-" * 78)
+    for r in templates:
+        print(
+            f"  {r['template']:<28} {r['renders']:>8} {r['dedent_ms']:>10.2f} "
+            f"{r['render_ms']:>10.2f} {r['batch_ms']:>9.2f} {r['speedup']:>7.1f}x"
+        )
+
+    stages = bench_stages(pipeline, args.stages, args.repeat)
+    print(
+        f"\n  {'Stage':<28} {'Pairs':>8} {'dedent ms':>10} "
+        f"{'compiled ms':>12} {'Speedup':>8}"
+    )
+    print("  " + "-" * 70)
+    for r in stages:
+        print(
+            f"  {r['stage']:<28} {r['pairs']:>8} {r['dedent_ms']:>10.2f} "
+            f"{r['compiled_ms']:>12.2f} {r['speedup']:>7.1f}x"
+        )
+
+    report = {
+        "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "config": {"stages": args.stages, "repeat": args.repeat},
+        "templates": templates,
+        "stages": stages,
+    }
+
+    output: Optional[Path] = args.output
+    if output is None:
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        output = _RESULTS_DIR / f"templates_{stamp}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"\n[OK] Results --> {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+# Engineering analysis engines (tolerances, fits, machine elements)
@@ -0,0 +1,272 @@
+"""BOM roll-up and mass-property aggregation over an exported assembly tree.
+
+The add-in exports one node per component instance (parts and
+sub-assemblies) with its parent, quantity, placement in the parent
+(``Transform2.ArrayData``), and for parts the mass, center of mass and
+inertia tensor about that center of mass in the part's own axes.
+
+``AssemblyTree`` stores the tree as flat NumPy arrays in breadth-first
+order (every parent precedes its children) and rolls everything up level
+by level with ``np.bincount``:
+
+- effective quantity of every node (product of quantities up the path),
+- flattened BOM quantities per part number,
+- mass, center of mass and inertia of every sub-tree, in root axes.
+
+All roll-up terms are sums (mass, first moment, second moment about the
+root origin), so changing one part only adds a delta to the part and its
+ancestors -- ``update_node`` touches ``depth`` rows, not the whole tree.
+
+Units follow the export (SolidWorks system units: kg, m, kg*m^2).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Optional, Sequence
+
+import numpy as np
+
+_EYE = np.eye(3)
+_ZERO9 = (0.0,) * 9
+_IDENTITY12 = (1.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0)
+
+
+@dataclass
+class BomNode:
+    """One exported component instance.
+
+    Attributes:
+        id: Unique instance id (e.g. the component name ``"Bracket-1"``).
+        parent: Parent instance id; ``None`` for the root assembly.
+        part_number: BOM part number (file name or ``PartNo`` property).
+        quantity: Identical instances this node stands for.
+        mass: Own mass (0 for assemblies, which roll up their children).
+        center_of_mass: Own center of mass in the node's coordinates.
+        inertia: 3x3 inertia about the own center of mass, node axes.
+        transform: Placement in the parent (ArrayData, 12 or 16 values).
+        properties: Custom properties (description, material, ...).
+    """
+
+    id: str
+    parent: Optional[str] = None
+    part_number: str = ""
+    quantity: float = 1.0
+    mass: float = 0.0
+    center_of_mass: Sequence[float] = (0.0, 0.0, 0.0)
+    inertia: Optional[Sequence[float]] = None
+    transform: Optional[Sequence[float]] = None
+    properties: dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class MassProperties:
+    """Rolled-up mass properties of a sub-tree (root axes)."""
+
+    mass: float
+    center_of_mass: list[float]
+    inertia: list[list[float]]  # about center_of_mass
+
+
+class AssemblyTree:
+    """Array-backed assembly tree with vectorised and incremental roll-ups.
+
+    Args:
+        nodes: Exported instances in any order; exactly one root.
+
+    Raises:
+        ValueError: Duplicate ids, unknown parents, cycles or no/multiple roots.
+    """
+
+    def __init__(self, nodes: Sequence[BomNode]) -> None:
+        if not nodes:
+            raise ValueError("An assembly tree needs at least one node.")
+        by_id: dict[str, int] = {}
+        for i, node in enumerate(nodes):
+            if node.id in by_id:
+                raise ValueError(f"Duplicate node id '{node.id}'.")
+            by_id[node.id] = i
+
+        roots = [i for i, node in enumerate(nodes) if node.parent is None]
+        if len(roots) != 1:
+            raise ValueError(f"Expected exactly one root node, found {len(roots)}.")
+
+        children: list[list[int]] = [[] for _ in nodes]
+        for i, node in enumerate(nodes):
+            if node.parent is not None:
+                if node.parent not in by_id:
+                    raise ValueError(f"Node '{node.id}' has unknown parent '{node.parent}'.")
+                children[by_id[node.parent]].append(i)
+
+        # Breadth-first order: parents before children, levels contiguous
+        order = [roots[0]]
+        depth_of = {roots[0]: 0}
+        for i in order:
+            for c in children[i]:
+                depth_of[c] = depth_of[i] + 1
+                order.append(c)
+        if len(order) != len(nodes):
+            raise ValueError("Assembly tree contains a cycle or disconnected nodes.")
+
+        self.nodes = [nodes[i] for i in order]
+        self.index = {node.id: k for k, node in enumerate(self.nodes)}
+        n = len(self.nodes)
+
+        self.parent = np.array(
+            [-1 if node.parent is None else self.index[node.parent] for node in self.nodes],
+            dtype=np.int64,
+        )
+        self.depth = np.array([depth_of[i] for i in order], dtype=np.int64)
+        self.is_leaf = np.bincount(self.parent[1:], minlength=n) == 0
+        self._levels = [np.flatnonzero(self.depth == d) for d in range(int(self.depth.max()) + 1)]
+
+        self.quantity = np.array([float(node.quantity) for node in self.nodes])
+        self.mass = np.array([float(node.mass) for node in self.nodes])
+        self.local_com = np.array([node.center_of_mass for node in self.nodes], dtype=float)
+        self.local_inertia = np.array(
+            [_ZERO9 if node.inertia is None else node.inertia for node in self.nodes],
+            dtype=float,
+        ).reshape(n, 3, 3)
+        rotation, translation = _parse_transforms([node.transform for node in self.nodes])
+
+        # World placement and effective quantity, top-down by level
+        self.world_rotation = rotation.copy()
+        self.world_translation = translation.copy()
+        self.effective_quantity = self.quantity.copy()
+        for level in self._levels[1:]:
+            p = self.parent[level]
+            # Row-vector convention: world = local . R + t
+            self.world_rotation[level] = rotation[level] @ self.world_rotation[p]
+            self.world_translation[level] = (
+                np.einsum("ni,nij->nj", translation[level], self.world_rotation[p])
+                + self.world_translation[p]
+            )
+            self.effective_quantity[level] *= self.effective_quantity[p]
+
+        self._own = self._contributions(np.arange(n))
+        self._rollup = self._accumulate(self._own)
+
+    # ------------------------------------------------------------------
+    # Roll-up
+    # ------------------------------------------------------------------
+
+    def _contributions(self, rows: np.ndarray) -> np.ndarray:
+        """Own additive terms per row: [mass, m*c (3), I about origin (9)]."""
+        q = self.effective_quantity[rows]
+        m = self.mass[rows] * q
+        R = self.world_rotation[rows]
+        c = np.einsum("ni,nij->nj", self.local_com[rows], R) + self.world_translation[rows]
+        # Column-vector rotation is R^T: I_world = R^T I R
+        I_com = (R.transpose(0, 2, 1) @ self.local_inertia[rows] @ R) * q[:, None, None]
+        parallel = m[:, None, None] * (
+            np.einsum("ni,ni->n", c, c)[:, None, None] * _EYE - c[:, :, None] * c[:, None, :]
+        )
+        terms = np.empty((len(rows), 13))
+        terms[:, 0] = m
+        terms[:, 1:4] = m[:, None] * c
+        terms[:, 4:] = (I_com + parallel).reshape(-1, 9)
+        return terms
+
+    def _accumulate(self, own: np.ndarray) -> np.ndarray:
+        """Sub-tree sums, bottom-up by level."""
+        total = own.copy()
+        n = len(total)
+        for level in reversed(self._levels[1:]):
+            parents = self.parent[level]
+            for col in range(total.shape[1]):
+                total[:, col] += np.bincount(parents, weights=total[level, col], minlength=n)
+        return total
+
+    def mass_properties(self, node_id: Optional[str] = None) -> MassProperties:
+        """Rolled-up mass properties of *node_id* (default: the whole assembly)."""
+        row = 0 if node_id is None else self.index[node_id]
+        return _to_mass_properties(self._rollup[row])
+
+    def subtree_masses(self) -> np.ndarray:
+        """Rolled-up mass of every node (breadth-first order)."""
+        return self._rollup[:, 0].copy()
+
+    def update_node(
+        self,
+        node_id: str,
+        mass: Optional[float] = None,
+        center_of_mass: Optional[Sequence[float]] = None,
+        inertia: Optional[Sequence[float]] = None,
+    ) -> MassProperties:
+        """Change one node's own mass properties and update its ancestors only.
+
+        Returns the new whole-assembly mass properties.
+        """
+        row = self.index[node_id]
+        if mass is not None:
+            self.mass[row] = float(mass)
+        if center_of_mass is not None:
+            self.local_com[row] = np.asarray(center_of_mass, dtype=float)
+        if inertia is not None:
+            self.local_inertia[row] = np.reshape(np.asarray(inertia, dtype=float), (3, 3))
+
+        new = self._contributions(np.array([row]))[0]
+        delta = new - self._own[row]
+        self._own[row] = new
+
+        path = [row]
+        while self.parent[path[-1]] >= 0:
+            path.append(int(self.parent[path[-1]]))
+        self._rollup[path] += delta
+        return self.mass_properties()
+
+    # ------------------------------------------------------------------
+    # BOM
+    # ------------------------------------------------------------------
+
+    def flattened_bom(self, parts_only: bool = True) -> list[dict[str, Any]]:
+        """Total quantity per part number, in first-occurrence order.
+
+        Args:
+            parts_only: Count leaf nodes only (a "parts only" BOM);
+                        otherwise sub-assemblies are listed too.
+        """
+        rows = np.flatnonzero(self.is_leaf) if parts_only else np.arange(1, len(self.nodes))
+        numbers = [self.nodes[r].part_number or self.nodes[r].id for r in rows]
+        keys, first, codes = np.unique(numbers, return_index=True, return_inverse=True)
+        quantity = np.bincount(codes, weights=self.effective_quantity[rows], minlength=len(keys))
+        total_mass = np.bincount(codes, weights=self._rollup[rows, 0], minlength=len(keys))
+
+        bom = []
+        for k in np.argsort(first, kind="stable"):
+            row = rows[first[k]]
+            unit = self.effective_quantity[row]
+            bom.append({
+                "part_number": str(keys[k]),
+                "quantity": float(quantity[k]),
+                "unit_mass": float(self._rollup[row, 0] / unit) if unit else 0.0,
+                "total_mass": float(total_mass[k]),
+                "properties": dict(self.nodes[row].properties),
+            })
+        return bom
+
+
+def _to_mass_properties(terms: np.ndarray) -> MassProperties:
+    mass = float(terms[0])
+    if mass <= 0:
+        return MassProperties(0.0, [0.0, 0.0, 0.0], np.zeros((3, 3)).tolist())
+    c = terms[1:4] / mass
+    I_origin = terms[4:].reshape(3, 3)
+    I_com = I_origin - mass * (np.dot(c, c) * _EYE - np.outer(c, c))
+    return MassProperties(mass, c.tolist(), I_com.tolist())
+
+
+def _parse_transforms(
+    transforms: Sequence[Optional[Sequence[float]]],
+) -> tuple[np.ndarray, np.ndarray]:
+    """Rotation (n, 3, 3) and translation (n, 3) from ArrayData lists."""
+    rows = []
+    for xform in transforms:
+        if xform is None:
+            rows.append(_IDENTITY12)
+        elif len(xform) in (12, 16):
+            rows.append(xform[:12])
+        else:
+            raise ValueError("transform needs 12 or 16 ArrayData values.")
+    data = np.array(rows, dtype=float)
+    return data[:, :9].reshape(-1, 3, 3), data[:, 9:12].copy()
@@ -0,0 +1,248 @@
+"""Broad-phase clearance / interference precheck.
+
+Takes the bounding boxes the add-in exports for every component and
+returns the component pairs that *may* be closer than a clearance
+threshold, so SolidWorks' exact ``ToolsCheckInterference`` / Measure
+checks only run on those pairs.
+
+Each component is a box in its own coordinate system (``box_min`` /
+``box_max``, e.g. from ``IBody2.GetBodyBox``) placed by its
+``Component2.Transform2.ArrayData``.  ArrayData uses SolidWorks' row-vector
+convention: elements 0-8 are the rotation rows, 9-11 the translation and
+12 the scale, so ``world = local . R * scale + t``.  Boxes that are
+already in assembly space (``Component2.GetBox``) use the identity
+transform.
+
+The search runs in two phases:
+
+1. **Sweep and prune** on the world-space AABBs (inflated by the
+   clearance) along the axis with the largest spread -- one sort plus a
+   ``searchsorted`` per chunk, near-linear for real assemblies.
+2. **OBB separating-axis test** (15 axes) on the surviving pairs,
+   vectorised; pairs separated by more than the clearance on any axis are
+   dropped.
+
+The reported distance is a lower bound on the true body distance (0 for
+overlapping boxes).  Units follow the input (SolidWorks exports metres).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Optional, Sequence
+
+import numpy as np
+
+# Binary record: 16 ArrayData values + box_min (3) + box_max (3), float64 LE
+RECORD_FLOATS = 22
+RECORD_DTYPE = np.dtype("<f8")
+
+IDENTITY_TRANSFORM = (1.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0)
+
+# Boxes swept per chunk in phase 1 (bounds the temporary pair arrays)
+_SWEEP_CHUNK = 4096
+
+
+@dataclass
+class BoxSet:
+    """Oriented boxes in world space.
+
+    Attributes:
+        names: Component names (index order).
+        center: World-space box centres, shape ``(n, 3)``.
+        axes: Box axes as rows, shape ``(n, 3, 3)`` (orthonormal).
+        half: Half extents along the axes, shape ``(n, 3)``.
+    """
+
+    names: list[str]
+    center: np.ndarray
+    axes: np.ndarray
+    half: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @classmethod
+    def from_arrays(
+        cls,
+        transforms: np.ndarray,
+        box_min: np.ndarray,
+        box_max: np.ndarray,
+        names: Optional[Sequence[str]] = None,
+    ) -> BoxSet:
+        """Build from ``(n, 16)`` ArrayData and ``(n, 3)`` local corners."""
+        transforms = np.asarray(transforms, dtype=float).reshape(-1, 16)
+        box_min = np.asarray(box_min, dtype=float).reshape(-1, 3)
+        box_max = np.asarray(box_max, dtype=float).reshape(-1, 3)
+        n = len(transforms)
+        if len(box_min) != n or len(box_max) != n:
+            raise ValueError("transforms, box_min and box_max must have the same length.")
+        if np.any(box_max < box_min):
+            raise ValueError("box_max must be >= box_min on every axis.")
+
+        rotation = transforms[:, :9].reshape(n, 3, 3)
+        translation = transforms[:, 9:12]
+        scale = transforms[:, 12:13]
+        scale = np.where(scale == 0, 1.0, scale)
+
+        local_center = (box_min + box_max) / 2.0
+        center = np.einsum("ni,nij->nj", local_center, rotation) * scale + translation
+        # Rows of R are the images of the local axes; normalise defensively
+        norms = np.linalg.norm(rotation, axis=2, keepdims=True)
+        axes = rotation / np.where(norms == 0, 1.0, norms)
+        half = (box_max - box_min) / 2.0 * norms[:, :, 0] * scale
+
+        if names is None:
+            names = [str(i) for i in range(n)]
+        return cls(list(names), center, axes, half)
+
+    @classmethod
+    def from_records(cls, components: Sequence[dict[str, Any]]) -> BoxSet:
+        """Build from dicts with ``name``, ``box_min``, ``box_max`` and
+        optional ``transform`` (12 or 16 ArrayData values)."""
+        transforms = np.empty((len(components), 16))
+        for i, comp in enumerate(components):
+            xform = comp.get("transform") or IDENTITY_TRANSFORM
+            if len(xform) == 12:
+                xform = (*xform, 1.0, 0.0, 0.0, 0.0)
+            if len(xform) != 16:
+                raise ValueError(
+                    f"Component {comp.get('name', i)!r}: transform needs 12 or 16 values."
+                )
+            transforms[i] = xform
+        return cls.from_arrays(
+            transforms,
+            [c["box_min"] for c in components],
+            [c["box_max"] for c in components],
+            [c.get("name") or str(i) for i, c in enumerate(components)],
+        )
+
+    @classmethod
+    def from_buffer(cls, data: bytes, names: Optional[Sequence[str]] = None) -> BoxSet:
+        """Build from packed little-endian float64 records of ``RECORD_FLOATS``."""
+        if len(data) % (RECORD_FLOATS * RECORD_DTYPE.itemsize):
+            raise ValueError(
+                f"Buffer length {len(data)} is not a multiple of "
+                f"{RECORD_FLOATS * RECORD_DTYPE.itemsize} bytes."
+            )
+        records = np.frombuffer(data, dtype=RECORD_DTYPE).reshape(-1, RECORD_FLOATS)
+        return cls.from_arrays(records[:, :16], records[:, 16:19], records[:, 19:22], names)
+
+    def world_aabbs(self) -> tuple[np.ndarray, np.ndarray]:
+        """World-space AABB ``(lo, hi)`` of every box."""
+        extent = np.einsum("nj,nji->ni", self.half, np.abs(self.axes))
+        return self.center - extent, self.center + extent
+
+
+@dataclass
+class BroadPhaseResult:
+    """Candidate pairs for exact checking.
+
+    Attributes:
+        pairs: Component index pairs ``(i, j)`` with ``i < j``, shape ``(k, 2)``.
+        distance: Lower bound of the separation of each pair.
+        aabb_pairs: Pairs that survived sweep and prune (before the OBB test).
+    """
+
+    pairs: np.ndarray
+    distance: np.ndarray
+    aabb_pairs: int
+
+
+def broad_phase(
+    boxes: BoxSet,
+    clearance: float = 0.0,
+    refine_obb: bool = True,
+) -> BroadPhaseResult:
+    """Pairs of *boxes* that may be within *clearance* of each other."""
+    if clearance < 0:
+        raise ValueError("clearance must be >= 0.")
+    n = len(boxes)
+    empty = BroadPhaseResult(np.empty((0, 2), dtype=np.int64), np.empty(0), 0)
+    if n < 2:
+        return empty
+
+    lo, hi = boxes.world_aabbs()
+    i, j = _sweep_and_prune(lo, hi, clearance)
+    gap = np.maximum(np.maximum(lo[j] - hi[i], lo[i] - hi[j]), 0.0)
+    distance = np.sqrt(np.einsum("ij,ij->i", gap, gap))
+    keep = distance <= clearance
+    i, j, distance = i[keep], j[keep], distance[keep]
+    aabb_pairs = len(i)
+
+    if refine_obb and len(i):
+        separation = _obb_separation(boxes, i, j)
+        keep = separation <= clearance
+        i, j = i[keep], j[keep]
+        distance = np.maximum(distance[keep], separation[keep])
+
+    a, b = np.minimum(i, j), np.maximum(i, j)
+    order = np.lexsort((b, a))
+    return BroadPhaseResult(
+        pairs=np.stack([a[order], b[order]], axis=1),
+        distance=distance[order],
+        aabb_pairs=aabb_pairs,
+    )
+
+
+def _sweep_and_prune(
+    lo: np.ndarray,
+    hi: np.ndarray,
+    clearance: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Index pairs whose inflated AABBs overlap on all three axes."""
+    axis = int(np.argmax(np.var(lo + hi, axis=0)))
+    order = np.argsort(lo[:, axis], kind="stable")
+    starts = lo[order, axis]
+    # Box k overlaps every later box whose start is <= its end + clearance
+    ends = np.searchsorted(starts, hi[order, axis] + clearance, side="right")
+
+    other = [a for a in range(3) if a != axis]
+    lo_o, hi_o = lo[order][:, other], hi[order][:, other]
+
+    found_i: list[np.ndarray] = []
+    found_j: list[np.ndarray] = []
+    for start in range(0, len(order), _SWEEP_CHUNK):
+        rows = np.arange(start, min(start + _SWEEP_CHUNK, len(order)))
+        counts = ends[rows] - rows - 1
+        counts = np.maximum(counts, 0)
+        if not counts.sum():
+            continue
+        ii = np.repeat(rows, counts)
+        # j runs from row + 1 to ends[row] - 1 for each row
+        offsets = np.arange(len(ii)) - np.repeat(np.cumsum(counts) - counts, counts)
+        jj = ii + 1 + offsets
+        overlap = np.all(
+            (lo_o[jj] <= hi_o[ii] + clearance) & (lo_o[ii] <= hi_o[jj] + clearance),
+            axis=1,
+        )
+        found_i.append(order[ii[overlap]])
+        found_j.append(order[jj[overlap]])
+
+    if not found_i:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    return np.concatenate(found_i), np.concatenate(found_j)
+
+
+def _obb_separation(boxes: BoxSet, i: np.ndarray, j: np.ndarray) -> np.ndarray:
+    """Largest separating-axis gap between OBB pairs (<= 0 if overlapping).
+
+    Tests the 3 + 3 face normals and 9 edge cross products; the gap along
+    any unit axis is a lower bound on the distance between the boxes.
+    """
+    a_axes, b_axes = boxes.axes[i], boxes.axes[j]
+    a_half, b_half = boxes.half[i], boxes.half[j]
+    t = boxes.center[j] - boxes.center[i]
+
+    cross = np.cross(a_axes[:, :, None, :], b_axes[:, None, :, :]).reshape(-1, 9, 3)
+    axes = np.concatenate([a_axes, b_axes, cross], axis=1)
+    norms = np.linalg.norm(axes, axis=2)
+    # Parallel edges give degenerate cross products; skip those axes
+    valid = norms > 1e-9
+    axes = axes / np.where(valid, norms, 1.0)[:, :, None]
+
+    ra = np.einsum("nk,nkm->nm", a_half, np.abs(np.einsum("nkd,nmd->nkm", a_axes, axes)))
+    rb = np.einsum("nk,nkm->nm", b_half, np.abs(np.einsum("nkd,nmd->nkm", b_axes, axes)))
+    gap = np.abs(np.einsum("nd,nmd->nm", t, axes)) - ra - rb
+    gap = np.where(valid, gap, -np.inf)
+    return np.maximum(gap.max(axis=1), 0.0)
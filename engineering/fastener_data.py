@@ -0,0 +1,255 @@
+"""Indexed fastener and Hole Wizard size data.
+
+Compiles the tables in ``engineering.fastener_tables`` (shared with the
+fastener training generator) into immutable columnar stores: one
+read-only NumPy array per numeric column, a hash index on the
+designation, and a sorted index per numeric column for range queries
+such as "all metric sizes whose counterbore fits in 12 mm"::
+
+    FASTENER_DATA.query_sizes(system="metric", cbore_dia_mm=(None, 12.0))
+
+Missing values (e.g. counterbore data for inch sizes) are NaN and never
+match a range.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from dataclasses import dataclass
+from fractions import Fraction
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
+
+import numpy as np
+
+from engineering.fastener_tables import (
+    CBORE_DEPTH_MM,
+    CBORE_DIA_MM,
+    INCH_SIZES,
+    METRIC_NOMINAL_MM,
+    METRIC_SIZES,
+    TORQUE_NM,
+)
+
+SYSTEMS = ("metric", "inch")
+
+# Numbered machine-screw gauges: major diameter = 0.060 + 0.013 * N inch
+_GAUGE = re.compile(r"^#(\d+)-(\d+)$")
+_FRACTION = re.compile(r"^(\d+(?:/\d+)?)-(\d+)$")
+
+Range = tuple[Optional[float], Optional[float]]
+
+
+def _inch_thread(designation: str) -> tuple[float, int]:
+    """Return (major diameter mm, threads per inch) of a UNC designation."""
+    gauge = _GAUGE.match(designation)
+    if gauge:
+        return (0.060 + 0.013 * int(gauge.group(1))) * 25.4, int(gauge.group(2))
+    fraction = _FRACTION.match(designation)
+    if fraction:
+        return float(Fraction(fraction.group(1))) * 25.4, int(fraction.group(2))
+    raise ValueError(f"Unrecognised inch thread designation: '{designation}'")
+
+
+def _hash_index(values: tuple[str, ...]) -> Mapping[str, tuple[int, ...]]:
+    index: dict[str, list[int]] = {}
+    for row, value in enumerate(values):
+        index.setdefault(value, []).append(row)
+    return MappingProxyType({k: tuple(v) for k, v in index.items()})
+
+
+def _frozen(values: list[float]) -> np.ndarray:
+    array = np.array(values, dtype=float)
+    array.flags.writeable = False
+    return array
+
+
+class ColumnStore:
+    """Immutable table with a key index and sorted numeric indexes.
+
+    Args:
+        key: Name of the key column.
+        keys: Key values, one per row (need not be unique).
+        text: Extra string columns.
+        numeric: Numeric columns (NaN for missing values).
+    """
+
+    def __init__(
+        self,
+        key: str,
+        keys: list[str],
+        text: Mapping[str, list[str]],
+        numeric: Mapping[str, list[float]],
+    ) -> None:
+        self.key = key
+        self.keys = tuple(keys)
+        self.text = MappingProxyType({name: tuple(col) for name, col in text.items()})
+        self.numeric = MappingProxyType({name: _frozen(col) for name, col in numeric.items()})
+
+        # Hash index on the key and every text column
+        self._hash = MappingProxyType({
+            name: _hash_index(values)
+            for name, values in ((key, self.keys), *self.text.items())
+        })
+
+        # Sorted (values, rows) per numeric column; NaNs sort last and are cut
+        sorted_index = {}
+        for name, column in self.numeric.items():
+            order = np.argsort(column, kind="stable")
+            valid = order[~np.isnan(column[order])]
+            values = column[valid]
+            values.flags.writeable = False
+            valid.flags.writeable = False
+            sorted_index[name] = (values, valid)
+        self._sorted = MappingProxyType(sorted_index)
+        self._records = tuple(self._build_record(row) for row in range(len(self.keys)))
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    @property
+    def columns(self) -> tuple[str, ...]:
+        return (self.key, *self.text, *self.numeric)
+
+    def rows(self, key: str) -> tuple[int, ...]:
+        """Row numbers for *key* (empty if unknown)."""
+        return self._hash[self.key].get(key, ())
+
+    def record(self, row: int) -> dict[str, Any]:
+        """Row *row* as a dict (NaN becomes ``None``); a fresh copy each call."""
+        return dict(self._records[row])
+
+    def range_rows(self, column: str, low: Optional[float], high: Optional[float]) -> np.ndarray:
+        """Rows with ``low <= column <= high`` (either bound may be ``None``)."""
+        if column not in self._sorted:
+            raise KeyError(f"Unknown numeric column '{column}'. Valid: {', '.join(self.numeric)}")
+        values, rows = self._sorted[column]
+        start = 0 if low is None else int(np.searchsorted(values, low, side="left"))
+        stop = len(values) if high is None else int(np.searchsorted(values, high, side="right"))
+        return rows[start:stop]
+
+    def query(self, ranges: Mapping[str, Range], **equals: Optional[str]) -> list[int]:
+        """Row numbers matching every numeric range and text equality.
+
+        Args:
+            ranges: Column -> ``(low, high)`` inclusive bounds.
+            **equals: Text column (or the key column) -> required value;
+                      ``None`` values are ignored.
+        """
+        selected: Optional[set[int]] = None
+        for column, (low, high) in ranges.items():
+            if low is None and high is None:
+                continue
+            rows = set(self.range_rows(column, low, high).tolist())
+            selected = rows if selected is None else selected & rows
+        for column, value in equals.items():
+            if value is None:
+                continue
+            if column not in self._hash:
+                raise KeyError(f"Unknown text column '{column}'.")
+            rows = set(self._hash[column].get(value, ()))
+            selected = rows if selected is None else selected & rows
+        if selected is None:
+            return list(range(len(self)))
+        return sorted(selected)
+
+    def _build_record(self, row: int) -> MappingProxyType:
+        data: dict[str, Any] = {self.key: self.keys[row]}
+        for name, column in self.text.items():
+            data[name] = column[row]
+        for name, column in self.numeric.items():
+            value = float(column[row])
+            data[name] = None if math.isnan(value) else value
+        return MappingProxyType(data)
+
+
+@dataclass(frozen=True)
+class FastenerStore:
+    """Fastener sizes and tightening torques."""
+
+    sizes: ColumnStore
+    torques: ColumnStore
+
+    def size(self, designation: str) -> Optional[dict[str, Any]]:
+        """Record for *designation* (e.g. ``"M8"`` or ``"1/4-20"``)."""
+        rows = self.sizes.rows(designation)
+        return self.sizes.record(rows[0]) if rows else None
+
+    def query_sizes(
+        self,
+        system: Optional[str] = None,
+        nominal_mm: Range = (None, None),
+        cbore_dia_mm: Range = (None, None),
+        cbore_depth_mm: Range = (None, None),
+    ) -> list[dict[str, Any]]:
+        """Sizes matching *system* and every inclusive range."""
+        rows = self.sizes.query(
+            {
+                "nominal_mm": nominal_mm,
+                "cbore_dia_mm": cbore_dia_mm,
+                "cbore_depth_mm": cbore_depth_mm,
+            },
+            system=system,
+        )
+        return [self.sizes.record(r) for r in rows]
+
+    def torque(self, size: Optional[str] = None, grade: Optional[str] = None) -> list[dict[str, Any]]:
+        """Torque records, optionally filtered by size and property class."""
+        rows = self.torques.query({}, size=size, grade=grade)
+        return [self.torques.record(r) for r in rows]
+
+
+def build_store() -> FastenerStore:
+    """Compile the fastener tables into a ``FastenerStore``."""
+    designations: list[str] = []
+    systems: list[str] = []
+    nominal: list[float] = []
+    cbore_dia: list[float] = []
+    cbore_depth: list[float] = []
+    tpi: list[float] = []
+
+    for size in METRIC_SIZES:
+        designations.append(size)
+        systems.append("metric")
+        nominal.append(float(METRIC_NOMINAL_MM[size]))
+        cbore_dia.append(float(CBORE_DIA_MM.get(size, math.nan)))
+        cbore_depth.append(float(CBORE_DEPTH_MM.get(size, math.nan)))
+        tpi.append(math.nan)
+
+    for size in INCH_SIZES:
+        major_mm, threads = _inch_thread(size)
+        designations.append(size)
+        systems.append("inch")
+        nominal.append(round(major_mm, 4))
+        cbore_dia.append(math.nan)
+        cbore_depth.append(math.nan)
+        tpi.append(float(threads))
+
+    sizes = ColumnStore(
+        "designation",
+        designations,
+        text={"system": systems},
+        numeric={
+            "nominal_mm": nominal,
+            "cbore_dia_mm": cbore_dia,
+            "cbore_depth_mm": cbore_depth,
+            "threads_per_inch": tpi,
+        },
+    )
+
+    torques = ColumnStore(
+        "size",
+        [size for size, _, _ in TORQUE_NM],
+        text={"grade": [grade for _, grade, _ in TORQUE_NM]},
+        numeric={
+            "torque_dry_nm": [float(nm) for _, _, nm in TORQUE_NM],
+            # K=0.15 vs K=0.2, as in the generator's conceptual pairs
+            "torque_lubricated_nm": [float(int(nm * 0.75)) for _, _, nm in TORQUE_NM],
+            "nominal_mm": [float(METRIC_NOMINAL_MM[size]) for size, _, _ in TORQUE_NM],
+        },
+    )
+    return FastenerStore(sizes=sizes, torques=torques)
+
+
+FASTENER_DATA = build_store()
@@ -0,0 +1,38 @@
+"""Fastener size, counterbore and torque tables.
+
+Shared by the fastener data store (``engineering.fastener_data``) and the
+fastener training generator.  Plain Python data with no dependencies, so
+the generator can import it without pulling in NumPy.  Lengths are in
+millimetres.
+"""
+
+from __future__ import annotations
+
+METRIC_SIZES = ["M3", "M4", "M5", "M6", "M8", "M10", "M12", "M16", "M20"]
+
+INCH_SIZES = ["#4-40", "#6-32", "#8-32", "1/4-20", "5/16-18", "3/8-16", "1/2-13"]
+
+# Nominal (major) diameters of the metric sizes
+METRIC_NOMINAL_MM = {
+    "M3": 3, "M4": 4, "M5": 5, "M6": 6, "M8": 8,
+    "M10": 10, "M12": 12, "M16": 16, "M20": 20,
+}
+
+# Counterbore diameter and depth for socket head cap screws
+CBORE_DIA_MM = {
+    "M3": 6.5, "M4": 8, "M5": 10, "M6": 11, "M8": 14.5,
+    "M10": 17.5, "M12": 20, "M16": 26, "M20": 33,
+}
+
+CBORE_DEPTH_MM = {
+    "M3": 3.5, "M4": 4.5, "M5": 5.5, "M6": 6.5, "M8": 8.5,
+    "M10": 10.5, "M12": 13, "M16": 17, "M20": 21,
+}
+
+# Recommended tightening torque, dry (K=0.2): (size, property class, Nm)
+TORQUE_NM = [
+    ("M6", "8.8", 9.9), ("M8", "8.8", 24), ("M10", "8.8", 47),
+    ("M12", "8.8", 82), ("M16", "8.8", 200), ("M20", "8.8", 390),
+    ("M6", "10.9", 14), ("M8", "10.9", 34), ("M10", "10.9", 67),
+    ("M12", "10.9", 116), ("M16", "10.9", 280), ("M20", "10.9", 550),
+]
@@ -0,0 +1,252 @@
+"""Spur gear geometry over parameter grids.
+
+Standard full-depth involute spur gears (addendum ``1.0 m``, dedendum
+``1.25 m``).  Every function broadcasts over NumPy arrays, so the same code
+computes one gear or a full module x tooth-count x pressure-angle grid::
+
+    g = spur_geometry(2.0, 24, 20.0)
+    g.pitch_dia, g.outside_dia               # 48.0, 52.0
+
+    grid = GearGrid()                        # default module/teeth/angle series
+    grid.pair_candidates(ratio=3.0, center_distance=80.0)
+
+All lengths are in millimetres, angles in degrees.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Any, Optional, Sequence, Union
+
+import numpy as np
+
+ArrayLike = Union[float, Sequence[float], np.ndarray]
+
+ADDENDUM_COEFF = 1.0
+DEDENDUM_COEFF = 1.25
+
+# Default search series (ISO 54 / DIN 780 modules)
+DEFAULT_MODULES = (0.5, 0.75, 1.0, 1.25, 1.5, 2.0, 2.5, 3.0, 4.0, 5.0, 6.0, 8.0, 10.0)
+DEFAULT_TOOTH_COUNTS = tuple(range(12, 121))
+DEFAULT_PRESSURE_ANGLES = (14.5, 20.0, 25.0)
+
+
+@dataclass(frozen=True)
+class GearGeometry:
+    """Geometry of one gear or a broadcast array of gears (mm)."""
+
+    module: np.ndarray
+    teeth: np.ndarray
+    pressure_angle: np.ndarray
+    pitch_dia: np.ndarray
+    base_dia: np.ndarray
+    outside_dia: np.ndarray
+    root_dia: np.ndarray
+
+    def at(self, *index: int) -> dict[str, float]:
+        """Scalar values at *index* (no index for 0-d results)."""
+        return {
+            name: float(np.asarray(getattr(self, name))[index])
+            for name in (
+                "module", "teeth", "pressure_angle",
+                "pitch_dia", "base_dia", "outside_dia", "root_dia",
+            )
+        }
+
+
+def spur_geometry(
+    module: ArrayLike,
+    teeth: ArrayLike,
+    pressure_angle: ArrayLike = 20.0,
+) -> GearGeometry:
+    """Pitch, base, outside and root diameters, broadcasting all inputs."""
+    m, z, pa = np.broadcast_arrays(
+        np.asarray(module, dtype=float),
+        np.asarray(teeth, dtype=float),
+        np.asarray(pressure_angle, dtype=float),
+    )
+    pitch = m * z
+    return GearGeometry(
+        module=m,
+        teeth=z,
+        pressure_angle=pa,
+        pitch_dia=pitch,
+        base_dia=pitch * np.cos(np.radians(pa)),
+        outside_dia=pitch + 2 * (ADDENDUM_COEFF * m),
+        root_dia=pitch - 2 * (DEDENDUM_COEFF * m),
+    )
+
+
+def center_distance(module: ArrayLike, z1: ArrayLike, z2: ArrayLike) -> np.ndarray:
+    """Standard center distance ``m (z1 + z2) / 2`` of an external pair."""
+    m = np.asarray(module, dtype=float)
+    return (m * np.asarray(z1) + m * np.asarray(z2)) / 2.0
+
+
+def contact_ratio(
+    module: ArrayLike,
+    z1: ArrayLike,
+    z2: ArrayLike,
+    pressure_angle: ArrayLike = 20.0,
+) -> np.ndarray:
+    """Transverse contact ratio of an external pair at standard center distance.
+
+    ``(sqrt(ra1^2 - rb1^2) + sqrt(ra2^2 - rb2^2) - a sin(alpha)) / (pi m cos(alpha))``
+    """
+    m = np.asarray(module, dtype=float)
+    alpha = np.radians(np.asarray(pressure_angle, dtype=float))
+    g1 = spur_geometry(m, z1, pressure_angle)
+    g2 = spur_geometry(m, z2, pressure_angle)
+    a = center_distance(m, z1, z2)
+    path = (
+        np.sqrt((g1.outside_dia / 2) ** 2 - (g1.base_dia / 2) ** 2)
+        + np.sqrt((g2.outside_dia / 2) ** 2 - (g2.base_dia / 2) ** 2)
+        - a * np.sin(alpha)
+    )
+    return path / (math.pi * m * np.cos(alpha))
+
+
+def min_teeth_without_undercut(pressure_angle: ArrayLike) -> np.ndarray:
+    """Smallest tooth count cut by a rack without undercut: ``2 / sin^2(alpha)``.
+
+    Rounded up (18 at 20 degrees); the common practical limit of 17 accepts
+    slight undercut.
+    """
+    alpha = np.radians(np.asarray(pressure_angle, dtype=float))
+    return np.ceil(2 * ADDENDUM_COEFF / np.sin(alpha) ** 2 - 1e-9)
+
+
+class GearGrid:
+    """Precomputed gear and gear-pair geometry over module/teeth/angle series.
+
+    Single-gear geometry has shape ``(modules, teeth, angles)``.  The pair
+    table holds every ``pinion <= gear`` combination of equal module and
+    pressure angle, sorted by center distance for windowed searches.
+    """
+
+    def __init__(
+        self,
+        modules: Sequence[float] = DEFAULT_MODULES,
+        tooth_counts: Sequence[int] = DEFAULT_TOOTH_COUNTS,
+        pressure_angles: Sequence[float] = DEFAULT_PRESSURE_ANGLES,
+    ) -> None:
+        self.modules = np.asarray(modules, dtype=float)
+        self.tooth_counts = np.asarray(tooth_counts, dtype=int)
+        self.pressure_angles = np.asarray(pressure_angles, dtype=float)
+        self._module_index = {float(m): i for i, m in enumerate(self.modules)}
+        self._teeth_index = {int(z): i for i, z in enumerate(self.tooth_counts)}
+        self._angle_index = {float(a): i for i, a in enumerate(self.pressure_angles)}
+
+        self.gears = spur_geometry(
+            self.modules[:, None, None],
+            self.tooth_counts[None, :, None],
+            self.pressure_angles[None, None, :],
+        )
+
+    def gear(self, module: float, teeth: int, pressure_angle: float = 20.0) -> dict[str, float]:
+        """Geometry of one grid gear (``KeyError`` if not on the grid)."""
+        return self.gears.at(
+            self._module_index[float(module)],
+            self._teeth_index[int(teeth)],
+            self._angle_index[float(pressure_angle)],
+        )
+
+    @cached_property
+    def pairs(self) -> dict[str, np.ndarray]:
+        """Column arrays of every pair, sorted by center distance."""
+        i1, i2 = np.triu_indices(len(self.tooth_counts))
+        n_m, n_p, n_a = len(self.modules), len(i1), len(self.pressure_angles)
+
+        m = np.repeat(self.modules, n_p * n_a)
+        z1 = np.tile(np.repeat(self.tooth_counts[i1], n_a), n_m)
+        z2 = np.tile(np.repeat(self.tooth_counts[i2], n_a), n_m)
+        pa = np.tile(self.pressure_angles, n_m * n_p)
+
+        cd = center_distance(m, z1, z2)
+        order = np.argsort(cd, kind="stable")
+        columns = {
+            "module": m,
+            "pinion_teeth": z1,
+            "gear_teeth": z2,
+            "pressure_angle": pa,
+            "ratio": z2 / z1,
+            "center_distance": cd,
+            "contact_ratio": contact_ratio(m, z1, z2, pa),
+        }
+        columns = {name: col[order] for name, col in columns.items()}
+        columns["undercut"] = columns["pinion_teeth"] < min_teeth_without_undercut(
+            columns["pressure_angle"]
+        )
+        for col in columns.values():
+            col.flags.writeable = False
+        return columns
+
+    def pair_candidates(
+        self,
+        ratio: float,
+        center_distance: float,
+        ratio_tolerance: float = 0.02,
+        center_distance_tolerance: float = 0.5,
+        pressure_angle: Optional[float] = None,
+        min_contact_ratio: float = 1.2,
+        allow_undercut: bool = False,
+        limit: int = 20,
+    ) -> list[dict[str, Any]]:
+        """Gear pairs close to a target ratio and center distance.
+
+        Args:
+            ratio: Target ratio ``gear / pinion`` (>= 1).
+            center_distance: Target center distance in mm.
+            ratio_tolerance: Allowed relative ratio error.
+            center_distance_tolerance: Allowed center distance error in mm.
+            pressure_angle: Restrict to one pressure angle.
+            min_contact_ratio: Reject pairs below this contact ratio.
+            allow_undercut: Keep pinions that would be undercut.
+            limit: Maximum number of candidates.
+
+        Returns:
+            Candidates ordered by combined relative ratio and center
+            distance error, best first.
+        """
+        if ratio < 1:
+            raise ValueError("ratio must be >= 1 (gear teeth / pinion teeth).")
+        if center_distance <= 0:
+            raise ValueError("center_distance must be positive.")
+
+        pairs = self.pairs
+        cd = pairs["center_distance"]
+        lo = np.searchsorted(cd, center_distance - center_distance_tolerance, side="left")
+        hi = np.searchsorted(cd, center_distance + center_distance_tolerance, side="right")
+        window = {name: col[lo:hi] for name, col in pairs.items()}
+
+        ratio_error = np.abs(window["ratio"] - ratio) / ratio
+        mask = (ratio_error <= ratio_tolerance) & (window["contact_ratio"] >= min_contact_ratio)
+        if pressure_angle is not None:
+            mask &= window["pressure_angle"] == pressure_angle
+        if not allow_undercut:
+            mask &= ~window["undercut"]
+
+        idx = np.flatnonzero(mask)
+        cd_error = np.abs(window["center_distance"][idx] - center_distance) / center_distance
+        score = ratio_error[idx] + cd_error
+        # Best score first; ties go to the higher contact ratio
+        best = idx[np.lexsort((-window["contact_ratio"][idx], score))[:limit]]
+
+        return [
+            {
+                "module": float(window["module"][i]),
+                "pinion_teeth": int(window["pinion_teeth"][i]),
+                "gear_teeth": int(window["gear_teeth"][i]),
+                "pressure_angle": float(window["pressure_angle"][i]),
+                "ratio": round(float(window["ratio"][i]), 6),
+                "center_distance": float(window["center_distance"][i]),
+                "contact_ratio": round(float(window["contact_ratio"][i]), 4),
+                "ratio_error": round(float(window["ratio"][i] / ratio - 1.0), 6),
+                "center_distance_error": round(
+                    float(window["center_distance"][i] - center_distance), 6
+                ),
+            }
+            for i in best
+        ]
@@ -0,0 +1,433 @@
+"""ISO 286 limits and fits.
+
+Standard tolerance grades IT1-IT18 and the fundamental deviations of the
+common hole (A-H, JS, K-U) and shaft (a-h, js, k-u) positions are tabulated
+for nominal sizes up to 500 mm.  At import every (position, grade, size
+range) combination is expanded into NumPy limit tables, so a lookup is a
+designation parse (memoised) plus one ``searchsorted`` and an array index,
+and a batch over thousands of sizes and fits is a single fancy-indexing
+operation.
+
+All public functions take and return millimetres; the tables are stored in
+micrometres as in the standard.
+
+Example::
+
+    fit = evaluate_fit(25, "H7/g6")
+    fit.min_clearance, fit.max_clearance      # (0.007, 0.041)
+
+    table = evaluate_fits(_BEARING_BORES, ["H7/g6", "H7/k6", "H7/p6"])
+    table.max_clearance                       # shape (len(bores), 3)
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Sequence
+
+import numpy as np
+
+# ---------------------------------------------------------------------------
+# Size ranges
+# ---------------------------------------------------------------------------
+
+# Upper bound (inclusive) of every nominal size range, using the
+# intermediate steps where the fundamental deviations change.
+_RANGE_UPPER = np.array([
+    3, 6, 10, 14, 18, 24, 30, 40, 50, 65, 80, 100, 120,
+    140, 160, 180, 200, 225, 250, 280, 315, 355, 400, 450, 500,
+], dtype=float)
+
+MAX_NOMINAL_MM = float(_RANGE_UPPER[-1])
+
+# Main range each intermediate range belongs to (IT values are per main range)
+_MAIN_RANGE = [0, 1, 2, 3, 3, 4, 4, 5, 5, 6, 6, 7, 7, 8, 8, 8, 9, 9, 9, 10, 10, 11, 11, 12, 12]
+
+# ---------------------------------------------------------------------------
+# Standard tolerance grades IT1..IT18 (um) per main size range
+# ---------------------------------------------------------------------------
+
+_IT_MAIN = np.array([
+    # IT1   2     3    4    5    6    7    8    9   10   11   12   13    14    15    16    17    18
+    [0.8, 1.2, 2.0, 3, 4, 6, 10, 14, 25, 40, 60, 100, 140, 250, 400, 600, 1000, 1400],      # -3
+    [1.0, 1.5, 2.5, 4, 5, 8, 12, 18, 30, 48, 75, 120, 180, 300, 480, 750, 1200, 1800],      # 3-6
+    [1.0, 1.5, 2.5, 4, 6, 9, 15, 22, 36, 58, 90, 150, 220, 360, 580, 900, 1500, 2200],      # 6-10
+    [1.2, 2.0, 3.0, 5, 8, 11, 18, 27, 43, 70, 110, 180, 270, 430, 700, 1100, 1800, 2700],   # 10-18
+    [1.5, 2.5, 4.0, 6, 9, 13, 21, 33, 52, 84, 130, 210, 330, 520, 840, 1300, 2100, 3300],   # 18-30
+    [1.5, 2.5, 4.0, 7, 11, 16, 25, 39, 62, 100, 160, 250, 390, 620, 1000, 1600, 2500, 3900],  # 30-50
+    [2.0, 3.0, 5.0, 8, 13, 19, 30, 46, 74, 120, 190, 300, 460, 740, 1200, 1900, 3000, 4600],  # 50-80
+    [2.5, 4.0, 6.0, 10, 15, 22, 35, 54, 87, 140, 220, 350, 540, 870, 1400, 2200, 3500, 5400],  # 80-120
+    [3.5, 5.0, 8.0, 12, 18, 25, 40, 63, 100, 160, 250, 400, 630, 1000, 1600, 2500, 4000, 6300],  # 120-180
+    [4.5, 7.0, 10.0, 14, 20, 29, 46, 72, 115, 185, 290, 460, 720, 1150, 1850, 2900, 4600, 7200],  # 180-250
+    [6.0, 8.0, 12.0, 16, 23, 32, 52, 81, 130, 210, 320, 520, 810, 1300, 2100, 3200, 5200, 8100],  # 250-315
+    [7.0, 9.0, 13.0, 18, 25, 36, 57, 89, 140, 230, 360, 570, 890, 1400, 2300, 3600, 5700, 8900],  # 315-400
+    [8.0, 10.0, 15.0, 20, 27, 40, 63, 97, 155, 250, 400, 630, 970, 1550, 2500, 4000, 6300, 9700],  # 400-500
+])
+
+MIN_GRADE = 1
+MAX_GRADE = 18
+
+# IT per (grade index 0..18, range); column 0 is unused so grade n is index n
+_IT = np.zeros((MAX_GRADE + 1, len(_RANGE_UPPER)))
+_IT[1:, :] = _IT_MAIN[_MAIN_RANGE].T
+
+# ---------------------------------------------------------------------------
+# Shaft fundamental deviations (um) per size range
+# a-h give the upper deviation es, k-u the lower deviation ei.
+# NaN = position not defined for that size range.
+# ---------------------------------------------------------------------------
+
+_NA = np.nan
+
+_SHAFT_ES = {
+    "a": [-270, -270, -280, -290, -290, -300, -300, -310, -320, -340, -360, -380, -410,
+          -460, -520, -580, -660, -740, -820, -920, -1050, -1200, -1350, -1500, -1650],
+    "b": [-140, -140, -150, -150, -150, -160, -160, -170, -180, -190, -200, -220, -240,
+          -260, -280, -310, -340, -380, -420, -480, -540, -600, -680, -760, -840],
+    "c": [-60, -70, -80, -95, -95, -110, -110, -120, -130, -140, -150, -170, -180,
+          -200, -210, -230, -240, -260, -280, -300, -330, -360, -400, -440, -480],
+    "d": [-20, -30, -40, -50, -50, -65, -65, -80, -80, -100, -100, -120, -120,
+          -145, -145, -145, -170, -170, -170, -190, -190, -210, -210, -230, -230],
+    "e": [-14, -20, -25, -32, -32, -40, -40, -50, -50, -60, -60, -72, -72,
+          -85, -85, -85, -100, -100, -100, -110, -110, -125, -125, -135, -135],
+    "f": [-6, -10, -13, -16, -16, -20, -20, -25, -25, -30, -30, -36, -36,
+          -43, -43, -43, -50, -50, -50, -56, -56, -62, -62, -68, -68],
+    "g": [-2, -4, -5, -6, -6, -7, -7, -9, -9, -10, -10, -12, -12,
+          -14, -14, -14, -15, -15, -15, -17, -17, -18, -18, -20, -20],
+    "h": [0] * 25,
+}
+
+_SHAFT_EI = {
+    # k applies to grades IT4-IT7; other grades have ei = 0
+    "k": [0, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2, 3, 3,
+          3, 3, 3, 4, 4, 4, 4, 4, 4, 4, 5, 5],
+    "m": [2, 4, 6, 7, 7, 8, 8, 9, 9, 11, 11, 13, 13,
+          15, 15, 15, 17, 17, 17, 20, 20, 21, 21, 23, 23],
+    "n": [4, 8, 10, 12, 12, 15, 15, 17, 17, 20, 20, 23, 23,
+          27, 27, 27, 31, 31, 31, 34, 34, 37, 37, 40, 40],
+    "p": [6, 12, 15, 18, 18, 22, 22, 26, 26, 32, 32, 37, 37,
+          43, 43, 43, 50, 50, 50, 56, 56, 62, 62, 68, 68],
+    "r": [10, 15, 19, 23, 23, 28, 28, 34, 34, 41, 43, 51, 54,
+          63, 65, 68, 77, 80, 84, 94, 98, 108, 114, 126, 132],
+    "s": [14, 19, 23, 28, 28, 35, 35, 43, 43, 53, 59, 71, 79,
+          92, 100, 108, 122, 130, 140, 158, 170, 190, 208, 232, 252],
+    "t": [_NA, _NA, _NA, _NA, _NA, _NA, 41, 48, 54, 66, 75, 91, 104,
+          122, 134, 146, 166, 180, 196, 218, 240, 268, 294, 330, 360],
+    "u": [18, 23, 28, 33, 33, 41, 48, 60, 70, 87, 102, 124, 144,
+          170, 190, 210, 236, 258, 284, 315, 350, 390, 435, 490, 540],
+}
+
+SHAFT_POSITIONS = tuple(_SHAFT_ES) + ("js",) + tuple(_SHAFT_EI)
+HOLE_POSITIONS = tuple(p.upper() for p in SHAFT_POSITIONS)
+
+_DESIGNATION = re.compile(r"^\s*([A-Za-z]{1,2})\s*(\d{1,2})\s*$")
+
+# ---------------------------------------------------------------------------
+# Precomputed limit tables: [position, grade, range] -> deviation (um)
+# ---------------------------------------------------------------------------
+
+
+def _build_tables() -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    n_pos = len(SHAFT_POSITIONS)
+    shape = (n_pos, MAX_GRADE + 1, len(_RANGE_UPPER))
+    shaft_upper = np.full(shape, np.nan)
+    shaft_lower = np.full(shape, np.nan)
+    hole_upper = np.full(shape, np.nan)
+    hole_lower = np.full(shape, np.nan)
+
+    grades = np.arange(MAX_GRADE + 1)[:, None]
+    it = _IT
+    # Delta = IT(n) - IT(n-1) for the hole grade; zero up to 3 mm
+    delta = np.zeros_like(it)
+    delta[2:, :] = it[2:, :] - it[1:-1, :]
+    delta[:, 0] = 0.0
+    small = np.zeros(len(_RANGE_UPPER), dtype=bool)
+    small[0] = True
+
+    for i, pos in enumerate(SHAFT_POSITIONS):
+        if pos in _SHAFT_ES:
+            es = np.array(_SHAFT_ES[pos], dtype=float)[None, :]
+            shaft_upper[i] = es
+            shaft_lower[i] = es - it
+            # A-H: EI = -es
+            hole_lower[i] = -es
+            hole_upper[i] = -es + it
+        elif pos == "js":
+            shaft_upper[i] = it / 2.0
+            shaft_lower[i] = -it / 2.0
+            hole_upper[i] = it / 2.0
+            hole_lower[i] = -it / 2.0
+        else:
+            ei = np.array(_SHAFT_EI[pos], dtype=float)[None, :]
+            ei_grade = np.broadcast_to(ei, it.shape).copy()
+            if pos == "k":
+                ei_grade[((grades < 4) | (grades > 7))[:, 0]] = 0.0
+            shaft_lower[i] = ei_grade
+            shaft_upper[i] = ei_grade + it
+
+            # Holes K-U: ES = -ei (+ Delta for fine grades), ISO 286-1 5.3
+            if pos in ("k", "m", "n"):
+                es_hole = -ei + np.where(grades <= 8, delta, 0.0)
+                if pos == "k":
+                    es_hole = np.where(grades <= 8, es_hole, 0.0)
+                elif pos == "n":
+                    es_hole = np.where((grades > 8) & ~small[None, :], 0.0, es_hole)
+            else:
+                es_hole = -ei + np.where(grades <= 7, delta, 0.0)
+            hole_upper[i] = es_hole
+            hole_lower[i] = es_hole - it
+
+    # Grade index 0 does not exist; "+ 0.0" turns -0.0 into 0.0
+    for table in (shaft_upper, shaft_lower, hole_upper, hole_lower):
+        table[:, 0, :] = np.nan
+        table += 0.0
+    return shaft_upper, shaft_lower, hole_upper, hole_lower
+
+
+_SHAFT_UPPER, _SHAFT_LOWER, _HOLE_UPPER, _HOLE_LOWER = _build_tables()
+_POSITION_INDEX = {p: i for i, p in enumerate(SHAFT_POSITIONS)}
+
+# ---------------------------------------------------------------------------
+# Data classes
+# ---------------------------------------------------------------------------
+
+FIT_TYPES = ("clearance", "transition", "interference")
+
+
+@dataclass(frozen=True)
+class ToleranceZone:
+    """Limit deviations of one hole or shaft tolerance class at a size (mm)."""
+
+    designation: str
+    nominal: float
+    upper_deviation: float
+    lower_deviation: float
+    is_hole: bool
+
+    @property
+    def max_size(self) -> float:
+        return self.nominal + self.upper_deviation
+
+    @property
+    def min_size(self) -> float:
+        return self.nominal + self.lower_deviation
+
+
+@dataclass(frozen=True)
+class FitResult:
+    """Clearance/interference of a hole/shaft fit at a nominal size (mm).
+
+    Negative clearance is interference.
+    """
+
+    designation: str
+    nominal: float
+    hole: ToleranceZone
+    shaft: ToleranceZone
+
+    @property
+    def max_clearance(self) -> float:
+        return round(self.hole.upper_deviation - self.shaft.lower_deviation, 6) + 0.0
+
+    @property
+    def min_clearance(self) -> float:
+        return round(self.hole.lower_deviation - self.shaft.upper_deviation, 6) + 0.0
+
+    @property
+    def fit_type(self) -> str:
+        """``"clearance"``, ``"transition"`` or ``"interference"``."""
+        return _classify(self.min_clearance, self.max_clearance)
+
+
+@dataclass
+class FitTable:
+    """Vectorised fit evaluation over *nominals* x *fits*.
+
+    All arrays have shape ``(len(nominals), len(fits))`` and are in mm.
+    """
+
+    nominals: np.ndarray
+    fits: list[str]
+    hole_upper: np.ndarray
+    hole_lower: np.ndarray
+    shaft_upper: np.ndarray
+    shaft_lower: np.ndarray
+
+    @property
+    def max_clearance(self) -> np.ndarray:
+        return np.round(self.hole_upper - self.shaft_lower, 6) + 0.0
+
+    @property
+    def min_clearance(self) -> np.ndarray:
+        return np.round(self.hole_lower - self.shaft_upper, 6) + 0.0
+
+    @property
+    def fit_type_codes(self) -> np.ndarray:
+        """Index into ``FIT_TYPES`` for every cell."""
+        lo, hi = self.min_clearance, self.max_clearance
+        return np.where(lo >= 0, 0, np.where(hi <= 0, 2, 1))
+
+    def result(self, i: int, j: int) -> FitResult:
+        """Scalar ``FitResult`` for cell ``(i, j)``."""
+        hole_class, shaft_class = self.fits[j].split("/")
+        nominal = float(self.nominals[i])
+        return FitResult(
+            designation=self.fits[j],
+            nominal=nominal,
+            hole=ToleranceZone(hole_class, nominal, float(self.hole_upper[i, j]),
+                               float(self.hole_lower[i, j]), True),
+            shaft=ToleranceZone(shaft_class, nominal, float(self.shaft_upper[i, j]),
+                                float(self.shaft_lower[i, j]), False),
+        )
+
+    def to_records(self) -> list[dict[str, Any]]:
+        """One flat dict per (nominal, fit) cell, row-major."""
+        max_c = self.max_clearance.tolist()
+        min_c = self.min_clearance.tolist()
+        codes = self.fit_type_codes.tolist()
+        hu, hl = self.hole_upper.tolist(), self.hole_lower.tolist()
+        su, sl = self.shaft_upper.tolist(), self.shaft_lower.tolist()
+        records = []
+        for i, nominal in enumerate(self.nominals.tolist()):
+            for j, fit in enumerate(self.fits):
+                records.append({
+                    "nominal": nominal,
+                    "fit": fit,
+                    "hole_upper": hu[i][j],
+                    "hole_lower": hl[i][j],
+                    "shaft_upper": su[i][j],
+                    "shaft_lower": sl[i][j],
+                    "max_clearance": max_c[i][j],
+                    "min_clearance": min_c[i][j],
+                    "fit_type": FIT_TYPES[codes[i][j]],
+                })
+        return records
+
+
+# ---------------------------------------------------------------------------
+# Lookup
+# ---------------------------------------------------------------------------
+
+@lru_cache(maxsize=1024)
+def parse_tolerance_class(designation: str) -> tuple[int, int, bool]:
+    """Parse ``"H7"`` / ``"g6"`` into ``(position index, grade, is_hole)``.
+
+    Upper-case positions are holes, lower-case positions shafts.
+
+    Raises:
+        ValueError: Unknown position or grade outside IT1-IT18.
+    """
+    match = _DESIGNATION.match(designation)
+    if not match:
+        raise ValueError(f"Invalid tolerance class: '{designation}'")
+    letters, grade_str = match.groups()
+    grade = int(grade_str)
+    if letters.isupper():
+        is_hole = True
+    elif letters.islower():
+        is_hole = False
+    else:
+        raise ValueError(
+            f"Invalid tolerance class: '{designation}' "
+            f"(use upper case for holes, lower case for shafts)"
+        )
+    position = letters.lower()
+    if position not in _POSITION_INDEX:
+        valid = HOLE_POSITIONS if is_hole else SHAFT_POSITIONS
+        raise ValueError(
+            f"Unsupported position '{letters}' in '{designation}'. "
+            f"Valid values: {', '.join(valid)}"
+        )
+    if not MIN_GRADE <= grade <= MAX_GRADE:
+        raise ValueError(f"Grade IT{grade} outside IT{MIN_GRADE}-IT{MAX_GRADE} in '{designation}'")
+    return _POSITION_INDEX[position], grade, is_hole
+
+
+@lru_cache(maxsize=256)
+def parse_fit(fit: str) -> tuple[tuple[int, int, bool], tuple[int, int, bool]]:
+    """Parse ``"H7/g6"`` into hole and shaft classes."""
+    parts = fit.split("/")
+    if len(parts) != 2:
+        raise ValueError(f"Invalid fit designation: '{fit}' (expected e.g. 'H7/g6')")
+    hole = parse_tolerance_class(parts[0])
+    shaft = parse_tolerance_class(parts[1])
+    if not hole[2] or shaft[2]:
+        raise ValueError(f"Invalid fit designation: '{fit}' (hole class first, e.g. 'H7/g6')")
+    return hole, shaft
+
+
+def _range_index(nominals: np.ndarray) -> np.ndarray:
+    if np.any(nominals <= 0) or np.any(nominals > MAX_NOMINAL_MM):
+        raise ValueError(f"Nominal size must be in (0, {MAX_NOMINAL_MM:g}] mm.")
+    # Ranges are "over a up to and including b"
+    return np.searchsorted(_RANGE_UPPER, nominals, side="left")
+
+
+def _deviations(
+    cls: tuple[int, int, bool],
+    ranges: np.ndarray,
+    designation: str,
+) -> tuple[np.ndarray, np.ndarray]:
+    pos, grade, is_hole = cls
+    upper_table, lower_table = (
+        (_HOLE_UPPER, _HOLE_LOWER) if is_hole else (_SHAFT_UPPER, _SHAFT_LOWER)
+    )
+    upper = upper_table[pos, grade, ranges]
+    lower = lower_table[pos, grade, ranges]
+    if np.isnan(upper).any():
+        raise ValueError(f"Tolerance class '{designation}' is not defined for this size.")
+    return upper / 1000.0, lower / 1000.0
+
+
+def tolerance_zone(nominal: float, designation: str) -> ToleranceZone:
+    """Limit deviations (mm) of tolerance class *designation* at *nominal*."""
+    cls = parse_tolerance_class(designation)
+    upper, lower = _deviations(cls, _range_index(np.array([float(nominal)])), designation)
+    return ToleranceZone(
+        designation=designation.strip(),
+        nominal=float(nominal),
+        upper_deviation=round(float(upper[0]), 6),
+        lower_deviation=round(float(lower[0]), 6),
+        is_hole=cls[2],
+    )
+
+
+def evaluate_fit(nominal: float, fit: str) -> FitResult:
+    """Limits and clearance of fit *fit* (e.g. ``"H7/g6"``) at *nominal* mm."""
+    return evaluate_fits([nominal], [fit]).result(0, 0)
+
+
+def evaluate_fits(nominals: Sequence[float], fits: Sequence[str]) -> FitTable:
+    """Evaluate every fit in *fits* at every size in *nominals* at once."""
+    sizes = np.asarray(nominals, dtype=float).reshape(-1)
+    ranges = _range_index(sizes)
+    fits = [f.replace(" ", "") for f in fits]
+
+    shape = (len(sizes), len(fits))
+    hole_upper = np.empty(shape)
+    hole_lower = np.empty(shape)
+    shaft_upper = np.empty(shape)
+    shaft_lower = np.empty(shape)
+    for j, fit in enumerate(fits):
+        hole, shaft = parse_fit(fit)
+        hole_upper[:, j], hole_lower[:, j] = _deviations(hole, ranges, fit)
+        shaft_upper[:, j], shaft_lower[:, j] = _deviations(shaft, ranges, fit)
+
+    return FitTable(
+        nominals=sizes,
+        fits=fits,
+        hole_upper=np.round(hole_upper, 6),
+        hole_lower=np.round(hole_lower, 6),
+        shaft_upper=np.round(shaft_upper, 6),
+        shaft_lower=np.round(shaft_lower, 6),
+    )
+
+
+def _classify(min_clearance: float, max_clearance: float) -> str:
+    if min_clearance >= 0:
+        return "clearance"
+    if max_clearance <= 0:
+        return "interference"
+    return "transition"
@@ -0,0 +1,709 @@
+"""Degree-of-freedom analysis of an exported assembly mate list.
+
+Every non-fixed component is a rigid body with a 6-vector twist
+``(omega, v)`` about the assembly origin.  Each mate, linearised at the
+current (solved) configuration, contributes a few rows to the constraint
+Jacobian ``J``:
+
+- keep a point on a plane / line / point: ``u . (v + omega x p)`` rows,
+  i.e. ``[p x u, u]`` for every constrained direction ``u``,
+- keep directions parallel / at an angle: ``[u, 0]`` rotation rows,
+- mechanical couplers (gear, rack and pinion, screw, linear coupler): one
+  row coupling the two components' twists.
+
+Relative rows enter with ``+`` for the second component and ``-`` for the
+first; fixed components (and the assembly itself) are ground and get no
+columns.  The columns are not the absolute twists but twists relative to
+a parent: a breadth-first spanning tree of the mate graph, rooted at
+ground, gives every component a parent, and its absolute twist is the sum
+of the relative twists on its path to ground.  A mate along a tree edge
+then only touches the child's six columns (its relative rows cancel on
+the shared path), so a serial chain stays banded; only loop-closing mates
+and couplers reach along a path.  ``J`` is kept sparse: each mate's rows
+are reduced against the rows before them by sparse elimination (as in
+``sketch_dof``), and union-find over the mates splits the result into
+independent blocks (mate groups).  So:
+
+- ``rank`` is the number of rows that survive elimination,
+- remaining DOF = ``6 x components - rank``,
+- a mate whose rows all reduce to zero is redundant with the mates before
+  it (partial overlap, e.g. the parallel rows of a face coincident after a
+  concentric, is normal and only counted),
+- a few random null-space vectors, back-substituted through the pivots,
+  give the DOF left to every component and between every mated pair (the
+  rank of the samples restricted to their columns), and the rigid
+  clusters that move as one body.
+
+Mate entities follow ``IMateEntity2``: a kind (point, axis or plane; a
+sphere counts as its centre, a cylinder / cone / circle as its axis), a
+point and a direction (plane normal or axis direction) in assembly space.
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+import re
+from dataclasses import dataclass, field
+from typing import Optional, Sequence
+
+import numpy as np
+
+ENTITY_KINDS = {
+    "point": "point",
+    "vertex": "point",
+    "origin": "point",
+    "sphere": "point",
+    "axis": "axis",
+    "line": "axis",
+    "edge": "axis",
+    "cylinder": "axis",
+    "cone": "axis",
+    "circle": "axis",
+    "plane": "plane",
+    "face": "plane",
+}
+
+MATE_TYPES = (
+    "COINCIDENT", "CONCENTRIC", "DISTANCE", "PARALLEL", "PERPENDICULAR", "ANGLE",
+    "TANGENT", "LOCK", "HINGE", "UNIVERSALJOINT", "SLOT", "PATH", "WIDTH",
+    "SYMMETRIC", "PROFILECENTER", "CAMFOLLOWER", "GEAR", "RACKPINION", "SCREW",
+    "LINEARCOUPLER",
+)
+
+# Generator / UI names that differ from the swMateType_e suffix
+_TYPE_ALIASES = {"CAM": "CAMFOLLOWER", "PATHMATE": "PATH"}
+
+_ZERO3 = np.zeros(3)
+
+
+@dataclass
+class MateEntity:
+    """One mate entity in assembly coordinates.
+
+    Attributes:
+        kind: ``point``, ``axis`` or ``plane`` (or an alias in ``ENTITY_KINDS``).
+        point: A point on the entity (sphere / circle centre, axis point).
+        direction: Plane normal or axis direction (ignored for points).
+    """
+
+    kind: str
+    point: Sequence[float] = (0.0, 0.0, 0.0)
+    direction: Sequence[float] = (0.0, 0.0, 1.0)
+
+
+@dataclass
+class Mate:
+    """One exported mate.
+
+    Attributes:
+        name: Mate feature name (e.g. ``"Concentric1"``).
+        type: ``swMateType_e`` name, with or without the ``swMate`` prefix.
+        components: The two mated components; ``None`` for the assembly
+            itself (its planes / origin).
+        entities: Mate entities, ``entities[i]`` on ``components[i]``
+            (hinge: two axes then two planes).
+        ratio: Gear ratio, rack pinion pitch radius, screw lead per
+            revolution or linear coupler ratio.
+    """
+
+    name: str
+    type: str
+    components: tuple[Optional[str], Optional[str]]
+    entities: Sequence[MateEntity] = ()
+    ratio: float = 1.0
+
+
+@dataclass
+class MateReport:
+    """Analysis of one mate.
+
+    Attributes:
+        rows: Constraint rows the mate contributes.
+        independent_rows: Rows independent of the mates before it.
+        relative_dof: DOF left between its two components (all mates applied).
+    """
+
+    name: str
+    type: str
+    group: int
+    rows: int
+    independent_rows: int
+    relative_dof: int
+
+    @property
+    def redundant(self) -> bool:
+        """The mate adds no constraint the earlier mates did not."""
+        return self.independent_rows == 0
+
+
+@dataclass
+class GroupReport:
+    """One independent block of mated components.
+
+    Attributes:
+        components: Non-fixed components in the group.
+        grounded: Whether any mate ties the group to a fixed component.
+        dof: Remaining degrees of freedom of the group.
+        rank: Independent constraint rows.
+        rows: Total constraint rows.
+        component_dof: DOF left to each component (relative to ground).
+        rigid_clusters: Components that move as one rigid body.
+        redundant_mates: Mates that add no independent constraint.
+    """
+
+    components: list[str]
+    grounded: bool
+    dof: int
+    rank: int
+    rows: int
+    component_dof: dict[str, int] = field(default_factory=dict)
+    rigid_clusters: list[list[str]] = field(default_factory=list)
+    redundant_mates: list[str] = field(default_factory=list)
+
+    @property
+    def status(self) -> str:
+        if self.redundant_mates:
+            return "over_defined"
+        return "fully_defined" if self.dof == 0 else "under_defined"
+
+
+@dataclass
+class MateDofResult:
+    """DOF analysis of one assembly."""
+
+    groups: list[GroupReport]
+    mates: list[MateReport]
+
+    @property
+    def total_dof(self) -> int:
+        return sum(g.dof for g in self.groups)
+
+    @property
+    def redundant_mates(self) -> list[str]:
+        return [m.name for m in self.mates if m.redundant]
+
+
+class _UnionFind:
+    """Disjoint sets over ``0..n-1`` (path halving, union by size)."""
+
+    def __init__(self, n: int) -> None:
+        self.parent = list(range(n))
+        self.size = [1] * n
+
+    def find(self, x: int) -> int:
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(self, a: int, b: int) -> None:
+        a, b = self.find(a), self.find(b)
+        if a == b:
+            return
+        if self.size[a] < self.size[b]:
+            a, b = b, a
+        self.parent[b] = a
+        self.size[a] += self.size[b]
+
+    def groups(self) -> list[list[int]]:
+        """Members per set, sets ordered by their first member."""
+        members: dict[int, list[int]] = {}
+        for x in range(len(self.parent)):
+            members.setdefault(self.find(x), []).append(x)
+        return list(members.values())
+
+
+def normalize_mate_type(mate_type: str) -> str:
+    """``"swMateCONCENTRIC"`` / ``"Concentric"`` -> ``"CONCENTRIC"``."""
+    name = re.sub(r"[^A-Z]", "", re.sub(r"^swMate", "", mate_type.strip()).upper())
+    name = _TYPE_ALIASES.get(name, name)
+    if name not in MATE_TYPES:
+        raise ValueError(f"Unsupported mate type '{mate_type}'. Valid: {', '.join(MATE_TYPES)}")
+    return name
+
+
+# ---------------------------------------------------------------------------
+# Constraint rows
+# ---------------------------------------------------------------------------
+
+def _unit(v: np.ndarray, what: str) -> np.ndarray:
+    norm = np.linalg.norm(v)
+    if norm < 1e-12:
+        raise ValueError(f"{what} has zero length.")
+    return v / norm
+
+
+def _cross(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """``np.cross`` for two 3-vectors, without its axis handling overhead."""
+    return np.array([
+        a[1] * b[2] - a[2] * b[1],
+        a[2] * b[0] - a[0] * b[2],
+        a[0] * b[1] - a[1] * b[0],
+    ])
+
+
+def _perp(u: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Two unit vectors completing *u* to an orthonormal frame."""
+    helper = np.eye(3)[np.argmin(np.abs(u))]
+    u1 = _cross(u, helper)
+    u1 /= np.linalg.norm(u1)
+    return u1, _cross(u, u1)
+
+
+def _normal_to(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Unit ``a x b``; a perpendicular of *a* if they are parallel."""
+    n = _cross(a, b)
+    norm = np.linalg.norm(n)
+    return n / norm if norm > 1e-9 else _perp(a)[0]
+
+
+def _trans(u: np.ndarray, p: np.ndarray) -> np.ndarray:
+    """Row keeping point *p* fixed along *u*: ``u . (v + omega x p)``."""
+    return np.concatenate([_cross(p, u), u])
+
+
+def _rot(u: np.ndarray) -> np.ndarray:
+    """Row locking rotation about *u*."""
+    return np.concatenate([u, _ZERO3])
+
+
+def _separation(a: tuple, b: tuple) -> np.ndarray:
+    """Unit direction between two entities, perpendicular to any axis."""
+    d = b[1] - a[1]
+    for kind, _, direction in (a, b):
+        if kind == "axis":
+            d = d - np.dot(d, direction) * direction
+    norm = np.linalg.norm(d)
+    if norm > 1e-9:
+        return d / norm
+    if a[0] == b[0] == "point":
+        # Coincident points: any direction is a separation direction
+        return np.eye(3)[0]
+    axis = a[2] if a[0] != "point" else b[2]
+    return _perp(axis)[0]
+
+
+def _pair_rows(mtype: str, a: tuple, b: tuple) -> list[np.ndarray]:
+    """Relative rows of a two-entity geometric mate."""
+    kinds = (a[0], b[0])
+    by_kind = {a[0]: a, b[0]: b}
+    p = b[1]
+
+    if mtype == "DISTANCE" and kinds != ("plane", "plane"):
+        return [_trans(_separation(a, b), p)]
+
+    if mtype in ("COINCIDENT", "CONCENTRIC", "DISTANCE", "SYMMETRIC"):
+        if kinds == ("plane", "plane"):
+            n = a[2]
+            return [_trans(n, p), *(_rot(u) for u in _perp(n))]
+        if kinds == ("axis", "axis"):
+            perp = _perp(a[2])
+            return [*(_trans(u, p) for u in perp), *(_rot(u) for u in perp)]
+        if kinds == ("point", "point"):
+            return [_trans(u, p) for u in np.eye(3)]
+        if set(kinds) == {"point", "plane"}:
+            return [_trans(by_kind["plane"][2], by_kind["point"][1])]
+        if set(kinds) == {"point", "axis"}:
+            return [_trans(u, by_kind["point"][1]) for u in _perp(by_kind["axis"][2])]
+        # Line in plane
+        n, line = by_kind["plane"][2], by_kind["axis"]
+        return [_trans(n, line[1]), _rot(_normal_to(line[2], n))]
+
+    if mtype == "PARALLEL":
+        if kinds[0] == kinds[1]:
+            return [_rot(u) for u in _perp(a[2])]
+        if "point" not in kinds:
+            return [_rot(_normal_to(a[2], b[2]))]
+
+    if mtype in ("PERPENDICULAR", "ANGLE") and "point" not in kinds:
+        if mtype == "PERPENDICULAR" and kinds[0] != kinds[1]:
+            # Axis perpendicular to a plane is parallel to its normal
+            return [_rot(u) for u in _perp(by_kind["plane"][2])]
+        return [_rot(_normal_to(a[2], b[2]))]
+
+    if mtype == "TANGENT":
+        if "plane" in kinds and kinds[0] != kinds[1]:
+            n, other = by_kind["plane"][2], by_kind[({*kinds} - {"plane"}).pop()]
+            rows = [_trans(n, other[1])]
+            if other[0] == "axis":
+                rows.append(_rot(_normal_to(other[2], n)))
+            return rows
+        rows = [_trans(_separation(a, b), p)]
+        if kinds == ("axis", "axis"):
+            rows.extend(_rot(u) for u in _perp(a[2]))
+        return rows
+
+    raise ValueError(f"{mtype} mate is not defined between {kinds[0]} and {kinds[1]}.")
+
+
+def _mate_rows(mate: Mate, mtype: str, scale: float, origin: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Rows on the first and second component, each ``(k, 6)``."""
+    ents = []
+    for ent in mate.entities:
+        kind = ENTITY_KINDS.get(ent.kind.lower())
+        if kind is None:
+            raise ValueError(f"Mate '{mate.name}': unknown entity kind '{ent.kind}'.")
+        point = (np.asarray(ent.point, dtype=float) - origin) / scale
+        direction = (
+            _ZERO3 if kind == "point"
+            else _unit(np.asarray(ent.direction, dtype=float), f"Mate '{mate.name}' direction")
+        )
+        ents.append((kind, point, direction))
+
+    if mtype == "LOCK":
+        rows = [_trans(u, _ZERO3) for u in np.eye(3)] + [_rot(u) for u in np.eye(3)]
+        rows = np.array(rows)
+        return -rows, rows
+
+    need = 4 if mtype == "HINGE" else 2
+    if len(ents) < need:
+        raise ValueError(f"Mate '{mate.name}': {mtype} needs {need} entities, got {len(ents)}.")
+    a, b = ents[0], ents[1]
+
+    coupling: Optional[tuple[np.ndarray, np.ndarray]] = None
+    if mtype == "GEAR":
+        coupling = _rot(a[2] * mate.ratio), _rot(b[2])
+    elif mtype == "RACKPINION":
+        # v_rack . d = r * omega_pinion . axis
+        coupling = _trans(a[2], _ZERO3), -_rot(b[2] * mate.ratio / scale)
+    elif mtype == "LINEARCOUPLER":
+        coupling = _trans(a[2] * mate.ratio, _ZERO3), _trans(b[2], _ZERO3)
+    if coupling is not None:
+        return coupling[0][None, :], coupling[1][None, :]
+
+    if mtype == "HINGE":
+        axes = [e for e in ents if e[0] == "axis"]
+        planes = [e for e in ents if e[0] == "plane"]
+        if len(axes) < 2 or len(planes) < 2:
+            raise ValueError(f"Mate '{mate.name}': HINGE needs two axes and two planes.")
+        rows = _pair_rows("CONCENTRIC", axes[0], axes[1])
+        rows.append(_trans(planes[0][2], planes[1][1]))
+    elif mtype == "SCREW":
+        # Concentric plus v . d = lead / (2 pi) * omega . d
+        rows = _pair_rows("CONCENTRIC", a, b)
+        d = a[2]
+        rows.append(np.concatenate([-d * mate.ratio / (2 * math.pi * scale), d]))
+    elif mtype == "UNIVERSALJOINT":
+        rows = [_trans(u, b[1]) for u in np.eye(3)]
+        rows.append(_rot(_normal_to(a[2], b[2])))
+    elif mtype in ("SLOT", "PATH"):
+        # Pin / point follows the slot or path tangent
+        track = b if b[0] == "axis" else a
+        follower = a if track is b else b
+        rows = [_trans(u, follower[1]) for u in _perp(track[2])]
+    elif mtype in ("WIDTH", "CAMFOLLOWER"):
+        plane = a if a[0] == "plane" else b
+        rows = [_trans(plane[2], b[1])]
+    elif mtype == "PROFILECENTER":
+        plane = a if a[0] == "plane" else b
+        rows = _pair_rows("COINCIDENT", plane, (plane[0], b[1], plane[2]))
+        rows.extend(_trans(u, b[1]) for u in _perp(plane[2]))
+    else:
+        rows = _pair_rows(mtype, a, b)
+
+    rows = np.array(rows)
+    return -rows, rows
+
+
+# ---------------------------------------------------------------------------
+# Analysis
+# ---------------------------------------------------------------------------
+
+# Fill-in below this magnitude is dropped during elimination
+_DROP = 1e-14
+
+# Random null-space vectors sampled per group.  A component's (or mated
+# pair's) motion spans at most 6 dimensions, so 6 generic samples recover
+# its rank; the extra ones keep the sampled 6 x k blocks well conditioned.
+_NULL_SAMPLES = 10
+
+
+def _eliminate(pivots: dict[int, tuple[int, dict[int, float]]], row: dict[int, float], tol: float) -> bool:
+    """Reduce *row* by the pivot rows; store it if it is independent.
+
+    Same scheme as ``sketch_dof``: every pivot row is reduced by the pivots
+    before it, so it only holds columns that became pivots later (or never
+    did), and eliminating oldest-first terminates.
+    """
+    heap = [(pivots[k][0], k) for k in row if k in pivots]
+    heapq.heapify(heap)
+    queued = {k for _, k in heap}
+    while heap:
+        _, col = heapq.heappop(heap)
+        value = row.pop(col, 0.0)
+        if not value:
+            continue
+        prow = pivots[col][1]
+        factor = value / prow[col]
+        for k, d in prow.items():
+            if k == col:
+                continue
+            new = row.get(k, 0.0) - factor * d
+            if abs(new) < _DROP:
+                row.pop(k, None)
+                continue
+            row[k] = new
+            if k in pivots and k not in queued:
+                queued.add(k)
+                heapq.heappush(heap, (pivots[k][0], k))
+
+    if not row:
+        return False
+    col = max(row, key=lambda k: abs(row[k]))
+    if abs(row[col]) <= tol:
+        return False
+    pivots[col] = (len(pivots), row)
+    return True
+
+
+def _spanning_tree(n: int, edges: Sequence[tuple[int, int]]) -> tuple[list[int], list[int], list[int]]:
+    """Breadth-first spanning forest of the mate graph, rooted at ground.
+
+    Components mated to ground start the search together; every other tree
+    gets ground as the (constraint-free) parent of its first component.
+
+    Returns:
+        ``(parent, depth, order)`` -- parent ``-1`` is ground, depth counts
+        from 0 below ground, and *order* lists parents before children.
+    """
+    neighbours: list[list[int]] = [[] for _ in range(n)]
+    grounded: list[int] = []
+    for a, b in edges:
+        if a >= 0 and b >= 0:
+            if a != b:
+                neighbours[a].append(b)
+                neighbours[b].append(a)
+        elif max(a, b) >= 0:
+            grounded.append(max(a, b))
+
+    parent = [-1] * n
+    depth = [-1] * n
+    order: list[int] = []
+    for sources in (grounded, *([c] for c in range(n))):
+        head = len(order)
+        for c in sources:
+            if depth[c] < 0:
+                depth[c] = 0
+                order.append(c)
+        while head < len(order):
+            c = order[head]
+            head += 1
+            for d in neighbours[c]:
+                if depth[d] < 0:
+                    depth[d] = depth[c] + 1
+                    parent[d] = c
+                    order.append(d)
+    return parent, depth, order
+
+
+def _path_blocks(
+    a: int,
+    b: int,
+    rows_a: np.ndarray,
+    rows_b: np.ndarray,
+    parent: list[int],
+    depth: list[int],
+) -> list[tuple[int, np.ndarray]]:
+    """Rows of a mate on the relative-twist columns, per component.
+
+    Each side's rows apply to every relative twist on its path to ground;
+    on the shared part of the paths they add up (and cancel for relative
+    constraints).
+    """
+    blocks = []
+    while a != b:
+        if (depth[a] if a >= 0 else -1) >= (depth[b] if b >= 0 else -1):
+            blocks.append((a, rows_a))
+            a = parent[a]
+        else:
+            blocks.append((b, rows_b))
+            b = parent[b]
+    shared = rows_a + rows_b
+    if a >= 0 and np.abs(shared).max(initial=0.0) > _DROP:
+        while a >= 0:
+            blocks.append((a, shared))
+            a = parent[a]
+    return blocks
+
+
+def _null_samples(
+    pivots: dict[int, tuple[int, dict[int, float]]],
+    n_cols: int,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """``(n_cols, _NULL_SAMPLES)`` random vectors of the null space.
+
+    Free columns get random values; pivot columns are back-substituted
+    newest pivot first, which only needs columns already set.
+    """
+    x = rng.standard_normal((n_cols, _NULL_SAMPLES))
+    for col, (_, row) in sorted(pivots.items(), key=lambda item: -item[1][0]):
+        others = [k for k in row if k != col]
+        if others:
+            x[col] = -np.asarray([row[k] for k in others]) @ x[others] / row[col]
+        else:
+            x[col] = 0.0
+    return x
+
+
+def _ranks(blocks: np.ndarray, tol: np.ndarray) -> list[int]:
+    """Numerical rank of each ``(6, k)`` block of a stack (*tol* per block)."""
+    if not len(blocks):
+        return []
+    return (np.linalg.svd(blocks, compute_uv=False) > tol[:, None]).sum(axis=1).tolist()
+
+
+def analyze_mates(
+    mates: Sequence[Mate],
+    fixed: Sequence[str] = (),
+    components: Sequence[str] = (),
+    tol: float = 1e-6,
+) -> MateDofResult:
+    """Remaining DOF, redundant mates and rigid clusters of an assembly.
+
+    Args:
+        mates: Exported mates.
+        fixed: Fixed (grounded) component names.
+        components: All component names, so unmated parts are reported as
+            free; components that only appear in mates are added.
+        tol: Rank tolerance on unit-norm constraint rows.
+
+    Raises:
+        ValueError: Unknown mate types or entity kinds, missing entities.
+    """
+    fixed_set = set(fixed)
+    names: list[str] = []
+    index: dict[str, int] = {}
+    for name in (*components, *(c for m in mates for c in m.components)):
+        if name and name not in fixed_set and name not in index:
+            index[name] = len(names)
+            names.append(name)
+
+    points = [e.point for m in mates for e in m.entities]
+    if points:
+        cloud = np.asarray(points, dtype=float)
+        origin = cloud.mean(axis=0)
+        scale = float(np.abs(cloud - origin).max()) or 1.0
+    else:
+        origin, scale = _ZERO3, 1.0
+
+    mate_cols: list[tuple[int, int]] = []
+    for mate in mates:
+        if len(mate.components) != 2:
+            raise ValueError(f"Mate '{mate.name}' needs exactly two components.")
+        ia, ib = (index.get(c, -1) if c else -1 for c in mate.components)
+        mate_cols.append((ia, ib))
+    parent, depth, order = _spanning_tree(len(names), mate_cols)
+
+    # Constraint rows on the relative twists, one block per mate, each
+    # reduced against the rows before it as it is assembled.  Rows of
+    # different mate groups share no columns, so one sparse elimination
+    # serves every group.
+    uf = _UnionFind(len(names))
+    pivots: dict[int, tuple[int, dict[int, float]]] = {}
+    mate_types: list[str] = []
+    mate_sizes: list[int] = []
+    independent: list[int] = []
+    for mate, (ia, ib) in zip(mates, mate_cols):
+        mtype = normalize_mate_type(mate.type)
+        if ia >= 0 and ib >= 0:
+            uf.union(ia, ib)
+        rows_a, rows_b = _mate_rows(mate, mtype, scale, origin)
+        norms = np.linalg.norm(np.hstack([rows_a * (ia >= 0), rows_b * (ib >= 0)]), axis=1)
+        norms = np.where(norms < 1e-12, 1.0, norms)
+
+        blocks = _path_blocks(ia, ib, rows_a, rows_b, parent, depth)
+        keys = [6 * c + j for c, _ in blocks for j in range(6)]
+        values = (np.hstack([rows for _, rows in blocks] or [rows_a[:, :0]]) / norms[:, None]).tolist()
+        count = 0
+        for row_values in values:
+            row = {k: v for k, v in zip(keys, row_values) if v}
+            count += _eliminate(pivots, row, tol)
+        mate_types.append(mtype)
+        mate_sizes.append(len(norms))
+        independent.append(count)
+
+    groups = uf.groups()
+    group_of = np.empty(len(names), dtype=np.int64)
+    for g, members in enumerate(groups):
+        group_of[members] = g
+
+    mate_group = [
+        int(group_of[ia if ia >= 0 else ib]) if max(ia, ib) >= 0 else -1
+        for ia, ib in mate_cols
+    ]
+    mates_of: list[list[int]] = [[] for _ in groups]
+    for i, g in enumerate(mate_group):
+        if g >= 0:
+            mates_of[g].append(i)
+
+    # DOF left to each component and between mated components: rank of
+    # the null space restricted to their columns, from random samples.
+    # Round-off is judged against the largest sample of the group.
+    x = _null_samples(pivots, 6 * len(names), np.random.default_rng(0))
+    x = x.reshape(len(names), 6, _NULL_SAMPLES)
+    # Relative -> absolute twists, parents first
+    for c in order:
+        if parent[c] >= 0:
+            x[c] += x[parent[c]]
+    group_max = np.ones(len(groups))
+    np.maximum.at(group_max, group_of, np.abs(x).max(axis=(1, 2), initial=0.0))
+    cutoff = tol * group_max[group_of]
+    mobility = _ranks(x, cutoff)
+
+    pairs = [i for i, (ia, ib) in enumerate(mate_cols) if ia >= 0 and ib >= 0]
+    first = [mate_cols[i][0] for i in pairs]
+    second = [mate_cols[i][1] for i in pairs]
+    relative = [
+        mobility[ia if ia >= 0 else ib] if max(ia, ib) >= 0 else 0
+        for ia, ib in mate_cols
+    ]
+    for i, rel in zip(pairs, _ranks(x[first] - x[second], cutoff[first])):
+        relative[i] = rel
+
+    reports: list[GroupReport] = []
+    for g, members in enumerate(groups):
+        local = {c: k for k, c in enumerate(members)}
+        group_mates = mates_of[g]
+        rank = sum(independent[i] for i in group_mates)
+
+        clusters = _UnionFind(len(members))
+        for i in group_mates:
+            ia, ib = mate_cols[i]
+            if ia >= 0 and ib >= 0 and relative[i] == 0:
+                clusters.union(local[ia], local[ib])
+        grounded = [k for k, c in enumerate(members) if mobility[c] == 0]
+        for k in grounded[1:]:
+            clusters.union(grounded[0], k)
+
+        reports.append(GroupReport(
+            components=[names[c] for c in members],
+            grounded=any(min(mate_cols[i]) < 0 for i in group_mates),
+            dof=6 * len(members) - rank,
+            rank=rank,
+            rows=sum(mate_sizes[i] for i in group_mates),
+            component_dof={names[c]: mobility[c] for c in members},
+            rigid_clusters=[
+                [names[members[k]] for k in cluster] for cluster in clusters.groups()
+            ],
+            redundant_mates=[
+                mates[i].name for i in group_mates
+                if independent[i] == 0
+            ],
+        ))
+
+    # Mates between fixed components / the assembly only: all rows redundant
+    mate_reports = [
+        MateReport(
+            name=mate.name,
+            type=mate_types[i],
+            group=mate_group[i],
+            rows=mate_sizes[i],
+            independent_rows=independent[i],
+            relative_dof=relative[i],
+        )
+        for i, mate in enumerate(mates)
+    ]
+    return MateDofResult(groups=reports, mates=mate_reports)
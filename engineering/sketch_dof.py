@@ -0,0 +1,747 @@
+"""Numeric degree-of-freedom analysis of 2-D sketches.
+
+Every sketch entity owns solver variables (its true DOF):
+
+========  ===============================================  ===
+point     ``x, y``                                          2
+line      ``x1, y1, x2, y2``                                4
+circle    ``cx, cy, r``                                     3
+arc       ``cx, cy, r, start angle, end angle``             5
+spline    ``x, y`` per fit point                            2n
+========  ===============================================  ===
+
+Each ``SketchConstraint`` becomes one or more equations ``g(x) = 0``
+whose gradients (forward-mode derivatives at the current geometry) are
+sparse Jacobian rows.  ``SketchSystem`` adds the rows one constraint at a
+time to a sparse row-echelon factorisation (Gaussian elimination with
+partial pivoting inside each row, fill-in limited to the rows that share
+variables), so:
+
+- ``rank`` is the number of independent equations,
+- remaining DOF = ``variables - rank``,
+- a constraint whose rows are all dependent on earlier ones is
+  *redundant* if its residual is consistent with them and *conflicting*
+  if not (the linearised system has no solution).
+
+Constraint entities are addressed by name; sub-points use a suffix:
+``L1.start``, ``L1.end``, ``A1.center``, ``A1.start``, ``A1.end``,
+``C1.center``, ``S1.start``, ``S1.end``.  The sketch origin (``origin``)
+is a fixed point with no variables.
+
+Without explicit geometry, ``analyze_sketch`` places the entities named by
+the constraints at seeded random positions and solves them onto the
+constraints: the Jacobian rank there is the generic rank of the
+constraint system, which is the DOF answer for every non-degenerate
+drawing of the sketch.
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+import random
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Optional, Sequence, Union
+
+import numpy as np
+from scipy import sparse
+from scipy.sparse import linalg as sparse_linalg
+
+if TYPE_CHECKING:
+    from training_pipeline.normalizers.sketch_constraint_normalizer import SketchConstraint
+
+ENTITY_DOF = {"point": 2, "line": 4, "circle": 3, "arc": 5}
+
+# Geometry values per entity type (spline: any even count >= 4)
+GEOMETRY_SIZE = {"point": 2, "line": 4, "circle": 3, "arc": 6}
+
+INDEPENDENT = "independent"
+REDUNDANT = "redundant"
+CONFLICTING = "conflicting"
+
+ORIGIN = "origin"
+
+# Reduced-row entries below this are dropped (limits fill-in)
+_DROP = 1e-14
+
+# Levenberg-Marquardt damping of the minimum-norm solve steps
+_DAMPING = 1e-12
+
+
+@dataclass
+class SketchEntity:
+    """One sketch entity and its current geometry.
+
+    Attributes:
+        name: Entity name used by the constraints (e.g. ``"L1"``).
+        type: ``point``, ``line``, ``circle``, ``arc`` or ``spline``.
+        geometry: ``(x, y)``; ``(x1, y1, x2, y2)``; ``(cx, cy, r)``;
+            arc ``(cx, cy, sx, sy, ex, ey)`` (center, start, end as
+            ``ISketchArc`` exports them); spline ``(x1, y1, ..., xn, yn)``.
+    """
+
+    name: str
+    type: str
+    geometry: Sequence[float]
+
+
+@dataclass
+class SketchDofResult:
+    """DOF analysis of a sketch.
+
+    Attributes:
+        variables: Solver variables (sum of entity DOF).
+        rank: Independent constraint equations.
+        dof: Remaining degrees of freedom.
+        statuses: ``independent`` / ``redundant`` / ``conflicting`` per
+            constraint, in order.
+        redundant: Indices of redundant constraints.
+        conflicting: Indices of conflicting constraints.
+    """
+
+    variables: int
+    rank: int
+    dof: int
+    statuses: list[str] = field(default_factory=list)
+    redundant: list[int] = field(default_factory=list)
+    conflicting: list[int] = field(default_factory=list)
+
+    @property
+    def is_fully_defined(self) -> bool:
+        return self.dof == 0 and not self.conflicting
+
+
+# ---------------------------------------------------------------------------
+# Forward-mode derivatives
+# ---------------------------------------------------------------------------
+
+class _Dual:
+    """Value plus sparse gradient ``{variable: derivative}``."""
+
+    __slots__ = ("v", "g")
+
+    def __init__(self, v: float, g: Optional[dict[int, float]] = None) -> None:
+        self.v = v
+        self.g = g if g is not None else {}
+
+    def __add__(self, other: Union[_Dual, float]) -> _Dual:
+        if not isinstance(other, _Dual):
+            return _Dual(self.v + other, self.g)
+        g = dict(self.g)
+        for k, d in other.g.items():
+            g[k] = g.get(k, 0.0) + d
+        return _Dual(self.v + other.v, g)
+
+    __radd__ = __add__
+
+    def __neg__(self) -> _Dual:
+        return _Dual(-self.v, {k: -d for k, d in self.g.items()})
+
+    def __sub__(self, other: Union[_Dual, float]) -> _Dual:
+        return self + (-other)
+
+    def __rsub__(self, other: float) -> _Dual:
+        return (-self) + other
+
+    def __mul__(self, other: Union[_Dual, float]) -> _Dual:
+        if not isinstance(other, _Dual):
+            return _Dual(self.v * other, {k: d * other for k, d in self.g.items()})
+        g = {k: d * other.v for k, d in self.g.items()}
+        for k, d in other.g.items():
+            g[k] = g.get(k, 0.0) + d * self.v
+        return _Dual(self.v * other.v, g)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other: Union[_Dual, float]) -> _Dual:
+        if not isinstance(other, _Dual):
+            return self * (1.0 / other)
+        inv = 1.0 / other.v
+        g = {k: d * inv for k, d in self.g.items()}
+        scale = -self.v * inv * inv
+        for k, d in other.g.items():
+            g[k] = g.get(k, 0.0) + d * scale
+        return _Dual(self.v * inv, g)
+
+
+def _apply(x: _Dual, value: float, slope: float) -> _Dual:
+    return _Dual(value, {k: d * slope for k, d in x.g.items()})
+
+
+def _sqrt(x: _Dual) -> _Dual:
+    v = math.sqrt(max(x.v, 0.0))
+    return _apply(x, v, 0.5 / v if v > 0 else 0.0)
+
+
+def _abs(x: _Dual) -> _Dual:
+    return x if x.v >= 0 else -x
+
+
+def _cos(x: _Dual) -> _Dual:
+    return _apply(x, math.cos(x.v), -math.sin(x.v))
+
+
+def _sin(x: _Dual) -> _Dual:
+    return _apply(x, math.sin(x.v), math.cos(x.v))
+
+
+def _atan2(y: _Dual, x: _Dual) -> _Dual:
+    r2 = x.v * x.v + y.v * y.v or 1.0
+    g = {k: d * (x.v / r2) for k, d in y.g.items()}
+    for k, d in x.g.items():
+        g[k] = g.get(k, 0.0) - d * (y.v / r2)
+    return _Dual(math.atan2(y.v, x.v), g)
+
+
+Point = tuple[_Dual, _Dual]
+
+
+def _psub(p: Point, q: Point) -> Point:
+    return p[0] - q[0], p[1] - q[1]
+
+
+def _dot(p: Point, q: Point) -> _Dual:
+    return p[0] * q[0] + p[1] * q[1]
+
+
+def _cross(p: Point, q: Point) -> _Dual:
+    return p[0] * q[1] - p[1] * q[0]
+
+
+def _norm(p: Point) -> _Dual:
+    return _sqrt(_dot(p, p))
+
+
+# ---------------------------------------------------------------------------
+# Geometry references
+# ---------------------------------------------------------------------------
+
+@dataclass
+class _Ref:
+    """Resolved constraint operand."""
+
+    kind: str                      # point | line | circle | arc | spline
+    coords: list[_Dual]            # all variables (for 'fixed')
+    points: dict[str, Point]       # start / end / center / '' (the point)
+    radius: Optional[_Dual] = None
+
+    def point(self, which: str = "") -> Point:
+        """The point itself, a named sub-point, or a circle / arc center."""
+        if which in self.points:
+            return self.points[which]
+        if not which and "center" in self.points:
+            return self.points["center"]
+        raise ValueError(f"A {self.kind} has no point '{which or 'center'}'.")
+
+    def direction(self) -> Point:
+        if self.kind != "line":
+            raise ValueError(f"A {self.kind} has no direction.")
+        return _psub(self.points["end"], self.points["start"])
+
+
+def _angle_residual(angle: _Dual, target: float) -> _Dual:
+    """``angle - target`` for the branch (+/- target, +180) nearest now."""
+    best = None
+    for t in (target, -target, math.pi - target, target - math.pi):
+        diff = (angle.v - t + math.pi) % (2 * math.pi) - math.pi
+        if best is None or abs(diff) < abs(best[0]):
+            best = (diff, t)
+    return angle - (angle.v - best[0])
+
+
+# ---------------------------------------------------------------------------
+# Sketch system
+# ---------------------------------------------------------------------------
+
+class SketchSystem:
+    """Incremental sketch DOF solver.
+
+    Constraints are classified as they are added, at the current geometry
+    (a solved sketch exported from SolidWorks).  ``solve`` first moves the
+    geometry onto the constraint set (sparse Gauss-Newton) and classifies
+    everything again -- needed when the geometry is approximate or
+    inferred, since dependencies such as "two horizontal lines are
+    parallel" only show in the Jacobian where the constraints hold.
+
+    Args:
+        entities: Initial entities (more can be added later).
+        tol: Pivot tolerance on unit-norm Jacobian rows.
+        conflict_tol: Residual (relative to the sketch size) above which a
+            dependent constraint conflicts.
+        scale: Characteristic sketch size; defaults to the extent of the
+            initial geometry.
+    """
+
+    def __init__(
+        self,
+        entities: Sequence[SketchEntity] = (),
+        tol: float = 1e-9,
+        conflict_tol: float = 1e-6,
+        scale: Optional[float] = None,
+    ) -> None:
+        self.tol = tol
+        self.conflict_tol = conflict_tol
+        if scale is None:
+            coords = [float(v) for e in entities for v in e.geometry]
+            scale = max(coords) - min(coords) if coords else 1.0
+        self.scale = scale or 1.0
+
+        self.values: list[float] = []
+        self._entities: dict[str, tuple[str, list[int]]] = {}
+        self._refs: Optional[dict[str, _Ref]] = None
+        self.constraints: list[SketchConstraint] = []
+        self.statuses: list[str] = []
+        self._max_residual = 0.0
+        # Row echelon form: pivot column -> (order, row, rhs)
+        self._pivots: dict[int, tuple[int, dict[int, float], float]] = {}
+
+        for entity in entities:
+            self.add_entity(entity)
+
+    # -- entities ------------------------------------------------------
+
+    def add_entity(self, entity: SketchEntity) -> None:
+        """Register *entity* and its variables."""
+        kind = entity.type.lower()
+        name = entity.name
+        if name in self._entities or name.lower() == ORIGIN:
+            raise ValueError(f"Duplicate sketch entity '{name}'.")
+        geom = [float(v) / self.scale for v in entity.geometry]
+        expected = GEOMETRY_SIZE.get(kind)
+        if kind == "spline":
+            if len(geom) < 4 or len(geom) % 2:
+                raise ValueError(f"Spline '{name}' needs an even number (>= 4) of coordinates.")
+        elif expected is None:
+            raise ValueError(f"Unsupported sketch entity type '{entity.type}'.")
+        elif len(geom) != expected:
+            raise ValueError(f"{kind.capitalize()} '{name}' needs {expected} geometry values.")
+
+        if kind == "arc":
+            cx, cy, sx, sy, ex, ey = geom
+            geom = [
+                cx, cy, math.hypot(sx - cx, sy - cy),
+                math.atan2(sy - cy, sx - cx), math.atan2(ey - cy, ex - cx),
+            ]
+        first = len(self.values)
+        self.values.extend(geom)
+        self._entities[name] = (kind, list(range(first, len(self.values))))
+        self._refs = None
+
+    def _ref(self, kind: str, index: list[int]) -> _Ref:
+        """Operand for an entity at the current variable values."""
+        v = [_Dual(self.values[i], {i: 1.0}) for i in index]
+        if kind == "point":
+            return _Ref(kind, v, {"": (v[0], v[1])})
+        if kind == "line":
+            return _Ref(kind, v, {"start": (v[0], v[1]), "end": (v[2], v[3])})
+        if kind == "circle":
+            return _Ref(kind, v, {"center": (v[0], v[1])}, radius=v[2])
+        if kind == "arc":
+            c, r, a0, a1 = (v[0], v[1]), v[2], v[3], v[4]
+            start = (c[0] + r * _cos(a0), c[1] + r * _sin(a0))
+            end = (c[0] + r * _cos(a1), c[1] + r * _sin(a1))
+            return _Ref(kind, v, {"center": c, "start": start, "end": end}, radius=r)
+        pts = [(v[i], v[i + 1]) for i in range(0, len(v), 2)]
+        return _Ref(kind, v, {"start": pts[0], "end": pts[-1]})
+
+    def _resolve(self, name: Optional[str], kind: Optional[str]) -> _Ref:
+        if not name:
+            raise ValueError("Constraint is missing an entity name.")
+        if self._refs is None:
+            self._refs = {n: self._ref(k, idx) for n, (k, idx) in self._entities.items()}
+            origin = (_Dual(0.0), _Dual(0.0))
+            self._refs[ORIGIN] = _Ref("point", [], {"": origin})
+        if name in self._refs:
+            return self._refs[name]
+        if name.lower() == ORIGIN:
+            return self._refs[ORIGIN]
+        base, _, which = name.rpartition(".")
+        if base in self._refs and which:
+            pt = self._refs[base].point(which)
+            return _Ref("point", list(pt), {"": pt})
+        raise ValueError(f"Unknown sketch entity '{name}' ({kind or 'any type'}).")
+
+    # -- constraints ---------------------------------------------------
+
+    def _equations(self, constraint: SketchConstraint) -> list[_Dual]:
+        e1 = self._resolve(constraint.entity1_name, constraint.entity1_type)
+        e2 = (
+            self._resolve(constraint.entity2_name, constraint.entity2_type)
+            if constraint.entity2_name else None
+        )
+        ref = (
+            self._resolve(constraint.reference_entity, "line")
+            if constraint.reference_entity else None
+        )
+        return _equations(
+            constraint.constraint_type, e1, e2, ref, constraint.value, self.scale,
+        )
+
+    def add_constraint(self, constraint: SketchConstraint) -> str:
+        """Add one constraint; returns its status at the current geometry."""
+        equations = self._equations(constraint)
+        self.constraints.append(constraint)
+        status = self._classify(equations)
+        self.statuses.append(status)
+        return status
+
+    def add_constraints(self, constraints: Sequence[SketchConstraint]) -> list[str]:
+        return [self.add_constraint(c) for c in constraints]
+
+    def _classify(self, equations: list[_Dual]) -> str:
+        independent = 0
+        conflict = False
+        for eq in equations:
+            row = {k: d for k, d in eq.g.items() if d}
+            norm = math.sqrt(sum(d * d for d in row.values())) or 1.0
+            inv = 1.0 / norm
+            row = {k: d * inv for k, d in row.items()}
+            self._max_residual = max(self._max_residual, abs(eq.v))
+            added, rhs = self._eliminate(row, -eq.v * inv)
+            if added:
+                independent += 1
+            elif abs(rhs) > self.conflict_tol:
+                conflict = True
+        if independent:
+            return INDEPENDENT
+        return CONFLICTING if conflict else REDUNDANT
+
+    def _eliminate(self, row: dict[int, float], rhs: float) -> tuple[bool, float]:
+        """Reduce *row* by the pivots; store it if independent."""
+        pivots = self._pivots
+        heap = [(pivots[k][0], k) for k in row if k in pivots]
+        heapq.heapify(heap)
+        queued = {k for _, k in heap}
+        # A pivot row only holds columns that became pivots after it, so
+        # eliminating oldest-first terminates.
+        while heap:
+            _, col = heapq.heappop(heap)
+            value = row.pop(col, 0.0)
+            if not value:
+                continue
+            _, prow, prhs = pivots[col]
+            factor = value / prow[col]
+            for k, d in prow.items():
+                if k == col:
+                    continue
+                new = row.get(k, 0.0) - factor * d
+                if abs(new) < _DROP:
+                    row.pop(k, None)
+                    continue
+                row[k] = new
+                if k in pivots and k not in queued:
+                    queued.add(k)
+                    heapq.heappush(heap, (pivots[k][0], k))
+            rhs -= factor * prhs
+
+        if not row:
+            return False, rhs
+        col = max(row, key=lambda k: abs(row[k]))
+        if abs(row[col]) <= self.tol:
+            return False, rhs
+        pivots[col] = (len(pivots), row, rhs)
+        return True, rhs
+
+    # -- solving -------------------------------------------------------
+
+    def solve(self, max_iter: int = 30, tol: float = 1e-10, max_rounds: int = 5) -> float:
+        """Move the geometry onto the constraints and reclassify them.
+
+        Each round solves the currently independent constraints with
+        minimum-norm Gauss-Newton steps (a sparse ``J J^T`` solve, lightly
+        damped for redundant rows) and classifies every constraint again at
+        the result, until the independent set stops changing.  Dependent
+        constraints the solution does not satisfy are the conflicts.
+
+        Returns:
+            The largest remaining residual of the independent constraints.
+        """
+        residual = self._max_residual
+        if residual <= tol:
+            return residual
+        for _ in range(max_rounds):
+            active = [c for c, st in zip(self.constraints, self.statuses) if st == INDEPENDENT]
+            residual = self._gauss_newton(active, max_iter, tol)
+            before = self.statuses
+            self._pivots = {}
+            self._max_residual = 0.0
+            self.statuses = [self._classify(self._equations(c)) for c in self.constraints]
+            if self.statuses == before:
+                break
+        return residual
+
+    def _gauss_newton(self, constraints: list[SketchConstraint], max_iter: int, tol: float) -> float:
+        n = len(self.values)
+        residual = 0.0
+        for _ in range(max_iter):
+            rows: list[int] = []
+            cols: list[int] = []
+            vals: list[float] = []
+            rhs: list[float] = []
+            for constraint in constraints:
+                for eq in self._equations(constraint):
+                    r = len(rhs)
+                    for k, d in eq.g.items():
+                        rows.append(r)
+                        cols.append(k)
+                        vals.append(d)
+                    rhs.append(-eq.v)
+            residual = max((abs(g) for g in rhs), default=0.0)
+            if residual <= tol:
+                break
+            jacobian = sparse.csr_matrix((vals, (rows, cols)), shape=(len(rhs), n))
+            normal = (jacobian @ jacobian.T + _DAMPING * sparse.identity(len(rhs))).tocsc()
+            step = jacobian.T @ sparse_linalg.spsolve(normal, np.asarray(rhs))
+            self.values = (np.asarray(self.values) + step).tolist()
+            self._refs = None
+        return residual
+
+    # -- results -------------------------------------------------------
+
+    @property
+    def variables(self) -> int:
+        return len(self.values)
+
+    @property
+    def rank(self) -> int:
+        return len(self._pivots)
+
+    @property
+    def dof(self) -> int:
+        return self.variables - self.rank
+
+    def result(self) -> SketchDofResult:
+        return SketchDofResult(
+            variables=self.variables,
+            rank=self.rank,
+            dof=self.dof,
+            statuses=list(self.statuses),
+            redundant=[i for i, s in enumerate(self.statuses) if s == REDUNDANT],
+            conflicting=[i for i, s in enumerate(self.statuses) if s == CONFLICTING],
+        )
+
+
+def _signed_distance(line: _Ref, p: Point) -> _Dual:
+    d = line.direction()
+    return _cross(d, _psub(p, line.points["start"])) / _norm(d)
+
+
+def _line_distance(line: _Ref, p: Point) -> _Dual:
+    return _abs(_signed_distance(line, p))
+
+
+def _symmetric_points(p: Point, q: Point, axis: _Ref) -> list[_Dual]:
+    a, d = axis.points["start"], axis.direction()
+    mid = ((p[0] + q[0]) * 0.5, (p[1] + q[1]) * 0.5)
+    return [_cross(d, _psub(mid, a)) / _norm(d), _dot(_psub(q, p), d) / _norm(d)]
+
+
+def _equations(
+    ctype: str,
+    e1: _Ref,
+    e2: Optional[_Ref],
+    ref: Optional[_Ref],
+    value: Optional[float],
+    scale: float,
+) -> list[_Dual]:
+    """Residual equations of one constraint."""
+    ctype = ctype.lower()
+    k1 = e1.kind
+    k2 = e2.kind if e2 is not None else None
+    kinds = {k1, k2} - {None}
+    round_kinds = {"circle", "arc"}
+
+    if ctype == "fixed":
+        return [c - c.v for c in e1.coords]
+
+    if e2 is None and ctype in ("horizontal", "vertical"):
+        d = e1.direction()
+        return [d[1] if ctype == "horizontal" else d[0]]
+
+    if ctype in ("radius", "diameter"):
+        if e1.radius is None or value is None:
+            raise ValueError(f"'{ctype}' needs a circle or arc and a value.")
+        factor = 2.0 if ctype == "diameter" else 1.0
+        return [e1.radius * factor - value / scale]
+
+    if ctype == "angle":
+        if value is None:
+            raise ValueError("'angle' needs a value.")
+        d1 = e1.direction()
+        d2 = e2.direction() if e2 is not None else (_Dual(1.0), _Dual(0.0))
+        return [_angle_residual(_atan2(_cross(d1, d2), _dot(d1, d2)), math.radians(value))]
+
+    if ctype == "distance":
+        if value is None:
+            raise ValueError("'distance' needs a value.")
+        target = value / scale
+        if e2 is None:
+            if k1 != "line":
+                raise ValueError("A single-entity distance needs a line.")
+            return [_norm(e1.direction()) - target]
+        if k1 == "line" and k2 == "line":
+            return [_line_distance(e1, e2.points["start"]) - target]
+        if k1 == "line" or k2 == "line":
+            line, other = (e1, e2) if k1 == "line" else (e2, e1)
+            return [_line_distance(line, other.point()) - target]
+        return [_norm(_psub(e1.point(), e2.point())) - target]
+
+    if e2 is None:
+        raise ValueError(f"'{ctype}' requires a second entity.")
+
+    if ctype in ("horizontal", "vertical"):
+        d = _psub(e2.point(), e1.point())
+        return [d[1] if ctype == "horizontal" else d[0]]
+
+    if ctype in ("perpendicular", "parallel"):
+        d1, d2 = e1.direction(), e2.direction()
+        op = _dot if ctype == "perpendicular" else _cross
+        return [op(d1, d2) / (_norm(d1) * _norm(d2))]
+
+    if ctype == "collinear" or (ctype == "coincident" and kinds == {"line"}):
+        return [_signed_distance(e1, e2.points[end]) for end in ("start", "end")]
+
+    if ctype == "concentric" or (ctype == "coincident" and kinds <= round_kinds):
+        c1, c2 = e1.point(), e2.point()
+        eqs = [c1[0] - c2[0], c1[1] - c2[1]]
+        if ctype == "coincident":
+            eqs.append(e1.radius - e2.radius)
+        return eqs
+
+    if ctype == "coincident":
+        if k1 == "point" and k2 == "point":
+            p, q = e1.point(), e2.point()
+            return [p[0] - q[0], p[1] - q[1]]
+        point, curve = (e1, e2) if k1 == "point" else (e2, e1)
+        if point.kind != "point":
+            raise ValueError(f"'coincident' is not defined between a {k1} and a {k2}.")
+        if curve.kind == "line":
+            return [_signed_distance(curve, point.point())]
+        if curve.radius is not None:
+            return [_norm(_psub(point.point(), curve.point())) - curve.radius]
+        raise ValueError(f"'coincident' on a {curve.kind} is not supported.")
+
+    if ctype == "midpoint":
+        point, line = (e1, e2) if k2 == "line" else (e2, e1)
+        if line.kind != "line" or point.kind != "point":
+            raise ValueError("'midpoint' relates a point and a line.")
+        a, b = line.points["start"], line.points["end"]
+        p = point.point()
+        return [p[0] - (a[0] + b[0]) * 0.5, p[1] - (a[1] + b[1]) * 0.5]
+
+    if ctype == "equal":
+        if kinds == {"line"}:
+            return [_norm(e1.direction()) - _norm(e2.direction())]
+        if kinds <= round_kinds:
+            return [e1.radius - e2.radius]
+        raise ValueError(f"'equal' is not defined between a {k1} and a {k2}.")
+
+    if ctype == "tangent":
+        if "line" in kinds and kinds & round_kinds:
+            line, curve = (e1, e2) if k1 == "line" else (e2, e1)
+            return [_line_distance(line, curve.point()) - curve.radius]
+        if kinds <= round_kinds:
+            dist = _norm(_psub(e1.point(), e2.point()))
+            outer = dist - (e1.radius + e2.radius)
+            inner = dist - _abs(e1.radius - e2.radius)
+            return [outer if abs(outer.v) <= abs(inner.v) else inner]
+        raise ValueError(f"'tangent' is not defined between a {k1} and a {k2}.")
+
+    if ctype == "symmetric":
+        if ref is None or ref.kind != "line":
+            raise ValueError("'symmetric' needs a reference centerline.")
+        if k1 == "line" and k2 == "line":
+            return [
+                eq for end in ("start", "end")
+                for eq in _symmetric_points(e1.points[end], e2.points[end], ref)
+            ]
+        eqs = _symmetric_points(e1.point(), e2.point(), ref)
+        if e1.radius is not None and e2.radius is not None:
+            eqs.append(e1.radius - e2.radius)
+        return eqs
+
+    raise ValueError(f"Unsupported sketch constraint type '{ctype}'.")
+
+
+# ---------------------------------------------------------------------------
+# Convenience
+# ---------------------------------------------------------------------------
+
+def infer_entities(constraints: Sequence[SketchConstraint], seed: int = 0) -> list[SketchEntity]:
+    """Entities named by *constraints*, at seeded random (generic) positions.
+
+    Sub-point names (``L1.start``) resolve to their parent when the parent
+    is named too; otherwise they become standalone points.
+    """
+    rng = random.Random(seed)
+    # Spread the entities over the dimensioned size so the solve is short
+    spread = max(
+        (c.value for c in constraints
+         if c.value and c.constraint_type in ("distance", "radius", "diameter")),
+        default=1.0,
+    )
+    kinds: dict[str, str] = {}
+    for c in constraints:
+        for name, kind in (
+            (c.entity1_name, c.entity1_type),
+            (c.entity2_name, c.entity2_type),
+            (c.reference_entity, "line"),
+        ):
+            if name and name.lower() != ORIGIN and name not in kinds:
+                kinds[name] = (kind or "point").lower()
+
+    entities = []
+    for name, kind in kinds.items():
+        base, _, which = name.rpartition(".")
+        if which and base in kinds:
+            continue
+        u = [rng.uniform(-spread, spread) for _ in range(4)]
+        if kind == "line":
+            geometry = u
+        elif kind == "circle":
+            geometry = [u[0], u[1], rng.uniform(0.2, 1.0) * spread]
+        elif kind == "arc":
+            r = rng.uniform(0.2, 1.0) * spread
+            a0, a1 = rng.uniform(0, math.pi), rng.uniform(math.pi, 2 * math.pi)
+            geometry = [
+                u[0], u[1],
+                u[0] + r * math.cos(a0), u[1] + r * math.sin(a0),
+                u[0] + r * math.cos(a1), u[1] + r * math.sin(a1),
+            ]
+        elif kind == "spline":
+            geometry = u + [rng.uniform(-spread, spread) for _ in range(4)]
+        elif kind == "point":
+            geometry = u[:2]
+        else:
+            kind, geometry = "point", u[:2]
+        entities.append(SketchEntity(name, kind, geometry))
+    return entities
+
+
+def analyze_sketch(
+    constraints: Sequence[SketchConstraint],
+    entities: Optional[Sequence[SketchEntity]] = None,
+    tol: float = 1e-9,
+    conflict_tol: float = 1e-6,
+    seed: int = 0,
+) -> SketchDofResult:
+    """Exact remaining DOF and redundant / conflicting constraints.
+
+    Args:
+        constraints: Sketch constraints, in the order they were added.
+        entities: Entity geometry (solved onto the constraints first);
+            inferred generically from the constraints when omitted.
+        tol: Pivot tolerance.
+        conflict_tol: Relative residual that marks a conflict.
+        seed: Seed for inferred geometry.
+
+    Raises:
+        ValueError: Unknown entities, unsupported entity / constraint
+                    combinations or missing dimension values.
+    """
+    if entities is None:
+        entities = infer_entities(constraints, seed)
+    system = SketchSystem(entities, tol, conflict_tol)
+    system.add_constraints(constraints)
+    system.solve()
+    return system.result()
@@ -0,0 +1,484 @@
+"""One-dimensional tolerance stack-up analysis.
+
+A stack is a closed loop of dimensions; each contributor adds (``direction
+= +1``) or subtracts (``-1``) its value to the result, typically a gap or
+clearance.  Three methods are provided:
+
+- **Worst case** -- every contributor at its adverse limit.
+- **RSS** -- root-sum-square of the half-bands.  A normal contributor
+  whose band spans more than +/-3 standard deviations (``sigma > 3``)
+  contributes its +/-3 sigma range instead; no contributor counts for more
+  than its half-band, so RSS never exceeds worst case.
+- **Monte Carlo** -- vectorised NumPy sampling, processed in fixed-size
+  chunks so memory stays bounded for any sample count.  Percentiles come
+  from a fixed-bin histogram over the worst-case range.
+
+Geometric tolerances (``GDTSpecification``) contribute a zone of width
+``t`` centred on the nominal.  With an MMC or LMC modifier and a feature of
+size, the zone grows by the bonus tolerance -- the departure of the
+feature's actual size from its MMC (or LMC) size -- which the Monte Carlo
+samples from the feature's size tolerance.
+
+Example::
+
+    stack = ToleranceStack([
+        StackContributor("housing", 50.0, 0.10, 0.10, direction=+1),
+        StackContributor("shaft", 49.8, 0.05, 0.05, direction=-1),
+        StackContributor.from_gdt(
+            "bore position", spec, direction=-1,
+            feature_size=FeatureOfSize(10.0, 0.1, 0.0, is_external=False),
+        ),
+    ], lower_limit=0.0)
+    result = stack.analyze(samples=1_000_000)
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Optional, Sequence
+
+import numpy as np
+
+from training_pipeline.normalizers.gdt_normalizer import GDTSpecification
+
+if TYPE_CHECKING:
+    from parameterization.parameter_space import ParameterDefinition
+
+# Samples per Monte Carlo chunk (each chunk holds a few float64 arrays of
+# this length per contributor)
+DEFAULT_CHUNK_SIZE = 262_144
+
+# Histogram resolution for Monte Carlo percentiles
+_HISTOGRAM_BINS = 8192
+
+_PERCENTILES = (0.135, 1.0, 5.0, 50.0, 95.0, 99.0, 99.865)
+
+DISTRIBUTIONS = ("normal", "uniform")
+
+
+@dataclass(frozen=True)
+class FeatureOfSize:
+    """Size tolerance of the feature a geometric tolerance applies to.
+
+    Attributes:
+        nominal: Nominal size (e.g. hole or pin diameter).
+        tol_plus: Upper deviation (positive number).
+        tol_minus: Lower deviation magnitude (positive number).
+        is_external: True for pins/shafts, False for holes/slots.
+    """
+
+    nominal: float
+    tol_plus: float
+    tol_minus: float
+    is_external: bool = True
+
+    @property
+    def mmc(self) -> float:
+        """Maximum material condition size."""
+        return self.nominal + self.tol_plus if self.is_external else self.nominal - self.tol_minus
+
+    @property
+    def lmc(self) -> float:
+        """Least material condition size."""
+        return self.nominal - self.tol_minus if self.is_external else self.nominal + self.tol_plus
+
+    def bonus(self, actual: np.ndarray, modifier: Optional[str]) -> np.ndarray:
+        """Bonus tolerance for actual sizes *actual* under *modifier*."""
+        if modifier == "MMC":
+            return np.abs(actual - self.mmc)
+        if modifier == "LMC":
+            return np.abs(actual - self.lmc)
+        return np.zeros_like(actual)
+
+    @property
+    def max_bonus(self) -> float:
+        """Largest possible bonus (full size tolerance band)."""
+        return self.tol_plus + self.tol_minus
+
+
+@dataclass
+class StackContributor:
+    """One dimension (or geometric tolerance) in the stack.
+
+    Attributes:
+        name: Label used in the report.
+        nominal: Nominal value (0 for pure geometric contributors).
+        tol_plus: Upper deviation (positive number).
+        tol_minus: Lower deviation magnitude (positive number).
+        direction: +1 if the dimension adds to the result, -1 if it subtracts.
+        distribution: ``"normal"`` (band = +/- ``sigma`` std devs, clipped)
+                      or ``"uniform"``.
+        sigma: Standard deviations per half-band for normal distributions.
+        gdt: Optional geometric tolerance adding a zone around the nominal.
+        feature_size: Size tolerance used for the MMC/LMC bonus of *gdt*.
+    """
+
+    name: str
+    nominal: float
+    tol_plus: float = 0.0
+    tol_minus: float = 0.0
+    direction: int = 1
+    distribution: str = "normal"
+    sigma: float = 3.0
+    gdt: Optional[GDTSpecification] = None
+    feature_size: Optional[FeatureOfSize] = None
+
+    def __post_init__(self) -> None:
+        if self.direction not in (1, -1):
+            raise ValueError(f"Contributor '{self.name}': direction must be +1 or -1.")
+        if self.tol_plus < 0 or self.tol_minus < 0:
+            raise ValueError(
+                f"Contributor '{self.name}': tolerances are magnitudes and must be >= 0."
+            )
+        if self.distribution not in DISTRIBUTIONS:
+            raise ValueError(
+                f"Contributor '{self.name}': unknown distribution '{self.distribution}'. "
+                f"Valid values: {', '.join(DISTRIBUTIONS)}"
+            )
+        if self.sigma <= 0:
+            raise ValueError(f"Contributor '{self.name}': sigma must be positive.")
+
+    # ------------------------------------------------------------------
+    # Constructors
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_parameter(
+        cls,
+        param: ParameterDefinition,
+        direction: int = 1,
+        value: Optional[float] = None,
+        **kwargs: Any,
+    ) -> StackContributor:
+        """Contributor from a ``ParameterDefinition`` with bilateral tolerance.
+
+        Args:
+            param: Parameter providing ``default_value`` and
+                   ``tolerance_plus`` / ``tolerance_minus`` (the lower
+                   deviation is stored signed, e.g. ``-0.1``).
+            direction: +1 or -1.
+            value: Nominal override (e.g. from a ``ParameterAssignment``).
+        """
+        return cls(
+            name=param.name,
+            nominal=float(param.default_value if value is None else value),
+            tol_plus=abs(param.tolerance_plus or 0.0),
+            tol_minus=abs(param.tolerance_minus or 0.0),
+            direction=direction,
+            **kwargs,
+        )
+
+    @classmethod
+    def from_gdt(
+        cls,
+        name: str,
+        spec: GDTSpecification,
+        direction: int = 1,
+        nominal: float = 0.0,
+        feature_size: Optional[FeatureOfSize] = None,
+        **kwargs: Any,
+    ) -> StackContributor:
+        """Contributor for a geometric tolerance about a basic *nominal*."""
+        return cls(
+            name=name,
+            nominal=nominal,
+            direction=direction,
+            gdt=spec,
+            feature_size=feature_size,
+            **kwargs,
+        )
+
+    # ------------------------------------------------------------------
+    # Derived quantities
+    # ------------------------------------------------------------------
+
+    @property
+    def mean(self) -> float:
+        """Mid-point of the size band."""
+        return self.nominal + (self.tol_plus - self.tol_minus) / 2.0
+
+    @property
+    def half_band(self) -> float:
+        """Half-width of the size band."""
+        return (self.tol_plus + self.tol_minus) / 2.0
+
+    @property
+    def geometric_half_band(self) -> float:
+        """Largest half-width of the geometric zone, including bonus."""
+        if self.gdt is None:
+            return 0.0
+        zone = self.gdt.tolerance_value
+        if self.feature_size is not None and self.gdt.material_modifier in ("MMC", "LMC"):
+            zone += self.feature_size.max_bonus
+        return zone / 2.0
+
+    @property
+    def worst_case_half_band(self) -> float:
+        """Worst-case contribution to either side of the mean."""
+        return self.half_band + self.geometric_half_band
+
+
+@dataclass
+class MonteCarloResult:
+    """Monte Carlo statistics of the stack result."""
+
+    samples: int
+    mean: float
+    std: float
+    min: float
+    max: float
+    percentiles: dict[str, float]
+    in_spec_fraction: Optional[float] = None
+
+    @property
+    def ppm_out_of_spec(self) -> Optional[float]:
+        """Parts per million outside the limits (``None`` without limits)."""
+        if self.in_spec_fraction is None:
+            return None
+        return (1.0 - self.in_spec_fraction) * 1e6
+
+
+@dataclass
+class StackResult:
+    """Worst-case, RSS and (optionally) Monte Carlo results of a stack."""
+
+    nominal: float
+    mean: float
+    worst_case_min: float
+    worst_case_max: float
+    rss_min: float
+    rss_max: float
+    contributions: list[dict[str, Any]] = field(default_factory=list)
+    monte_carlo: Optional[MonteCarloResult] = None
+    lower_limit: Optional[float] = None
+    upper_limit: Optional[float] = None
+
+    @property
+    def worst_case_ok(self) -> Optional[bool]:
+        """Whether the worst-case range lies within the limits."""
+        if self.lower_limit is None and self.upper_limit is None:
+            return None
+        return (
+            (self.lower_limit is None or self.worst_case_min >= self.lower_limit)
+            and (self.upper_limit is None or self.worst_case_max <= self.upper_limit)
+        )
+
+
+class ToleranceStack:
+    """A chain of contributors with optional limits on the result.
+
+    Args:
+        contributors: The dimensions in the loop.
+        lower_limit: Minimum acceptable result (e.g. 0 for a clearance).
+        upper_limit: Maximum acceptable result.
+    """
+
+    def __init__(
+        self,
+        contributors: Sequence[StackContributor],
+        lower_limit: Optional[float] = None,
+        upper_limit: Optional[float] = None,
+    ) -> None:
+        if not contributors:
+            raise ValueError("A tolerance stack needs at least one contributor.")
+        self.contributors = list(contributors)
+        self.lower_limit = lower_limit
+        self.upper_limit = upper_limit
+
+        self._direction = np.array([c.direction for c in self.contributors], dtype=float)
+        self._mean = np.array([c.mean for c in self.contributors])
+        self._half = np.array([c.half_band for c in self.contributors])
+        self._geo_half = np.array([c.geometric_half_band for c in self.contributors])
+
+    # ------------------------------------------------------------------
+    # Analytic methods
+    # ------------------------------------------------------------------
+
+    @property
+    def nominal(self) -> float:
+        """Result with every contributor at nominal."""
+        return float(sum(c.direction * c.nominal for c in self.contributors))
+
+    @property
+    def mean(self) -> float:
+        """Result with every contributor at its band mid-point."""
+        return float(self._direction @ self._mean)
+
+    def worst_case(self) -> tuple[float, float]:
+        """Return ``(min, max)`` of the result with all contributors adverse."""
+        spread = float(np.sum(self._half + self._geo_half))
+        return self.mean - spread, self.mean + spread
+
+    def rss(self) -> tuple[float, float]:
+        """Return ``(min, max)`` as mean -/+ root-sum-square of half-bands.
+
+        Each contributor enters with its half-band, or its narrower
+        +/-3 sigma range when it is normal with ``sigma > 3``, so the result
+        always lies within :meth:`worst_case`.
+        """
+        spread = float(np.sqrt(np.sum(self._rss_terms())))
+        return self.mean - spread, self.mean + spread
+
+    def _rss_terms(self) -> np.ndarray:
+        """Squared RSS contributions of every contributor."""
+        scale = np.array([min(1.0, 3.0 / c.sigma) if c.distribution == "normal" else 1.0
+                          for c in self.contributors])
+        return scale ** 2 * (self._half ** 2 + self._geo_half ** 2)
+
+    # ------------------------------------------------------------------
+    # Monte Carlo
+    # ------------------------------------------------------------------
+
+    def monte_carlo(
+        self,
+        samples: int = 1_000_000,
+        seed: Optional[int] = 0,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> MonteCarloResult:
+        """Sample the stack *samples* times in chunks of *chunk_size*.
+
+        Size deviations follow each contributor's distribution, clipped to
+        its band.  Geometric zones are sampled around the nominal with a
+        width of ``t + bonus``, where the bonus comes from a sampled actual
+        feature size.
+        """
+        if samples <= 0:
+            raise ValueError("samples must be positive.")
+
+        rng = np.random.default_rng(seed)
+        lo, hi = self.worst_case()
+        if hi <= lo:
+            hi = lo + 1e-12
+        counts = np.zeros(_HISTOGRAM_BINS, dtype=np.int64)
+
+        total = 0.0
+        total_sq = 0.0
+        observed_min = math.inf
+        observed_max = -math.inf
+        in_spec = 0
+
+        remaining = samples
+        while remaining > 0:
+            n = min(chunk_size, remaining)
+            remaining -= n
+            result = self._sample_chunk(rng, n)
+
+            # Shift by the mean before squaring to keep the variance
+            # accumulation numerically stable.
+            centred = result - self.mean
+            total += float(centred.sum())
+            total_sq += float(centred @ centred)
+            observed_min = min(observed_min, float(result.min()))
+            observed_max = max(observed_max, float(result.max()))
+
+            bins = ((result - lo) * (_HISTOGRAM_BINS / (hi - lo))).astype(np.int64)
+            np.clip(bins, 0, _HISTOGRAM_BINS - 1, out=bins)
+            counts += np.bincount(bins, minlength=_HISTOGRAM_BINS)
+
+            if self.lower_limit is not None or self.upper_limit is not None:
+                ok = np.ones(n, dtype=bool)
+                if self.lower_limit is not None:
+                    ok &= result >= self.lower_limit
+                if self.upper_limit is not None:
+                    ok &= result <= self.upper_limit
+                in_spec += int(ok.sum())
+
+        mean_offset = total / samples
+        variance = max(total_sq / samples - mean_offset ** 2, 0.0)
+
+        cumulative = np.cumsum(counts) / samples
+        edges = np.linspace(lo, hi, _HISTOGRAM_BINS + 1)
+        percentiles = {
+            f"p{p:g}": float(np.interp(p / 100.0, cumulative, edges[1:]))
+            for p in _PERCENTILES
+        }
+
+        limited = self.lower_limit is not None or self.upper_limit is not None
+        return MonteCarloResult(
+            samples=samples,
+            mean=self.mean + mean_offset,
+            std=math.sqrt(variance),
+            min=observed_min,
+            max=observed_max,
+            percentiles=percentiles,
+            in_spec_fraction=in_spec / samples if limited else None,
+        )
+
+    def _sample_chunk(self, rng: np.random.Generator, n: int) -> np.ndarray:
+        """Stack result for *n* samples."""
+        result = np.zeros(n)
+        for c in self.contributors:
+            value = c.mean + _deviation(rng, n, c.half_band, c.distribution, c.sigma)
+            if c.gdt is not None:
+                half = np.full(n, c.gdt.tolerance_value / 2.0)
+                if c.feature_size is not None and c.gdt.material_modifier in ("MMC", "LMC"):
+                    fos = c.feature_size
+                    size_mean = fos.nominal + (fos.tol_plus - fos.tol_minus) / 2.0
+                    actual = size_mean + _deviation(
+                        rng, n, (fos.tol_plus + fos.tol_minus) / 2.0, c.distribution, c.sigma
+                    )
+                    half += fos.bonus(actual, c.gdt.material_modifier) / 2.0
+                value = value + _deviation(rng, n, 1.0, c.distribution, c.sigma) * half
+            if c.direction > 0:
+                result += value
+            else:
+                result -= value
+        return result
+
+    # ------------------------------------------------------------------
+    # Combined report
+    # ------------------------------------------------------------------
+
+    def analyze(
+        self,
+        samples: Optional[int] = 1_000_000,
+        seed: Optional[int] = 0,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> StackResult:
+        """Run worst-case, RSS and (unless *samples* is falsy) Monte Carlo."""
+        wc_min, wc_max = self.worst_case()
+        rss_min, rss_max = self.rss()
+
+        rss_terms = self._rss_terms()
+        rss_total = float(rss_terms.sum()) or 1.0
+        contributions = [
+            {
+                "name": c.name,
+                "direction": c.direction,
+                "worst_case_half_band": c.worst_case_half_band,
+                "rss_percent": round(100.0 * float(term) / rss_total, 3),
+            }
+            for c, term in zip(self.contributors, rss_terms)
+        ]
+
+        return StackResult(
+            nominal=self.nominal,
+            mean=self.mean,
+            worst_case_min=wc_min,
+            worst_case_max=wc_max,
+            rss_min=rss_min,
+            rss_max=rss_max,
+            contributions=contributions,
+            monte_carlo=self.monte_carlo(samples, seed, chunk_size) if samples else None,
+            lower_limit=self.lower_limit,
+            upper_limit=self.upper_limit,
+        )
+
+
+def _deviation(
+    rng: np.random.Generator,
+    n: int,
+    half_band: float,
+    distribution: str,
+    sigma: float,
+) -> np.ndarray:
+    """*n* deviations within +/- *half_band* (array is always fresh)."""
+    if half_band == 0:
+        return np.zeros(n)
+    if distribution == "uniform":
+        return rng.uniform(-half_band, half_band, n)
+    dev = rng.standard_normal(n)
+    dev *= half_band / sigma
+    np.clip(dev, -half_band, half_band, out=dev)
+    return dev
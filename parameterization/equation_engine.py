@@ -0,0 +1,496 @@
+"""
+Equation Engine: evaluates SolidWorks-style global-variable equations.
+
+Equations use the syntax of the SolidWorks Equations dialog::
+
+    "Width"        = 100
+    "Height"       = "Width" / 2 + 5mm
+    "D1@Sketch1"   = iif("Width" > 80, "Height", "Height" * 2)
+    "D2@Sketch1"   = sqr("Width" ^ 2 + "Height" ^ 2)
+
+Each right-hand side is parsed once (a small recursive-descent parser --
+nothing is passed to ``eval``) into a sympy expression, the equations are
+ordered by their dependency DAG, and every equation is compiled with
+``sympy.lambdify`` into a NumPy function of only the names it references.
+Evaluating a whole design table is then one vectorised call per
+equation::
+
+    system = EquationSystem(lines)
+    values = system.evaluate({"Width": np.linspace(60, 120, 5000)})
+
+``EquationState`` keeps the values of one batch and, when inputs change,
+recomputes only the equations downstream of them.
+
+Quoted names that are never assigned are inputs; equations with a
+constant right-hand side are defaults that inputs may override.
+Trigonometric functions follow SolidWorks and take degrees unless the
+system is created with ``angle_unit="rad"``.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from graphlib import CycleError, TopologicalSorter
+from typing import Any, Callable, Iterable, Mapping, Optional, Sequence
+
+import numpy as np
+import sympy as sp
+
+# Number-literal unit suffixes -> factor to millimetres / degrees
+_LENGTH_UNITS = {"mm": 1.0, "cm": 10.0, "m": 1000.0, "in": 25.4, "ft": 304.8}
+_ANGLE_UNITS = {"deg": 1.0, "rad": 180.0 / np.pi}
+
+_EQUATION = re.compile(r'^\s*"([^"]+)"\s*=\s*(.+?)\s*$', re.DOTALL)
+_TOKEN = re.compile(
+    r'\s*(?:(?P<number>(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)'
+    r'|"(?P<name>[^"]+)"'
+    r'|(?P<ident>[A-Za-z_][A-Za-z_0-9]*)'
+    r'|(?P<op><=|>=|<>|[-+*/^(),<>=]))'
+)
+
+
+def _trig(angle_unit: str) -> dict[str, Callable[..., sp.Expr]]:
+    """SolidWorks function names -> sympy builders."""
+    to_rad = sp.pi / 180 if angle_unit == "deg" else sp.Integer(1)
+    from_rad = 1 / to_rad
+    return {
+        "sin": lambda x: sp.sin(x * to_rad),
+        "cos": lambda x: sp.cos(x * to_rad),
+        "tan": lambda x: sp.tan(x * to_rad),
+        "sec": lambda x: sp.sec(x * to_rad),
+        "cosec": lambda x: sp.csc(x * to_rad),
+        "cotan": lambda x: sp.cot(x * to_rad),
+        "arcsin": lambda x: sp.asin(x) * from_rad,
+        "arccos": lambda x: sp.acos(x) * from_rad,
+        "atn": lambda x: sp.atan(x) * from_rad,
+        "arcsec": lambda x: sp.asec(x) * from_rad,
+        "arccosec": lambda x: sp.acsc(x) * from_rad,
+        "arccotan": lambda x: sp.acot(x) * from_rad,
+        "abs": sp.Abs,
+        "exp": sp.exp,
+        "log": sp.log,
+        "sqr": sp.sqrt,
+        "int": lambda x: sp.sign(x) * sp.floor(sp.Abs(x)),
+        "sgn": sp.sign,
+        "iif": lambda cond, a, b: sp.Piecewise((a, cond), (b, True)),
+    }
+
+
+_ARITY = {"iif": 3}
+
+_COMPARE = {
+    "<": sp.Lt,
+    ">": sp.Gt,
+    "<=": sp.Le,
+    ">=": sp.Ge,
+    "=": sp.Eq,
+    "<>": sp.Ne,
+}
+
+
+class _Parser:
+    """Recursive-descent parser for one right-hand side.
+
+    Grammar (lowest precedence first)::
+
+        comparison := sum [("<" | ">" | "<=" | ">=" | "=" | "<>") sum]
+        sum        := product (("+" | "-") product)*
+        product    := unary (("*" | "/") unary)*
+        unary      := ("-" | "+") unary | power
+        power      := primary ["^" unary]
+        primary    := number [unit] | "name" | pi | func "(" args ")" | "(" comparison ")"
+    """
+
+    def __init__(
+        self,
+        text: str,
+        symbol: Callable[[str], sp.Symbol],
+        functions: Mapping[str, Callable[..., sp.Expr]],
+    ) -> None:
+        self.text = text
+        self.symbol = symbol
+        self.functions = functions
+        self.tokens: list[tuple[str, str]] = []
+        pos = 0
+        text = text.rstrip()
+        while pos < len(text):
+            m = _TOKEN.match(text, pos)
+            if not m or m.end() == pos:
+                raise ValueError(f"Unexpected character at '{text[pos:pos + 10]}' in: {self.text}")
+            kind = m.lastgroup
+            self.tokens.append((kind, m.group(kind)))
+            pos = m.end()
+        self.pos = 0
+
+    def parse(self) -> sp.Expr:
+        expr = self.comparison()
+        if self.pos != len(self.tokens):
+            raise ValueError(f"Unexpected '{self.tokens[self.pos][1]}' in: {self.text}")
+        return expr
+
+    def _peek(self) -> Optional[tuple[str, str]]:
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else None
+
+    def _accept(self, *ops: str) -> Optional[str]:
+        tok = self._peek()
+        if tok and tok[0] == "op" and tok[1] in ops:
+            self.pos += 1
+            return tok[1]
+        return None
+
+    def _expect(self, op: str) -> None:
+        if not self._accept(op):
+            raise ValueError(f"Expected '{op}' in: {self.text}")
+
+    def comparison(self) -> sp.Expr:
+        left = self.sum()
+        op = self._accept(*_COMPARE)
+        return _COMPARE[op](left, self.sum()) if op else left
+
+    def sum(self) -> sp.Expr:
+        expr = self.product()
+        while op := self._accept("+", "-"):
+            right = self.product()
+            expr = expr + right if op == "+" else expr - right
+        return expr
+
+    def product(self) -> sp.Expr:
+        expr = self.unary()
+        while op := self._accept("*", "/"):
+            right = self.unary()
+            expr = expr * right if op == "*" else expr / right
+        return expr
+
+    def unary(self) -> sp.Expr:
+        if self._accept("-"):
+            return -self.unary()
+        if self._accept("+"):
+            return self.unary()
+        return self.power()
+
+    def power(self) -> sp.Expr:
+        base = self.primary()
+        if self._accept("^"):
+            return base ** self.unary()
+        return base
+
+    def primary(self) -> sp.Expr:
+        tok = self._peek()
+        if tok is None:
+            raise ValueError(f"Unexpected end of expression: {self.text}")
+        kind, value = tok
+        self.pos += 1
+        if kind == "number":
+            number = sp.Float(value) if any(c in value for c in ".eE") else sp.Integer(value)
+            unit = self._peek()
+            if unit and unit[0] == "ident" and unit[1].lower() in {**_LENGTH_UNITS, **_ANGLE_UNITS}:
+                self.pos += 1
+                u = unit[1].lower()
+                factor = _LENGTH_UNITS.get(u) or _ANGLE_UNITS[u]
+                return number * sp.Float(factor) if factor != 1.0 else number
+            return number
+        if kind == "name":
+            return self.symbol(value)
+        if kind == "ident":
+            name = value.lower()
+            if name == "pi":
+                return sp.pi
+            if name not in self.functions:
+                raise ValueError(f"Unknown function or identifier '{value}' in: {self.text}")
+            self._expect("(")
+            args = [self.comparison()]
+            while self._accept(","):
+                args.append(self.comparison())
+            self._expect(")")
+            if len(args) != _ARITY.get(name, 1):
+                raise ValueError(f"{value}() takes {_ARITY.get(name, 1)} argument(s) in: {self.text}")
+            return self.functions[name](*args)
+        if value == "(":
+            expr = self.comparison()
+            self._expect(")")
+            return expr
+        raise ValueError(f"Unexpected '{value}' in: {self.text}")
+
+
+def _check_constants(expr: sp.Basic, text: str) -> None:
+    """Reject constant subexpressions that fold to no real number.
+
+    sympy folds ``1/0`` and ``log(0)`` to ``zoo`` and ``sqr(-1)`` to ``I``;
+    neither has a NumPy value, so they are reported as equation errors.
+    """
+    if isinstance(expr, sp.Expr) and not expr.free_symbols:
+        value = sp.N(expr)
+        if not (value.is_real and value.is_finite):
+            raise ValueError(f"'{expr}' is undefined, infinite or complex in: {text}")
+        return
+    for arg in expr.args:
+        _check_constants(arg, text)
+
+
+def _lambdify(args: Sequence[sp.Symbol], expr: sp.Expr, text: str) -> Callable[..., Any]:
+    try:
+        return sp.lambdify(args, expr, modules="numpy")
+    except Exception as exc:  # sympy raises KeyError/TypeError for some folds
+        raise ValueError(f"Cannot compile '{text}': {exc}") from exc
+
+
+@dataclass(frozen=True)
+class Equation:
+    """One compiled equation ``"target" = expression``."""
+
+    target: str
+    text: str
+    expression: sp.Expr
+    depends_on: tuple[str, ...]
+    function: Callable[..., Any]
+
+    @property
+    def is_constant(self) -> bool:
+        return not self.depends_on
+
+    def call(self, *values: Any) -> np.ndarray:
+        """Evaluate for the values of ``depends_on`` as a float array.
+
+        Raises:
+            ValueError: The compiled function fails or returns non-real values.
+        """
+        try:
+            return np.asarray(self.function(*values), dtype=float)
+        except (ArithmeticError, KeyError, TypeError) as exc:
+            raise ValueError(f"Cannot evaluate {self.text}: {exc}") from exc
+
+
+def parse_equation(line: str) -> tuple[str, str]:
+    """Split ``"Name" = expression`` into (name, expression text)."""
+    m = _EQUATION.match(line)
+    if not m:
+        raise ValueError(f'Equation must look like "Name" = expression: {line!r}')
+    return m.group(1), m.group(2)
+
+
+class EquationSystem:
+    """Compiled, dependency-ordered set of equations.
+
+    Args:
+        lines: Equations, one ``"Name" = expression`` per entry (blank
+               lines and ``'`` comments are skipped).
+        defaults: Default values for input names.
+        angle_unit: ``"deg"`` (SolidWorks default) or ``"rad"`` for the
+                    trigonometric functions.
+
+    Raises:
+        ValueError: Syntax errors, duplicate targets, circular references
+                    or constants that are undefined, infinite or complex.
+    """
+
+    def __init__(
+        self,
+        lines: Iterable[str],
+        defaults: Optional[Mapping[str, float]] = None,
+        angle_unit: str = "deg",
+    ) -> None:
+        if angle_unit not in ("deg", "rad"):
+            raise ValueError("angle_unit must be 'deg' or 'rad'.")
+        functions = _trig(angle_unit)
+        symbols: dict[str, sp.Symbol] = {}
+
+        def symbol(name: str) -> sp.Symbol:
+            if name not in symbols:
+                symbols[name] = sp.Symbol(f"v{len(symbols)}")
+            return symbols[name]
+
+        parsed: dict[str, tuple[str, sp.Expr]] = {}
+        for line in lines:
+            text = line.split("'", 1)[0].strip()
+            if not text:
+                continue
+            target, rhs = parse_equation(text)
+            if target in parsed:
+                raise ValueError(f"'{target}' is assigned by more than one equation.")
+            symbol(target)
+            expr = _Parser(rhs, symbol, functions).parse()
+            _check_constants(expr, text)
+            parsed[target] = (text, expr)
+
+        names = {sym: name for name, sym in symbols.items()}
+        graph = {
+            target: sorted((names[s] for s in expr.free_symbols), key=lambda n: symbols[n].name)
+            for target, (_, expr) in parsed.items()
+        }
+        try:
+            order = [n for n in TopologicalSorter(graph).static_order() if n in parsed]
+        except CycleError as exc:
+            raise ValueError(f"Circular equation references: {' -> '.join(exc.args[1])}") from exc
+
+        self.equations: dict[str, Equation] = {}
+        for target in order:
+            text, expr = parsed[target]
+            deps = tuple(graph[target])
+            args = [symbols[d] for d in deps]
+            self.equations[target] = Equation(
+                target=target,
+                text=text,
+                expression=expr,
+                depends_on=deps,
+                function=_lambdify(args, expr, text),
+            )
+        self.order = order
+        self.inputs = sorted(set(symbols) - set(parsed))
+        self.defaults = {
+            **{t: float(e.call()) for t, e in self.equations.items() if e.is_constant},
+            **(defaults or {}),
+        }
+
+        # Equations downstream of every name, in evaluation order
+        position = {t: i for i, t in enumerate(order)}
+        dependents: dict[str, set[str]] = {name: set() for name in symbols}
+        for target, eq in self.equations.items():
+            for dep in eq.depends_on:
+                dependents[dep].add(target)
+        self._downstream: dict[str, tuple[str, ...]] = {}
+        for name in symbols:
+            seen: set[str] = set()
+            stack = [name]
+            while stack:
+                for child in dependents[stack.pop()]:
+                    if child not in seen:
+                        seen.add(child)
+                        stack.append(child)
+            self._downstream[name] = tuple(sorted(seen, key=position.__getitem__))
+        self._position = position
+
+    @property
+    def dependencies(self) -> dict[str, tuple[str, ...]]:
+        """Target -> names its expression references."""
+        return {t: e.depends_on for t, e in self.equations.items()}
+
+    def downstream(self, names: Iterable[str]) -> list[str]:
+        """Equations affected by a change of *names*, in evaluation order."""
+        affected: set[str] = set()
+        for name in names:
+            affected.update(self._downstream.get(name, ()))
+        return sorted(affected, key=self._position.__getitem__)
+
+    # ------------------------------------------------------------------
+    # Evaluation
+    # ------------------------------------------------------------------
+
+    def _batch_inputs(self, inputs: Mapping[str, Any]) -> tuple[dict[str, np.ndarray], tuple[int, ...]]:
+        driven = sorted(n for n in inputs if n in self.equations and not self.equations[n].is_constant)
+        if driven:
+            raise ValueError(f"Driven by an equation, cannot be set: {', '.join(driven)}")
+        unknown = sorted(set(inputs) - set(self.inputs) - set(self.defaults))
+        if unknown:
+            raise ValueError(f"Unknown input(s): {', '.join(unknown)}")
+        missing = [n for n in self.inputs if n not in inputs and n not in self.defaults]
+        if missing:
+            raise ValueError(f"Missing input(s): {', '.join(missing)}")
+
+        values = {n: np.asarray(v, dtype=float) for n, v in {**self.defaults, **inputs}.items()}
+        shape = np.broadcast_shapes(*(v.shape for v in values.values())) if values else ()
+        return {n: np.broadcast_to(v, shape) for n, v in values.items()}, shape
+
+    def _run(self, targets: Iterable[str], values: dict[str, np.ndarray], shape: tuple[int, ...]) -> None:
+        for target in targets:
+            eq = self.equations[target]
+            if eq.is_constant and target in values:
+                continue
+            result = eq.call(*(values[d] for d in eq.depends_on))
+            values[target] = result if result.shape == shape else np.broadcast_to(result, shape)
+
+    def evaluate(self, inputs: Optional[Mapping[str, Any]] = None) -> dict[str, np.ndarray]:
+        """Evaluate every equation for a batch of inputs.
+
+        Args:
+            inputs: Input name -> scalar or array; arrays broadcast
+                    together (one element per configuration).
+
+        Returns:
+            Name -> read-only array of the broadcast batch shape, for
+            inputs and equation targets.
+
+        Raises:
+            ValueError: Unknown, missing or equation-driven inputs, or an
+                        equation that cannot be evaluated for them.
+        """
+        values, shape = self._batch_inputs(inputs or {})
+        self._run(self.order, values, shape)
+        return values
+
+    def evaluate_one(self, inputs: Optional[Mapping[str, float]] = None) -> dict[str, float]:
+        """Scalar convenience wrapper around ``evaluate``."""
+        return {n: float(v) for n, v in self.evaluate(inputs).items()}
+
+    def state(self, inputs: Optional[Mapping[str, Any]] = None) -> EquationState:
+        """Evaluate once and keep the values for incremental updates."""
+        values, shape = self._batch_inputs(inputs or {})
+        self._run(self.order, values, shape)
+        return EquationState(self, values, shape)
+
+    @classmethod
+    def from_parameter_space(cls, space: Any, angle_unit: str = "deg") -> EquationSystem:
+        """Equations of a ``ParameterSpace``.
+
+        Parameters of type ``EQUATION`` / ``EXPRESSION`` (or with the
+        ``EXPRESSED`` constraint) hold their expression in
+        ``default_value``; every other numeric parameter's default is an
+        input default.
+        """
+        lines: list[str] = []
+        defaults: dict[str, float] = {}
+        for name, param in space.parameters.items():
+            expressed = (
+                param.parameter_type.value in ("equation", "expression")
+                or param.constraint_type.value == "expressed"
+            )
+            if expressed and isinstance(param.default_value, str):
+                text = param.default_value.strip()
+                lines.append(text if _EQUATION.match(text) else f'"{name}" = {text.lstrip("=")}')
+            elif isinstance(param.default_value, (int, float)) and not isinstance(param.default_value, bool):
+                defaults[name] = float(param.default_value)
+        return cls(lines, defaults, angle_unit)
+
+
+class EquationState:
+    """Values of one evaluated batch with incremental recomputation."""
+
+    def __init__(self, system: EquationSystem, values: dict[str, np.ndarray], shape: tuple[int, ...]) -> None:
+        self.system = system
+        self.values = values
+        self.shape = shape
+
+    def update(self, changes: Mapping[str, Any]) -> list[str]:
+        """Set inputs and recompute only the equations downstream of them.
+
+        Returns:
+            The recomputed equation targets, in evaluation order.
+
+        Raises:
+            ValueError: Unknown or equation-driven names, or values that do
+                        not broadcast to the batch shape.
+        """
+        system = self.system
+        for name, value in changes.items():
+            eq = system.equations.get(name)
+            if name not in system.inputs and eq is None:
+                raise ValueError(f"Unknown input '{name}'.")
+            if eq is not None and not eq.is_constant:
+                raise ValueError(f"'{name}' is driven by an equation and cannot be set.")
+            self.values[name] = np.broadcast_to(np.asarray(value, dtype=float), self.shape)
+
+        targets = [t for t in system.downstream(changes) if t not in changes]
+        system._run(targets, self.values, self.shape)
+        return targets
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.values[name]
+
+
+def evaluate_equations(
+    lines: Sequence[str],
+    inputs: Optional[Mapping[str, Any]] = None,
+    angle_unit: str = "deg",
+) -> dict[str, np.ndarray]:
+    """One-shot ``EquationSystem(lines).evaluate(inputs)``."""
+    return EquationSystem(lines, angle_unit=angle_unit).evaluate(inputs)
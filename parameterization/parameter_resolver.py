@@ -7,6 +7,7 @@ This is the bridge between design intent (parameter space) and implementation (C
 from typing import Dict, List, Optional
 from parameter_space import (
     ParameterAssignment,
+    ParameterAssignmentBatch,
     ParameterSpace,
     ParameterDomain,
     ParameterType,
@@ -83,6 +84,22 @@ IFeature {feat_var} = part.FeatureByName("{feature_name}");
 
         return "\n".join(code_blocks)
 
+    def resolve_batch(
+        self,
+        batch: ParameterAssignmentBatch,
+        valid_only: bool = True,
+    ) -> List[str]:
+        """
+        Generate C# code for every variant of a columnar batch.
+
+        The batch is validated once with array operations; rows with an
+        invalid value are skipped unless valid_only is False.
+        """
+        return [
+            self.resolve_assignment(assignment)
+            for assignment in batch.iter_assignments(valid_only)
+        ]
+
     def _generate_sketch_code(
         self,
         params: Dict[str, any],
@@ -255,7 +272,7 @@ IFeature {feat_var} = part.FeatureByName("{feature_name}");
                     f"sketch.CreateDimension(...);"
                 )
                 lines.append(
-                    f"{param_name}_dim.SetValue({{{{{param_name}}}});"
+                    f"{param_name}_dim.SetValue({{{{{param_name}}}}});"
                 )
                 lines.append("")
 
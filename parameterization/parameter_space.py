@@ -13,9 +13,11 @@ A SolidWorks design can be parameterized at multiple levels:
 """
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Union
 from enum import Enum
 
+import numpy as np
+
 
 class ParameterType(Enum):
     """Enumeration of SolidWorks parameter types."""
@@ -263,6 +265,234 @@ class ParameterAssignment:
         return self.values.copy()
 
 
+_NUMERIC_CONSTRAINTS = (
+    ParameterConstraint.POSITIVE,
+    ParameterConstraint.NON_NEGATIVE,
+    ParameterConstraint.RANGE,
+)
+
+
+def _number_kind(value: Any) -> Optional[str]:
+    """``"b"``, ``"i"`` or ``"f"`` for a bool, integer or float; None otherwise."""
+    if isinstance(value, (bool, np.bool_)):
+        return "b"
+    if isinstance(value, (int, np.integer)):
+        return "i"
+    if isinstance(value, (float, np.floating)):
+        return "f"
+    return None
+
+
+def _csharp_item(name: str, value: Any) -> str:
+    """One ``[name] = value`` entry, formatted as ``to_csharp_dict`` does."""
+    if isinstance(value, str):
+        return f'    [{name!r}] = "{value}"'
+    if isinstance(value, bool):
+        return f'    [{name!r}] = {str(value).lower()}'
+    return f'    [{name!r}] = {value}'
+
+
+@dataclass
+class ParameterAssignmentBatch:
+    """
+    Columnar assignments of many design variants to one parameter space.
+
+    Numeric parameters are stored as one NumPy array each; DISCRETE
+    parameters as integer codes into ``discrete_values`` (-1 for a value
+    outside the allowed set).  Validation runs per column, so a 100k-row
+    sweep costs a handful of array comparisons instead of one
+    ``validate_assignment`` call per value.
+    """
+
+    parameter_space: ParameterSpace
+    columns: Dict[str, np.ndarray] = field(default_factory=dict)
+    size: int = 0
+    # Raw out-of-set values of DISCRETE parameters: {parameter: {row: value}}
+    rejected: Dict[str, Dict[int, Any]] = field(default_factory=dict)
+
+    @classmethod
+    def from_columns(
+        cls, parameter_space: ParameterSpace, columns: Dict[str, Sequence[Any]]
+    ) -> "ParameterAssignmentBatch":
+        """Build from ``{parameter: values}``; all columns share one length."""
+        batch = cls(parameter_space)
+        for name in parameter_space.parameters:
+            if name in columns:
+                batch.set_column(name, columns[name])
+        unknown = [name for name in columns if name not in parameter_space.parameters]
+        if unknown:
+            raise ValueError(f"Parameter '{unknown[0]}' not found")
+        return batch
+
+    @classmethod
+    def from_rows(
+        cls, parameter_space: ParameterSpace, rows: Iterable[Dict[str, Any]]
+    ) -> "ParameterAssignmentBatch":
+        """Build from per-variant dicts (every row sets the same parameters)."""
+        rows = list(rows)
+        names = list(rows[0]) if rows else []
+        try:
+            columns = {name: [row[name] for row in rows] for name in names}
+        except KeyError as exc:
+            raise ValueError(f"Every row must set parameter {exc}") from None
+        return cls.from_columns(parameter_space, columns)
+
+    def set_column(self, param_name: str, values: Sequence[Any]) -> None:
+        """Set all variants' values of one parameter (not validated yet)."""
+        param = self.parameter_space.get_parameter(param_name)
+        if param is None:
+            raise ValueError(f"Parameter '{param_name}' not found")
+        if self.columns and len(values) != self.size:
+            raise ValueError(
+                f"Column '{param_name}' has {len(values)} values, expected {self.size}"
+            )
+
+        if param.constraint_type == ParameterConstraint.DISCRETE:
+            lookup = {value: code for code, value in enumerate(param.discrete_values)}
+            column = np.fromiter(
+                (lookup.get(value, -1) for value in values), dtype=np.int32, count=len(values)
+            )
+            self.rejected[param_name] = {
+                int(i): values[i] for i in np.flatnonzero(column < 0)
+            }
+        else:
+            column = np.asarray(values)
+            # Mixed bool / int / float values would all be coerced to the
+            # widest type (10 -> 10.0); keep them as given instead, so the
+            # export matches ``to_csharp_dict``.
+            if column.dtype.kind not in "biuf" or (
+                not isinstance(values, np.ndarray) and len({_number_kind(v) for v in values}) > 1
+            ):
+                column = np.asarray(values, dtype=object)
+        self.columns[param_name] = column
+        self.size = len(column)
+
+    # ------------------------------------------------------------------
+    # Validation
+    # ------------------------------------------------------------------
+
+    def validate(self) -> Dict[str, np.ndarray]:
+        """Per-parameter boolean masks, True where a row violates the constraint."""
+        masks = {}
+        for name, column in self.columns.items():
+            param = self.parameter_space.parameters[name]
+            constraint = param.constraint_type
+            if constraint == ParameterConstraint.DISCRETE:
+                masks[name] = column < 0
+                continue
+            if constraint not in _NUMERIC_CONSTRAINTS:
+                masks[name] = np.zeros(self.size, dtype=bool)
+                continue
+
+            # Non-numeric values ('abc', None) violate a numeric constraint
+            invalid = np.zeros(self.size, dtype=bool)
+            if column.dtype == object:
+                invalid = np.fromiter(
+                    (_number_kind(v) is None for v in column), dtype=bool, count=self.size
+                )
+                column = np.where(invalid, 0, column).astype(float)
+            if constraint == ParameterConstraint.POSITIVE:
+                invalid |= ~(column > 0)
+            elif constraint == ParameterConstraint.NON_NEGATIVE:
+                invalid |= ~(column >= 0)
+            else:
+                if param.min_value is not None:
+                    invalid |= column < param.min_value
+                if param.max_value is not None:
+                    invalid |= column > param.max_value
+            masks[name] = invalid
+        return masks
+
+    def error_mask(self) -> np.ndarray:
+        """True for every row with at least one invalid value."""
+        mask = np.zeros(self.size, dtype=bool)
+        for column_mask in self.validate().values():
+            mask |= column_mask
+        return mask
+
+    def row_errors(self, index: int) -> List[str]:
+        """``validate_assignment``-style messages for one row."""
+        errors = []
+        for name, mask in self.validate().items():
+            if mask[index]:
+                param = self.parameter_space.parameters[name]
+                value = self.rejected.get(name, {}).get(index)
+                if value is None:
+                    value = self._decode(name, self.columns[name][index : index + 1])[0]
+                errors.append(
+                    f"Value {value} violates constraint "
+                    f"{param.constraint_type.value} for parameter '{name}'"
+                )
+        return errors
+
+    # ------------------------------------------------------------------
+    # Export
+    # ------------------------------------------------------------------
+
+    def _decode(self, name: str, column: np.ndarray) -> List[Any]:
+        param = self.parameter_space.parameters[name]
+        if param.constraint_type == ParameterConstraint.DISCRETE:
+            categories = list(param.discrete_values) + [None]
+            return [categories[code] for code in column.tolist()]
+        return column.tolist()
+
+    def _rows(self, valid_only: bool) -> np.ndarray:
+        if valid_only:
+            return np.flatnonzero(~self.error_mask())
+        return np.arange(self.size)
+
+    def get_column(self, param_name: str) -> List[Any]:
+        """Decoded values of one parameter (categories instead of codes)."""
+        return self._decode(param_name, self.columns[param_name])
+
+    def get_row(self, index: int) -> Dict[str, Any]:
+        """Values of one variant."""
+        return {
+            name: self._decode(name, column[index : index + 1])[0]
+            for name, column in self.columns.items()
+        }
+
+    def iter_rows(self, valid_only: bool = True) -> Iterator[Dict[str, Any]]:
+        """Per-variant value dicts, decoded column-wise once."""
+        rows = self._rows(valid_only)
+        decoded = {name: self._decode(name, column[rows]) for name, column in self.columns.items()}
+        names = list(decoded)
+        for values in zip(*decoded.values()):
+            yield dict(zip(names, values))
+
+    def iter_assignments(self, valid_only: bool = True) -> Iterator[ParameterAssignment]:
+        """``ParameterAssignment`` per variant, skipping per-value validation."""
+        for values in self.iter_rows(valid_only):
+            yield ParameterAssignment(self.parameter_space, values)
+
+    def to_csharp_dicts(self, valid_only: bool = True) -> List[str]:
+        """``to_csharp_dict`` of every variant.
+
+        Each distinct value of a column is formatted once and the entries
+        are gathered by index.
+        """
+        rows = self._rows(valid_only)
+        entries = []
+        for name, column in self.columns.items():
+            if column.dtype == object:
+                entries.append([_csharp_item(name, v) for v in column[rows].tolist()])
+                continue
+            unique, inverse = np.unique(column[rows], return_inverse=True)
+            formatted = np.array(
+                [_csharp_item(name, v) for v in self._decode(name, unique)], dtype=object
+            )
+            entries.append(formatted[inverse].tolist())
+        if not entries:
+            return ["new Dictionary<string, object>\n{\n\n}"] * len(rows)
+        return [
+            "new Dictionary<string, object>\n{\n" + ",\n".join(items) + "\n}"
+            for items in zip(*entries)
+        ]
+
+    def __len__(self) -> int:
+        return self.size
+
+
 # Example: Mounting hole sketch parameterization
 MOUNTING_HOLE_SPACE = ParameterSpace(
     name="mounting_hole",
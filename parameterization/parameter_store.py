@@ -0,0 +1,491 @@
+"""
+Parameter Store: persistent storage of parameter spaces and saved assignments.
+
+Parameter spaces, their definitions and saved assignment sets live in a
+SQLite database (via SQLAlchemy Core).  Definitions are indexed by domain,
+parameter type and source path, and dependency edges are stored in their
+own table so "what depends on X" is an index lookup.
+
+Loaded spaces and their dependency graphs are kept in an in-process
+read-through cache; writes through the same store invalidate it.  Spaces
+and definitions handed to callers are copies, so modifying them never
+changes the cache (save the space again to persist a change).
+
+Example:
+    store = ParameterStore("parameters.db")
+    store.save_space(MOUNTING_HOLE_SPACE)
+    space = store.load_space("mounting_hole")
+    store.dependents("mounting_hole", "hole_x_position")
+    # -> ['position_tolerance']
+"""
+
+import copy
+import json
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from sqlalchemy import (
+    Column,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    Text,
+    UniqueConstraint,
+    create_engine,
+    delete,
+    event,
+    func,
+    insert,
+    select,
+)
+from sqlalchemy.pool import StaticPool
+
+from parameter_space import (
+    ParameterAssignment,
+    ParameterAssignmentBatch,
+    ParameterConstraint,
+    ParameterDefinition,
+    ParameterDomain,
+    ParameterSpace,
+    ParameterType,
+)
+
+metadata = MetaData()
+
+spaces_table = Table(
+    "parameter_spaces",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("name", String, nullable=False, unique=True),
+    Column("description", Text, nullable=False, default=""),
+)
+
+definitions_table = Table(
+    "parameter_definitions",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("space_id", Integer, ForeignKey("parameter_spaces.id", ondelete="CASCADE"), nullable=False),
+    Column("position", Integer, nullable=False),
+    Column("name", String, nullable=False),
+    Column("parameter_type", String, nullable=False),
+    Column("domain", String, nullable=False),
+    Column("constraint_type", String, nullable=False),
+    Column("default_value", Text),  # JSON
+    Column("min_value", Float),
+    Column("max_value", Float),
+    Column("discrete_values", Text),  # JSON
+    Column("unit", String, nullable=False),
+    Column("precision", Integer, nullable=False),
+    Column("tolerance_plus", Float),
+    Column("tolerance_minus", Float),
+    Column("description", Text, nullable=False),
+    Column("source", String, nullable=False),
+    Column("affects", Text, nullable=False),  # JSON
+    UniqueConstraint("space_id", "name"),
+    Index("ix_definitions_domain", "domain"),
+    Index("ix_definitions_type", "parameter_type"),
+    Index("ix_definitions_source", "source"),
+)
+
+dependencies_table = Table(
+    "parameter_dependencies",
+    metadata,
+    Column("space_id", Integer, ForeignKey("parameter_spaces.id", ondelete="CASCADE"), primary_key=True),
+    Column("parameter", String, primary_key=True),
+    Column("depends_on", String, primary_key=True),
+    Column("position", Integer, nullable=False),
+    Index("ix_dependencies_reverse", "space_id", "depends_on"),
+)
+
+assignment_sets_table = Table(
+    "assignment_sets",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("space_id", Integer, ForeignKey("parameter_spaces.id", ondelete="CASCADE"), nullable=False),
+    Column("name", String, nullable=False),
+    UniqueConstraint("space_id", "name"),
+)
+
+assignments_table = Table(
+    "assignments",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("set_id", Integer, ForeignKey("assignment_sets.id", ondelete="CASCADE"), nullable=False),
+    Column("row", Integer, nullable=False),
+    Column("values", Text, nullable=False),  # JSON
+    Index("ix_assignments_set_row", "set_id", "row"),
+)
+
+
+def _enable_foreign_keys(dbapi_connection, _record) -> None:
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
+
+class ParameterStore:
+    """
+    SQLite-backed store of parameter spaces and assignment sets.
+
+    Args:
+        path: Database file, ":memory:", or a full SQLAlchemy URL.
+    """
+
+    def __init__(self, path: str = "parameters.db"):
+        if "://" in path:
+            url = path
+        else:
+            url = f"sqlite:///{path}"
+        kwargs: Dict[str, Any] = {}
+        if url in ("sqlite://", "sqlite:///:memory:"):
+            # One shared connection, or every checkout sees an empty database
+            kwargs = {"poolclass": StaticPool, "connect_args": {"check_same_thread": False}}
+        self.engine = create_engine(url, **kwargs)
+        if self.engine.dialect.name == "sqlite":
+            event.listen(self.engine, "connect", _enable_foreign_keys)
+        metadata.create_all(self.engine)
+
+        self._lock = threading.RLock()
+        self._spaces: Dict[str, ParameterSpace] = {}
+        self._dependents: Dict[str, Dict[str, List[str]]] = {}
+
+    # ------------------------------------------------------------------
+    # Parameter spaces
+    # ------------------------------------------------------------------
+
+    def save_space(self, space: ParameterSpace) -> None:
+        """Insert or replace a parameter space and all its definitions."""
+        with self._lock, self.engine.begin() as conn:
+            space_id = self._space_id(conn, space.name)
+            if space_id is None:
+                space_id = conn.execute(
+                    insert(spaces_table).values(name=space.name, description=space.description)
+                ).inserted_primary_key[0]
+            else:
+                conn.execute(
+                    spaces_table.update()
+                    .where(spaces_table.c.id == space_id)
+                    .values(description=space.description)
+                )
+                conn.execute(delete(definitions_table).where(definitions_table.c.space_id == space_id))
+                conn.execute(delete(dependencies_table).where(dependencies_table.c.space_id == space_id))
+
+            definitions = [
+                _definition_row(space_id, position, param)
+                for position, param in enumerate(space.parameters.values())
+            ]
+            if definitions:
+                conn.execute(insert(definitions_table), definitions)
+            edges = [
+                {"space_id": space_id, "parameter": param.name, "depends_on": dep, "position": position}
+                for param in space.parameters.values()
+                for position, dep in enumerate(dict.fromkeys(param.dependent_on))
+            ]
+            if edges:
+                conn.execute(insert(dependencies_table), edges)
+
+            self._invalidate(space.name)
+
+    def load_space(self, name: str) -> Optional[ParameterSpace]:
+        """Load a parameter space (a copy; the database is read once)."""
+        space = self._cached_space(name)
+        return None if space is None else copy.deepcopy(space)
+
+    def _cached_space(self, name: str) -> Optional[ParameterSpace]:
+        """The cached space itself; internal callers must not modify it."""
+        with self._lock:
+            if name in self._spaces:
+                return self._spaces[name]
+
+            with self.engine.connect() as conn:
+                space_row = conn.execute(
+                    select(spaces_table).where(spaces_table.c.name == name)
+                ).first()
+                if space_row is None:
+                    return None
+                definitions = conn.execute(
+                    select(definitions_table)
+                    .where(definitions_table.c.space_id == space_row.id)
+                    .order_by(definitions_table.c.position)
+                ).all()
+                edges = conn.execute(
+                    select(dependencies_table.c.parameter, dependencies_table.c.depends_on)
+                    .where(dependencies_table.c.space_id == space_row.id)
+                    .order_by(dependencies_table.c.parameter, dependencies_table.c.position)
+                ).all()
+
+            depends_on: Dict[str, List[str]] = {}
+            dependents: Dict[str, List[str]] = {}
+            for parameter, dep in edges:
+                depends_on.setdefault(parameter, []).append(dep)
+                dependents.setdefault(dep, []).append(parameter)
+
+            space = ParameterSpace(name=space_row.name, description=space_row.description)
+            for row in definitions:
+                space.add_parameter(_definition_from_row(row, depends_on.get(row.name, [])))
+
+            self._spaces[name] = space
+            self._dependents[name] = dependents
+            return space
+
+    def list_spaces(self) -> List[str]:
+        """Names of all stored parameter spaces."""
+        with self.engine.connect() as conn:
+            return list(conn.execute(select(spaces_table.c.name).order_by(spaces_table.c.name)).scalars())
+
+    def delete_space(self, name: str) -> bool:
+        """Delete a space with its definitions and assignment sets."""
+        with self._lock, self.engine.begin() as conn:
+            result = conn.execute(delete(spaces_table).where(spaces_table.c.name == name))
+            self._invalidate(name)
+            return result.rowcount > 0
+
+    # ------------------------------------------------------------------
+    # Indexed queries
+    # ------------------------------------------------------------------
+
+    def find_parameters(
+        self,
+        domain: Optional[ParameterDomain] = None,
+        parameter_type: Optional[ParameterType] = None,
+        source: Optional[str] = None,
+        space: Optional[str] = None,
+    ) -> List[Tuple[str, ParameterDefinition]]:
+        """
+        Find definitions across spaces by domain, type and/or source path.
+
+        A source ending in "*" matches as a prefix (e.g. "Hole.Sketch1.*").
+
+        Returns (space_name, definition) pairs.
+        """
+        d, s = definitions_table.c, spaces_table.c
+        query = select(s.name, d.name).join_from(definitions_table, spaces_table)
+        if domain is not None:
+            query = query.where(d.domain == domain.value)
+        if parameter_type is not None:
+            query = query.where(d.parameter_type == parameter_type.value)
+        if source is not None:
+            if source.endswith("*"):
+                prefix = source[:-1]
+                # Range scan instead of LIKE so the source index is used
+                query = query.where(d.source >= prefix, d.source < prefix + "\U0010ffff")
+            else:
+                query = query.where(d.source == source)
+        if space is not None:
+            query = query.where(s.name == space)
+        query = query.order_by(s.name, d.position)
+
+        with self.engine.connect() as conn:
+            matches = conn.execute(query).all()
+        results = []
+        for space_name, param_name in matches:
+            definition = self._cached_space(space_name).parameters[param_name]
+            results.append((space_name, copy.deepcopy(definition)))
+        return results
+
+    def dependencies(self, space: str, parameter: str) -> List[str]:
+        """Parameters that *parameter* depends on."""
+        loaded = self._cached_space(space)
+        if loaded is None or parameter not in loaded.parameters:
+            return []
+        return list(loaded.parameters[parameter].dependent_on)
+
+    def dependents(self, space: str, parameter: str, transitive: bool = False) -> List[str]:
+        """
+        Parameters that depend on *parameter*.
+
+        With transitive=True, everything downstream of it (breadth-first).
+        """
+        if self._cached_space(space) is None:
+            return []
+        graph = self._dependents[space]
+        if not transitive:
+            return list(graph.get(parameter, []))
+
+        seen = {parameter}
+        result = []
+        queue = [parameter]
+        while queue:
+            for child in graph.get(queue.pop(0), []):
+                if child not in seen:
+                    seen.add(child)
+                    result.append(child)
+                    queue.append(child)
+        return result
+
+    # ------------------------------------------------------------------
+    # Assignment sets
+    # ------------------------------------------------------------------
+
+    def save_assignments(
+        self,
+        space: str,
+        assignments: Union[ParameterAssignmentBatch, Iterable[ParameterAssignment]],
+        set_name: str = "default",
+        valid_only: bool = True,
+    ) -> int:
+        """
+        Bulk-insert assignments into a named set (appending to it).
+
+        Args:
+            space: Name of a stored parameter space
+            assignments: A ParameterAssignmentBatch or ParameterAssignments
+            set_name: Assignment set to append to (created if missing)
+            valid_only: For batches, skip rows that fail validation
+
+        Returns:
+            Number of assignments stored
+        """
+        if isinstance(assignments, ParameterAssignmentBatch):
+            rows = assignments.iter_rows(valid_only)
+        else:
+            rows = (assignment.get_all_values() for assignment in assignments)
+
+        with self._lock, self.engine.begin() as conn:
+            space_id = self._space_id(conn, space)
+            if space_id is None:
+                raise ValueError(f"Parameter space '{space}' not found")
+            set_id = conn.execute(
+                select(assignment_sets_table.c.id).where(
+                    assignment_sets_table.c.space_id == space_id,
+                    assignment_sets_table.c.name == set_name,
+                )
+            ).scalar()
+            if set_id is None:
+                set_id = conn.execute(
+                    insert(assignment_sets_table).values(space_id=space_id, name=set_name)
+                ).inserted_primary_key[0]
+            start = conn.execute(
+                select(func.coalesce(func.max(assignments_table.c.row) + 1, 0))
+                .where(assignments_table.c.set_id == set_id)
+            ).scalar()
+
+            records = [
+                {"set_id": set_id, "row": start + offset, "values": json.dumps(values)}
+                for offset, values in enumerate(rows)
+            ]
+            if records:
+                conn.execute(insert(assignments_table), records)
+            return len(records)
+
+    def load_assignments(self, space: str, set_name: str = "default") -> List[ParameterAssignment]:
+        """Saved assignments of a set, in insertion order."""
+        loaded = self.load_space(space)
+        if loaded is None:
+            raise ValueError(f"Parameter space '{space}' not found")
+        return [
+            ParameterAssignment(loaded, values)
+            for values in self._assignment_values(space, set_name)
+        ]
+
+    def load_batch(self, space: str, set_name: str = "default") -> ParameterAssignmentBatch:
+        """Saved assignments of a set as a columnar batch."""
+        loaded = self.load_space(space)
+        if loaded is None:
+            raise ValueError(f"Parameter space '{space}' not found")
+        return ParameterAssignmentBatch.from_rows(loaded, self._assignment_values(space, set_name))
+
+    def list_assignment_sets(self, space: str) -> Dict[str, int]:
+        """Assignment set name -> number of saved assignments."""
+        a, s, sp = assignments_table.c, assignment_sets_table.c, spaces_table.c
+        query = (
+            select(s.name, func.count(a.id))
+            .join_from(assignment_sets_table, spaces_table)
+            .outerjoin(assignments_table, a.set_id == s.id)
+            .where(sp.name == space)
+            .group_by(s.id)
+            .order_by(s.name)
+        )
+        with self.engine.connect() as conn:
+            return {name: count for name, count in conn.execute(query)}
+
+    def delete_assignment_set(self, space: str, set_name: str) -> bool:
+        """Delete one assignment set."""
+        with self._lock, self.engine.begin() as conn:
+            space_id = self._space_id(conn, space)
+            if space_id is None:
+                return False
+            result = conn.execute(
+                delete(assignment_sets_table).where(
+                    assignment_sets_table.c.space_id == space_id,
+                    assignment_sets_table.c.name == set_name,
+                )
+            )
+            return result.rowcount > 0
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _assignment_values(self, space: str, set_name: str) -> List[Dict[str, Any]]:
+        a, s, sp = assignments_table.c, assignment_sets_table.c, spaces_table.c
+        query = (
+            select(a["values"])
+            .join_from(assignments_table, assignment_sets_table)
+            .join(spaces_table, s.space_id == sp.id)
+            .where(sp.name == space, s.name == set_name)
+            .order_by(a.row)
+        )
+        with self.engine.connect() as conn:
+            return [json.loads(values) for values in conn.execute(query).scalars()]
+
+    @staticmethod
+    def _space_id(conn, name: str) -> Optional[int]:
+        return conn.execute(select(spaces_table.c.id).where(spaces_table.c.name == name)).scalar()
+
+    def _invalidate(self, name: str) -> None:
+        self._spaces.pop(name, None)
+        self._dependents.pop(name, None)
+
+    def clear_cache(self) -> None:
+        """Drop cached spaces (e.g. after another process wrote the database)."""
+        with self._lock:
+            self._spaces.clear()
+            self._dependents.clear()
+
+
+def _definition_row(space_id: int, position: int, param: ParameterDefinition) -> Dict[str, Any]:
+    return {
+        "space_id": space_id,
+        "position": position,
+        "name": param.name,
+        "parameter_type": param.parameter_type.value,
+        "domain": param.domain.value,
+        "constraint_type": param.constraint_type.value,
+        "default_value": json.dumps(param.default_value),
+        "min_value": param.min_value,
+        "max_value": param.max_value,
+        "discrete_values": None if param.discrete_values is None else json.dumps(param.discrete_values),
+        "unit": param.unit,
+        "precision": param.precision,
+        "tolerance_plus": param.tolerance_plus,
+        "tolerance_minus": param.tolerance_minus,
+        "description": param.description,
+        "source": param.source,
+        "affects": json.dumps(param.affects),
+    }
+
+
+def _definition_from_row(row, dependent_on: List[str]) -> ParameterDefinition:
+    return ParameterDefinition(
+        name=row.name,
+        parameter_type=ParameterType(row.parameter_type),
+        domain=ParameterDomain(row.domain),
+        default_value=json.loads(row.default_value),
+        min_value=row.min_value,
+        max_value=row.max_value,
+        discrete_values=None if row.discrete_values is None else json.loads(row.discrete_values),
+        constraint_type=ParameterConstraint(row.constraint_type),
+        unit=row.unit,
+        precision=row.precision,
+        tolerance_plus=row.tolerance_plus,
+        tolerance_minus=row.tolerance_minus,
+        description=row.description,
+        source=row.source,
+        dependent_on=dependent_on,
+        affects=json.loads(row.affects),
+    )
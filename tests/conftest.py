@@ -0,0 +1,14 @@
+"""Shared fixtures for the test suite."""
+
+from __future__ import annotations
+
+import pytest
+from fastapi.testclient import TestClient
+
+
+@pytest.fixture(scope="session")
+def client() -> TestClient:
+    """Client for the FastAPI app (no Ollama server is needed)."""
+    from backend.main import app
+
+    return TestClient(app)
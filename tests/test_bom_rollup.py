@@ -0,0 +1,111 @@
+"""Tests for the BOM roll-up and mass-property aggregation."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from engineering.bom_rollup import AssemblyTree, BomNode
+
+
+def _at(x: float, y: float = 0.0, z: float = 0.0) -> tuple[float, ...]:
+    return (1.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0, x, y, z)
+
+
+def _nodes() -> list[BomNode]:
+    """Root with a plate and two copies of a sub-assembly holding three bolts."""
+    return [
+        BomNode("bolt-1", parent="sub-1", part_number="BOLT", quantity=3, mass=0.1),
+        BomNode("sub-1", parent="root", part_number="SUB", quantity=2, transform=_at(1.0)),
+        BomNode("plate-1", parent="root", part_number="PLATE", mass=2.0,
+                properties={"material": "6061"}),
+        BomNode("root"),
+    ]
+
+
+def test_flattened_bom_multiplies_quantities_down_the_tree():
+    tree = AssemblyTree(_nodes())
+    assert [(line["part_number"], line["quantity"]) for line in tree.flattened_bom()] == [
+        ("PLATE", 1.0), ("BOLT", 6.0),
+    ]
+    bolt = tree.flattened_bom()[1]
+    assert (bolt["unit_mass"], bolt["total_mass"]) == pytest.approx((0.1, 0.6))
+    assert tree.flattened_bom()[0]["properties"] == {"material": "6061"}
+    assert [line["part_number"] for line in tree.flattened_bom(parts_only=False)] == [
+        "SUB", "PLATE", "BOLT",
+    ]
+
+
+def test_mass_and_center_of_mass_roll_up():
+    tree = AssemblyTree(_nodes())
+    total = tree.mass_properties()
+    assert total.mass == pytest.approx(2.6)
+    assert total.center_of_mass == pytest.approx([0.6 / 2.6, 0.0, 0.0])
+    assert tree.mass_properties("sub-1").mass == pytest.approx(0.6)
+    assert tree.subtree_masses()[0] == pytest.approx(2.6)
+
+
+def test_inertia_uses_the_parallel_axis_theorem():
+    tree = AssemblyTree([
+        BomNode("root"),
+        BomNode("a", parent="root", mass=1.0, transform=_at(-1.0)),
+        BomNode("b", parent="root", mass=1.0, transform=_at(1.0)),
+    ])
+    assert np.allclose(tree.mass_properties().inertia, np.diag([0.0, 2.0, 2.0]))
+
+
+def test_inertia_is_rotated_into_root_axes():
+    quarter_turn = (0.0, 1.0, 0.0, -1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0)
+    tree = AssemblyTree([
+        BomNode("root"),
+        BomNode("part", parent="root", mass=1.0, inertia=(1, 0, 0, 0, 2, 0, 0, 0, 3),
+                transform=quarter_turn),
+    ])
+    assert np.allclose(tree.mass_properties().inertia, np.diag([2.0, 1.0, 3.0]))
+
+
+def test_incremental_update_matches_a_full_rebuild():
+    tree = AssemblyTree(_nodes())
+    updated = tree.update_node("bolt-1", mass=0.2, center_of_mass=(0.0, 0.5, 0.0))
+
+    nodes = _nodes()
+    nodes[0] = replace(nodes[0], mass=0.2, center_of_mass=(0.0, 0.5, 0.0))
+    rebuilt = AssemblyTree(nodes).mass_properties()
+    assert updated.mass == pytest.approx(rebuilt.mass)
+    assert updated.center_of_mass == pytest.approx(rebuilt.center_of_mass)
+    assert np.allclose(updated.inertia, rebuilt.inertia)
+    assert tree.mass_properties("sub-1").mass == pytest.approx(1.2)
+
+
+@pytest.mark.parametrize("nodes", [
+    [],
+    [BomNode("root"), BomNode("root")],
+    [BomNode("a"), BomNode("b")],
+    [BomNode("root"), BomNode("a", parent="missing")],
+    [BomNode("root"), BomNode("a", parent="b"), BomNode("b", parent="a")],
+])
+def test_malformed_trees_are_rejected(nodes):
+    with pytest.raises(ValueError):
+        AssemblyTree(nodes)
+
+
+def test_routes(client):
+    nodes = [
+        {"id": "root"},
+        {"id": "bolt-1", "parent": "root", "part_number": "BOLT", "quantity": 4, "mass": 0.1},
+    ]
+    response = client.post("/api/bom/rollup", json={"nodes": nodes})
+    assert response.status_code == 200
+    body = response.json()
+    assert body["mass_properties"]["mass"] == pytest.approx(0.4)
+    assert body["bom"][0]["quantity"] == 4.0
+
+    tree_id = body["tree_id"]
+    response = client.patch(f"/api/bom/{tree_id}/nodes/bolt-1", json={"mass": 0.2})
+    assert response.json()["mass_properties"]["mass"] == pytest.approx(0.8)
+    assert client.get(f"/api/bom/{tree_id}").json()["mass_properties"]["mass"] == pytest.approx(0.8)
+    assert client.get("/api/bom/unknown").status_code == 404
+    response = client.post("/api/bom/rollup", json={"nodes": [{"id": "a"}, {"id": "b"}]})
+    assert response.status_code == 422
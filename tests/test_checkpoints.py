@@ -0,0 +1,77 @@
+"""Tests for per-stage pipeline checkpoints."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from training_pipeline import checkpoints
+from training_pipeline.checkpoints import CheckpointStore, code_version, config_hash
+from training_pipeline.instrumentation import StageMetrics
+from training_pipeline.run_pipeline import TrainingPipeline
+
+PAIRS = [("Draw a line.", "sketchMgr.CreateLine(0, 0, 0, 1, 0, 0);"), ("Rebuild.", "x\n\"y\"")]
+
+
+@pytest.fixture
+def store(tmp_path) -> CheckpointStore:
+    return CheckpointStore(tmp_path / "checkpoints")
+
+
+def _metrics() -> StageMetrics:
+    return StageMetrics(name="sketch", pairs=len(PAIRS), wall_s=1.5, cpu_s=1.25, output_bytes=42)
+
+
+def test_saved_stage_round_trips(store):
+    store.save("sketch", "abc", PAIRS, _metrics())
+    pairs, metrics = CheckpointStore(store.directory).load("sketch", "abc")
+    assert pairs == PAIRS
+    assert (metrics.pairs, metrics.wall_s, metrics.cpu_s, metrics.output_bytes) == (2, 1.5, 1.25, 42)
+
+
+def test_other_config_hash_or_missing_stage_is_not_resumed(store):
+    store.save("sketch", "abc", PAIRS, _metrics())
+    assert store.load("sketch", "def") is None
+    assert store.load("gdt", "abc") is None
+
+
+def test_modified_stage_file_is_not_resumed(store):
+    store.save("sketch", "abc", PAIRS, _metrics())
+    path = store.directory / "sketch.jsonl"
+    path.write_text(path.read_text(encoding="utf-8").replace("line", "arc"), encoding="utf-8")
+    assert CheckpointStore(store.directory).load("sketch", "abc") is None
+
+
+def test_manifest_from_other_layout_version_is_ignored(store):
+    store.save("sketch", "abc", PAIRS, _metrics())
+    manifest = json.loads(store.manifest_path.read_text(encoding="utf-8"))
+    manifest["version"] = checkpoints.CHECKPOINT_VERSION + 1
+    store.manifest_path.write_text(json.dumps(manifest), encoding="utf-8")
+    assert CheckpointStore(store.directory).load("sketch", "abc") is None
+
+
+def test_config_hash_is_stable_and_key_order_independent():
+    assert config_hash({"seed": 0, "combined_budget": None}) == config_hash(
+        {"combined_budget": None, "seed": 0}
+    )
+    assert config_hash({"seed": 0}) != config_hash({"seed": 1})
+
+
+def test_generation_config_covers_generator_source(tmp_path, monkeypatch):
+    pipeline = TrainingPipeline(checkpoint=False)
+    assert pipeline.generation_config()["code_version"] == code_version()
+
+    package = tmp_path / "training_pipeline" / "generators"
+    package.mkdir(parents=True)
+    source = package / "gear_generator.py"
+    source.write_text("PAIRS = 1\n", encoding="utf-8")
+    monkeypatch.setattr(checkpoints, "_SOURCE_ROOT", tmp_path)
+    code_version.cache_clear()
+    try:
+        before = config_hash(pipeline.generation_config())
+        source.write_text("PAIRS = 2\n", encoding="utf-8")
+        code_version.cache_clear()
+        assert config_hash(pipeline.generation_config()) != before
+    finally:
+        code_version.cache_clear()
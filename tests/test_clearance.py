@@ -0,0 +1,110 @@
+"""Tests for the broad-phase clearance precheck."""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pytest
+
+from engineering.clearance import IDENTITY_TRANSFORM, BoxSet, broad_phase
+
+UNIT = {"box_min": [0.0, 0.0, 0.0], "box_max": [1.0, 1.0, 1.0]}
+
+# A thin bar turned 45 degrees about Z and set off the unit cube's corner:
+# the world AABBs overlap, the oriented boxes are about 0.94 apart.
+C = S = math.sqrt(0.5)
+DIAGONAL_BAR = {
+    "name": "bar",
+    "box_min": [-1.0, -0.05, 0.0],
+    "box_max": [1.0, 0.05, 1.0],
+    "transform": [C, -S, 0.0, S, C, 0.0, 0.0, 0.0, 1.0, 1.7, 1.7, 0.0],
+}
+
+
+def _moved(name: str, dx: float) -> dict:
+    transform = list(IDENTITY_TRANSFORM)
+    transform[9] = dx
+    return {"name": name, **UNIT, "transform": transform}
+
+
+def test_gap_is_reported_only_within_the_clearance():
+    boxes = BoxSet.from_records([_moved("a", 0.0), _moved("b", 1.5), _moved("c", 10.0)])
+    assert len(broad_phase(boxes).pairs) == 0
+    result = broad_phase(boxes, clearance=0.5)
+    assert result.pairs.tolist() == [[0, 1]]
+    assert result.distance == pytest.approx([0.5])
+
+
+def test_overlapping_boxes_have_zero_distance():
+    result = broad_phase(BoxSet.from_records([_moved("a", 0.0), _moved("b", 0.5)]))
+    assert result.pairs.tolist() == [[0, 1]]
+    assert result.distance.tolist() == [0.0]
+
+
+def test_obb_test_drops_rotated_boxes_whose_aabbs_overlap():
+    boxes = BoxSet.from_records([_moved("cube", 0.0), DIAGONAL_BAR])
+    refined = broad_phase(boxes)
+    assert (refined.aabb_pairs, len(refined.pairs)) == (1, 0)
+    assert len(broad_phase(boxes, refine_obb=False).pairs) == 1
+
+    result = broad_phase(boxes, clearance=1.0)
+    assert result.distance[0] == pytest.approx(1.4 / math.sqrt(2) - 0.05)
+
+
+def test_pairs_match_brute_force_on_random_boxes():
+    rng = np.random.default_rng(0)
+    n = 300
+    lo = rng.uniform(0, 20, (n, 3))
+    hi = lo + rng.uniform(0.1, 2.0, (n, 3))
+    transforms = np.tile(IDENTITY_TRANSFORM, (n, 1))
+    result = broad_phase(BoxSet.from_arrays(transforms, lo, hi), clearance=0.25)
+
+    gap = np.maximum(np.maximum(lo[None] - hi[:, None], lo[:, None] - hi[None]), 0.0)
+    close = np.linalg.norm(gap, axis=2) <= 0.25
+    expected = np.argwhere(np.triu(close, k=1))
+    assert result.pairs.tolist() == expected.tolist()
+
+
+def test_buffer_matches_records():
+    records = [_moved("a", 0.0), _moved("b", 1.2)]
+    buffer = np.array(
+        [[*r["transform"], *r["box_min"], *r["box_max"]] for r in records], dtype="<f8"
+    ).tobytes()
+    boxes = BoxSet.from_buffer(buffer, ["a", "b"])
+    expected = BoxSet.from_records(records)
+    assert boxes.names == expected.names
+    assert np.allclose(boxes.center, expected.center)
+    with pytest.raises(ValueError):
+        BoxSet.from_buffer(buffer[:-8])
+
+
+def test_invalid_input_is_rejected():
+    with pytest.raises(ValueError):
+        BoxSet.from_records([{"box_min": [1, 1, 1], "box_max": [0, 0, 0]}])
+    with pytest.raises(ValueError):
+        BoxSet.from_records([{**UNIT, "transform": [1.0, 0.0]}])
+    with pytest.raises(ValueError):
+        broad_phase(BoxSet.from_records([UNIT]), clearance=-1.0)
+
+
+def test_routes(client):
+    components = [_moved("a", 0.0), _moved("b", 1.5)]
+    response = client.post(
+        "/api/clearance/broadphase", json={"components": components, "clearance": 0.5},
+    )
+    assert response.status_code == 200
+    body = response.json()
+    assert (body["component_count"], body["candidate_count"]) == (2, 1)
+    assert body["pairs"][0]["a"] == "a" and body["pairs"][0]["b"] == "b"
+
+    buffer = np.array(
+        [[*c["transform"], *c["box_min"], *c["box_max"]] for c in components], dtype="<f8"
+    ).tobytes()
+    response = client.post(
+        "/api/clearance/broadphase/binary", params={"clearance": 0.5}, content=buffer,
+    )
+    assert response.status_code == 200
+    assert response.json()["pairs"][0]["b"] == "1"
+    response = client.post("/api/clearance/broadphase/binary", content=buffer[:-8])
+    assert response.status_code == 422
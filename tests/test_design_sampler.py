@@ -0,0 +1,58 @@
+"""Tests for the budgeted pairwise-covering design sampler."""
+
+from __future__ import annotations
+
+import pytest
+
+from training_pipeline.design_sampler import DesignSampler
+
+FACTORS = {
+    "tol": [0.05, 0.1, 0.2, 0.3, 0.5],
+    "mod": ["MMC", "LMC", None],
+    "dia": [5, 8, 10, 12],
+    "datums": ["A", "A|B", "A|B|C"],
+}
+GRID_SIZE = 5 * 3 * 4 * 3
+
+
+def _keys(rows: list[dict]) -> list[tuple]:
+    return [tuple(row.values()) for row in rows]
+
+
+@pytest.mark.parametrize("budget", [1, 20, 100, GRID_SIZE - 1])
+def test_budget_sets_the_design_size(budget):
+    assert len(DesignSampler(seed=1).sample(FACTORS, budget=budget)) == budget
+
+
+def test_budget_above_the_grid_returns_the_full_grid():
+    rows = DesignSampler().sample(FACTORS, budget=10 * GRID_SIZE)
+    assert len(set(_keys(rows))) == GRID_SIZE
+
+
+@pytest.mark.parametrize("budget", [None, 40, 100, GRID_SIZE - 1])
+def test_every_value_pair_is_covered(budget):
+    sampler = DesignSampler(seed=3)
+    levels = [len(values) for values in FACTORS.values()]
+    design = sampler.design_indices(levels, budget)
+    assert sampler.uncovered_pairs(design, levels) == set()
+
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("budget", [50, 100, 150, GRID_SIZE - 1])
+def test_rows_are_distinct(seed, budget):
+    keys = _keys(DesignSampler(seed=seed).sample(FACTORS, budget=budget))
+    assert len(set(keys)) == len(keys)
+
+
+def test_design_is_deterministic_per_seed():
+    assert DesignSampler(seed=7).sample(FACTORS, 60) == DesignSampler(seed=7).sample(FACTORS, 60)
+    assert DesignSampler(seed=7).sample(FACTORS, 60) != DesignSampler(seed=8).sample(FACTORS, 60)
+
+
+def test_fill_stops_when_the_grid_is_exhausted():
+    assert len(DesignSampler().design_indices([2, 2, 2], budget=100)) == 8
+
+
+def test_empty_factors_give_no_rows():
+    assert DesignSampler().sample({}) == []
+    assert DesignSampler().sample({"a": [1, 2], "b": []}, budget=5) == []
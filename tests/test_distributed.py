@@ -0,0 +1,84 @@
+"""Tests for the shared-directory work queue and distributed roles."""
+
+from __future__ import annotations
+
+import pytest
+
+from training_pipeline import distributed
+from training_pipeline.distributed import QueuedUnit, WorkQueue
+from training_pipeline.instrumentation import StageMetrics
+from training_pipeline.run_pipeline import TrainingPipeline
+
+EXPIRED = -1.0
+
+
+@pytest.fixture
+def queue(tmp_path):
+    queue = WorkQueue(tmp_path / "run")
+    queue.create(
+        [QueuedUnit(0, "sketch", 0, 256, 0), QueuedUnit(0, "sketch", 256, 512, 0)],
+        {"seed": 0},
+    )
+    yield queue
+    queue.close()
+
+
+def test_plan_can_only_be_created_once(queue):
+    assert queue.config == {"seed": 0}
+    with pytest.raises(ValueError, match="already holds a plan"):
+        queue.create([QueuedUnit(0, "gdt", 0, None, 0)], {"seed": 1})
+
+
+def test_units_are_claimed_in_order_and_completed(queue):
+    first = queue.claim("w1")
+    second = queue.claim("w2")
+    assert (first.start, second.start) == (0, 256)
+    assert queue.claim("w3") is None
+    assert first.shard_name == "sketch/00000000-00000256.jsonl"
+
+    assert not queue.complete(first.id, "w2", first.shard_name, 3, StageMetrics("sketch"))
+    assert queue.complete(first.id, "w1", first.shard_name, 3, StageMetrics("sketch"))
+    assert queue.counts() == {"pending": 0, "leased": 1, "done": 1, "failed": 0}
+
+
+def test_expired_lease_is_reclaimed_until_max_attempts(queue):
+    for attempt in (1, 2):
+        unit = queue.claim(f"w{attempt}", lease_s=EXPIRED, max_attempts=2)
+        assert (unit.start, unit.attempts) == (0, attempt)
+    assert not queue.renew(unit.id, "w1")
+
+    unit = queue.claim("w3", max_attempts=2)
+    assert (unit.start, unit.attempts) == (256, 1)
+    failed = queue.units()[0]
+    assert failed["status"] == "failed"
+    assert failed["error"] == "lease expired on attempt 2"
+    assert queue.claim("w4", max_attempts=2) is None
+
+
+def test_failed_unit_is_retried_then_fails_for_good(queue):
+    for attempt in range(1, distributed.DEFAULT_MAX_ATTEMPTS + 1):
+        unit = queue.claim("w1")
+        assert (unit.start, unit.attempts) == (0, attempt)
+        queue.fail(unit.id, "w1", "boom")
+    assert queue.units()[0]["status"] == "failed"
+    with pytest.raises(RuntimeError, match="not finished"):
+        distributed.merge(queue)
+
+
+def test_distributed_run_matches_local_run(tmp_path):
+    pipeline = TrainingPipeline(only=["gdt", "combined"], checkpoint=False)
+    local = [pair for spec in pipeline.selected_stages() for pair in spec.run(pipeline)]
+
+    queue = WorkQueue(tmp_path / "run")
+    try:
+        units = distributed.plan(queue, pipeline, chunk_size=100)
+        assert len(units) > 2
+        done = distributed.run_worker(queue, TrainingPipeline(checkpoint=False), "w1", poll_s=0.0)
+        assert done == len(units)
+        pairs, metrics, index = distributed.merge(queue)
+    finally:
+        queue.close()
+
+    assert pairs == local
+    assert sum(m.pairs for m in metrics.values()) == len(local)
+    assert index["shards"][-1]["stop"] == len(local)
@@ -0,0 +1,79 @@
+"""Tests for the compiled SolidWorks equation evaluator."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from parameterization.equation_engine import EquationSystem, evaluate_equations
+
+EQUATIONS = [
+    '"Width" = 100',
+    '"Height" = "Width" / 2 + 5mm',
+    '"D1@Sketch1" = iif("Width" > 80, "Height", "Height" * 2)',
+    '"D2@Sketch1" = sqr("Width" ^ 2 + "Height" ^ 2)',
+]
+
+
+def test_evaluates_in_dependency_order():
+    values = EquationSystem(EQUATIONS).evaluate_one()
+    assert values["Height"] == 55.0
+    assert values["D1@Sketch1"] == 55.0
+    assert values["D2@Sketch1"] == pytest.approx(np.hypot(100.0, 55.0))
+
+
+def test_batch_matches_scalar_evaluation():
+    system = EquationSystem(EQUATIONS)
+    widths = np.linspace(60, 120, 7)
+    batch = system.evaluate({"Width": widths})
+    for i, width in enumerate(widths):
+        one = system.evaluate_one({"Width": width})
+        assert batch["D1@Sketch1"][i] == pytest.approx(one["D1@Sketch1"])
+
+
+def test_state_update_recomputes_downstream_only():
+    system = EquationSystem(['"b" = "a" * 2', '"c" = "b" + 1', '"d" = "x" + 1'])
+    state = system.state({"a": 1.0, "x": 0.0})
+    assert state.update({"a": 3.0}) == ["b", "c"]
+    assert float(state["c"]) == 7.0
+
+
+def test_trigonometry_uses_degrees_by_default():
+    assert evaluate_equations(['"a" = sin(30)'])["a"] == pytest.approx(0.5)
+    assert evaluate_equations(['"a" = sin(pi / 6)'], angle_unit="rad")["a"] == pytest.approx(0.5)
+
+
+@pytest.mark.parametrize("lines", [
+    ['"a" = "b" +'],
+    ['"a" = 1', '"a" = 2'],
+    ['"a" = "b"', '"b" = "a"'],
+    ['"a" = foo(1)'],
+])
+def test_invalid_equations_raise_value_error(lines):
+    with pytest.raises(ValueError):
+        EquationSystem(lines)
+
+
+@pytest.mark.parametrize("rhs", ["1/0", '"b"/0', "log(0)", "sqr(-1)", '"b"*0/0', "arccos(2)"])
+def test_constants_without_real_value_raise_value_error(rhs):
+    with pytest.raises(ValueError, match="undefined, infinite or complex"):
+        EquationSystem([f'"a" = {rhs}'])
+
+
+@pytest.mark.parametrize("rhs", ["1/0", '"b"/0', "log(0)", "sqr(-1)"])
+def test_route_rejects_undefined_constants_with_422(client, rhs):
+    response = client.post(
+        "/api/equations/evaluate",
+        json={"equations": [f'"a" = {rhs}'], "inputs": {"b": 1.0}},
+    )
+    assert response.status_code == 422
+
+
+def test_route_evaluates_a_sweep(client):
+    response = client.post(
+        "/api/equations/evaluate",
+        json={"equations": ['"a" = "b" * 2'], "inputs": {"b": [1.0, 2.0]}},
+    )
+    assert response.status_code == 200
+    assert response.json()["values"]["a"] == [2.0, 4.0]
+    assert response.json()["configurations"] == 2
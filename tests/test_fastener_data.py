@@ -0,0 +1,87 @@
+"""Tests for the indexed fastener size and torque store."""
+
+from __future__ import annotations
+
+import pytest
+
+from engineering.fastener_data import FASTENER_DATA
+from engineering.fastener_tables import CBORE_DIA_MM, INCH_SIZES, METRIC_SIZES
+
+
+def test_every_table_size_is_indexed():
+    assert list(FASTENER_DATA.sizes.keys) == METRIC_SIZES + INCH_SIZES
+    assert FASTENER_DATA.size("M8")["cbore_dia_mm"] == CBORE_DIA_MM["M8"]
+    assert FASTENER_DATA.size("M7") is None
+
+
+def test_inch_lookup():
+    record = FASTENER_DATA.size("1/4-20")
+    assert record["system"] == "inch"
+    assert record["nominal_mm"] == pytest.approx(6.35)
+    assert record["threads_per_inch"] == 20.0
+    assert record["cbore_dia_mm"] is None
+    assert FASTENER_DATA.size("#10-32") is None
+    assert FASTENER_DATA.size("#6-32")["nominal_mm"] == pytest.approx(0.138 * 25.4, abs=1e-4)
+
+
+def test_counterbore_range_query():
+    sizes = FASTENER_DATA.query_sizes(system="metric", cbore_dia_mm=(None, 12.0))
+    assert [s["designation"] for s in sizes] == ["M3", "M4", "M5", "M6"]
+    # Inch sizes have no counterbore data and never match a counterbore bound
+    assert FASTENER_DATA.query_sizes(cbore_dia_mm=(None, 12.0)) == sizes
+    assert FASTENER_DATA.query_sizes(cbore_dia_mm=(11.0, 11.0))[0]["designation"] == "M6"
+
+
+def test_nominal_range_spans_both_systems():
+    sizes = FASTENER_DATA.query_sizes(nominal_mm=(6.0, 8.0))
+    assert {s["designation"] for s in sizes} == {"M6", "M8", "1/4-20", "5/16-18"}
+    assert FASTENER_DATA.query_sizes(system="inch", nominal_mm=(6.0, 8.0))[0]["system"] == "inch"
+
+
+def test_torque_filters():
+    assert len(FASTENER_DATA.torque()) == 12
+    (m10,) = FASTENER_DATA.torque(size="M10", grade="8.8")
+    assert (m10["torque_dry_nm"], m10["torque_lubricated_nm"]) == (47.0, 35.0)
+    assert {t["size"] for t in FASTENER_DATA.torque(grade="10.9")} == {
+        "M6", "M8", "M10", "M12", "M16", "M20",
+    }
+    assert FASTENER_DATA.torque(size="M3") == []
+
+
+def test_store_is_read_only():
+    column = FASTENER_DATA.sizes.numeric["nominal_mm"]
+    with pytest.raises(ValueError):
+        column[0] = 99.0
+    FASTENER_DATA.size("M8")["nominal_mm"] = 99.0
+    assert FASTENER_DATA.size("M8")["nominal_mm"] == 8.0
+
+
+def test_unknown_column_is_rejected():
+    with pytest.raises(KeyError, match="Unknown numeric column"):
+        FASTENER_DATA.sizes.range_rows("pitch_mm", 0.0, 1.0)
+
+
+def test_size_routes(client):
+    response = client.get("/api/fasteners/sizes", params={"max_cbore_dia_mm": 12})
+    assert response.status_code == 200
+    assert [s["designation"] for s in response.json()] == ["M3", "M4", "M5", "M6"]
+
+    everything = client.get("/api/fasteners/sizes").json()
+    assert len(everything) == len(METRIC_SIZES) + len(INCH_SIZES)
+    response = client.get("/api/fasteners/sizes", params={"system": "inch"})
+    assert [s["designation"] for s in response.json()] == INCH_SIZES
+
+    response = client.get("/api/fasteners/sizes/1/4-20")
+    assert response.status_code == 200
+    assert response.json()["threads_per_inch"] == 20.0
+
+    response = client.get("/api/fasteners/sizes/M7")
+    assert response.status_code == 404
+    assert "M7" in response.json()["detail"]
+
+
+def test_torque_route(client):
+    response = client.get("/api/fasteners/torque", params={"size": "M12", "grade": "10.9"})
+    assert [t["torque_dry_nm"] for t in response.json()] == [116.0]
+    assert len(client.get("/api/fasteners/torque").json()) == 12
+    assert client.get("/api/fasteners/torque", params={"size": "M3"}).json() == []
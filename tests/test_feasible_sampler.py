@@ -0,0 +1,94 @@
+"""Tests for the constraint-aware quasi-random sampler."""
+
+from __future__ import annotations
+
+import dataclasses
+
+import numpy as np
+import pytest
+
+from parameterization.parameter_space import MOUNTING_HOLE_SPACE, ParameterSpace
+from training_pipeline.feasible_sampler import ConditionalBound, FeasibleSampler, Predicate
+
+EDGE_BOUND = ConditionalBound(
+    "hole_x_position", ("hole_diameter",),
+    lambda v: (v["hole_diameter"] / 2, 100 - v["hole_diameter"] / 2),
+)
+TOLERANCE_VS_SIZE = Predicate(
+    "tolerance_vs_size", ("position_tolerance", "hole_diameter"),
+    lambda v: v["position_tolerance"] <= v["hole_diameter"] / 20,
+)
+
+
+def _sampler(**kwargs) -> FeasibleSampler:
+    return FeasibleSampler(
+        MOUNTING_HOLE_SPACE, bounds=[EDGE_BOUND], predicates=[TOLERANCE_VS_SIZE], **kwargs,
+    )
+
+
+def test_every_sampled_row_is_feasible():
+    sampler = _sampler(seed=7)
+    columns = sampler.sample(2000)
+    assert list(columns) == list(MOUNTING_HOLE_SPACE.parameters)
+    assert all(len(column) == 2000 for column in columns.values())
+
+    d, x = columns["hole_diameter"], columns["hole_x_position"]
+    assert np.all((x >= d / 2) & (x <= 100 - d / 2))
+    assert np.all(columns["position_tolerance"] <= d / 20)
+    assert np.all((d >= 5.0) & (d <= 50.0))
+    assert np.array_equal(d, np.round(d, 3))
+    assert set(columns["position_material_modifier"]) == {"RFS", "MMC", "LMC"}
+    assert sampler.filter(columns).all()
+
+
+def test_rejection_statistics():
+    sampler = _sampler(seed=7)
+    sampler.sample(1000)
+    assert 0 < sampler.acceptance_rate < 1
+    assert sampler.accepted == 1000
+    assert sampler.rejected_by["tolerance_vs_size"] > 0
+    assert sampler.rejected_by["bounds"] == 0
+
+
+def test_same_seed_gives_same_rows():
+    first = _sampler(seed=3).sample_rows(50)
+    assert first == _sampler(seed=3).sample_rows(50)
+    assert first != _sampler(seed=4).sample_rows(50)
+    assert set(first[0]) == set(MOUNTING_HOLE_SPACE.parameters)
+
+
+def test_filter_flags_infeasible_rows():
+    columns = {
+        "hole_diameter": np.array([10.0, 10.0, 10.0]),
+        "hole_x_position": np.array([50.0, 2.0, 50.0]),
+        "position_tolerance": np.array([0.1, 0.1, 0.6]),
+    }
+    assert _sampler().filter(columns).tolist() == [True, False, False]
+
+
+def test_parameters_without_a_range_are_held_at_their_default():
+    params = dict(MOUNTING_HOLE_SPACE.parameters)
+    params["hole_y_position"] = dataclasses.replace(
+        params["hole_y_position"], min_value=None, max_value=None,
+    )
+    space = ParameterSpace(name="fixed_y", description="", parameters=params)
+    sampler = FeasibleSampler(space)
+    assert "hole_y_position" not in sampler.dimensions
+    assert np.all(sampler.sample(16)["hole_y_position"] == 15.0)
+
+
+def test_empty_feasible_region_raises():
+    impossible = Predicate("never", ("hole_diameter",), lambda v: v["hole_diameter"] < 0)
+    sampler = FeasibleSampler(MOUNTING_HOLE_SPACE, predicates=[impossible], max_blocks=2)
+    with pytest.raises(ValueError, match="feasible rows"):
+        sampler.sample(10)
+
+
+def test_invalid_constraints_are_rejected():
+    with pytest.raises(ValueError, match="unknown parameter"):
+        FeasibleSampler(MOUNTING_HOLE_SPACE, predicates=[Predicate("p", ("depth",), len)])
+    circular = ConditionalBound(
+        "hole_diameter", ("hole_x_position",), lambda v: (5.0, v["hole_x_position"]),
+    )
+    with pytest.raises(ValueError, match="Circular"):
+        FeasibleSampler(MOUNTING_HOLE_SPACE, bounds=[EDGE_BOUND, circular])
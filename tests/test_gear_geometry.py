@@ -0,0 +1,88 @@
+"""Tests for spur gear geometry and the gear-pair search."""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pytest
+
+from backend.routes import gears
+from engineering.gear_geometry import (
+    GearGrid,
+    center_distance,
+    min_teeth_without_undercut,
+    spur_geometry,
+)
+
+
+@pytest.fixture(scope="module")
+def grid() -> GearGrid:
+    return GearGrid()
+
+
+def test_standard_spur_gear_diameters():
+    geometry = spur_geometry(2, 24, 20).at()
+    assert geometry["pitch_dia"] == pytest.approx(48.0)
+    assert geometry["outside_dia"] == pytest.approx(52.0)
+    assert geometry["root_dia"] == pytest.approx(43.0)
+    assert geometry["base_dia"] == pytest.approx(48.0 * math.cos(math.radians(20)))
+
+
+def test_pair_formulas():
+    assert center_distance(2, 24, 72) == pytest.approx(96.0)
+    assert min_teeth_without_undercut(20) == 18
+    assert min_teeth_without_undercut(14.5) > min_teeth_without_undercut(25)
+
+
+def test_grid_gear_matches_spur_geometry(grid):
+    assert grid.gear(2, 24, 20) == spur_geometry(2, 24, 20).at()
+    with pytest.raises(KeyError):
+        grid.gear(2.2, 24, 20)
+
+
+def test_pair_table_is_sorted_and_read_only(grid):
+    pairs = grid.pairs
+    assert np.all(np.diff(pairs["center_distance"]) >= 0)
+    assert np.all(pairs["pinion_teeth"] <= pairs["gear_teeth"])
+    with pytest.raises(ValueError):
+        pairs["ratio"][0] = 1.0
+
+
+def test_pair_candidates_hit_exact_targets_first(grid):
+    candidates = grid.pair_candidates(3.0, 96.0, pressure_angle=20.0)
+    best = candidates[0]
+    assert (best["ratio_error"], best["center_distance_error"]) == (0.0, 0.0)
+    assert {(c["module"], c["pinion_teeth"], c["gear_teeth"]) for c in candidates[:2]} == {
+        (1.5, 32, 96), (2.0, 24, 72),
+    }
+    for c in candidates:
+        assert c["pressure_angle"] == 20.0
+        assert c["contact_ratio"] >= 1.2
+        assert c["pinion_teeth"] >= 18
+        assert abs(c["center_distance"] - 96.0) <= 0.5
+
+
+@pytest.mark.parametrize("ratio, cd", [(0.5, 96.0), (3.0, 0.0)])
+def test_pair_candidates_reject_bad_targets(grid, ratio, cd):
+    with pytest.raises(ValueError):
+        grid.pair_candidates(ratio, cd)
+
+
+def test_route_pair_table_is_built_at_import():
+    assert "pairs" in vars(gears._GRID)
+
+
+def test_routes(client):
+    response = client.get("/api/gears/geometry", params={"module": 2, "teeth": 24})
+    assert response.status_code == 200
+    assert response.json()["outside_dia"] == pytest.approx(52.0)
+
+    response = client.get("/api/gears/pairs", params={"ratio": 3, "center_distance": 96})
+    assert response.status_code == 200
+    body = response.json()
+    assert body["searched_pairs"] == len(gears._GRID.pairs["ratio"])
+    assert body["candidates"][0]["ratio_error"] == 0.0
+
+    response = client.get("/api/gears/pairs", params={"ratio": 0.5, "center_distance": 96})
+    assert response.status_code == 422
@@ -0,0 +1,90 @@
+"""Tests for per-stage instrumentation and the JSON run report."""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+import time
+
+import pytest
+
+from training_pipeline import instrumentation
+from training_pipeline.instrumentation import StageMetrics, measure_stage, write_run_report
+
+PAIRS = [("Create a boss.", "swModel.Rebuild();"), ("Add a fillet.", "// é")]
+
+# Burns about 0.3 s of CPU in a child process
+_BUSY_CHILD = [
+    sys.executable, "-c",
+    "import time\nend = time.process_time() + 0.3\nwhile time.process_time() < end: pass",
+]
+
+
+def test_stage_metrics_are_recorded():
+    with measure_stage("sketch") as metrics:
+        time.sleep(0.01)
+        metrics.record(PAIRS)
+    assert (metrics.name, metrics.status, metrics.pairs) == ("sketch", "ok", 2)
+    assert metrics.wall_s >= 0.01
+    assert metrics.output_bytes == sum(len(i.encode()) + len(o.encode()) for i, o in PAIRS)
+    assert metrics.pairs_per_s == pytest.approx(2 / metrics.wall_s)
+    assert metrics.py_peak_alloc_kb is None and metrics.profile_path is None
+    assert metrics.worker_peak_rss_kb is None
+
+
+def test_failed_stage_is_marked_and_reraised():
+    with pytest.raises(RuntimeError, match="boom"):
+        with measure_stage("gdt") as metrics:
+            raise RuntimeError("boom")
+    assert (metrics.status, metrics.error) == ("failed", "boom")
+    assert metrics.wall_s > 0
+
+
+def test_profile_and_heap_peak(tmp_path):
+    profile = tmp_path / "profiles" / "gdt.pstats"
+    with measure_stage("gdt", trace_memory=True, profile_path=profile) as metrics:
+        blocks = [bytearray(1024) for _ in range(2048)]
+        del blocks
+    assert metrics.py_peak_alloc_kb >= 2048
+    assert metrics.profile_path == str(profile) and profile.stat().st_size > 0
+
+
+@pytest.mark.skipif(instrumentation.resource is None, reason="needs the resource module")
+def test_worker_processes_are_counted():
+    with measure_stage("combined") as metrics:
+        for _ in range(2):
+            subprocess.run(_BUSY_CHILD, check=True)
+    # The parent only waits; the CPU time is the children's
+    assert metrics.cpu_s >= 0.5
+    assert metrics.worker_peak_rss_kb > 0
+
+
+def test_run_report(tmp_path):
+    export = tmp_path / "data.jsonl"
+    export.write_text("{}\n", encoding="utf-8")
+    stages = [
+        StageMetrics(name="gdt", pairs=30, wall_s=1.0, cpu_s=0.5, output_bytes=300),
+        StageMetrics(name="sketch", pairs=10, wall_s=1.0, cpu_s=2.0, output_bytes=100,
+                     worker_peak_rss_kb=4096),
+        StageMetrics(name="mates", status="failed", error="boom"),
+    ]
+    path = tmp_path / "report.json"
+    report = write_run_report(
+        path, stages, {"seed": 0},
+        {"jsonl": export, "alpaca": tmp_path / "missing.json"},
+    )
+    assert json.loads(path.read_text(encoding="utf-8")) == report
+    assert report["config"] == {"seed": 0}
+    assert report["totals"] == {
+        "pairs": 40,
+        "wall_s": 2.0,
+        "cpu_s": 2.5,
+        "worker_peak_rss_kb": 4096,
+        "output_bytes": 400,
+        "pairs_per_s": 20.0,
+        "failed_stages": ["mates"],
+    }
+    assert [s["name"] for s in report["stages"]] == ["gdt", "sketch", "mates"]
+    assert report["stages"][0]["pairs_per_s"] == 30.0
+    assert report["exports"] == {"jsonl": {"path": str(export), "bytes": 3}}
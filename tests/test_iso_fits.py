@@ -0,0 +1,56 @@
+"""Tests for ISO 286 tolerance zones and fits."""
+
+from __future__ import annotations
+
+import pytest
+
+from engineering.iso_fits import evaluate_fit, evaluate_fits, parse_fit, tolerance_zone
+
+
+@pytest.mark.parametrize("fit, min_clearance, max_clearance, fit_type", [
+    ("H7/g6", 0.007, 0.041, "clearance"),
+    ("H7/k6", -0.015, 0.019, "transition"),
+    ("H7/p6", -0.035, -0.001, "interference"),
+])
+def test_fits_at_25_mm_match_the_iso_286_tables(fit, min_clearance, max_clearance, fit_type):
+    result = evaluate_fit(25, fit)
+    assert result.min_clearance == pytest.approx(min_clearance)
+    assert result.max_clearance == pytest.approx(max_clearance)
+    assert result.fit_type == fit_type
+
+
+def test_hole_basis_and_shaft_basis_zones():
+    result = evaluate_fit(100, "F8/h7")
+    hole, shaft = result.hole, result.shaft
+    assert (hole.upper_deviation, hole.lower_deviation) == pytest.approx((0.090, 0.036))
+    assert (shaft.upper_deviation, shaft.lower_deviation) == pytest.approx((0.0, -0.035))
+    assert (result.min_clearance, result.max_clearance) == pytest.approx((0.036, 0.125))
+
+
+def test_range_boundaries_belong_to_the_lower_range():
+    assert tolerance_zone(3, "h6").lower_deviation == pytest.approx(-0.006)
+    assert tolerance_zone(3.0001, "h6").lower_deviation == pytest.approx(-0.008)
+
+
+def test_fit_table_matches_scalar_evaluation():
+    table = evaluate_fits([10, 25, 100], ["H7/g6", "H7/p6"])
+    assert table.fit_type_codes.tolist() == [[0, 2]] * 3
+    assert table.to_records()[0] == {
+        "nominal": 10.0, "fit": "H7/g6",
+        "hole_upper": 0.015, "hole_lower": 0.0, "shaft_upper": -0.005, "shaft_lower": -0.014,
+        "max_clearance": 0.029, "min_clearance": 0.005, "fit_type": "clearance",
+    }
+    scalar = evaluate_fit(100, "H7/p6")
+    assert table.result(2, 1).min_clearance == pytest.approx(scalar.min_clearance)
+
+
+@pytest.mark.parametrize("fit", ["H7/z6", "H19/g6", "h7/G6", "g6/H7", "H7g6"])
+def test_malformed_fits_are_rejected(fit):
+    with pytest.raises(ValueError):
+        parse_fit(fit)
+
+
+@pytest.mark.parametrize("nominal", [0, -1, 500.5])
+def test_nominal_outside_the_tables_is_rejected(nominal):
+    with pytest.raises(ValueError):
+        evaluate_fit(nominal, "H7/g6")
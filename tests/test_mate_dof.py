@@ -0,0 +1,134 @@
+"""Tests for the assembly mate DOF analyzer."""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from engineering.mate_dof import Mate, MateEntity, analyze_mates, normalize_mate_type
+
+Z = (0.0, 0.0, 1.0)
+
+
+def _hinge_chain(n: int) -> list[Mate]:
+    """Components C0..C{n-1}, each on a revolute joint to the previous one.
+
+    Parallel axes on a zigzag, so the chain is a planar linkage away from
+    its collinear (singular) configuration.
+    """
+    mates = []
+    for i in range(n):
+        parent = None if i == 0 else f"C{i - 1}"
+        axis = MateEntity("axis", (10.0 * i, 3.0 * (i % 2), 0.0), Z)
+        face = MateEntity("plane", (10.0 * i, 3.0 * (i % 2), float(i)), Z)
+        mates.append(Mate(f"Concentric{i}", "CONCENTRIC", (parent, f"C{i}"), [axis, axis]))
+        mates.append(Mate(f"Coincident{i}", "COINCIDENT", (parent, f"C{i}"), [face, face]))
+    return mates
+
+
+def test_normalize_mate_type():
+    assert normalize_mate_type("swMateCONCENTRIC") == "CONCENTRIC"
+    assert normalize_mate_type("Rack Pinion") == "RACKPINION"
+    with pytest.raises(ValueError):
+        normalize_mate_type("glue")
+
+
+def test_unmated_component_is_free():
+    result = analyze_mates([], components=["Bracket"])
+    assert result.total_dof == 6
+    assert result.groups[0].component_dof == {"Bracket": 6}
+
+
+def test_revolute_joint_leaves_one_dof():
+    result = analyze_mates(_hinge_chain(1))
+    group = result.groups[0]
+    assert group.dof == 1
+    assert group.grounded
+    assert group.component_dof == {"C0": 1}
+    assert [m.relative_dof for m in result.mates] == [1, 1]
+    assert group.status == "under_defined"
+
+
+def test_lock_fully_defines_and_repeated_mate_is_redundant():
+    mates = [
+        Mate("Lock1", "LOCK", (None, "A")),
+        Mate("Lock2", "LOCK", (None, "A")),
+    ]
+    result = analyze_mates(mates)
+    assert result.total_dof == 0
+    assert result.redundant_mates == ["Lock2"]
+    assert result.groups[0].status == "over_defined"
+
+
+def test_locked_pair_forms_one_rigid_cluster():
+    mates = [Mate("Lock1", "LOCK", ("A", "B"))]
+    result = analyze_mates(mates)
+    group = result.groups[0]
+    assert group.dof == 6
+    assert group.component_dof == {"A": 6, "B": 6}
+    assert group.rigid_clusters == [["A", "B"]]
+    assert result.mates[0].relative_dof == 0
+
+
+def test_independent_groups_are_reported_separately():
+    mates = [
+        Mate("Lock1", "LOCK", (None, "A")),
+        Mate("Concentric1", "CONCENTRIC", ("B", "C"),
+             [MateEntity("axis", (0, 0, 0), Z), MateEntity("axis", (0, 0, 0), Z)]),
+    ]
+    result = analyze_mates(mates)
+    assert [g.components for g in result.groups] == [["A"], ["B", "C"]]
+    assert [g.dof for g in result.groups] == [0, 8]
+
+
+def test_planar_chain_component_dof_saturates_at_three():
+    result = analyze_mates(_hinge_chain(8))
+    dof = result.groups[0].component_dof
+    assert result.total_dof == 8
+    assert [dof[f"C{i}"] for i in range(8)] == [1, 2, 3, 3, 3, 3, 3, 3]
+    assert [m.relative_dof for m in result.mates][2:4] == [1, 1]
+    assert result.groups[0].rigid_clusters == [[f"C{i}"] for i in range(8)]
+    assert not result.redundant_mates
+
+
+def test_coincident_points_distance_mate_is_well_defined():
+    mates = [Mate("Distance1", "DISTANCE", ("A", "B"),
+                  [MateEntity("point", (1, 2, 3)), MateEntity("point", (1, 2, 3))])]
+    assert analyze_mates(mates).total_dof == 11
+
+
+def test_large_assemblies_scale():
+    """A long chain and many independent groups stay well under quadratic-dense cost."""
+    start = time.perf_counter()
+    chain = analyze_mates(_hinge_chain(1000))
+    groups = analyze_mates([
+        Mate(f"Lock{i}", "LOCK", (f"A{i}", f"B{i}")) for i in range(5000)
+    ])
+    elapsed = time.perf_counter() - start
+    assert chain.total_dof == 1000
+    assert len(groups.groups) == 5000 and groups.total_dof == 5000 * 6
+    assert elapsed < 15.0
+
+
+def test_long_chain_scales_linearly():
+    """Each chain link only touches its own relative-twist columns."""
+    def timed(n: int) -> float:
+        start = time.perf_counter()
+        result = analyze_mates(_hinge_chain(n))
+        assert result.total_dof == n and not result.redundant_mates
+        return time.perf_counter() - start
+
+    short, long = timed(1000), timed(8000)
+    # Linear growth is 8x; the dense fill-in this replaced was 50x
+    assert long < 20 * short
+    assert long < 15.0
+
+
+def test_loop_closing_mate_spans_the_loop():
+    """Pinning the last link of a chain to ground makes a planar five-bar."""
+    pin = MateEntity("axis", (40.0, 0.0, 0.0), Z)
+    result = analyze_mates(_hinge_chain(4) + [Mate("Close", "CONCENTRIC", ("C3", None), [pin, pin])])
+    assert result.total_dof == 2
+    assert result.mates[-1].independent_rows == 2
+    assert result.groups[0].component_dof == {"C0": 1, "C1": 2, "C2": 2, "C3": 1}
@@ -0,0 +1,67 @@
+"""Tests for the GD&T and sketch constraint normalizers."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from training_pipeline.normalizers import gdt_normalizer, sketch_constraint_normalizer
+from training_pipeline.normalizers.gdt_normalizer import GDTNormalizer
+from training_pipeline.normalizers.sketch_constraint_normalizer import SketchConstraintNormalizer
+
+
+def test_gdt_frames_are_parsed():
+    spec = GDTNormalizer().normalize("position 0.5 MMC A|B|C")
+    assert (spec.characteristic, spec.tolerance_value, spec.material_modifier) == (
+        "position", 0.5, "MMC",
+    )
+    assert [d.label for d in spec.datum_references] == ["A", "B", "C"]
+    with pytest.raises(ValueError):
+        GDTNormalizer().normalize("no frame here")
+
+
+def test_repeated_datum_is_invalid():
+    normalizer = GDTNormalizer()
+    errors = normalizer.validate_specification(normalizer.normalize("position 0.25 MMC A|A"))
+    assert errors == ["Datum 'A' is referenced more than once."]
+    assert normalizer.validate_specification(normalizer.normalize("position 0.25 MMC A|B")) == []
+
+
+def test_normalize_many_returns_none_or_raises_for_bad_input():
+    normalizer = SketchConstraintNormalizer()
+    items = ["line L1 is horizontal", "gibberish", "line L1 is horizontal"]
+    results = normalizer.normalize_many(items)
+    assert results[1] is None
+    assert results[0] == results[2] and results[0] is not results[2]
+    with pytest.raises(ValueError):
+        normalizer.normalize_many(items, strict=True)
+
+
+@pytest.mark.parametrize("module, good", [
+    (gdt_normalizer, "flatness 0.05"),
+    (sketch_constraint_normalizer, "radius of arc A1 = 25"),
+])
+def test_parallel_parse_matches_in_process(monkeypatch, module, good):
+    monkeypatch.setattr(module._PARSER, "parallel_min_items", 2)
+    items = [good, "?", good] * 5
+    assert module._PARSER.parse_many(items, workers=2) == module._PARSER.parse_many(items)
+
+
+def test_sketch_dof_is_imported_only_when_checking_definition():
+    code = (
+        "import sys\n"
+        "from training_pipeline.normalizers.sketch_constraint_normalizer import "
+        "SketchConstraintNormalizer as N\n"
+        "assert 'engineering.sketch_dof' not in sys.modules\n"
+        "n = N()\n"
+        "c = [n.normalize('line L1 is horizontal')]\n"
+        "print(n.check_fully_defined(c)['dof_remaining'])\n"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], cwd=Path(__file__).resolve().parents[1],
+        capture_output=True, text=True, check=True,
+    )
+    assert out.stdout.strip() == "3"
@@ -0,0 +1,117 @@
+"""Tests for the pre-tokenized, pre-packed dataset export."""
+
+from __future__ import annotations
+
+from collections import Counter
+
+import numpy as np
+import pytest
+
+from training_pipeline.exporters import packed_dataset
+from training_pipeline.exporters.packed_dataset import (
+    PackedDataset,
+    build_packed_dataset,
+    format_alpaca_prompt,
+    pack_first_fit_decreasing,
+)
+
+SEQUENCE_LEN = 512
+PAIRS = [
+    (f"Create feature {i}.", "swModel.Rebuild();" + " // step" * (i % 23)) for i in range(40)
+]
+
+
+class CharTokenizer:
+    """One token per character; ids 0-2 are pad, bos and eos."""
+
+    pad_token_id = 0
+    bos_token_id = 1
+    eos_token_id = 2
+
+    def __call__(self, texts: list[str], add_special_tokens: bool = True) -> dict[str, list]:
+        return {"input_ids": [[ord(c) + 3 for c in text] for text in texts]}
+
+    @staticmethod
+    def decode(ids) -> str:
+        return "".join(chr(int(i) - 3) for i in ids)
+
+
+@pytest.fixture
+def stub_tokenizer(monkeypatch):
+    monkeypatch.setattr(packed_dataset, "_load_tokenizer", lambda name: CharTokenizer())
+    monkeypatch.setattr(packed_dataset, "_WORKER_TOKENIZER", None)
+
+
+def _build(tmp_path, pairs=PAIRS, sequence_len=SEQUENCE_LEN) -> dict:
+    return build_packed_dataset(
+        pairs, tmp_path, tokenizer_name="stub", sequence_len=sequence_len, workers=1,
+    )
+
+
+def _examples(tmp_path) -> list[tuple[str, str]]:
+    """(prompt, response) text of every packed segment."""
+    tokens = np.load(tmp_path / "tokens.npy")
+    loss_mask = np.load(tmp_path / "loss_mask.npy")
+    examples = []
+    for seq, start, length in np.load(tmp_path / "segments.npy").tolist():
+        ids = tokens[seq, start:start + length]
+        mask = loss_mask[seq, start:start + length]
+        assert ids[0] == CharTokenizer.bos_token_id and ids[-1] == CharTokenizer.eos_token_id
+        # The loss covers a contiguous tail: the response and eos
+        prompt_len = int(length - mask.sum())
+        assert not mask[:prompt_len].any() and mask[prompt_len:].all()
+        examples.append((
+            CharTokenizer.decode(ids[1:prompt_len]), CharTokenizer.decode(ids[prompt_len:-1]),
+        ))
+    return examples
+
+
+def test_every_pair_round_trips(tmp_path, stub_tokenizer):
+    meta = _build(tmp_path)
+    assert (meta["num_examples"], meta["num_truncated"]) == (len(PAIRS), 0)
+    expected = Counter((format_alpaca_prompt(ins), out) for ins, out in PAIRS)
+    assert Counter(_examples(tmp_path)) == expected
+
+
+def test_no_pair_crosses_a_sequence_boundary(tmp_path, stub_tokenizer):
+    meta = _build(tmp_path)
+    tokens = np.load(tmp_path / "tokens.npy")
+    segments = np.load(tmp_path / "segments.npy").astype(np.int64)
+    offsets = np.load(tmp_path / "offsets.npy").astype(np.int64)
+    assert tokens.shape == (meta["num_sequences"], SEQUENCE_LEN)
+    assert offsets[0] == 0 and offsets[-1] == len(segments)
+
+    for seq in range(meta["num_sequences"]):
+        rows = segments[offsets[seq]:offsets[seq + 1]]
+        assert len(rows) and (rows[:, 0] == seq).all()
+        ends = rows[:, 1] + rows[:, 2]
+        # Segments are laid end to end from position 0 and fit the sequence
+        assert rows[0, 1] == 0 and (rows[1:, 1] == ends[:-1]).all()
+        assert ends[-1] <= SEQUENCE_LEN
+        assert (tokens[seq, ends[-1]:] == CharTokenizer.pad_token_id).all()
+
+
+def test_reader_resets_positions_at_every_example(tmp_path, stub_tokenizer):
+    _build(tmp_path)
+    dataset = PackedDataset(tmp_path)
+    segments = np.load(tmp_path / "segments.npy")
+    item = dataset[0]
+    lengths = segments[segments[:, 0] == 0][:, 2].astype(np.int64)
+    assert item["cu_seqlens"].tolist() == [0, *np.cumsum(lengths).tolist()]
+    assert (item["position_ids"][item["cu_seqlens"][:-1]] == 0).all()
+    assert item["position_ids"][lengths[0] - 1] == lengths[0] - 1
+
+
+def test_long_examples_are_truncated_to_one_sequence(tmp_path, stub_tokenizer):
+    meta = _build(tmp_path, [("Long.", "x" * 1000), ("Short.", "y")], sequence_len=256)
+    assert meta["num_truncated"] == 1
+    segments = np.load(tmp_path / "segments.npy")
+    assert segments[:, 2].max() == 256
+
+
+def test_first_fit_decreasing_respects_capacity():
+    lengths = [7, 3, 5, 2, 8, 1, 4]
+    bins = pack_first_fit_decreasing(lengths, 10)
+    assert sorted(i for b in bins for i in b) == list(range(len(lengths)))
+    assert all(sum(lengths[i] for i in b) <= 10 for b in bins)
+    assert len(bins) == 3
@@ -0,0 +1,118 @@
+"""Tests for parameter spaces and columnar assignment batches."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from parameterization.parameter_space import (
+    ParameterAssignment,
+    ParameterAssignmentBatch,
+    ParameterConstraint,
+    ParameterDefinition,
+    ParameterDomain,
+    ParameterSpace,
+    ParameterType,
+)
+
+
+def _param(name: str, constraint: ParameterConstraint, **kwargs) -> ParameterDefinition:
+    return ParameterDefinition(
+        name=name,
+        parameter_type=ParameterType.LENGTH,
+        domain=ParameterDomain.SKETCH,
+        default_value=kwargs.pop("default_value", 10.0),
+        constraint_type=constraint,
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def space() -> ParameterSpace:
+    return ParameterSpace("plate", parameters={
+        "width": _param("width", ParameterConstraint.RANGE, min_value=5.0, max_value=50.0),
+        "depth": _param("depth", ParameterConstraint.POSITIVE),
+        "offset": _param("offset", ParameterConstraint.NON_NEGATIVE),
+        "material": _param(
+            "material", ParameterConstraint.DISCRETE,
+            discrete_values=["steel", "aluminum"], default_value="steel",
+        ),
+    })
+
+
+def _scalar_mask(space: ParameterSpace, name: str, values: list) -> list[bool]:
+    """Violations according to the scalar ``validate_value`` path."""
+    param = space.parameters[name]
+    result = []
+    for value in values:
+        try:
+            result.append(not param.validate_value(value))
+        except TypeError:
+            result.append(True)
+    return result
+
+
+def test_numeric_validation_matches_scalar_path(space):
+    columns = {
+        "width": [4.0, 5.0, 50.0, 51.0],
+        "depth": [0.0, 1.0, -1.0, 2.0],
+        "offset": [0.0, -0.5, 3.0, 1.0],
+        "material": ["steel", "wood", "aluminum", "steel"],
+    }
+    masks = ParameterAssignmentBatch.from_columns(space, columns).validate()
+    for name in ("width", "depth", "offset", "material"):
+        assert masks[name].tolist() == _scalar_mask(space, name, columns[name])
+
+
+@pytest.mark.parametrize("name", ["width", "depth", "offset"])
+def test_non_numeric_values_violate_numeric_constraints(space, name):
+    batch = ParameterAssignmentBatch.from_columns(space, {name: [10, "abc", None, 20.5]})
+    assert batch.validate()[name].tolist() == [False, True, True, False]
+    assert batch.row_errors(1) == [
+        f"Value abc violates constraint {space.parameters[name].constraint_type.value} "
+        f"for parameter '{name}'"
+    ]
+
+
+def test_row_errors_report_rejected_discrete_value(space):
+    batch = ParameterAssignmentBatch.from_rows(space, [
+        {"width": 10.0, "material": "wood"},
+    ])
+    assert batch.error_mask().tolist() == [True]
+    assert batch.row_errors(0) == [
+        "Value wood violates constraint discrete for parameter 'material'"
+    ]
+
+
+def test_mixed_int_float_column_keeps_integers(space):
+    rows = [{"width": 10, "depth": 2.5}, {"width": 12.5, "depth": 3}]
+    batch = ParameterAssignmentBatch.from_rows(space, rows)
+    scalar = [ParameterAssignment(space, row).to_csharp_dict() for row in rows]
+    assert batch.to_csharp_dicts() == scalar
+    assert "['width'] = 10," in scalar[0]
+    assert batch.get_row(0) == rows[0]
+
+
+def test_array_columns_export_like_scalar_assignments(space):
+    widths = np.linspace(5.0, 50.0, 7)
+    batch = ParameterAssignmentBatch.from_columns(space, {
+        "width": widths,
+        "material": ["steel", "aluminum"] * 3 + ["steel"],
+    })
+    expected = [assignment.to_csharp_dict() for assignment in batch.iter_assignments()]
+    assert batch.to_csharp_dicts() == expected
+    assert len(expected) == 7
+
+
+def test_invalid_rows_are_skipped(space):
+    batch = ParameterAssignmentBatch.from_columns(space, {"width": [1.0, 10.0, 60.0]})
+    assert [row["width"] for row in batch.iter_rows()] == [10.0]
+    assert len(list(batch.iter_rows(valid_only=False))) == 3
+
+
+def test_column_length_mismatch_raises(space):
+    batch = ParameterAssignmentBatch.from_columns(space, {"width": [10.0, 20.0]})
+    with pytest.raises(ValueError, match="expected 2"):
+        batch.set_column("depth", [1.0])
+    with pytest.raises(ValueError, match="not found"):
+        ParameterAssignmentBatch.from_columns(space, {"height": [1.0]})
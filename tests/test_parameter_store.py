@@ -0,0 +1,148 @@
+"""Tests for the SQLite parameter store."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# The store imports its sibling as a top-level module, like parameter_resolver
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "parameterization"))
+
+from parameter_space import (  # noqa: E402
+    MOUNTING_HOLE_SPACE,
+    ParameterAssignment,
+    ParameterAssignmentBatch,
+    ParameterDefinition,
+    ParameterDomain,
+    ParameterSpace,
+    ParameterType,
+)
+from parameter_store import ParameterStore  # noqa: E402
+
+
+def _length(name: str, *depends_on: str) -> ParameterDefinition:
+    return ParameterDefinition(
+        name=name,
+        parameter_type=ParameterType.LENGTH,
+        domain=ParameterDomain.FEATURE,
+        default_value=10.0,
+        min_value=1.0,
+        max_value=100.0,
+        source=f"Boss.{name}",
+        dependent_on=list(depends_on),
+    )
+
+
+# width <- height <- fillet, width <- depth, depth <- fillet
+CHAIN_SPACE = ParameterSpace("chain", parameters={
+    param.name: param for param in [
+        _length("width"),
+        _length("height", "width"),
+        _length("depth", "width"),
+        _length("fillet", "height", "depth"),
+    ]
+})
+
+
+@pytest.fixture
+def store() -> ParameterStore:
+    store = ParameterStore(":memory:")
+    store.save_space(MOUNTING_HOLE_SPACE)
+    store.save_space(CHAIN_SPACE)
+    return store
+
+
+def test_space_round_trips(store):
+    loaded = store.load_space("mounting_hole")
+    assert loaded == MOUNTING_HOLE_SPACE
+    assert list(loaded.parameters) == list(MOUNTING_HOLE_SPACE.parameters)
+    store.clear_cache()
+    assert store.load_space("mounting_hole") == MOUNTING_HOLE_SPACE
+    assert store.list_spaces() == ["chain", "mounting_hole"]
+    assert store.load_space("missing") is None
+
+
+def test_loaded_space_is_a_copy(store):
+    loaded = store.load_space("mounting_hole")
+    loaded.parameters["hole_diameter"].max_value = 500.0
+    del loaded.parameters["hole_y_position"]
+    fresh = store.load_space("mounting_hole")
+    assert fresh.parameters["hole_diameter"].max_value == 50.0
+    assert "hole_y_position" in fresh.parameters
+
+    _, found = store.find_parameters(source="Hole.Sketch1.Diameter1")[0]
+    found.min_value = 0.0
+    assert store.load_space("mounting_hole").parameters["hole_diameter"].min_value == 5.0
+
+
+def test_saving_again_replaces_the_space(store):
+    replacement = ParameterSpace("chain", description="v2", parameters={
+        "width": _length("width"),
+        "radius": _length("radius", "width"),
+    })
+    store.load_space("chain")  # populate the cache
+    store.save_space(replacement)
+    assert store.load_space("chain") == replacement
+    assert store.dependents("chain", "width") == ["radius"]
+    assert store.find_parameters(space="chain", source="Boss.height") == []
+    assert store.list_spaces() == ["chain", "mounting_hole"]
+
+
+def test_dependents(store):
+    assert store.dependents("mounting_hole", "hole_x_position") == ["position_tolerance"]
+    assert store.dependencies("mounting_hole", "position_tolerance") == [
+        "hole_x_position", "hole_y_position",
+    ]
+    assert store.dependents("chain", "width") == ["depth", "height"]
+    assert store.dependents("chain", "width", transitive=True) == ["depth", "height", "fillet"]
+    assert store.dependents("chain", "fillet", transitive=True) == []
+    assert store.dependents("missing", "width") == []
+
+
+def test_find_parameters_by_index(store):
+    found = store.find_parameters(domain=ParameterDomain.GDT)
+    assert [(space, p.name) for space, p in found] == [
+        ("mounting_hole", "position_tolerance"), ("mounting_hole", "position_material_modifier"),
+    ]
+    found = store.find_parameters(parameter_type=ParameterType.LENGTH, source="Boss.*")
+    assert [p.name for _, p in found] == ["width", "height", "depth", "fillet"]
+
+
+def test_batch_assignments_are_saved_in_one_set(store):
+    batch = ParameterAssignmentBatch.from_columns(MOUNTING_HOLE_SPACE, {
+        "hole_diameter": [8.0, 12.0, 80.0, 20.0],
+        "position_material_modifier": ["MMC", "LMC", "RFS", "RFS"],
+    })
+    assert store.save_assignments("mounting_hole", batch, set_name="sweep") == 3
+    assert store.save_assignments("mounting_hole", batch, set_name="all", valid_only=False) == 4
+
+    loaded = store.load_batch("mounting_hole", "sweep")
+    assert len(loaded) == 3
+    assert loaded.get_column("hole_diameter") == [8.0, 12.0, 20.0]
+    assert loaded.get_column("position_material_modifier") == ["MMC", "LMC", "RFS"]
+    assert store.list_assignment_sets("mounting_hole") == {"all": 4, "sweep": 3}
+
+
+def test_assignments_append_in_order(store):
+    space = store.load_space("mounting_hole")
+    first = ParameterAssignment(space, {"hole_diameter": 6.0})
+    second = ParameterAssignment(space, {"hole_diameter": 9.0})
+    store.save_assignments("mounting_hole", [first])
+    store.save_assignments("mounting_hole", [second])
+    loaded = store.load_assignments("mounting_hole")
+    assert [a.get_value("hole_diameter") for a in loaded] == [6.0, 9.0]
+
+    assert store.delete_assignment_set("mounting_hole", "default")
+    assert store.list_assignment_sets("mounting_hole") == {}
+    with pytest.raises(ValueError, match="not found"):
+        store.save_assignments("missing", [first])
+
+
+def test_delete_space_removes_its_assignment_sets(store):
+    store.save_assignments("chain", [ParameterAssignment(CHAIN_SPACE, {"width": 5.0})])
+    assert store.delete_space("chain")
+    assert store.load_space("chain") is None
+    assert store.list_assignment_sets("chain") == {}
+    assert not store.delete_space("chain")
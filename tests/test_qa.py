@@ -0,0 +1,85 @@
+"""Tests for the dataset QA linter."""
+
+from __future__ import annotations
+
+import pytest
+
+from training_pipeline import qa
+from training_pipeline.run_pipeline import TrainingPipeline
+
+
+@pytest.fixture(scope="module")
+def catalog() -> qa.IdentifierTrie:
+    return qa.build_catalog()
+
+
+def _rules(output: str, catalog: qa.IdentifierTrie) -> list[str]:
+    return [v.rule for v in qa.check_output(output, catalog)]
+
+
+def test_unbalanced_delimiters_ignore_strings_and_comments(catalog):
+    assert _rules('Debug.Print("(" + x); // )', catalog) == []
+    assert _rules("if (a) { b(); ", catalog) == ["unbalanced_delimiters"]
+    assert _rules("a(b]);", catalog) == ["unbalanced_delimiters"]
+
+
+def test_enum_members_are_checked_only_for_complete_enums(catalog):
+    known = "(int)swMaterialModifier_e.swMaterialModifier_MMC"
+    unknown = "(int)swMaterialModifier_e.swMaterialModifier_XYZ"
+    partial = "(int)swConstraintType_e.swConstraintTypePerpendicular"
+    unlisted = "(int)swSelectType_e.swSelFACES"
+    assert _rules(known, catalog) == []
+    assert qa.check_output(unknown, catalog) == [
+        qa.Violation("unknown_enum_member", qa.ERROR, unknown[5:])
+    ]
+    assert _rules(partial, catalog) == []
+    assert _rules(unlisted, catalog) == []
+
+
+def test_members_are_checked_only_for_complete_interfaces():
+    catalog = qa.IdentifierTrie(
+        [("IGtol.SetFrameValues", "member")], complete_owners=["IGtol"],
+    )
+    code = "Gtol gtol = null; gtol.SetFrameValues(1); gtol.Bogus(); swModel.Extension.X();"
+    assert qa.check_output(code, catalog) == [
+        qa.Violation("unknown_member", qa.WARNING, "IGtol.Bogus")
+    ]
+
+
+def test_duplicates_are_compared_by_content():
+    output = "swModel.EditRebuild3();"
+    pairs = [
+        ("Rebuild the  model.", output),
+        ("Rebuild the model.", output),
+        ("Rebuild the model.", "".join(["swModel.", "EditRebuild3();"])),
+        ("Rebuild the model.", "swModel.ForceRebuild3(false);"),
+    ]
+    report = qa.lint_pairs(pairs, workers=1)
+    assert {index: [v.rule for v in found] for index, found in report.violations.items()} == {
+        1: ["duplicate"],
+        2: ["duplicate"],
+        3: ["conflicting_duplicate"],
+    }
+    assert report.failing() == {3}
+    assert report.failing(strict=True) == {1, 2, 3}
+    assert qa.drop_failing(pairs, report) == pairs[:3]
+
+
+def test_shift_range():
+    assert qa.shift_range(2, 6, [0, 3, 7]) == (1, 4)
+
+
+def test_clean_generator_run_passes():
+    pipeline = TrainingPipeline(checkpoint=False)
+    pairs: list[tuple[str, str]] = []
+    stages: dict[str, tuple[int, int]] = {}
+    for spec in pipeline.selected_stages():
+        start = len(pairs)
+        pairs.extend(spec.run(pipeline))
+        stages[spec.name] = (start, len(pairs))
+
+    report = qa.lint_pairs(pairs, stages, workers=1)
+    summary = report.to_dict(pairs)
+    assert report.failing() == set()
+    assert set(summary["rules"]) <= {"duplicate"}
+    assert summary["stages"]["sketch"]["rules"] == {}
@@ -0,0 +1,70 @@
+"""Tests for the training pipeline entry point."""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+from training_pipeline.run_pipeline import TrainingPipeline
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def test_heavy_modules_load_only_when_used():
+    code = (
+        "import sys\n"
+        "from training_pipeline.run_pipeline import TrainingPipeline\n"
+        "lazy = ['numpy', 'scipy', 'engineering.sketch_dof', 'training_pipeline.qa',\n"
+        "        'training_pipeline.distributed', 'training_pipeline.checkpoints']\n"
+        "print(sorted(m for m in lazy if m in sys.modules))\n"
+        "pipeline = TrainingPipeline(only=['gdt'], checkpoint=False)\n"
+        "for spec in pipeline.selected_stages():\n"
+        "    spec.run(pipeline)\n"
+        "print(sorted(m for m in lazy if m in sys.modules))\n"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    assert out.stdout.split("\n")[:2] == ["[]", "[]"]
+
+
+def test_config_is_hashed_only_when_checkpointing(tmp_path):
+    code = (
+        "import sys\n"
+        "from training_pipeline.run_pipeline import TrainingPipeline\n"
+        "pipeline = TrainingPipeline(\n"
+        f"    output_dir={str(tmp_path / 'off')!r}, export_format='jsonl',\n"
+        "    only=['gdt'], checkpoint=False,\n"
+        ")\n"
+        "pipeline.run()\n"
+        "print('training_pipeline.checkpoints' in sys.modules)\n"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    assert out.stdout.split("\n")[-2] == "False"
+    report = json.loads((tmp_path / "off" / "sw_training_run_report.json").read_text())
+    assert report["config"]["config_hash"] is None
+
+    pipeline = TrainingPipeline(
+        output_dir=str(tmp_path / "on"), export_format="jsonl", only=["gdt"],
+    )
+    pipeline.run()
+    report = json.loads((tmp_path / "on" / "sw_training_run_report.json").read_text())
+    assert pipeline.config_hash is not None
+    assert report["config"]["config_hash"] == pipeline.config_hash
+    assert (tmp_path / "on" / "checkpoints" / "manifest.json").exists()
+
+
+def test_stage_selection_by_name_and_category():
+    pipeline = TrainingPipeline(only=["gdt", "sketch"], skip=["sketch"], checkpoint=False)
+    assert [spec.name for spec in pipeline.selected_stages()] == ["gdt"]
+
+
+def test_explicit_combined_budget_overrides_the_template_budget():
+    template = {"desc": "x", "budget": 5, "a": [1, 2, 3], "b": [1, 2, 3]}
+    assert len(TrainingPipeline(checkpoint=False)._sample_template(template)) == 5
+    assert len(TrainingPipeline(combined_budget=2, checkpoint=False)._sample_template(template)) == 2
+    assert TrainingPipeline(combined_budget=0, checkpoint=False)._sample_template(template) == []
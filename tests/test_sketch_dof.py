@@ -0,0 +1,93 @@
+"""Tests for the sketch degree-of-freedom analyzer."""
+
+from __future__ import annotations
+
+import pytest
+
+from engineering.sketch_dof import (
+    CONFLICTING,
+    INDEPENDENT,
+    REDUNDANT,
+    SketchEntity,
+    analyze_sketch,
+    infer_entities,
+)
+from training_pipeline.normalizers.sketch_constraint_normalizer import (
+    SketchConstraint,
+    SketchConstraintNormalizer,
+)
+
+
+def _constraints(*phrases: str) -> list[SketchConstraint]:
+    normalizer = SketchConstraintNormalizer()
+    return [normalizer.normalize(phrase) for phrase in phrases]
+
+
+def test_single_horizontal_line_keeps_three_dof():
+    result = analyze_sketch(_constraints("line L1 is horizontal"))
+    assert (result.variables, result.rank, result.dof) == (4, 1, 3)
+    assert not result.is_fully_defined
+
+
+def test_anchored_dimensioned_line_is_fully_defined():
+    result = analyze_sketch(_constraints(
+        "point P1 is fixed",
+        "line L1 is horizontal",
+        "distance of line L1 = 10",
+        "point P1 coincident with point L1.start",
+    ))
+    assert result.dof == 0
+    assert result.statuses == [INDEPENDENT] * 4
+    assert result.is_fully_defined
+
+
+def test_point_on_line_leaves_the_line_free_to_slide():
+    result = analyze_sketch(_constraints(
+        "point P1 is fixed",
+        "line L1 is horizontal",
+        "distance of line L1 = 10",
+        "point P1 coincident with line L1",
+    ))
+    assert result.dof == 1
+
+
+def test_implied_constraint_is_redundant():
+    result = analyze_sketch(_constraints(
+        "line L1 is horizontal", "line L2 is vertical", "line L1 perpendicular to line L2",
+    ))
+    assert result.statuses == [INDEPENDENT, INDEPENDENT, REDUNDANT]
+    assert (result.redundant, result.dof) == ([2], 6)
+
+
+def test_contradicting_dimensions_conflict():
+    result = analyze_sketch(_constraints("distance of line L1 = 10", "distance of line L1 = 20"))
+    assert result.statuses == [INDEPENDENT, CONFLICTING]
+    assert result.conflicting == [1]
+    assert not result.is_fully_defined
+
+    result = analyze_sketch(_constraints(
+        "line L1 perpendicular to line L2", "line L1 parallel to line L2",
+    ))
+    assert result.conflicting == [1]
+
+
+def test_result_does_not_depend_on_the_inferred_geometry():
+    constraints = _constraints(
+        "circle C1 concentric with circle C2", "radius of circle C1 = 5", "radius of circle C2 = 10",
+    )
+    results = {analyze_sketch(constraints, seed=seed).dof for seed in range(5)}
+    assert results == {2}
+
+
+def test_inferred_entities_fold_sub_points_into_their_parent():
+    entities = infer_entities(_constraints(
+        "line L1 is horizontal", "point P1 coincident with point L1.start",
+    ))
+    assert [(e.name, e.type) for e in entities] == [("L1", "line"), ("P1", "point")]
+
+
+def test_explicit_geometry_is_used_and_must_name_every_entity():
+    line = [SketchEntity("L1", "line", (0.0, 0.0, 10.0, 0.0))]
+    assert analyze_sketch(_constraints("line L1 is horizontal"), line).dof == 3
+    with pytest.raises(ValueError, match="Unknown sketch entity"):
+        analyze_sketch(_constraints("line L2 is horizontal"), line)
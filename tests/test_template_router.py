@@ -0,0 +1,103 @@
+"""Tests for the deterministic template fast path."""
+
+from __future__ import annotations
+
+import pytest
+
+from backend.models import CodeGenerationRequest, CodeGenerationResponse
+from backend.template_router import TemplateRouter, split_clauses
+
+
+@pytest.fixture(scope="module")
+def router() -> TemplateRouter:
+    return TemplateRouter()
+
+
+class FakeLLM:
+    """Records the prompts it is sent and answers with fixed code."""
+
+    def __init__(self) -> None:
+        self.prompts: list[str] = []
+
+    async def __call__(self, request: CodeGenerationRequest) -> CodeGenerationResponse:
+        self.prompts.append(request.prompt)
+        return CodeGenerationResponse(
+            code="// model code", explanation="From the model.", confidence=0.5,
+        )
+
+
+def test_split_clauses_keeps_decimal_points():
+    assert split_clauses("radius of arc A1 = 25.0. line L1 is horizontal") == [
+        "radius of arc A1 = 25.0",
+        "line L1 is horizontal",
+    ]
+
+
+def test_gdt_shorthand_is_rendered(router):
+    response = router.route_gdt("position DIA 0.25 MMC A B C")
+    assert response is not None
+    assert response.source == "template"
+    assert response.confidence == 1.0
+
+
+def test_gdt_natural_language_falls_through(router):
+    assert router.route_gdt("please add a position tolerance to the hole") is None
+
+
+@pytest.mark.parametrize("prompt", [
+    "position DIA 0.25 MMC A A",
+    "perpendicularity 0.1 A B(M) B",
+])
+def test_gdt_repeated_datum_falls_through(router, prompt):
+    assert router.parse_gdt(prompt) is None
+    assert router.route_gdt(prompt) is None
+
+
+@pytest.mark.asyncio
+async def test_sketch_clauses_joined_by_and_are_split(router):
+    llm = FakeLLM()
+    request = CodeGenerationRequest(
+        prompt="line L1 is horizontal and line L2 is vertical", domain="sketch",
+    )
+    response = await router.route(request, llm)
+    assert response is not None
+    assert response.source == "template"
+    assert len(response.parameters_used) == 2
+    assert llm.prompts == []
+
+
+@pytest.mark.parametrize("prompt, system_value", [
+    ("radius of arc A1 = 10", "dim.SystemValue = 0.01;"),
+    ("angle of line L1 = 90", "dim.SystemValue = 1.5707963267948966;"),
+])
+@pytest.mark.asyncio
+async def test_dimensions_are_rendered_in_system_units(router, prompt, system_value):
+    response = await router.route(CodeGenerationRequest(prompt=prompt, domain="sketch"), FakeLLM())
+    assert response is not None and response.source == "template"
+    assert system_value in response.code
+    assert response.parameters_used[0]["value"] == float(prompt.split()[-1])
+
+
+@pytest.mark.parametrize("sentence", [
+    "line L1 and line L2 are perpendicular",
+    "distance between point P1 and point P2 = 30",
+])
+@pytest.mark.asyncio
+async def test_binary_relation_reaches_llm_unsplit(router, sentence):
+    llm = FakeLLM()
+    request = CodeGenerationRequest(
+        prompt=f"line L3 is horizontal. {sentence}", domain="sketch",
+    )
+    response = await router.route(request, llm)
+    assert response is not None
+    assert response.source == "hybrid"
+    assert llm.prompts == [sentence + "."]
+    assert response.confidence == pytest.approx(0.75)
+
+
+@pytest.mark.asyncio
+async def test_unparsed_prompt_falls_through(router):
+    request = CodeGenerationRequest(
+        prompt="line L1 and line L2 are perpendicular", domain="sketch",
+    )
+    assert await router.route(request, FakeLLM()) is None
@@ -0,0 +1,75 @@
+"""Tests for one-dimensional tolerance stack-up analysis."""
+
+from __future__ import annotations
+
+import math
+
+import pytest
+
+from engineering.tolerance_stackup import StackContributor, ToleranceStack
+
+
+def _stack(distribution: str = "normal", sigma: float = 3.0) -> ToleranceStack:
+    return ToleranceStack([
+        StackContributor("housing", 50.0, 0.10, 0.10, +1, distribution, sigma),
+        StackContributor("shaft", 49.8, 0.05, 0.05, -1, distribution, sigma),
+        StackContributor("spacer", 0.1, 0.02, 0.0, -1, distribution, sigma),
+    ], lower_limit=0.0)
+
+
+def test_worst_case_sums_half_bands():
+    stack = _stack()
+    assert stack.nominal == pytest.approx(0.1)
+    lo, hi = stack.worst_case()
+    assert lo == pytest.approx(stack.mean - 0.16)
+    assert hi == pytest.approx(stack.mean + 0.16)
+
+
+def test_rss_of_three_sigma_bands_is_root_sum_square():
+    lo, hi = _stack().rss()
+    spread = math.sqrt(0.10 ** 2 + 0.05 ** 2 + 0.01 ** 2)
+    assert hi - lo == pytest.approx(2 * spread)
+
+
+@pytest.mark.parametrize("distribution, sigma", [
+    ("uniform", 3.0), ("normal", 1.0), ("normal", 3.0), ("normal", 6.0),
+])
+def test_rss_never_exceeds_worst_case(distribution, sigma):
+    stack = _stack(distribution, sigma)
+    rss_lo, rss_hi = stack.rss()
+    wc_lo, wc_hi = stack.worst_case()
+    assert wc_lo <= rss_lo <= rss_hi <= wc_hi
+
+    single = ToleranceStack([StackContributor("only", 10.0, 0.1, 0.1, 1, distribution, sigma)])
+    assert single.rss()[1] - single.mean <= 0.1 + 1e-12
+
+
+def test_tighter_normal_process_narrows_rss():
+    lo, hi = _stack("normal", 6.0).rss()
+    base_lo, base_hi = _stack().rss()
+    assert hi - lo == pytest.approx((base_hi - base_lo) / 2)
+
+
+def test_monte_carlo_stays_within_worst_case_and_is_reproducible():
+    stack = _stack()
+    first = stack.monte_carlo(samples=50_000, seed=1, chunk_size=7_000)
+    second = stack.monte_carlo(samples=50_000, seed=1, chunk_size=7_000)
+    lo, hi = stack.worst_case()
+    assert lo <= first.min <= first.max <= hi
+    assert first == second
+    assert first.mean == pytest.approx(stack.mean, abs=1e-3)
+    assert 0.0 < first.in_spec_fraction <= 1.0
+
+
+def test_analyze_reports_contributions():
+    result = _stack().analyze(samples=None)
+    assert result.monte_carlo is None
+    assert sum(c["rss_percent"] for c in result.contributions) == pytest.approx(100.0, abs=0.01)
+    assert result.contributions[0]["rss_percent"] > result.contributions[1]["rss_percent"]
+
+
+def test_invalid_contributors_raise():
+    with pytest.raises(ValueError, match="direction"):
+        StackContributor("x", 1.0, direction=0)
+    with pytest.raises(ValueError, match="distribution"):
+        StackContributor("x", 1.0, distribution="triangular")
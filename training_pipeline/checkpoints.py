@@ -0,0 +1,152 @@
+"""Per-stage checkpoints for resumable pipeline runs.
+
+Every completed stage is flushed to ``<output>/checkpoints`` as it
+finishes, so a run that dies at stage 13 keeps stages 1-12::
+
+    <output>/checkpoints/manifest.json     stage -> file, hash, pairs, metrics
+    <output>/checkpoints/<stage>.jsonl     the stage's pairs
+
+Both files are written to a temporary name and renamed into place, so a
+crash mid-write leaves the previous manifest (and no half-written stage)
+behind.  A manifest entry records the hash of the settings that shape the
+generated pairs (seed, budgets, and the ``code_version`` of the generator
+source); ``--resume`` reuses a stage only when the hash matches and the
+file's SHA-256 still matches the manifest.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import uuid
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Optional
+
+from training_pipeline.instrumentation import StageMetrics
+
+TrainingPairs = list[tuple[str, str]]
+
+# Bump when the checkpoint layout changes; old manifests are then ignored
+CHECKPOINT_VERSION = 1
+
+# Packages whose source shapes the generated pairs
+_CODE_PACKAGES = ("training_pipeline", "parameterization", "engineering")
+_SOURCE_ROOT = Path(__file__).resolve().parent.parent
+
+
+@lru_cache(maxsize=None)
+def code_version() -> str:
+    """Short SHA-256 over the source of the pair-generating packages.
+
+    Stages share one version: editing any generator, or a module it
+    imports, invalidates every checkpoint written by the old code.
+    """
+    digest = hashlib.sha256()
+    for package in _CODE_PACKAGES:
+        for path in sorted((_SOURCE_ROOT / package).rglob("*.py")):
+            digest.update(path.relative_to(_SOURCE_ROOT).as_posix().encode("utf-8"))
+            digest.update(b"\0")
+            digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def config_hash(config: dict[str, Any]) -> str:
+    """Stable short hash of a JSON-serialisable configuration."""
+    canonical = json.dumps({"version": CHECKPOINT_VERSION, **config}, sort_keys=True)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16]
+
+
+def _write_json_atomic(path: Path, data: Any) -> None:
+    tmp = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+class CheckpointStore:
+    """Stage checkpoints and their manifest in one directory.
+
+    Args:
+        directory: Checkpoint directory (created on first save).
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = Path(directory)
+        self.manifest_path = self.directory / "manifest.json"
+        self._manifest = self._read_manifest()
+
+    def _read_manifest(self) -> dict[str, Any]:
+        try:
+            with open(self.manifest_path, encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            manifest = {}
+        if manifest.get("version") != CHECKPOINT_VERSION:
+            manifest = {"version": CHECKPOINT_VERSION, "stages": {}}
+        return manifest
+
+    @property
+    def stages(self) -> dict[str, dict[str, Any]]:
+        """Manifest entries by stage name."""
+        return self._manifest["stages"]
+
+    def save(self, stage: str, config_hash: str, pairs: TrainingPairs, metrics: StageMetrics) -> None:
+        """Flush a completed stage, then record it in the manifest."""
+        from training_pipeline.distributed import write_shard
+
+        path = self.directory / f"{stage}.jsonl"
+        write_shard(path, pairs)
+        self.stages[stage] = {
+            "config_hash": config_hash,
+            "file": path.name,
+            "pairs": len(pairs),
+            "sha256": _file_sha256(path),
+            "metrics": metrics.to_dict(),
+            "completed_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        }
+        _write_json_atomic(self.manifest_path, self._manifest)
+
+    def load(self, stage: str, config_hash: str) -> Optional[tuple[TrainingPairs, StageMetrics]]:
+        """Pairs and metrics of a stage completed under *config_hash*.
+
+        Returns None when there is no such checkpoint or its file is
+        missing or does not match the manifest.
+        """
+        entry = self.stages.get(stage)
+        if entry is None or entry["config_hash"] != config_hash:
+            return None
+        path = self.directory / entry["file"]
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        if hashlib.sha256(data).hexdigest() != entry["sha256"]:
+            return None
+
+        records = map(json.loads, data.decode("utf-8").splitlines())
+        pairs = [(record["instruction"], record["output"]) for record in records]
+        if len(pairs) != entry["pairs"]:
+            return None
+
+        saved = entry["metrics"]
+        metrics = StageMetrics(
+            name=stage,
+            pairs=saved["pairs"],
+            wall_s=saved["wall_s"],
+            cpu_s=saved["cpu_s"],
+            output_bytes=saved["output_bytes"],
+        )
+        return pairs, metrics
+
+
+def _file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
@@ -0,0 +1,215 @@
+"""Precompiled code templates for the training-data generators.
+
+Generators used to build every pair with ``textwrap.dedent(f\"\"\"...\"\"\")``,
+which re-scans and re-indents the whole multi-line block for every pair.
+A ``CodeTemplate`` is dedented once, at import, and then only filled in::
+
+    _EXTRUDE = CodeTemplate(\"\"\"\\
+        // {label}
+        Feature feat = (Feature)featMgr.FeatureExtrusion3(
+            true, false, false, {ec}, 0, {depth}, 0, ...);
+    \"\"\")
+
+    code = _EXTRUDE(label="Boss", ec=ec, depth=0.01)     # keywords
+    code = _EXTRUDE({"label": "Boss", ...})              # dict
+    code = _EXTRUDE(("Boss", ec, 0.01))                  # tuple, field order
+    codes = _EXTRUDE.render_batch({"label": [...], ...}) # columnar table
+
+Placeholders use ``str.format`` syntax (``{name}``, ``{name:.4f}``,
+``{{`` for a literal brace).
+
+The output is identical to ``textwrap.dedent(source.format(...))``.  A
+multi-line value indented less than the template lowers the margin (the
+template text for each margin is cached), and a value that blanks a line
+on its own empties it, as dedent would.  The few values whose effect on
+the margin cannot be known up front -- e.g. one that starts a line with
+whitespace -- take a slow path that formats and then dedents.
+"""
+
+from __future__ import annotations
+
+import re
+import textwrap
+from string import Formatter
+from typing import Any, Mapping, Optional, Sequence, Union
+
+_LEADING_WS = re.compile(r"^[ \t]*", re.MULTILINE)
+_BLANK_LINE = re.compile(r"^[ \t]+$", re.MULTILINE)
+
+
+class CodeTemplate:
+    """A multi-line template dedented and parsed once.
+
+    Args:
+        source: Template text as it would have appeared inside
+                ``textwrap.dedent(f\"\"\"...\"\"\")`` (indentation included).
+    """
+
+    __slots__ = (
+        "source", "text", "fields", "_margin", "_texts",
+        "_line_start", "_blank_lines", "_alone", "_alone_safe",
+    )
+
+    def __init__(self, source: str) -> None:
+        self.source = source
+        parsed = list(Formatter().parse(source))
+
+        fields: list[str] = []
+        for _, name, _, _ in parsed:
+            if name is not None and name not in fields:
+                fields.append(name)
+        self.fields = tuple(fields)
+
+        # Replace every field with a non-blank marker to measure the margin
+        # the way dedent would see a filled-in template.
+        marked = "".join(
+            literal + ("\0" if name is not None else "") for literal, name, _, _ in parsed
+        )
+        margins = [
+            _LEADING_WS.match(line).group(0)
+            for line in marked.split("\n")
+            if line.strip(" \t")
+        ]
+        self._margin = _common_prefix(margins)
+
+        # Dedent the template itself, keeping the format fields intact
+        self.text = _dedent_lines(source, self._margin)
+
+        # Fields that start a line (after indentation), and fields whose
+        # line holds nothing else -- an empty value there would make the
+        # line blank and drop it from dedent's margin calculation.
+        self._line_start: set[str] = set()
+        self._blank_lines: set[str] = set()
+        self._alone: set[str] = set()
+        line = ""
+        line_fields: list[str] = []
+        for literal, name, _, _ in parsed:
+            head, *more = literal.split("\n")
+            line += head
+            if more:
+                self._close_line(line, line_fields)
+                line, line_fields = more[-1], []
+            if name is not None:
+                if not line.strip(" \t"):
+                    self._line_start.add(name)
+                line += "\0"
+                line_fields.append(name)
+        self._close_line(line, line_fields)
+
+        # A field alone on its line may blank that line only if dropping
+        # such lines from the margin calculation leaves the margin as is.
+        kept = [
+            _LEADING_WS.match(line).group(0)
+            for line in marked.split("\n")
+            if line.replace("\0", "").strip(" \t")
+        ]
+        self._alone_safe = bool(kept) and _common_prefix(kept) == self._margin
+        self._texts = {self._margin: self.text}
+
+    def _close_line(self, line: str, names: list[str]) -> None:
+        if names and not line.replace("\0", "").strip(" \t"):
+            self._blank_lines.update(names)
+            if len(names) == 1 and line.endswith("\0"):
+                self._alone.add(names[0])
+
+    # ------------------------------------------------------------------
+    # Rendering
+    # ------------------------------------------------------------------
+
+    def __call__(
+        self,
+        values: Optional[Union[Mapping[str, Any], Sequence[Any]]] = None,
+        /,
+        **kwargs: Any,
+    ) -> str:
+        """Render with a dict, a tuple in ``fields`` order, or keywords."""
+        if values is None:
+            mapping: Mapping[str, Any] = kwargs
+        elif isinstance(values, Mapping):
+            mapping = {**values, **kwargs} if kwargs else values
+        else:
+            mapping = dict(zip(self.fields, values), **kwargs)
+        return self.render(mapping)
+
+    def render(self, values: Mapping[str, Any]) -> str:
+        """Render from a mapping of field name to value."""
+        margin = self._margin
+        multiline: list[str] = []
+        blanked = False
+        for name in self.fields:
+            value = values[name]
+            if not isinstance(value, str):
+                continue
+            first, newline, rest = value.partition("\n")
+            if not first.strip(" \t") and name in self._blank_lines:
+                # The value leaves its line blank: dedent ignores that line
+                if name not in self._alone or not self._alone_safe:
+                    return self._slow(values)
+                blanked = True
+            elif name in self._line_start and (not first or first[0] in " \t"):
+                return self._slow(values)
+            if newline:
+                lines = rest.split("\n")
+                # A blank last line continues with template text, unless
+                # nothing follows the field on its line
+                if not lines[-1].strip(" \t") and name not in self._alone:
+                    return self._slow(values)
+                margin = _common_prefix(
+                    [margin] + [_LEADING_WS.match(line).group(0) for line in lines if line.strip(" \t")]
+                )
+                multiline.append(name)
+
+        if not multiline and not blanked:
+            return self.text.format_map(values)
+        text = self._texts.get(margin)
+        if text is None:
+            text = self._texts[margin] = _dedent_lines(self.source, margin)
+        if multiline:
+            values = dict(values)
+            for name in multiline:
+                values[name] = _dedent_value(values[name], margin)
+        text = text.format_map(values)
+        return _BLANK_LINE.sub("", text) if blanked else text
+
+    def render_batch(self, table: Mapping[str, Sequence[Any]]) -> list[str]:
+        """Render once per row of a columnar table (field -> column).
+
+        NumPy columns are converted to Python scalars once per column.
+        """
+        columns = [
+            table[name].tolist() if hasattr(table[name], "tolist") else table[name]
+            for name in self.fields
+        ]
+        fields = self.fields
+        render = self.render
+        return [render(dict(zip(fields, row))) for row in zip(*columns)]
+
+    def _slow(self, values: Mapping[str, Any]) -> str:
+        return textwrap.dedent(self.source.format_map(values))
+
+    def __repr__(self) -> str:
+        return f"CodeTemplate(fields={self.fields!r})"
+
+
+def _common_prefix(prefixes: list[str]) -> str:
+    if not prefixes:
+        return ""
+    low, high = min(prefixes), max(prefixes)
+    for i, (a, b) in enumerate(zip(low, high)):
+        if a != b:
+            return low[:i]
+    return low
+
+
+def _dedent_value(value: str, margin: str) -> str:
+    """Strip *margin* from the continuation lines of a multi-line value."""
+    first, *rest = value.split("\n")
+    return "\n".join([first] + [line[len(margin):] if line.strip(" \t") else "" for line in rest])
+
+
+def _dedent_lines(text: str, margin: str) -> str:
+    """``textwrap.dedent`` with a known margin."""
+    return "\n".join(
+        "" if not line.strip(" \t") else line[len(margin):]
+        for line in text.split("\n")
+    )
@@ -27,6 +27,11 @@ class CodeSnippet:
 class SolidWorksAPICollector:
     """Collects SolidWorks COM API reference data for training."""
 
+    # Enums and interfaces whose every member is listed below.  The rest are
+    # a sample of the API, so the dataset QA linter checks members of these
+    # only.
+    COMPLETE_OWNERS = frozenset({"swGDTCharacteristics_e", "swMaterialModifier_e"})
+
     def __init__(self):
         self.source_label = "solidworks_api_2024"
 
@@ -0,0 +1,244 @@
+"""Budgeted space-filling sampler for discrete parameter grids.
+
+Replaces full Cartesian products (exponential in the number of factors)
+with a design whose size is set by a budget:
+
+1. A greedy pairwise covering array (AETG-style) guarantees that every
+   pair of values from any two factors appears together in at least one
+   row -- e.g. every tolerance is seen with every material modifier.
+2. Remaining budget is filled with Latin-hypercube rows: each factor's
+   levels are stratified so every value appears an equal number of times
+   (+/- 1) across each draw.  Rows already in the design are rejected and
+   redrawn, so no row appears twice.
+
+The design depends only on the value lists and the seed, so a given
+``(factors, budget, seed)`` always produces the same rows.
+
+Example::
+
+    sampler = DesignSampler(seed=42)
+    rows = sampler.sample(
+        {"tol": [0.05, 0.1, 0.2], "mod": ["MMC", "LMC", None], "dia": [5, 8, 10]},
+        budget=20,
+    )
+    # -> 20 dicts; all 27 value pairs covered in the first 9-10 rows
+"""
+
+from __future__ import annotations
+
+import math
+import random
+from itertools import combinations
+from typing import Any, Optional, Sequence
+
+# Candidate rows scored per greedy step; more candidates -> smaller designs.
+_DEFAULT_CANDIDATES = 16
+
+
+class DesignSampler:
+    """Deterministic pairwise-covering + Latin-hypercube design generator.
+
+    Args:
+        seed: Seed for all tie-breaking and stratification shuffles.
+        candidates: Candidate rows evaluated per greedy covering step.
+    """
+
+    def __init__(self, seed: int = 0, candidates: int = _DEFAULT_CANDIDATES) -> None:
+        self.seed = seed
+        self.candidates = candidates
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def sample(
+        self,
+        factors: dict[str, Sequence[Any]],
+        budget: Optional[int] = None,
+    ) -> list[dict[str, Any]]:
+        """Sample rows from the grid spanned by *factors*.
+
+        Args:
+            factors: Mapping of factor name to its list of candidate values.
+            budget: Number of rows to return.  ``None`` returns exactly the
+                    pairwise covering design.  A budget smaller than the
+                    covering design keeps its first rows, which cover the
+                    most pairs.  A budget at or above the full grid size
+                    returns the full grid.
+
+        Returns:
+            A list of ``{factor: value}`` dicts of length
+            ``min(budget, grid size)``.
+        """
+        names = list(factors)
+        values = [list(factors[n]) for n in names]
+        levels = [len(v) for v in values]
+        if not names or 0 in levels:
+            return []
+
+        grid_size = 1
+        for n in levels:
+            grid_size *= n
+
+        if budget is not None and budget >= grid_size:
+            design = _full_grid(levels)
+        else:
+            design = self.design_indices(levels, budget)
+
+        return [
+            {name: values[f][row[f]] for f, name in enumerate(names)}
+            for row in design
+        ]
+
+    def design_indices(
+        self, levels: list[int], budget: Optional[int] = None
+    ) -> list[tuple[int, ...]]:
+        """Return the design as level-index tuples (one entry per factor).
+
+        Rows are distinct; the design is shorter than *budget* only when
+        the grid has fewer rows.
+        """
+        rng = random.Random(self.seed)
+        design = self._covering_rows(levels, rng)
+        if budget is None:
+            return design
+        if budget <= len(design):
+            return design[:budget]
+        return design + self._fill_rows(levels, design, budget - len(design), rng)
+
+    @staticmethod
+    def uncovered_pairs(
+        rows: list[tuple[int, ...]], levels: list[int]
+    ) -> set[tuple[int, int, int, int]]:
+        """Return the ``(f1, v1, f2, v2)`` value pairs *rows* do not cover."""
+        missing = _all_pairs(levels)
+        for row in rows:
+            missing.difference_update(_row_pairs(row))
+        return missing
+
+    # ------------------------------------------------------------------
+    # Private helpers
+    # ------------------------------------------------------------------
+
+    def _covering_rows(
+        self, levels: list[int], rng: random.Random
+    ) -> list[tuple[int, ...]]:
+        """Greedy (AETG) pairwise covering array over *levels*."""
+        k = len(levels)
+        if k == 1:
+            return [(v,) for v in range(levels[0])]
+
+        uncovered = _all_pairs(levels)
+        rows: list[tuple[int, ...]] = []
+
+        while uncovered:
+            # Seed every candidate from one uncovered pair so each step
+            # makes progress; pick the pair deterministically.
+            f1, v1, f2, v2 = min(uncovered)
+            best_row: Optional[list[int]] = None
+            best_gain = -1
+
+            for _ in range(self.candidates):
+                row = [-1] * k
+                row[f1], row[f2] = v1, v2
+                rest = [f for f in range(k) if f not in (f1, f2)]
+                rng.shuffle(rest)
+                fixed = [f1, f2]
+                for f in rest:
+                    scores = []
+                    for v in range(levels[f]):
+                        gain = sum(
+                            _pair(g, row[g], f, v) in uncovered for g in fixed
+                        )
+                        scores.append((gain, rng.random(), v))
+                    row[f] = max(scores)[2]
+                    fixed.append(f)
+
+                gain = sum(p in uncovered for p in _row_pairs(row))
+                if gain > best_gain:
+                    best_row, best_gain = row, gain
+
+            rows.append(tuple(best_row))
+            uncovered.difference_update(_row_pairs(best_row))
+
+        return rows
+
+    def _fill_rows(
+        self,
+        levels: list[int],
+        design: list[tuple[int, ...]],
+        count: int,
+        rng: random.Random,
+    ) -> list[tuple[int, ...]]:
+        """Up to *count* Latin-hypercube rows not already in *design*.
+
+        Duplicates are rejected and the shortfall redrawn.  Once the design
+        would cover at least half the grid, the remaining rows are taken
+        from the unused grid rows in shuffled order instead, so the fill
+        ends when the grid is exhausted.
+        """
+        grid_size = math.prod(levels)
+        seen = set(design)
+        rows: list[tuple[int, ...]] = []
+        while len(rows) < count and len(seen) < grid_size:
+            need = count - len(rows)
+            if 2 * (len(seen) + need) >= grid_size:
+                free = [row for row in _full_grid(levels) if row not in seen]
+                rng.shuffle(free)
+                rows.extend(free[:need])
+                break
+            for row in self._latin_hypercube_rows(levels, need, rng):
+                if row not in seen:
+                    seen.add(row)
+                    rows.append(row)
+        return rows
+
+    @staticmethod
+    def _latin_hypercube_rows(
+        levels: list[int], count: int, rng: random.Random
+    ) -> list[tuple[int, ...]]:
+        """Stratified rows: each factor's levels are balanced over *count*.
+
+        Each column starts at a random level, so draws smaller than a
+        factor's level count do not always use its first levels.
+        """
+        columns = []
+        for n in levels:
+            start = rng.randrange(n)
+            column = [(start + i) % n for i in range(count)]
+            rng.shuffle(column)
+            columns.append(column)
+        return list(zip(*columns))
+
+
+def _all_pairs(levels: list[int]) -> set[tuple[int, int, int, int]]:
+    """Every ``(f1, v1, f2, v2)`` pair with ``f1 < f2``."""
+    return {
+        (f1, v1, f2, v2)
+        for f1, f2 in combinations(range(len(levels)), 2)
+        for v1 in range(levels[f1])
+        for v2 in range(levels[f2])
+    }
+
+
+def _pair(f1: int, v1: int, f2: int, v2: int) -> tuple[int, int, int, int]:
+    """Canonical (lower factor first) key for a value pair."""
+    if f1 < f2:
+        return (f1, v1, f2, v2)
+    return (f2, v2, f1, v1)
+
+
+def _row_pairs(row: Sequence[int]) -> list[tuple[int, int, int, int]]:
+    """Value pairs covered by a single row."""
+    return [
+        (f1, row[f1], f2, row[f2])
+        for f1, f2 in combinations(range(len(row)), 2)
+    ]
+
+
+def _full_grid(levels: list[int]) -> list[tuple[int, ...]]:
+    """Full Cartesian grid of level indices (row-major order)."""
+    grid: list[tuple[int, ...]] = [()]
+    for n in levels:
+        grid = [row + (v,) for row in grid for v in range(n)]
+    return grid
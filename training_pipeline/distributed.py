@@ -0,0 +1,460 @@
+"""Distributed pipeline runs over a shared directory -- no broker needed.
+
+A run lives in one directory that every worker can reach, on a filesystem
+whose file locks SQLite can rely on: a local disk (worker processes on one
+host), or a shared filesystem whose POSIX locks are coherent across hosts.
+Do not use NFS, SMB or synced volumes -- SQLite locking is unreliable
+there, and concurrent claims can hand one unit to two workers or corrupt
+the queue::
+
+    <queue>/queue.sqlite            work units, leases, run configuration
+    <queue>/shards/<stage>/*.jsonl  one output shard per finished unit
+
+Three roles share it:
+
+1. **Coordinator** (``plan``) writes the work units.  A chunkable stage
+   (one with a ``WorkSpace``, see ``training_pipeline.work_units``) is
+   split into ``(stage, start, stop, seed)`` item ranges; every other stage
+   is a single whole-stage unit.
+2. **Workers** (``run_worker``), on any number of hosts, claim units with
+   a time-limited lease, render them, write the shard atomically and mark
+   the unit done.  A heartbeat renews the lease while a unit renders; the
+   lease of a crashed worker expires and the unit is claimed again, up to
+   ``max_attempts`` claims in all; after that the unit is marked failed.
+   Shard names are deterministic, so a unit rendered twice (after a lease
+   expired mid-write) just rewrites the same file.
+3. **Merge** (``merge``) concatenates the shards in stage and item order
+   -- the order a local run produces -- and returns the pairs, per-stage
+   metrics and an index of where each stage and shard landed.
+
+Example::
+
+    python -m training_pipeline.run_pipeline --distributed plan --queue /scratch/runs/r1
+    python -m training_pipeline.run_pipeline --distributed work --queue /scratch/runs/r1   # x N hosts
+    python -m training_pipeline.run_pipeline --distributed merge --queue /scratch/runs/r1 --output-dir data
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from training_pipeline.instrumentation import StageMetrics, measure_stage
+from training_pipeline.stages import all_stages
+from training_pipeline.work_units import partition
+
+TrainingPairs = list[tuple[str, str]]
+
+DEFAULT_CHUNK_SIZE = 256
+DEFAULT_LEASE_S = 300.0
+DEFAULT_MAX_ATTEMPTS = 3
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS units (
+    id            INTEGER PRIMARY KEY,
+    stage         TEXT    NOT NULL,
+    position      INTEGER NOT NULL,
+    start         INTEGER NOT NULL,
+    stop          INTEGER,
+    seed          INTEGER NOT NULL,
+    status        TEXT    NOT NULL DEFAULT 'pending',
+    worker        TEXT,
+    lease_expires REAL,
+    attempts      INTEGER NOT NULL DEFAULT 0,
+    shard         TEXT,
+    pairs         INTEGER,
+    metrics       TEXT,
+    error         TEXT
+);
+CREATE INDEX IF NOT EXISTS ix_units_claim ON units (status, lease_expires, id);
+"""
+
+
+@dataclass(frozen=True)
+class QueuedUnit:
+    """A work unit as stored in the queue.
+
+    Attributes:
+        id: Queue row id (also the claim order).
+        stage: Stage name.
+        start: First work item (inclusive).
+        stop: Last work item (exclusive); ``None`` for a whole-stage unit.
+        seed: Pipeline seed the unit is rendered with.
+        attempts: Claims so far, including the current one.
+    """
+
+    id: int
+    stage: str
+    start: int
+    stop: Optional[int]
+    seed: int
+    attempts: int = 0
+
+    @property
+    def shard_name(self) -> str:
+        """Deterministic shard path relative to ``<queue>/shards``."""
+        stop = "all" if self.stop is None else f"{self.stop:08d}"
+        return f"{self.stage}/{self.start:08d}-{stop}.jsonl"
+
+
+class WorkQueue:
+    """SQLite work queue in a shared directory.
+
+    Every state change is a single short transaction, so any number of
+    worker processes and hosts can share the file -- provided its
+    filesystem has reliable locking (see the module docstring).
+
+    Args:
+        directory: Shared run directory (created if missing).
+    """
+
+    def __init__(self, directory: Union[str, Path]) -> None:
+        self.directory = Path(directory)
+        self.shard_dir = self.directory / "shards"
+        self.shard_dir.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            str(self.directory / "queue.sqlite"),
+            timeout=60.0,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        self._lock = threading.Lock()
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    # ------------------------------------------------------------------
+    # Planning
+    # ------------------------------------------------------------------
+
+    def create(self, units: list[QueuedUnit], config: dict[str, Any]) -> None:
+        """Store the run configuration and its work units.
+
+        Raises:
+            ValueError: The queue already holds a plan.
+        """
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                if self._conn.execute("SELECT COUNT(*) FROM units").fetchone()[0]:
+                    raise ValueError(f"Queue {self.directory} already holds a plan")
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('config', ?)",
+                    (json.dumps(config),),
+                )
+                self._conn.executemany(
+                    "INSERT INTO units (stage, position, start, stop, seed) VALUES (?, ?, ?, ?, ?)",
+                    [(u.stage, position, u.start, u.stop, u.seed) for position, u in enumerate(units)],
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    @property
+    def config(self) -> dict[str, Any]:
+        """Pipeline settings recorded by the coordinator."""
+        row = self._conn.execute("SELECT value FROM meta WHERE key = 'config'").fetchone()
+        if row is None:
+            raise ValueError(f"Queue {self.directory} has no plan; run the coordinator first")
+        return json.loads(row[0])
+
+    # ------------------------------------------------------------------
+    # Leases
+    # ------------------------------------------------------------------
+
+    def claim(
+        self,
+        worker: str,
+        lease_s: float = DEFAULT_LEASE_S,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    ) -> Optional[QueuedUnit]:
+        """Lease the next pending (or expired) unit, or return None.
+
+        An expired lease on a unit already claimed *max_attempts* times
+        marks it failed instead, so a unit that keeps killing its workers
+        is not handed out forever.
+        """
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute(
+                    "UPDATE units SET status = 'failed', worker = NULL, lease_expires = NULL, "
+                    "error = 'lease expired on attempt ' || attempts "
+                    "WHERE status = 'leased' AND lease_expires < ? AND attempts >= ?",
+                    (now, max_attempts),
+                )
+                row = self._conn.execute(
+                    "SELECT id, stage, start, stop, seed, attempts FROM units "
+                    "WHERE status = 'pending' OR (status = 'leased' AND lease_expires < ?) "
+                    "ORDER BY id LIMIT 1",
+                    (now,),
+                ).fetchone()
+                if row is not None:
+                    self._conn.execute(
+                        "UPDATE units SET status = 'leased', worker = ?, lease_expires = ?, "
+                        "attempts = attempts + 1 WHERE id = ?",
+                        (worker, now + lease_s, row[0]),
+                    )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        if row is None:
+            return None
+        return QueuedUnit(*row[:5], attempts=row[5] + 1)
+
+    def renew(self, unit_id: int, worker: str, lease_s: float = DEFAULT_LEASE_S) -> bool:
+        """Extend a lease; False if *worker* no longer holds it."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE units SET lease_expires = ? "
+                "WHERE id = ? AND worker = ? AND status = 'leased'",
+                (time.time() + lease_s, unit_id, worker),
+            )
+        return cursor.rowcount == 1
+
+    def complete(
+        self, unit_id: int, worker: str, shard: str, pairs: int, metrics: StageMetrics
+    ) -> bool:
+        """Mark a leased unit done; False if the lease was lost meanwhile."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE units SET status = 'done', shard = ?, pairs = ?, metrics = ?, "
+                "lease_expires = NULL, error = NULL "
+                "WHERE id = ? AND worker = ? AND status = 'leased'",
+                (shard, pairs, json.dumps(metrics.to_dict()), unit_id, worker),
+            )
+        return cursor.rowcount == 1
+
+    def fail(
+        self, unit_id: int, worker: str, error: str, max_attempts: int = DEFAULT_MAX_ATTEMPTS
+    ) -> None:
+        """Release a unit after an error; it fails for good after *max_attempts*."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE units SET status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END, "
+                "worker = NULL, lease_expires = NULL, error = ? "
+                "WHERE id = ? AND worker = ? AND status = 'leased'",
+                (max_attempts, error, unit_id, worker),
+            )
+
+    # ------------------------------------------------------------------
+    # Inspection
+    # ------------------------------------------------------------------
+
+    def counts(self) -> dict[str, int]:
+        """Units per status (``pending``, ``leased``, ``done``, ``failed``)."""
+        counts = {"pending": 0, "leased": 0, "done": 0, "failed": 0}
+        for status, n in self._conn.execute("SELECT status, COUNT(*) FROM units GROUP BY status"):
+            counts[status] = n
+        return counts
+
+    def units(self) -> list[dict[str, Any]]:
+        """Every unit in plan order, as a dict per row."""
+        cursor = self._conn.execute(
+            "SELECT id, stage, start, stop, seed, status, worker, attempts, shard, pairs, "
+            "metrics, error FROM units ORDER BY position"
+        )
+        names = [column[0] for column in cursor.description]
+        return [dict(zip(names, row)) for row in cursor]
+
+
+# ---------------------------------------------------------------------------
+# Shards
+# ---------------------------------------------------------------------------
+
+def write_shard(path: Path, pairs: TrainingPairs) -> None:
+    """Write pairs as JSONL, atomically (temp file + rename)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        for instruction, output in pairs:
+            f.write(json.dumps({"instruction": instruction, "output": output}, ensure_ascii=False) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def read_shard(path: Path) -> TrainingPairs:
+    """Read a shard written by ``write_shard``."""
+    with open(path, encoding="utf-8") as f:
+        return [(record["instruction"], record["output"]) for record in map(json.loads, f)]
+
+
+# ---------------------------------------------------------------------------
+# Roles
+# ---------------------------------------------------------------------------
+
+def plan(queue: WorkQueue, pipeline: Any, chunk_size: int = DEFAULT_CHUNK_SIZE) -> list[QueuedUnit]:
+    """Coordinator: write the work units of the pipeline's selected stages.
+
+    The pipeline settings workers need to rebuild identical iteration
+    spaces (seed, budgets) are stored with the plan.
+    """
+    units: list[QueuedUnit] = []
+    for spec in pipeline.selected_stages():
+        if spec.space is None:
+            units.append(QueuedUnit(0, spec.name, 0, None, pipeline.seed))
+            continue
+        size = len(spec.space(pipeline).items)
+        chunks = -(-size // max(chunk_size, 1))
+        units.extend(
+            QueuedUnit(0, spec.name, unit.start, unit.stop, pipeline.seed)
+            for unit in partition(spec.name, size, chunks)
+        )
+
+    queue.create(units, {
+        "seed": pipeline.seed,
+        "combined_budget": pipeline.combined_budget,
+        "only": pipeline.only,
+        "skip": pipeline.skip,
+    })
+    return units
+
+
+class _Heartbeat(threading.Thread):
+    """Renews a lease every third of its duration until stopped."""
+
+    def __init__(self, queue: WorkQueue, unit: QueuedUnit, worker: str, lease_s: float) -> None:
+        super().__init__(daemon=True)
+        self.queue, self.unit, self.worker, self.lease_s = queue, unit, worker, lease_s
+        self.stopped = threading.Event()
+
+    def run(self) -> None:
+        while not self.stopped.wait(self.lease_s / 3):
+            if not self.queue.renew(self.unit.id, self.worker, self.lease_s):
+                return
+
+
+def render_unit(pipeline: Any, unit: QueuedUnit, spaces: dict[tuple[str, int], Any]) -> TrainingPairs:
+    """Render one unit with *pipeline* (whose seed is set to the unit's).
+
+    *spaces* caches ``(WorkSpace, state)`` per ``(stage, seed)`` so a
+    worker builds each iteration space once.
+    """
+    spec = {s.name: s for s in all_stages()}[unit.stage]
+    pipeline.seed = unit.seed
+    if unit.stop is None:
+        return spec.run(pipeline)
+    key = (unit.stage, unit.seed)
+    if key not in spaces:
+        space = spec.space(pipeline)
+        spaces[key] = (space, space.state())
+    space, state = spaces[key]
+    return space.render_range(unit.start, unit.stop, state)
+
+
+def run_worker(
+    queue: WorkQueue,
+    pipeline: Any,
+    worker: Optional[str] = None,
+    lease_s: float = DEFAULT_LEASE_S,
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    poll_s: float = 5.0,
+) -> int:
+    """Worker: claim and render units until the queue is drained.
+
+    While other workers still hold leases, the worker keeps polling so it
+    can take over units whose lease expires.
+
+    Returns:
+        Number of units this worker completed.
+    """
+    worker = worker or f"{socket.gethostname()}-{os.getpid()}"
+    spaces: dict[tuple[str, int], Any] = {}
+    completed = 0
+    while True:
+        unit = queue.claim(worker, lease_s, max_attempts)
+        if unit is None:
+            counts = queue.counts()
+            if not counts["pending"] and not counts["leased"]:
+                return completed
+            time.sleep(poll_s)
+            continue
+
+        label = f"{unit.stage}[{unit.start}:{'' if unit.stop is None else unit.stop}]"
+        heartbeat = _Heartbeat(queue, unit, worker, lease_s)
+        heartbeat.start()
+        try:
+            with measure_stage(unit.stage) as metrics:
+                pairs = render_unit(pipeline, unit, spaces)
+                metrics.record(pairs)
+            write_shard(queue.shard_dir / unit.shard_name, pairs)
+        except Exception as exc:
+            queue.fail(unit.id, worker, str(exc), max_attempts)
+            print(f"  [FAIL] {worker}: {label} (attempt {unit.attempts}): {exc}")
+            continue
+        finally:
+            heartbeat.stopped.set()
+
+        if queue.complete(unit.id, worker, unit.shard_name, len(pairs), metrics):
+            completed += 1
+            print(f"  [OK] {worker}: {label} -> {len(pairs)} pairs ({metrics.wall_s:.2f}s)")
+        else:
+            print(f"  [!] {worker}: lease on {label} expired before completion")
+
+
+def merge(queue: WorkQueue) -> tuple[TrainingPairs, dict[str, StageMetrics], dict[str, Any]]:
+    """Concatenate every shard in plan order.
+
+    Returns:
+        ``(pairs, metrics, index)`` -- metrics summed per stage, and an
+        index with each stage's and shard's ``[start, stop)`` range in the
+        merged output.
+
+    Raises:
+        RuntimeError: Units are still pending, leased or failed.
+    """
+    counts = queue.counts()
+    outstanding = {status: n for status, n in counts.items() if status != "done" and n}
+    if outstanding:
+        raise RuntimeError(f"Queue {queue.directory} is not finished: {outstanding}")
+
+    pairs: TrainingPairs = []
+    metrics: dict[str, StageMetrics] = {}
+    index: dict[str, Any] = {"config": queue.config, "stages": [], "shards": []}
+    for unit in queue.units():
+        shard_pairs = read_shard(queue.shard_dir / unit["shard"])
+        if len(shard_pairs) != unit["pairs"]:
+            raise RuntimeError(
+                f"Shard {unit['shard']} holds {len(shard_pairs)} pairs, queue recorded {unit['pairs']}"
+            )
+        index["shards"].append({
+            "stage": unit["stage"],
+            "shard": unit["shard"],
+            "start": len(pairs),
+            "stop": len(pairs) + len(shard_pairs),
+            "worker": unit["worker"],
+        })
+        pairs.extend(shard_pairs)
+
+        stage = metrics.setdefault(unit["stage"], StageMetrics(name=unit["stage"]))
+        unit_metrics = json.loads(unit["metrics"])
+        stage.pairs += unit_metrics["pairs"]
+        stage.wall_s += unit_metrics["wall_s"]
+        stage.cpu_s += unit_metrics["cpu_s"]
+        stage.output_bytes += unit_metrics["output_bytes"]
+
+    for shard in index["shards"]:
+        stages = index["stages"]
+        if stages and stages[-1]["stage"] == shard["stage"]:
+            stages[-1]["stop"] = shard["stop"]
+            stages[-1]["shards"] += 1
+        else:
+            stages.append({"stage": shard["stage"], "start": shard["start"], "stop": shard["stop"], "shards": 1})
+    return pairs, metrics, index
@@ -0,0 +1 @@
+# Training data exporters
@@ -0,0 +1,386 @@
+"""Pre-tokenized, pre-packed training dataset builder.
+
+Applies the Alpaca prompt template to instruction/output pairs, tokenizes
+them across a process pool, packs the token streams into fixed-length
+sequences and writes memory-mapped NumPy arrays.  A training job can then
+stream batches straight from disk instead of re-tokenizing and re-packing
+``sw_training_data.json`` on every run.
+
+Output layout (``<output_dir>/``)::
+
+    tokens.npy     uint32 [num_sequences, sequence_len]  packed token ids
+    loss_mask.npy  uint8  [num_sequences, sequence_len]  1 = response token
+    segments.npy   uint32 [num_segments, 3]              (sequence, start, length)
+    offsets.npy    uint64 [num_sequences + 1]            sequence -> segment rows
+    meta.json      tokenizer, sequence length, special token ids, counts
+
+``segments.npy`` / ``offsets.npy`` record the example boundaries inside
+every packed sequence so attention can be restricted to each example
+(``cu_seqlens`` for varlen flash-attention, or reset ``position_ids``).
+
+Usage:
+    python -m training_pipeline.exporters.packed_dataset output/sw_training_data.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Optional
+
+import numpy as np
+
+# ---------------------------------------------------------------------------
+# Alpaca prompt template (matches Axolotl's ``type: alpaca`` prompter)
+# ---------------------------------------------------------------------------
+
+ALPACA_PROMPT = (
+    "Below is an instruction that describes a task. "
+    "Write a response that appropriately completes the request.\n\n"
+    "### Instruction:\n{instruction}\n\n### Response:\n"
+)
+
+ALPACA_PROMPT_WITH_INPUT = (
+    "Below is an instruction that describes a task, paired with an input "
+    "that provides further context. "
+    "Write a response that appropriately completes the request.\n\n"
+    "### Instruction:\n{instruction}\n\n### Input:\n{input}\n\n### Response:\n"
+)
+
+DEFAULT_TOKENIZER = "Qwen/Qwen2.5-Coder-7B"
+DEFAULT_SEQUENCE_LEN = 2048
+
+# Examples handed to each worker task; large enough to amortise IPC.
+_CHUNK_SIZE = 256
+
+
+def format_alpaca_prompt(instruction: str, input_text: str = "") -> str:
+    """Render the Alpaca prompt that precedes the response tokens."""
+    if input_text:
+        return ALPACA_PROMPT_WITH_INPUT.format(
+            instruction=instruction, input=input_text
+        )
+    return ALPACA_PROMPT.format(instruction=instruction)
+
+
+# ---------------------------------------------------------------------------
+# Tokenization (runs inside worker processes)
+# ---------------------------------------------------------------------------
+
+_WORKER_TOKENIZER: Any = None
+
+
+def _load_tokenizer(tokenizer_name: str) -> Any:
+    """Load a Hugging Face tokenizer (imported lazily -- transformers is heavy)."""
+    from transformers import AutoTokenizer
+
+    return AutoTokenizer.from_pretrained(tokenizer_name, trust_remote_code=True)
+
+
+def _init_worker(tokenizer_name: str) -> None:
+    """Process-pool initializer: load the tokenizer once per worker."""
+    global _WORKER_TOKENIZER
+    _WORKER_TOKENIZER = _load_tokenizer(tokenizer_name)
+
+
+def _tokenize_chunk(
+    records: list[tuple[str, str, str]],
+) -> list[tuple[list[int], int]]:
+    """Tokenize a chunk of (instruction, input, output) records.
+
+    Returns:
+        One ``(token_ids, prompt_len)`` tuple per record.  ``prompt_len``
+        is the number of leading tokens that belong to the prompt and are
+        therefore excluded from the loss.
+    """
+    tok = _WORKER_TOKENIZER
+    prompts = [format_alpaca_prompt(ins, inp) for ins, inp, _ in records]
+    responses = [out for _, _, out in records]
+
+    prompt_ids = tok(prompts, add_special_tokens=False)["input_ids"]
+    response_ids = tok(responses, add_special_tokens=False)["input_ids"]
+
+    bos = [tok.bos_token_id] if tok.bos_token_id is not None else []
+    eos = [tok.eos_token_id] if tok.eos_token_id is not None else []
+
+    results: list[tuple[list[int], int]] = []
+    for p_ids, r_ids in zip(prompt_ids, response_ids):
+        prompt = bos + p_ids
+        results.append((prompt + r_ids + eos, len(prompt)))
+    return results
+
+
+def tokenize_records(
+    records: list[tuple[str, str, str]],
+    tokenizer_name: str = DEFAULT_TOKENIZER,
+    workers: Optional[int] = None,
+) -> list[tuple[list[int], int]]:
+    """Tokenize records in parallel, preserving input order.
+
+    Args:
+        records: ``(instruction, input, output)`` triples.
+        tokenizer_name: Hugging Face tokenizer name or local path.
+        workers: Process count (``None`` = ``os.cpu_count()``; ``1`` =
+                 tokenize in the calling process).
+    """
+    chunks = [
+        records[i:i + _CHUNK_SIZE] for i in range(0, len(records), _CHUNK_SIZE)
+    ]
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1 or len(chunks) <= 1:
+        _init_worker(tokenizer_name)
+        results = [_tokenize_chunk(chunk) for chunk in chunks]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(chunks)),
+            initializer=_init_worker,
+            initargs=(tokenizer_name,),
+        ) as pool:
+            results = list(pool.map(_tokenize_chunk, chunks))
+
+    return [item for chunk in results for item in chunk]
+
+
+# ---------------------------------------------------------------------------
+# Packing
+# ---------------------------------------------------------------------------
+
+def pack_first_fit_decreasing(
+    lengths: list[int], capacity: int
+) -> list[list[int]]:
+    """Assign examples to fixed-capacity bins with first-fit decreasing.
+
+    Ties are broken by original index so the packing is deterministic.
+
+    Returns:
+        A list of bins, each a list of example indices in placement order.
+    """
+    order = sorted(range(len(lengths)), key=lambda i: (-lengths[i], i))
+    bins: list[list[int]] = []
+    remaining: list[int] = []
+
+    for idx in order:
+        need = lengths[idx]
+        for b, free in enumerate(remaining):
+            if free >= need:
+                bins[b].append(idx)
+                remaining[b] = free - need
+                break
+        else:
+            bins.append([idx])
+            remaining.append(capacity - need)
+
+    return bins
+
+
+# ---------------------------------------------------------------------------
+# Builder
+# ---------------------------------------------------------------------------
+
+def build_packed_dataset(
+    pairs: list[tuple[str, str]],
+    output_dir: Path,
+    tokenizer_name: str = DEFAULT_TOKENIZER,
+    sequence_len: int = DEFAULT_SEQUENCE_LEN,
+    workers: Optional[int] = None,
+) -> dict[str, Any]:
+    """Tokenize, pack and write *pairs* as memory-mapped NumPy arrays.
+
+    Examples longer than *sequence_len* are truncated from the end of the
+    response so every example fits in a single packed sequence.
+
+    Args:
+        pairs: ``(instruction, output)`` training pairs.
+        output_dir: Directory that receives the ``.npy`` files and
+                    ``meta.json`` (created if missing).
+        tokenizer_name: Hugging Face tokenizer name or local path.
+        sequence_len: Length of every packed sequence.
+        workers: Tokenizer process count (see ``tokenize_records``).
+
+    Returns:
+        The metadata dict that was written to ``meta.json``.
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    records = [(instruction, "", output) for instruction, output in pairs]
+    tokenized = tokenize_records(records, tokenizer_name, workers)
+
+    truncated = 0
+    examples: list[tuple[list[int], int]] = []
+    for ids, prompt_len in tokenized:
+        if len(ids) > sequence_len:
+            ids = ids[:sequence_len]
+            truncated += 1
+        examples.append((ids, min(prompt_len, len(ids))))
+
+    lengths = [len(ids) for ids, _ in examples]
+    bins = pack_first_fit_decreasing(lengths, sequence_len)
+
+    tokenizer = _WORKER_TOKENIZER
+    if tokenizer is None:
+        tokenizer = _load_tokenizer(tokenizer_name)
+    pad_id = tokenizer.pad_token_id
+    if pad_id is None:
+        pad_id = tokenizer.eos_token_id or 0
+
+    num_sequences = len(bins)
+    num_segments = len(examples)
+
+    tokens = np.lib.format.open_memmap(
+        output_dir / "tokens.npy", mode="w+", dtype=np.uint32,
+        shape=(num_sequences, sequence_len),
+    )
+    loss_mask = np.lib.format.open_memmap(
+        output_dir / "loss_mask.npy", mode="w+", dtype=np.uint8,
+        shape=(num_sequences, sequence_len),
+    )
+    segments = np.empty((num_segments, 3), dtype=np.uint32)
+    offsets = np.zeros(num_sequences + 1, dtype=np.uint64)
+
+    tokens[:] = pad_id
+    loss_mask[:] = 0
+
+    seg_row = 0
+    for seq, members in enumerate(bins):
+        pos = 0
+        for idx in members:
+            ids, prompt_len = examples[idx]
+            n = len(ids)
+            tokens[seq, pos:pos + n] = ids
+            loss_mask[seq, pos + prompt_len:pos + n] = 1
+            segments[seg_row] = (seq, pos, n)
+            seg_row += 1
+            pos += n
+        offsets[seq + 1] = seg_row
+
+    tokens.flush()
+    loss_mask.flush()
+    np.save(output_dir / "segments.npy", segments)
+    np.save(output_dir / "offsets.npy", offsets)
+
+    total_tokens = int(sum(lengths))
+    meta: dict[str, Any] = {
+        "format": "swse-packed-v1",
+        "prompt_template": "alpaca",
+        "tokenizer": tokenizer_name,
+        "sequence_len": sequence_len,
+        "pad_token_id": int(pad_id),
+        "eos_token_id": tokenizer.eos_token_id,
+        "bos_token_id": tokenizer.bos_token_id,
+        "num_examples": num_segments,
+        "num_sequences": num_sequences,
+        "num_tokens": total_tokens,
+        "num_truncated": truncated,
+        "packing_efficiency": round(
+            total_tokens / max(num_sequences * sequence_len, 1), 4
+        ),
+    }
+    with open(output_dir / "meta.json", "w", encoding="utf-8") as f:
+        json.dump(meta, f, indent=2)
+
+    return meta
+
+
+# ---------------------------------------------------------------------------
+# Reader
+# ---------------------------------------------------------------------------
+
+class PackedDataset:
+    """Zero-copy reader for a directory written by ``build_packed_dataset``.
+
+    All arrays are opened with ``mmap_mode="r"``; indexing a sequence
+    touches only the pages that back that row.
+    """
+
+    def __init__(self, path: Path) -> None:
+        path = Path(path)
+        with open(path / "meta.json", encoding="utf-8") as f:
+            self.meta: dict[str, Any] = json.load(f)
+        self.tokens = np.load(path / "tokens.npy", mmap_mode="r")
+        self.loss_mask = np.load(path / "loss_mask.npy", mmap_mode="r")
+        self.segments = np.load(path / "segments.npy", mmap_mode="r")
+        self.offsets = np.load(path / "offsets.npy", mmap_mode="r")
+
+    def __len__(self) -> int:
+        return self.tokens.shape[0]
+
+    def __getitem__(self, index: int) -> dict[str, np.ndarray]:
+        """Return one packed sequence with its attention boundaries.
+
+        Keys:
+            input_ids:    uint32 [sequence_len]
+            loss_mask:    uint8  [sequence_len]
+            position_ids: int64  [sequence_len], reset at every example
+            cu_seqlens:   int32  [n_examples + 1], cumulative boundaries
+        """
+        lo, hi = int(self.offsets[index]), int(self.offsets[index + 1])
+        segs = np.asarray(self.segments[lo:hi])
+        starts = segs[:, 1].astype(np.int64)
+        lengths = segs[:, 2].astype(np.int64)
+
+        seq_len = self.tokens.shape[1]
+        used = int(lengths.sum())
+        position_ids = np.zeros(seq_len, dtype=np.int64)
+        position_ids[:used] = (
+            np.arange(used, dtype=np.int64) - np.repeat(starts, lengths)
+        )
+        cu_seqlens = np.concatenate(([0], np.cumsum(lengths))).astype(np.int32)
+
+        return {
+            "input_ids": np.asarray(self.tokens[index]),
+            "loss_mask": np.asarray(self.loss_mask[index]),
+            "position_ids": position_ids,
+            "cu_seqlens": cu_seqlens,
+        }
+
+
+# ---------------------------------------------------------------------------
+# CLI entry point
+# ---------------------------------------------------------------------------
+
+def main() -> None:
+    """Build a packed dataset from an existing Alpaca JSON / JSONL export."""
+    parser = argparse.ArgumentParser(
+        description="Pre-tokenize and pack an Alpaca training set into NumPy arrays",
+    )
+    parser.add_argument("input", help="Alpaca JSON (.json) or JSONL (.jsonl) file")
+    parser.add_argument(
+        "--output-dir",
+        default=None,
+        help="Destination directory (default: <input dir>/packed)",
+    )
+    parser.add_argument("--tokenizer", default=DEFAULT_TOKENIZER)
+    parser.add_argument("--sequence-len", type=int, default=DEFAULT_SEQUENCE_LEN)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    input_path = Path(args.input)
+    with open(input_path, encoding="utf-8") as f:
+        if input_path.suffix == ".jsonl":
+            rows = [json.loads(line) for line in f if line.strip()]
+        else:
+            rows = json.load(f)
+    pairs = [(row["instruction"], row["output"]) for row in rows]
+
+    output_dir = Path(args.output_dir or input_path.parent / "packed")
+    meta = build_packed_dataset(
+        pairs,
+        output_dir,
+        tokenizer_name=args.tokenizer,
+        sequence_len=args.sequence_len,
+        workers=args.workers,
+    )
+    print(
+        f"[OK] Packed {meta['num_examples']} examples into "
+        f"{meta['num_sequences']} x {meta['sequence_len']} tokens "
+        f"({meta['packing_efficiency']:.1%} utilisation) --> {output_dir}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,283 @@
+"""Constraint-aware quasi-random sampler for parameter spaces.
+
+Evenly spaced grids ignore cross-parameter feasibility -- a hole 40 mm in
+diameter placed 5 mm from an edge is a valid value for each parameter
+but not a valid design.  ``FeasibleSampler`` draws whole blocks of
+candidates at once and keeps only feasible ones:
+
+1. **Projection.**  A ``ConditionalBound`` gives a parameter bounds that
+   are functions of parameters sampled before it.  Parameters are sampled
+   in dependency order (``dependent_on`` plus the bound's inputs) and the
+   unit coordinate is mapped into the conditional interval, so these
+   constraints hold by construction.
+2. **Rejection.**  Every ``Predicate`` is a vectorised test over the
+   candidate columns; rows failing any predicate are dropped.
+
+Candidates come from a scrambled Sobol sequence (one dimension per
+sampled parameter), so accepted rows cover the feasible region evenly and
+a given ``(space, constraints, seed)`` always yields the same rows.
+
+Example::
+
+    sampler = FeasibleSampler(
+        MOUNTING_HOLE_SPACE,
+        bounds=[
+            ConditionalBound(
+                "hole_x_position", ("hole_diameter",),
+                lambda v: (v["hole_diameter"] / 2, 100 - v["hole_diameter"] / 2),
+            ),
+        ],
+        predicates=[
+            Predicate(
+                "tolerance_vs_size", ("position_tolerance", "hole_diameter"),
+                lambda v: v["position_tolerance"] <= v["hole_diameter"] / 20,
+            ),
+        ],
+        seed=7,
+    )
+    columns = sampler.sample(10_000)   # {parameter: array}, all feasible
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from graphlib import CycleError, TopologicalSorter
+from typing import Any, Callable, Optional, Sequence
+
+import numpy as np
+from scipy.stats import qmc
+
+Columns = dict[str, np.ndarray]
+
+_DEFAULT_BLOCK = 4096
+_DEFAULT_MAX_BLOCKS = 256
+
+
+@dataclass(frozen=True)
+class Predicate:
+    """Vectorised feasibility test.
+
+    Attributes:
+        name: Label used in rejection statistics.
+        parameters: Parameters the test reads (for validation only).
+        test: ``columns -> bool array``, True where a row is feasible.
+    """
+
+    name: str
+    parameters: tuple[str, ...]
+    test: Callable[[Columns], np.ndarray]
+
+
+@dataclass(frozen=True)
+class ConditionalBound:
+    """Bounds of one parameter as a function of earlier parameters.
+
+    Attributes:
+        parameter: The bounded (numeric) parameter.
+        depends_on: Parameters the bounds read; sampled first.
+        bounds: ``columns -> (low, high)`` arrays (or scalars).  Rows
+                where ``low > high`` are infeasible and rejected.
+    """
+
+    parameter: str
+    depends_on: tuple[str, ...]
+    bounds: Callable[[Columns], tuple[Any, Any]]
+
+
+class FeasibleSampler:
+    """Block-wise Sobol sampler with projection and rejection constraints.
+
+    Numeric parameters with ``min_value``/``max_value`` (or a conditional
+    bound) and DISCRETE parameters get one Sobol dimension each; every
+    other parameter is held at its default.
+
+    Args:
+        space: A ``ParameterSpace``.
+        predicates: Cross-parameter feasibility tests (rejection).
+        bounds: Conditional bounds (projection).
+        seed: Seed of the Sobol scrambling.
+        block_size: Candidates drawn per block (rounded up to a power of 2).
+        max_blocks: Blocks to draw before giving up on a sample request.
+        round_values: Round numeric values to each parameter's
+                      ``precision`` before the predicates are checked.
+
+    Raises:
+        ValueError: Unknown parameters or circular dependencies.
+    """
+
+    def __init__(
+        self,
+        space: Any,
+        predicates: Sequence[Predicate] = (),
+        bounds: Sequence[ConditionalBound] = (),
+        seed: int = 0,
+        block_size: int = _DEFAULT_BLOCK,
+        max_blocks: int = _DEFAULT_MAX_BLOCKS,
+        round_values: bool = True,
+    ) -> None:
+        self.space = space
+        self.predicates = list(predicates)
+        self.bounds = {b.parameter: b for b in bounds}
+        self.seed = seed
+        self.block_size = 1 << max(int(block_size) - 1, 1).bit_length()
+        self.max_blocks = max_blocks
+        self.round_values = round_values
+
+        params = space.parameters
+        referenced = [(p.name, p.parameters) for p in self.predicates] + [
+            (b.parameter, (b.parameter, *b.depends_on)) for b in bounds
+        ]
+        for label, names in referenced:
+            unknown = [n for n in names if n not in params]
+            if unknown:
+                raise ValueError(f"'{label}' references unknown parameter(s): {', '.join(unknown)}")
+
+        graph = {
+            name: [d for d in param.dependent_on if d in params]
+            + list(self.bounds[name].depends_on if name in self.bounds else ())
+            for name, param in params.items()
+        }
+        try:
+            self.order = list(TopologicalSorter(graph).static_order())
+        except CycleError as exc:
+            raise ValueError(f"Circular parameter dependencies: {' -> '.join(exc.args[1])}") from exc
+
+        # Parameters that get a Sobol dimension, in sampling order
+        self.dimensions = [name for name in self.order if self._kind(name) != "fixed"]
+        self.accepted = 0
+        self.drawn = 0
+        self.rejected_by: dict[str, int] = {}
+
+    def _kind(self, name: str) -> str:
+        param = self.space.parameters[name]
+        if param.constraint_type.value == "discrete":
+            return "discrete"
+        if name in self.bounds or (param.min_value is not None and param.max_value is not None):
+            return "range"
+        return "fixed"
+
+    # ------------------------------------------------------------------
+    # Sampling
+    # ------------------------------------------------------------------
+
+    def candidates(self, unit: np.ndarray) -> tuple[Columns, np.ndarray]:
+        """Map unit-cube points to parameter columns.
+
+        Args:
+            unit: (n, len(dimensions)) points in [0, 1).
+
+        Returns:
+            (columns, feasible) -- feasible is False where a conditional
+            bound was empty or a predicate failed.
+        """
+        n = len(unit)
+        columns: Columns = {}
+        feasible = np.ones(n, dtype=bool)
+        dim = {name: k for k, name in enumerate(self.dimensions)}
+
+        for name in self.order:
+            param = self.space.parameters[name]
+            kind = self._kind(name)
+            if kind == "fixed":
+                columns[name] = _constant(param.default_value, n)
+                continue
+            u = unit[:, dim[name]]
+            if kind == "discrete":
+                choices = np.asarray(param.discrete_values, dtype=object)
+                columns[name] = choices[np.minimum((u * len(choices)).astype(np.int64), len(choices) - 1)]
+                continue
+
+            low = param.min_value
+            high = param.max_value
+            if name in self.bounds:
+                lo, hi = self.bounds[name].bounds(columns)
+                lo = np.broadcast_to(np.asarray(lo, dtype=float), (n,))
+                hi = np.broadcast_to(np.asarray(hi, dtype=float), (n,))
+                # Intersect with the parameter's own range
+                if low is not None:
+                    lo = np.maximum(lo, low)
+                if high is not None:
+                    hi = np.minimum(hi, high)
+                feasible &= lo <= hi
+                low, high = lo, hi
+            values = low + u * (high - low)
+            if self.round_values:
+                values = np.clip(np.round(values, param.precision), low, high)
+            columns[name] = values
+
+        self.rejected_by.setdefault("bounds", 0)
+        self.rejected_by["bounds"] += int(n - feasible.sum())
+        for predicate in self.predicates:
+            ok = np.asarray(predicate.test(columns), dtype=bool)
+            rejected = int((feasible & ~ok).sum())
+            self.rejected_by[predicate.name] = self.rejected_by.get(predicate.name, 0) + rejected
+            feasible &= ok
+        return columns, feasible
+
+    def sample(self, n: int) -> Columns:
+        """Draw *n* feasible rows.
+
+        Returns:
+            Parameter name -> array of length *n* (object arrays for
+            discrete and string parameters), in space order.
+
+        Raises:
+            ValueError: Fewer than *n* feasible rows after ``max_blocks``
+                        blocks (the feasible region is too small or empty).
+        """
+        self.accepted = 0
+        self.drawn = 0
+        self.rejected_by = {}
+        names = list(self.space.parameters)
+        if n <= 0:
+            return {name: np.empty(0) for name in names}
+
+        sobol = qmc.Sobol(max(len(self.dimensions), 1), scramble=True, seed=self.seed)
+        parts: list[Columns] = []
+        for _ in range(self.max_blocks):
+            unit = sobol.random(self.block_size)[:, : len(self.dimensions)]
+            columns, feasible = self.candidates(unit)
+            self.drawn += len(unit)
+            rows = np.flatnonzero(feasible)[: n - self.accepted]
+            parts.append({name: columns[name][rows] for name in names})
+            self.accepted += len(rows)
+            if self.accepted >= n:
+                break
+        else:
+            raise ValueError(
+                f"Only {self.accepted} of {n} feasible rows after {self.drawn} candidates; "
+                f"rejections: {self.rejected_by}"
+            )
+        return {name: np.concatenate([part[name] for part in parts]) for name in names}
+
+    def sample_rows(self, n: int) -> list[dict[str, Any]]:
+        """``sample`` as a list of ``{parameter: value}`` dicts."""
+        columns = self.sample(n)
+        names = list(columns)
+        return [dict(zip(names, values)) for values in zip(*(columns[name].tolist() for name in names))]
+
+    def filter(self, columns: Columns) -> np.ndarray:
+        """Feasibility mask of existing rows (bounds and predicates)."""
+        n = len(next(iter(columns.values()))) if columns else 0
+        feasible = np.ones(n, dtype=bool)
+        for name, bound in self.bounds.items():
+            lo, hi = bound.bounds(columns)
+            values = np.asarray(columns[name], dtype=float)
+            feasible &= (values >= lo) & (values <= hi)
+        for predicate in self.predicates:
+            feasible &= np.asarray(predicate.test(columns), dtype=bool)
+        return feasible
+
+    @property
+    def acceptance_rate(self) -> Optional[float]:
+        """Accepted / drawn candidates of the last ``sample`` call."""
+        return self.accepted / self.drawn if self.drawn else None
+
+
+def _constant(value: Any, n: int) -> np.ndarray:
+    """Column of *n* copies of a default value."""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return np.full(n, value, dtype=float)
+    column = np.empty(n, dtype=object)
+    column[:] = [value] * n
+    return column
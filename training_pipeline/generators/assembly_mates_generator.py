@@ -163,18 +163,22 @@ class AssemblyMatesGenerator:
     Call ``generate_all()`` to get all ~450 (instruction, code) pairs.
     """
 
+    # Section methods in output order; each is one work unit when the
+    # stage runs chunked (see training_pipeline.work_units)
+    SECTIONS = (
+        "_advanced_mate_pairs",
+        "_mechanical_mate_pairs",
+        "_mate_editing_pairs",
+        "_mate_management_pairs",
+        "_conceptual_pairs",
+        "_multi_mate_workflow_pairs",
+    )
+
     def generate_all(self) -> list[tuple[str, str]]:
         """Return every training pair from all mate domains."""
         p: list[tuple[str, str]] = []
-        for gen in [
-            self._advanced_mate_pairs,
-            self._mechanical_mate_pairs,
-            self._mate_editing_pairs,
-            self._mate_management_pairs,
-            self._conceptual_pairs,
-            self._multi_mate_workflow_pairs,
-        ]:
-            p.extend(gen())
+        for name in self.SECTIONS:
+            p.extend(getattr(self, name)())
         return p
 
     # -- 1. Advanced Mates (~80) -------------------------------------------
@@ -364,7 +364,7 @@ class BomPropertiesGenerator:
                 for (int r = 0; r < tbl.RowCount; r++) {
                     var cells = new System.Collections.Generic.List<string>();
                     for (int c = 0; c < tbl.ColumnCount; c++)
-                        cells.Add("\"" + tbl.Text[r, c].Replace("\"", "\"\"") + "\"");
+                        cells.Add("\\"" + tbl.Text[r, c].Replace("\\"", "\\"\\"") + "\\"");
                     sb.AppendLine(string.Join(",", cells));
                 }
                 System.IO.File.WriteAllText(@"C:\\Output\\BOM_Export.csv", sb.ToString());
@@ -13,6 +13,15 @@ import math
 import textwrap
 from typing import List, Tuple
 
+from engineering.fastener_tables import (
+    CBORE_DEPTH_MM,
+    CBORE_DIA_MM,
+    INCH_SIZES,
+    METRIC_NOMINAL_MM,
+    METRIC_SIZES,
+    TORQUE_NM,
+)
+
 TrainingPair = Tuple[str, str]
 D = textwrap.dedent
 
@@ -62,26 +71,6 @@ _END_COND = {
     "through_all": "swEndConditions_e.swEndCondThroughAll",
 }
 
-METRIC_SIZES = ["M3", "M4", "M5", "M6", "M8", "M10", "M12", "M16", "M20"]
-
-INCH_SIZES = ["#4-40", "#6-32", "#8-32", "1/4-20", "5/16-18", "3/8-16", "1/2-13"]
-
-# Nominal diameters for depth calculations (meters)
-_METRIC_NOMINAL_MM = {
-    "M3": 3, "M4": 4, "M5": 5, "M6": 6, "M8": 8,
-    "M10": 10, "M12": 12, "M16": 16, "M20": 20,
-}
-
-_CBORE_DIA_MM = {
-    "M3": 6.5, "M4": 8, "M5": 10, "M6": 11, "M8": 14.5,
-    "M10": 17.5, "M12": 20, "M16": 26, "M20": 33,
-}
-
-_CBORE_DEPTH_MM = {
-    "M3": 3.5, "M4": 4.5, "M5": 5.5, "M6": 6.5, "M8": 8.5,
-    "M10": 10.5, "M12": 13, "M16": 17, "M20": 21,
-}
-
 _CSINK_ANGLE = 82  # degrees for ANSI; 90 for ISO
 
 
@@ -162,8 +151,8 @@ class FastenerGenerator:
         # --- Counterbore holes: metric blind ---
         for size in METRIC_SIZES:
             for depth in [10, 15, 20, 25]:
-                cbd = _CBORE_DIA_MM.get(size, 10)
-                cbdp = _CBORE_DEPTH_MM.get(size, 5)
+                cbd = CBORE_DIA_MM.get(size, 10)
+                cbdp = CBORE_DEPTH_MM.get(size, 5)
                 code = _hole_wizard_tpl(
                     "counterbore", "ansi_metric", "counterbore", size,
                     "blind", _mm(depth), _mm(cbd), _mm(cbdp))
@@ -174,8 +163,8 @@ class FastenerGenerator:
 
         # --- Counterbore holes: metric through all ---
         for size in ["M4", "M6", "M8", "M10", "M12"]:
-            cbd = _CBORE_DIA_MM[size]
-            cbdp = _CBORE_DEPTH_MM[size]
+            cbd = CBORE_DIA_MM[size]
+            cbdp = CBORE_DEPTH_MM[size]
             code = _hole_wizard_tpl(
                 "counterbore", "ansi_metric", "counterbore", size,
                 "through_all", 0, _mm(cbd), _mm(cbdp))
@@ -185,7 +174,7 @@ class FastenerGenerator:
 
         # --- Countersink holes: metric blind ---
         for size in ["M3", "M4", "M5", "M6", "M8", "M10"]:
-            nom = _METRIC_NOMINAL_MM[size]
+            nom = METRIC_NOMINAL_MM[size]
             for depth in [8, 12, 20]:
                 code = _hole_wizard_tpl(
                     "countersink", "ansi_metric", "countersink", size,
@@ -197,7 +186,7 @@ class FastenerGenerator:
 
         # --- Countersink holes: metric through all ---
         for size in ["M4", "M5", "M6", "M8"]:
-            nom = _METRIC_NOMINAL_MM[size]
+            nom = METRIC_NOMINAL_MM[size]
             code = _hole_wizard_tpl(
                 "countersink", "ansi_metric", "countersink", size,
                 "through_all", 0, 0, 0, _mm(nom * 2), _deg(82))
@@ -207,7 +196,7 @@ class FastenerGenerator:
 
         # --- Countersink holes: ISO ---
         for size in ["M5", "M6", "M8", "M10"]:
-            nom = _METRIC_NOMINAL_MM[size]
+            nom = METRIC_NOMINAL_MM[size]
             code = _hole_wizard_tpl(
                 "countersink", "iso", "countersink", size,
                 "through_all", 0, 0, 0, _mm(nom * 2), _deg(90))
@@ -236,7 +225,7 @@ class FastenerGenerator:
 
         # --- Straight tapped holes: metric blind ---
         for size in METRIC_SIZES:
-            nom = _METRIC_NOMINAL_MM[size]
+            nom = METRIC_NOMINAL_MM[size]
             for depth in [10, 15, 20]:
                 code = _hole_wizard_tpl(
                     "tapped", "ansi_metric", "tapped_standard", size,
@@ -306,7 +295,7 @@ class FastenerGenerator:
 
         # Cosmetic thread creation
         for size in ["M4", "M5", "M6", "M8", "M10", "M12", "M16"]:
-            nom = _METRIC_NOMINAL_MM[size]
+            nom = METRIC_NOMINAL_MM[size]
             code = D(f"""\
                 modelDoc.Extension.SelectByID2("", "EDGE", 0.02, 0.03, 0, false, 0, null, 0);
                 Feature thread = (Feature)featMgr.InsertCosmeticThread2(
@@ -321,7 +310,7 @@ class FastenerGenerator:
 
         # External cosmetic thread
         for size in ["M6", "M8", "M10", "M12", "M16", "M20"]:
-            nom = _METRIC_NOMINAL_MM[size]
+            nom = METRIC_NOMINAL_MM[size]
             code = D(f"""\
                 modelDoc.Extension.SelectByID2("", "EDGE", 0.02, 0.03, 0, false, 0, null, 0);
                 Feature thread = (Feature)featMgr.InsertCosmeticThread2(
@@ -342,7 +331,7 @@ class FastenerGenerator:
             p.append((
                 f"What is the thread callout for an {size} coarse pitch internal thread?",
                 f"{size}x{pitch} - {cl}. Pitch = {pitch}mm. "
-                f"Major diameter = {_METRIC_NOMINAL_MM[size]}mm. "
+                f"Major diameter = {METRIC_NOMINAL_MM[size]}mm. "
                 f"Class 6H is standard tolerance for internal metric threads."))
 
         for size, pitch, cl in [
@@ -443,7 +432,7 @@ class FastenerGenerator:
 
         # Thread depth and minor diameter
         for size in ["M6", "M8", "M10", "M12"]:
-            nom = _METRIC_NOMINAL_MM[size]
+            nom = METRIC_NOMINAL_MM[size]
             pitch = {6: 1.0, 8: 1.25, 10: 1.5, 12: 1.75}[nom]
             minor = nom - 1.0825 * pitch
             p.append((
@@ -830,12 +819,7 @@ class FastenerGenerator:
                 f"Grade 8 for safety-critical and high-vibration applications."))
 
         # Torque specifications
-        for size, grade, torque_nm in [
-            ("M6", "8.8", 9.9), ("M8", "8.8", 24), ("M10", "8.8", 47),
-            ("M12", "8.8", 82), ("M16", "8.8", 200), ("M20", "8.8", 390),
-            ("M6", "10.9", 14), ("M8", "10.9", 34), ("M10", "10.9", 67),
-            ("M12", "10.9", 116), ("M16", "10.9", 280), ("M20", "10.9", 550),
-        ]:
+        for size, grade, torque_nm in TORQUE_NM:
             p.append((
                 f"What is the recommended tightening torque for {size} class {grade}?",
                 f"{size} class {grade}: approximately {torque_nm} Nm (dry, K=0.2). "
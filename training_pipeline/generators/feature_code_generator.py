@@ -15,6 +15,8 @@ from __future__ import annotations
 import math
 import textwrap
 
+from training_pipeline.code_templates import CodeTemplate
+
 # ---------------------------------------------------------------------------
 # SolidWorks enums and conversion helpers
 # ---------------------------------------------------------------------------
@@ -48,31 +50,94 @@ def _ec(name: str) -> str:
 
 
 # ---------------------------------------------------------------------------
-# Shared code-block templates (kept short via format strings)
+# Shared code-block templates (dedented once at import)
 # ---------------------------------------------------------------------------
 
+_EXTRUDE = CodeTemplate("""\
+    // {label}
+    Feature feat = (Feature)featMgr.FeatureExtrusion3(
+        true, false, false, {ec}, 0, {depth}, 0,
+        false, false, false, false, {draft}, {do},
+        false, false, false, false, 0, 0, false, false);
+    modelDoc.EditRebuild3();""")
+
+_CUT = CodeTemplate("""\
+    // {label}
+    Feature cutFeat = (Feature)featMgr.FeatureCut4(
+        true, false, false, {ec}, 0, {depth}, 0,
+        false, false, false, false, {draft}, {do},
+        false, false, false, false, false, false, 0, 0, false, false);
+    modelDoc.EditRebuild3();""")
+
+_REVOLVE = CodeTemplate("""\
+    // {label}
+    Feature feat = (Feature)featMgr.FeatureRevolve2(
+        true, {boss}, false, {tf}, 0, {wall}, 0,
+        {ec}, {angle}, 0, 0, false, false, 0, 0, false);
+    modelDoc.EditRebuild3();""")
+
+_MATE = CodeTemplate("""\
+    // {label}
+    AssemblyDoc asmDoc = (AssemblyDoc)modelDoc;
+    int errCode = 0;
+    Mate2 mate = asmDoc.AddMate5(
+        (int)swMateType_e.{mtype}, (int)swMateAlign_e.swMateAlign{align},
+        false, {d}, {d}, {d}, {a}, {a}, {a}, {extra1}, {extra2},
+        false, out errCode);
+    modelDoc.EditRebuild3();""")
+
+_SURFACE = CodeTemplate("""\
+    // {label}
+    Feature feat = (Feature)featMgr.{method}({args});
+    modelDoc.EditRebuild3();""")
+
+_VARIABLE_FILLET = CodeTemplate("""\
+    // Variable fillet {r1}mm to {r2}mm
+    Feature fillet = (Feature)featMgr.InsertFeatureFillet2(0, {r1_m}, 0, 0, 0, 0);
+    IFillFilletFeatureData2 fData = (IFillFilletFeatureData2)fillet.GetDefinition();
+    fData.SetRadius(1, {r2_m});
+    fillet.ModifyDefinition(fData, modelDoc, null);
+    modelDoc.EditRebuild3();""")
+
+_ADD_COMPONENT = CodeTemplate("""\
+    // Add component: {fn}
+    AssemblyDoc asmDoc = (AssemblyDoc)modelDoc;
+    Component2 comp = asmDoc.AddComponent5(
+        @"C:\\Parts\\{fn}", 0, "", false, "", 0, 0, 0);
+    modelDoc.EditRebuild3();""")
+
+_LINEAR_COMPONENT_PATTERN = CodeTemplate("""\
+    // Component linear pattern: {c} at {s}mm
+    AssemblyDoc asmDoc = (AssemblyDoc)modelDoc;
+    Feature patt = (Feature)asmDoc.InsertLinearComponentPattern(
+        {s_m}, 0, 0, 1, {c}, 0, 0, 0, 1, 0, false);
+    modelDoc.EditRebuild3();""")
+
+_CIRCULAR_COMPONENT_PATTERN = CodeTemplate("""\
+    // Component circular pattern: {c} instances
+    AssemblyDoc asmDoc = (AssemblyDoc)modelDoc;
+    Feature patt = (Feature)asmDoc.InsertCircularComponentPattern(
+        {full_turn}, {c}, true, false);
+    modelDoc.EditRebuild3();""")
+
+_SUPPRESSION = CodeTemplate("""\
+    // {action} component
+    Component2 comp = (Component2)((SelectionMgr)modelDoc.SelectionManager)
+        .GetSelectedObjectsComponent4(1, -1);
+    comp.SetSuppression2((int)swComponentSuppressionState_e.{state});
+    modelDoc.EditRebuild3();""")
+
+
 def _extrude_tpl(label: str, ec: str, depth: float,
                  draft: float = 0, draft_out: bool = False) -> str:
     do = "true" if draft_out and draft else "false"
-    return textwrap.dedent(f"""\
-        // {label}
-        Feature feat = (Feature)featMgr.FeatureExtrusion3(
-            true, false, false, {ec}, 0, {depth}, 0,
-            false, false, false, false, {draft}, {do},
-            false, false, false, false, 0, 0, false, false);
-        modelDoc.EditRebuild3();""")
+    return _EXTRUDE(label=label, ec=ec, depth=depth, draft=draft, do=do)
 
 
 def _cut_tpl(label: str, ec: str, depth: float,
              draft: float = 0, draft_out: bool = False) -> str:
     do = "true" if draft_out and draft else "false"
-    return textwrap.dedent(f"""\
-        // {label}
-        Feature cutFeat = (Feature)featMgr.FeatureCut4(
-            true, false, false, {ec}, 0, {depth}, 0,
-            false, false, false, false, {draft}, {do},
-            false, false, false, false, false, false, 0, 0, false, false);
-        modelDoc.EditRebuild3();""")
+    return _CUT(label=label, ec=ec, depth=depth, draft=draft, do=do)
 
 
 def _revolve_tpl(label: str, is_boss: bool, angle: float,
@@ -80,33 +145,18 @@ def _revolve_tpl(label: str, is_boss: bool, angle: float,
                  thin: bool = False, wall: float = 0) -> str:
     boss = "true" if is_boss else "false"
     tf = "true" if thin else "false"
-    return textwrap.dedent(f"""\
-        // {label}
-        Feature feat = (Feature)featMgr.FeatureRevolve2(
-            true, {boss}, false, {tf}, 0, {wall}, 0,
-            {ec}, {angle}, 0, 0, false, false, 0, 0, false);
-        modelDoc.EditRebuild3();""")
+    return _REVOLVE(label=label, boss=boss, tf=tf, wall=wall, ec=ec, angle=angle)
 
 
 def _mate_tpl(label: str, mtype: str, align: str = "ALIGNED",
               d: float = 0, a: float = 0,
               extra1: float = 0, extra2: float = 0) -> str:
-    return textwrap.dedent(f"""\
-        // {label}
-        AssemblyDoc asmDoc = (AssemblyDoc)modelDoc;
-        int errCode = 0;
-        Mate2 mate = asmDoc.AddMate5(
-            (int)swMateType_e.{mtype}, (int)swMateAlign_e.swMateAlign{align},
-            false, {d}, {d}, {d}, {a}, {a}, {a}, {extra1}, {extra2},
-            false, out errCode);
-        modelDoc.EditRebuild3();""")
+    return _MATE(label=label, mtype=mtype, align=align, d=d, a=a,
+                 extra1=extra1, extra2=extra2)
 
 
 def _surface_tpl(label: str, method: str, args: str) -> str:
-    return textwrap.dedent(f"""\
-        // {label}
-        Feature feat = (Feature)featMgr.{method}({args});
-        modelDoc.EditRebuild3();""")
+    return _SURFACE(label=label, method=method, args=args)
 
 
 # ---------------------------------------------------------------------------
@@ -313,13 +363,7 @@ class FeatureCodeGenerator:
             p.append((f"Add a {r}mm constant-radius fillet to the selected edge(s) in SolidWorks.", code))
         # Variable fillet
         for r1, r2 in [(1,3),(2,5),(1,8),(3,10),(0.5,2),(2,8),(1,5)]:
-            code = textwrap.dedent(f"""\
-                // Variable fillet {r1}mm to {r2}mm
-                Feature fillet = (Feature)featMgr.InsertFeatureFillet2(0, {_mm(r1)}, 0, 0, 0, 0);
-                IFillFilletFeatureData2 fData = (IFillFilletFeatureData2)fillet.GetDefinition();
-                fData.SetRadius(1, {_mm(r2)});
-                fillet.ModifyDefinition(fData, modelDoc, null);
-                modelDoc.EditRebuild3();""")
+            code = _VARIABLE_FILLET(r1=r1, r2=r2, r1_m=_mm(r1), r2_m=_mm(r2))
             p.append((f"Add a variable-radius fillet from {r1}mm to {r2}mm on the selected edge in SolidWorks.", code))
         # Face fillet
         for r in [1, 2, 3, 5]:
@@ -379,12 +423,7 @@ class FeatureCodeGenerator:
         for fn in ["Bracket.SLDPRT","Bolt_M8.SLDPRT","Gear.SLDPRT","Housing.SLDPRT",
                     "Shaft.SLDPRT","Plate.SLDPRT","Bushing.SLDPRT","Flange.SLDPRT",
                     "Cover.SLDPRT","Motor.SLDASM"]:
-            code = textwrap.dedent(f"""\
-                // Add component: {fn}
-                AssemblyDoc asmDoc = (AssemblyDoc)modelDoc;
-                Component2 comp = asmDoc.AddComponent5(
-                    @"C:\\Parts\\{fn}", 0, "", false, "", 0, 0, 0);
-                modelDoc.EditRebuild3();""")
+            code = _ADD_COMPONENT(fn=fn)
             p.append((f"Add the component '{fn}' to the active SolidWorks assembly at the origin.", code))
         # Standard mates
         for mt in ["Coincident","Concentric","Parallel","Perpendicular","Tangent","Lock"]:
@@ -411,21 +450,11 @@ class FeatureCodeGenerator:
                    _mate_tpl("Cam mate", _MATE_ENUM["Cam"], "CLOSEST")))
         # Component linear pattern
         for c, s in [(2,60),(3,50),(4,40),(5,30),(6,25),(8,20)]:
-            code = textwrap.dedent(f"""\
-                // Component linear pattern: {c} at {s}mm
-                AssemblyDoc asmDoc = (AssemblyDoc)modelDoc;
-                Feature patt = (Feature)asmDoc.InsertLinearComponentPattern(
-                    {_mm(s)}, 0, 0, 1, {c}, 0, 0, 0, 1, 0, false);
-                modelDoc.EditRebuild3();""")
+            code = _LINEAR_COMPONENT_PATTERN(c=c, s=s, s_m=_mm(s))
             p.append((f"Create a component linear pattern with {c} instances spaced {s}mm apart in a SolidWorks assembly.", code))
         # Component circular pattern
         for c in [3, 4, 6, 8, 10, 12]:
-            code = textwrap.dedent(f"""\
-                // Component circular pattern: {c} instances
-                AssemblyDoc asmDoc = (AssemblyDoc)modelDoc;
-                Feature patt = (Feature)asmDoc.InsertCircularComponentPattern(
-                    {_deg(360)}, {c}, true, false);
-                modelDoc.EditRebuild3();""")
+            code = _CIRCULAR_COMPONENT_PATTERN(c=c, full_turn=_deg(360))
             p.append((f"Create a circular component pattern with {c} instances in a SolidWorks assembly.", code))
         # Interference detection
         code = textwrap.dedent("""\
@@ -451,12 +480,7 @@ class FeatureCodeGenerator:
             ("Suppress", "swComponentSuppressed", "Suppress the selected component to exclude it from calculations."),
             ("Unsuppress", "swComponentFullyResolved", "Unsuppress the selected component to restore it."),
         ]:
-            code = textwrap.dedent(f"""\
-                // {action} component
-                Component2 comp = (Component2)((SelectionMgr)modelDoc.SelectionManager)
-                    .GetSelectedObjectsComponent4(1, -1);
-                comp.SetSuppression2((int)swComponentSuppressionState_e.{state});
-                modelDoc.EditRebuild3();""")
+            code = _SUPPRESSION(action=action, state=state)
             p.append((desc, code))
         return p
 
@@ -7,9 +7,9 @@ Also produces instruction/code training pairs for fine-tuning.
 
 from __future__ import annotations
 
-import textwrap
 from typing import Optional
 
+from training_pipeline.code_templates import CodeTemplate
 from training_pipeline.normalizers.gdt_normalizer import (
     DatumReference,
     GDTSpecification,
@@ -50,6 +50,52 @@ _ZONE_SHAPE_ENUM: dict[str, str] = {
 # Maximum number of datum slots in SolidWorks feature control frame
 _MAX_DATUM_SLOTS = 3
 
+# ---------------------------------------------------------------------------
+# Code templates (dedented once at import)
+# ---------------------------------------------------------------------------
+
+_GTOL_TEMPLATE = CodeTemplate("""\
+            // ---------------------------------------------------------
+            // Apply {characteristic} tolerance: {tolerance_value}
+            // ---------------------------------------------------------
+
+            // Obtain the selected face / feature
+            Face2 selectedFace = (Face2)selectionMgr.GetSelectedObject6(1, -1);
+            Annotation annotation = (Annotation)selectedFace.GetAnnotation();
+
+            // Create the tolerance feature
+            Gtol gtol = (Gtol)annotation.GetSpecificAnnotation();
+            if (gtol == null)
+            {{
+                gtol = (Gtol)modelDoc.InsertGtol();
+            }}
+
+            // Configure the feature control frame
+            gtol.SetFrameSymbol2(0, (int){char_enum});
+            gtol.SetFrameValues3(
+                0,                              // frame index
+                {tolerance_value},         // tolerance value
+                (int){zone_enum},               // zone shape
+                (int){mod_enum}                 // material modifier
+            );
+
+            {datum_code}
+            {composite_code}
+            // Commit changes
+            gtol.SetDisplay(true);
+            modelDoc.EditRebuild3();
+""")
+
+_COMPOSITE_TEMPLATE = CodeTemplate("""\
+    // Composite refinement row
+    gtol.SetFrameSymbol2(1, (int){char_enum});
+    gtol.SetFrameValues3(
+        1,                              // second frame row
+        {refinement_tolerance},    // refinement tolerance
+        (int)swGDTToleranceZoneShape_e.swGDTToleranceZoneLinear,
+        (int)swGDTModifyingSymbol_e.swGDTModifyingSymbolNone
+    );""")
+
 
 class GDTCodeGenerator:
     """Generates SolidWorks-API C# code from ``GDTSpecification`` objects.
@@ -83,38 +129,15 @@ class GDTCodeGenerator:
         datum_code = self._generate_datum_code(spec.datum_references)
         composite_code = self._generate_composite_section(spec)
 
-        code = textwrap.dedent(f"""\
-            // ---------------------------------------------------------
-            // Apply {spec.characteristic} tolerance: {spec.tolerance_value}
-            // ---------------------------------------------------------
-
-            // Obtain the selected face / feature
-            Face2 selectedFace = (Face2)selectionMgr.GetSelectedObject6(1, -1);
-            Annotation annotation = (Annotation)selectedFace.GetAnnotation();
-
-            // Create the tolerance feature
-            Gtol gtol = (Gtol)annotation.GetSpecificAnnotation();
-            if (gtol == null)
-            {{
-                gtol = (Gtol)modelDoc.InsertGtol();
-            }}
-
-            // Configure the feature control frame
-            gtol.SetFrameSymbol2(0, (int){char_enum});
-            gtol.SetFrameValues3(
-                0,                              // frame index
-                {spec.tolerance_value},         // tolerance value
-                (int){zone_enum},               // zone shape
-                (int){mod_enum}                 // material modifier
-            );
-
-            {datum_code}
-            {composite_code}
-            // Commit changes
-            gtol.SetDisplay(true);
-            modelDoc.EditRebuild3();
-        """)
-        return code
+        return _GTOL_TEMPLATE(
+            characteristic=spec.characteristic,
+            tolerance_value=spec.tolerance_value,
+            char_enum=char_enum,
+            zone_enum=zone_enum,
+            mod_enum=mod_enum,
+            datum_code=datum_code,
+            composite_code=composite_code,
+        )
 
     def generate_training_pair(
         self, spec: GDTSpecification
@@ -130,7 +153,10 @@ class GDTCodeGenerator:
         """
         datum_desc = ""
         if spec.datum_references:
-            labels = ", ".join(d.label for d in spec.datum_references)
+            labels = ", ".join(
+                f"{d.label} at {d.modifier}" if d.modifier else d.label
+                for d in spec.datum_references
+            )
             datum_desc = f" with datum references {labels}"
 
         modifier_desc = ""
@@ -227,12 +253,7 @@ class GDTCodeGenerator:
             spec.characteristic,
             "swGDTCharacteristic_e.swGDTPosition",
         )
-        return textwrap.dedent(f"""\
-            // Composite refinement row
-            gtol.SetFrameSymbol2(1, (int){char_enum});
-            gtol.SetFrameValues3(
-                1,                              // second frame row
-                {spec.refinement_tolerance},    // refinement tolerance
-                (int)swGDTToleranceZoneShape_e.swGDTToleranceZoneLinear,
-                (int)swGDTModifyingSymbol_e.swGDTModifyingSymbolNone
-            );""")
+        return _COMPOSITE_TEMPLATE(
+            char_enum=char_enum,
+            refinement_tolerance=spec.refinement_tolerance,
+        )
@@ -34,22 +34,29 @@ class InterferenceClearanceGenerator:
     # Public API
     # ------------------------------------------------------------------
 
+    # Section methods in output order; each is one work unit when the
+    # stage runs chunked (see training_pipeline.work_units)
+    SECTIONS = (
+        "_interference_parameterized_pairs",
+        "_interference_result_pairs",
+        "_interference_selective_pairs",
+        "_interference_filtering_pairs",
+        "_interference_workflow_pairs",
+        "_clearance_measure_pairs",
+        "_clearance_threshold_pairs",
+        "_clearance_iteration_pairs",
+        "_clearance_report_pairs",
+        "_collision_setup_pairs",
+        "_collision_config_pairs",
+        "_collision_result_pairs",
+        "_conceptual_pairs",
+    )
+
     def generate_all(self) -> list[tuple[str, str]]:
         """Return all interference / clearance / collision training pairs."""
         p: list[tuple[str, str]] = []
-        p.extend(self._interference_parameterized_pairs())
-        p.extend(self._interference_result_pairs())
-        p.extend(self._interference_selective_pairs())
-        p.extend(self._interference_filtering_pairs())
-        p.extend(self._interference_workflow_pairs())
-        p.extend(self._clearance_measure_pairs())
-        p.extend(self._clearance_threshold_pairs())
-        p.extend(self._clearance_iteration_pairs())
-        p.extend(self._clearance_report_pairs())
-        p.extend(self._collision_setup_pairs())
-        p.extend(self._collision_config_pairs())
-        p.extend(self._collision_result_pairs())
-        p.extend(self._conceptual_pairs())
+        for name in self.SECTIONS:
+            p.extend(getattr(self, name)())
         return p
 
     # ==================================================================
@@ -12,7 +12,7 @@ Generates instruction/code training pairs covering:
 All dimensional values use meters (SolidWorks API internal convention).
 Angles use radians unless noted otherwise.
 
-Target: ~420-480 training pairs.
+Target: ~500-560 training pairs.
 """
 
 from __future__ import annotations
@@ -21,6 +21,9 @@ import math
 import textwrap
 from typing import List, Tuple
 
+from engineering.gear_geometry import ADDENDUM_COEFF, DEDENDUM_COEFF, GearGrid, center_distance
+from engineering.iso_fits import FitResult, evaluate_fit, evaluate_fits
+
 # ---------------------------------------------------------------------------
 # Aliases and helpers
 # ---------------------------------------------------------------------------
@@ -39,6 +42,27 @@ def _deg(v: float) -> float:
     return math.radians(v)
 
 
+def _fit_deviations(fit: FitResult) -> tuple[float, float, float, float]:
+    """(hole_upper, hole_lower, shaft_upper, shaft_lower) in mm."""
+    return (
+        fit.hole.upper_deviation,
+        fit.hole.lower_deviation,
+        fit.shaft.upper_deviation,
+        fit.shaft.lower_deviation,
+    )
+
+
+def _fit_range_text(fit: FitResult) -> str:
+    """Clearance/interference range sentence for a fit."""
+    lo, hi = fit.min_clearance, fit.max_clearance
+    at = f"at {fit.nominal:g}mm nominal"
+    if fit.fit_type == "clearance":
+        return f"Clearance range {lo:.3f}mm to {hi:.3f}mm {at}."
+    if fit.fit_type == "interference":
+        return f"Interference range {-hi:.3f}mm to {-lo:.3f}mm {at}."
+    return f"Range: {-lo:.3f}mm interference to {hi:.3f}mm clearance {at}."
+
+
 # ---------------------------------------------------------------------------
 # SolidWorks enum / constant maps
 # ---------------------------------------------------------------------------
@@ -85,20 +109,27 @@ _COUPLING_TYPES = {
 }
 
 # ---------------------------------------------------------------------------
-# ISO fit data  (nominal ~25 mm band)
-# Format: (hole_class, shaft_class, description,
-#          hole_upper_mm, hole_lower_mm, shaft_upper_mm, shaft_lower_mm)
+# ISO fits  (limit deviations come from engineering.iso_fits)
+# Format: (hole_class, shaft_class, description)
 # ---------------------------------------------------------------------------
 
+_ISO_FITS = [
+    ("H7", "g6", "Sliding fit"),
+    ("H7", "h6", "Location clearance fit"),
+    ("H7", "k6", "Location transition fit"),
+    ("H7", "p6", "Location interference fit"),
+    ("H7", "s6", "Medium press fit"),
+    ("H8", "f7", "Close running fit"),
+    ("H9", "d9", "Free running fit"),
+    ("H11", "c11", "Loose running fit"),
+]
+
+# (hole_class, shaft_class, description,
+#  hole_upper_mm, hole_lower_mm, shaft_upper_mm, shaft_lower_mm) at 25 mm
+_FITS_25 = {f"{hc}/{sc}": evaluate_fit(25, f"{hc}/{sc}") for hc, sc, _ in _ISO_FITS}
 _ISO_FITS_25 = [
-    ("H7", "g6", "Sliding fit",              +0.021,  0.000, -0.007, -0.020),
-    ("H7", "h6", "Location clearance fit",   +0.021,  0.000,  0.000, -0.013),
-    ("H7", "k6", "Location transition fit",  +0.021,  0.000, +0.002, -0.011),
-    ("H7", "p6", "Location interference fit", +0.021, 0.000, +0.018, +0.005),
-    ("H7", "s6", "Medium press fit",         +0.021,  0.000, +0.028, +0.015),
-    ("H8", "f7", "Close running fit",        +0.033,  0.000, -0.013, -0.032),
-    ("H9", "d9", "Free running fit",         +0.052,  0.000, -0.030, -0.082),
-    ("H11", "c11", "Loose running fit",      +0.160,  0.000, -0.060, -0.220),
+    (hc, sc, desc, *_fit_deviations(_FITS_25[f"{hc}/{sc}"]))
+    for hc, sc, desc in _ISO_FITS
 ]
 
 # ---------------------------------------------------------------------------
@@ -142,6 +173,9 @@ _KEYWAY_SIZES = [
 # Standard bearing bore diameters (mm)
 _BEARING_BORES = [10, 12, 15, 17, 20, 25, 30, 35, 40, 50]
 
+# Every _ISO_FITS class evaluated at every bearing bore in one batch
+_BEARING_FITS = evaluate_fits(_BEARING_BORES, [f"{hc}/{sc}" for hc, sc, _ in _ISO_FITS])
+
 # Gear module values (mm)
 _MODULES = [0.5, 0.75, 1.0, 1.25, 1.5, 2.0, 2.5, 3.0, 4.0, 5.0]
 
@@ -151,6 +185,9 @@ _TOOTH_COUNTS = [12, 16, 18, 20, 24, 28, 32, 36, 40, 48, 60, 72]
 # Pressure angles (degrees)
 _PRESSURE_ANGLES = [14.5, 20.0, 25.0]
 
+# Spur gear geometry for every module / tooth count / pressure angle above
+_GEARS = GearGrid(_MODULES, _TOOTH_COUNTS, _PRESSURE_ANGLES)
+
 
 # ---------------------------------------------------------------------------
 # ShaftPowerTransmissionGenerator
@@ -559,7 +596,7 @@ class ShaftPowerTransmissionGenerator:
         return p
 
     # ===================================================================
-    # 3. Fits and Tolerances Pairs (~80)
+    # 3. Fits and Tolerances Pairs (~130)
     # ===================================================================
 
     def _fits_tolerance_pairs(self) -> list[tuple[str, str]]:
@@ -575,8 +612,8 @@ class ShaftPowerTransmissionGenerator:
                 dim.SystemValue = {_mm(25)};  // 25mm nominal
                 DimensionTolerance tol = dim.Tolerance;
                 tol.Type = (int){_TOL_TYPE['bilateral']};
-                tol.MaxValue = {h_upper / 1000.0};  // upper deviation in meters
-                tol.MinValue = {h_lower / 1000.0};  // lower deviation in meters
+                tol.MaxValue = {round(h_upper / 1000.0, 9)};  // upper deviation in meters
+                tol.MinValue = {round(h_lower / 1000.0, 9)};  // lower deviation in meters
                 modelDoc.EditRebuild3();""")
             p.append((
                 f"Apply {hc} hole tolerance to a 25mm bore dimension ({desc}) "
@@ -592,8 +629,8 @@ class ShaftPowerTransmissionGenerator:
                 dim.SystemValue = {_mm(25)};  // 25mm nominal
                 DimensionTolerance tol = dim.Tolerance;
                 tol.Type = (int){_TOL_TYPE['bilateral']};
-                tol.MaxValue = {s_upper / 1000.0};  // upper deviation in meters
-                tol.MinValue = {s_lower / 1000.0};  // lower deviation in meters
+                tol.MaxValue = {round(s_upper / 1000.0, 9)};  // upper deviation in meters
+                tol.MinValue = {round(s_lower / 1000.0, 9)};  // lower deviation in meters
                 modelDoc.EditRebuild3();""")
             p.append((
                 f"Apply {sc} shaft tolerance to a 25mm shaft dimension ({desc}) "
@@ -611,15 +648,15 @@ class ShaftPowerTransmissionGenerator:
                 holeDim.SystemValue = {_mm(25)};
                 DimensionTolerance holeTol = holeDim.Tolerance;
                 holeTol.Type = (int){_TOL_TYPE['bilateral']};
-                holeTol.MaxValue = {h_upper / 1000.0};
-                holeTol.MinValue = {h_lower / 1000.0};
+                holeTol.MaxValue = {round(h_upper / 1000.0, 9)};
+                holeTol.MinValue = {round(h_lower / 1000.0, 9)};
                 // -- Set shaft tolerance --
                 Dimension shaftDim = (Dimension)modelDoc.Parameter("D1@ShaftSketch");
                 shaftDim.SystemValue = {_mm(25)};
                 DimensionTolerance shaftTol = shaftDim.Tolerance;
                 shaftTol.Type = (int){_TOL_TYPE['bilateral']};
-                shaftTol.MaxValue = {s_upper / 1000.0};
-                shaftTol.MinValue = {s_lower / 1000.0};
+                shaftTol.MaxValue = {round(s_upper / 1000.0, 9)};
+                shaftTol.MinValue = {round(s_lower / 1000.0, 9)};
                 modelDoc.EditRebuild3();""")
             p.append((
                 f"Apply the complete {hc}/{sc} fit system ({desc}) to both "
@@ -698,7 +735,7 @@ class ShaftPowerTransmissionGenerator:
             "(2) Sliding gears on splined shafts. "
             "(3) Piston-in-cylinder where lubrication is provided. "
             "(4) Machine tool spindle bearings (precision sliding). "
-            "Min clearance 0.007mm, max clearance 0.041mm at 25mm nominal."
+            + _fit_range_text(_FITS_25["H7/g6"])
         ))
         p.append((
             "When should I use an H7/h6 location clearance fit?",
@@ -707,7 +744,7 @@ class ShaftPowerTransmissionGenerator:
             "(2) Bearing outer ring in housing (non-rotating ring). "
             "(3) Dowel pins in reamed holes. "
             "(4) Gear blank bores on shafts with keys. "
-            "Min clearance 0mm, max clearance 0.034mm at 25mm nominal."
+            + _fit_range_text(_FITS_25["H7/h6"])
         ))
         p.append((
             "When should I use an H7/k6 location transition fit?",
@@ -715,7 +752,7 @@ class ShaftPowerTransmissionGenerator:
             "(1) Hub-to-shaft fits where light press or hand assembly is acceptable. "
             "(2) Coupling hubs. (3) Gear bores on shafts. "
             "(4) Parts that need accurate location but not heavy press. "
-            "Range: -0.002mm interference to +0.032mm clearance at 25mm."
+            + _fit_range_text(_FITS_25["H7/k6"])
         ))
         p.append((
             "When should I use an H7/p6 location interference fit?",
@@ -724,7 +761,7 @@ class ShaftPowerTransmissionGenerator:
             "(2) Bronze bushings pressed into housings. "
             "(3) Permanent gear mounting without keys. "
             "Requires press or heating/cooling for assembly. "
-            "Interference range 0.005mm to 0.039mm at 25mm nominal."
+            + _fit_range_text(_FITS_25["H7/p6"])
         ))
         p.append((
             "When should I use an H7/s6 medium press fit?",
@@ -732,7 +769,7 @@ class ShaftPowerTransmissionGenerator:
             "(1) Bearing seats under heavy load. "
             "(2) Permanent bushings. (3) Shaft collars that must never slip. "
             "Requires hydraulic press or thermal assembly (heat housing, cool shaft). "
-            "Interference range 0.015mm to 0.049mm at 25mm nominal."
+            + _fit_range_text(_FITS_25["H7/s6"])
         ))
         p.append((
             "When should I use an H8/f7 close running fit?",
@@ -740,14 +777,14 @@ class ShaftPowerTransmissionGenerator:
             "(1) Journal bearings (plain bearings). "
             "(2) Precision rotating assemblies. (3) Gearbox shafts in cast housings. "
             "Adequate for hydrodynamic lubrication film. "
-            "Clearance range 0.013mm to 0.065mm at 25mm nominal."
+            + _fit_range_text(_FITS_25["H8/f7"])
         ))
         p.append((
             "When should I use an H9/d9 free running fit?",
             "H9/d9 free running fit: generous clearance. Use for: "
             "(1) Loose-running bearings. (2) Shafts in long bores. "
             "(3) Applications with thermal expansion. (4) Agricultural and mining equipment. "
-            "Clearance range 0.030mm to 0.134mm at 25mm nominal."
+            + _fit_range_text(_FITS_25["H9/d9"])
         ))
         p.append((
             "When should I use an H11/c11 loose running fit?",
@@ -756,9 +793,24 @@ class ShaftPowerTransmissionGenerator:
             "(2) Hinge pins with no precision requirement. "
             "(3) Large cast assemblies with poor surface finish. "
             "(4) Hot-running machinery. "
-            "Clearance range 0.060mm to 0.380mm at 25mm nominal."
+            + _fit_range_text(_FITS_25["H11/c11"])
         ))
 
+        # -- Limits and clearance of each fit at every bearing bore size --
+        for i, bore in enumerate(_BEARING_BORES):
+            for j, (hc, sc, desc) in enumerate(_ISO_FITS):
+                fit = _BEARING_FITS.result(i, j)
+                h_upper, h_lower, s_upper, s_lower = _fit_deviations(fit)
+                p.append((
+                    f"What are the ISO 286 limits of a {bore}mm {hc}/{sc} fit?",
+                    f"{bore}mm {hc}/{sc} ({desc.lower()}): "
+                    f"hole {hc} {h_upper:+.3f}/{h_lower:+.3f}mm "
+                    f"({fit.hole.min_size:.3f}-{fit.hole.max_size:.3f}mm), "
+                    f"shaft {sc} {s_upper:+.3f}/{s_lower:+.3f}mm "
+                    f"({fit.shaft.min_size:.3f}-{fit.shaft.max_size:.3f}mm). "
+                    f"{fit.fit_type.capitalize()} fit. " + _fit_range_text(fit)
+                ))
+
         # -- Read tolerance value back --
         p.append((
             "Read the tolerance values from a dimension in SolidWorks using the API.",
@@ -809,7 +861,9 @@ class ShaftPowerTransmissionGenerator:
         p: list[tuple[str, str]] = []
 
         # -- Press-fit bore for bearing outer ring --
-        for bore in _BEARING_BORES:
+        h7_k6 = _BEARING_FITS.fits.index("H7/k6")
+        for i, bore in enumerate(_BEARING_BORES):
+            h7 = _BEARING_FITS.result(i, h7_k6).hole
             code = D(f"""\
                 // Create press-fit bore for bearing (bore dia {bore}mm)
                 // H7 tolerance on housing bore for interference fit with outer ring
@@ -827,8 +881,8 @@ class ShaftPowerTransmissionGenerator:
                 Dimension boreDim = (Dimension)modelDoc.Parameter("D1@Sketch1");
                 DimensionTolerance tol = boreDim.Tolerance;
                 tol.Type = (int)swDimensionToleranceType_e.swDimTolBilateral;
-                tol.MaxValue = 0.000021;  // +0.021mm in meters
-                tol.MinValue = 0.0;       //  0.000mm
+                tol.MaxValue = {round(h7.upper_deviation / 1000.0, 9)};  // {h7.upper_deviation:+.3f}mm in meters
+                tol.MinValue = {round(h7.lower_deviation / 1000.0, 9)};  // {h7.lower_deviation:+.3f}mm
                 modelDoc.EditRebuild3();""")
             p.append((
                 f"Create a press-fit bore for a bearing with {bore}mm bore diameter "
@@ -837,10 +891,9 @@ class ShaftPowerTransmissionGenerator:
             ))
 
         # -- Bearing shaft seat (k5/k6 for rotating inner ring) --
-        for bore in _BEARING_BORES:
-            # Approximate k6 deviations scale with size
-            k6_upper = 0.002 + bore * 0.0003
-            k6_lower = -0.011 + bore * 0.0002
+        for i, bore in enumerate(_BEARING_BORES):
+            k6 = _BEARING_FITS.result(i, h7_k6).shaft
+            k6_upper, k6_lower = k6.upper_deviation, k6.lower_deviation
             code = D(f"""\
                 // Bearing shaft seat for {bore}mm bearing bore
                 // k6 tolerance for rotating inner ring press fit
@@ -848,8 +901,8 @@ class ShaftPowerTransmissionGenerator:
                 shaftDim.SystemValue = {_mm(bore)};
                 DimensionTolerance tol = shaftDim.Tolerance;
                 tol.Type = (int)swDimensionToleranceType_e.swDimTolBilateral;
-                tol.MaxValue = {k6_upper / 1000.0};
-                tol.MinValue = {k6_lower / 1000.0};
+                tol.MaxValue = {round(k6_upper / 1000.0, 9)};
+                tol.MinValue = {round(k6_lower / 1000.0, 9)};
                 modelDoc.EditRebuild3();""")
             p.append((
                 f"Apply k6 shaft tolerance for a {bore}mm bearing inner ring "
@@ -1000,7 +1053,7 @@ class ShaftPowerTransmissionGenerator:
         # -- Pitch diameter calculation --
         for m in _MODULES:
             for z in [12, 20, 32, 48]:
-                pd = m * z
+                pd = _GEARS.gear(m, z)["pitch_dia"]
                 code = D(f"""\
                     // Gear pitch diameter: module {m}mm, {z} teeth
                     // Pitch diameter = module x tooth count = {pd:.2f}mm
@@ -1017,12 +1070,13 @@ class ShaftPowerTransmissionGenerator:
         # -- Full gear geometry calculation --
         for m in [1.0, 1.5, 2.0, 2.5, 3.0, 4.0, 5.0]:
             for z in [20, 36]:
-                pd = m * z
-                addendum = 1.0 * m
-                dedendum = 1.25 * m
-                od = pd + 2 * addendum
-                root_d = pd - 2 * dedendum
-                base_d = pd * math.cos(_deg(20))
+                gear = _GEARS.gear(m, z, 20.0)
+                pd = gear["pitch_dia"]
+                addendum = ADDENDUM_COEFF * m
+                dedendum = DEDENDUM_COEFF * m
+                od = gear["outside_dia"]
+                root_d = gear["root_dia"]
+                base_d = gear["base_dia"]
                 code = D(f"""\
                     // Full spur gear geometry: module {m}mm, {z} teeth, 20-deg pressure angle
                     double mod = {_mm(m)};
@@ -1044,8 +1098,9 @@ class ShaftPowerTransmissionGenerator:
         # -- Center distance --
         for m in [1.0, 2.0, 3.0]:
             for z1, z2 in [(20, 40), (18, 36), (24, 48)]:
-                pd1, pd2 = m * z1, m * z2
-                cd = (pd1 + pd2) / 2.0
+                pd1 = _GEARS.gear(m, z1)["pitch_dia"]
+                pd2 = _GEARS.gear(m, z2)["pitch_dia"]
+                cd = float(center_distance(m, z1, z2))
                 ratio = z2 / z1
                 code = D(f"""\
                     // Gear pair center distance: module {m}mm
@@ -1065,8 +1120,9 @@ class ShaftPowerTransmissionGenerator:
         # -- Pressure angle variations --
         for pa in _PRESSURE_ANGLES:
             for m, z in [(2.0, 24), (3.0, 20)]:
-                pd = m * z
-                base_d = pd * math.cos(_deg(pa))
+                gear = _GEARS.gear(m, z, pa)
+                pd = gear["pitch_dia"]
+                base_d = gear["base_dia"]
                 code = D(f"""\
                     // Base circle for {pa}-degree pressure angle gear
                     // Module {m}mm, {z} teeth
@@ -7,9 +7,9 @@ for LLM fine-tuning.
 
 from __future__ import annotations
 
-import textwrap
 from typing import Optional
 
+from training_pipeline.code_templates import CodeTemplate
 from training_pipeline.normalizers.sketch_constraint_normalizer import (
     SketchConstraint,
 )
@@ -48,6 +48,64 @@ _ENTITY_SELECT: dict[str, str] = {
     "spline": "swSelectType_e.swSelSKETCHSEGS",
 }
 
+# ---------------------------------------------------------------------------
+# Code templates (dedented once at import)
+#
+# Rendering matches dedent of the filled-in source, and the selection and
+# tolerance values are not indented like the templates -- so the templates
+# keep the indentation of the original f-strings.
+# ---------------------------------------------------------------------------
+
+_CONSTRAINT_TEMPLATE = CodeTemplate("""\
+            // ---------------------------------------------------------
+            // Apply sketch constraint: {constraint_type}
+            //   Entity 1: {entity1_type} "{entity1_name}"
+            //   Entity 2: {entity2_type} "{entity2_name}"
+            // ---------------------------------------------------------
+
+            SketchManager sketchMgr = modelDoc.SketchManager;
+
+            // Select entities
+            {select_lines}
+
+            // Apply the constraint
+            sketchMgr.AddConstraint((int){ctype_enum});
+""")
+
+_TOLERANCE_TEMPLATE = CodeTemplate("""\
+
+    // Apply bilateral tolerance
+    DisplayDimension dispDim = (DisplayDimension)dim;
+    DimensionTolerance tolObj = dispDim.GetTolerance();
+    tolObj.Type = (int)swDimensionToleranceType_e.swDimTolBilateral;
+    tolObj.MaxValue = {tolerance_plus};
+    tolObj.MinValue = {tolerance_minus};
+""")
+
+_DIMENSION_TEMPLATE = CodeTemplate("""\
+            // ---------------------------------------------------------
+            // Add {dim_type} dimension to "{entity_name}": {value}
+            // ---------------------------------------------------------
+
+            // Select the target entity
+            bool selOk = modelDoc.Extension.SelectByID2(
+                "{entity_name}",
+                "SKETCHSEGMENT",
+                0, 0, 0,
+                false, 0, null, 0
+            );
+
+            // Create the dimension
+            Dimension dim = (Dimension)modelDoc.{method}(0, 0, 0);
+            if (dim != null)
+            {{
+                dim.SystemValue = {value};
+                {tol_code}
+            }}
+
+            modelDoc.ClearSelection2(true);
+""")
+
 
 class SketchCodeGenerator:
     """Generates SolidWorks-API C# code for sketch constraints and dimensions.
@@ -101,22 +159,15 @@ class SketchCodeGenerator:
                 append=True,
             )
 
-        code = textwrap.dedent(f"""\
-            // ---------------------------------------------------------
-            // Apply sketch constraint: {constraint.constraint_type}
-            //   Entity 1: {constraint.entity1_type} "{constraint.entity1_name}"
-            //   Entity 2: {constraint.entity2_type or 'N/A'} "{constraint.entity2_name or 'N/A'}"
-            // ---------------------------------------------------------
-
-            SketchManager sketchMgr = modelDoc.SketchManager;
-
-            // Select entities
-            {select_lines}
-
-            // Apply the constraint
-            sketchMgr.AddConstraint((int){ctype_enum});
-        """)
-        return code
+        return _CONSTRAINT_TEMPLATE(
+            constraint_type=constraint.constraint_type,
+            entity1_type=constraint.entity1_type,
+            entity1_name=constraint.entity1_name,
+            entity2_type=constraint.entity2_type or "N/A",
+            entity2_name=constraint.entity2_name or "N/A",
+            select_lines=select_lines,
+            ctype_enum=ctype_enum,
+        )
 
     def generate_dimension(
         self,
@@ -144,40 +195,18 @@ class SketchCodeGenerator:
 
         tol_code = ""
         if tolerance_plus is not None and tolerance_minus is not None:
-            tol_code = textwrap.dedent(f"""\
-
-                // Apply bilateral tolerance
-                DisplayDimension dispDim = (DisplayDimension)dim;
-                DimensionTolerance tolObj = dispDim.GetTolerance();
-                tolObj.Type = (int)swDimensionToleranceType_e.swDimTolBilateral;
-                tolObj.MaxValue = {tolerance_plus};
-                tolObj.MinValue = {abs(tolerance_minus)};
-            """)
-
-        code = textwrap.dedent(f"""\
-            // ---------------------------------------------------------
-            // Add {dim_type} dimension to "{entity_name}": {value}
-            // ---------------------------------------------------------
-
-            // Select the target entity
-            bool selOk = modelDoc.Extension.SelectByID2(
-                "{entity_name}",
-                "SKETCHSEGMENT",
-                0, 0, 0,
-                false, 0, null, 0
-            );
-
-            // Create the dimension
-            Dimension dim = (Dimension)modelDoc.{method}(0, 0, 0);
-            if (dim != null)
-            {{
-                dim.SystemValue = {value};
-                {tol_code}
-            }}
+            tol_code = _TOLERANCE_TEMPLATE(
+                tolerance_plus=tolerance_plus,
+                tolerance_minus=abs(tolerance_minus),
+            )
 
-            modelDoc.ClearSelection2(true);
-        """)
-        return code
+        return _DIMENSION_TEMPLATE(
+            dim_type=dim_type,
+            entity_name=entity_name,
+            value=value,
+            method=method,
+            tol_code=tol_code,
+        )
 
     def generate_training_pair(
         self, constraint: SketchConstraint
@@ -0,0 +1,214 @@
+"""Per-stage instrumentation for the training data pipeline.
+
+Measures wall time, CPU time, peak RSS growth, optional Python heap peak
+(``tracemalloc``), throughput and output size for every stage, optionally
+dumps a ``cProfile`` stats file per stage, and writes a machine-readable
+JSON run report next to the exported dataset.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None  # type: ignore[assignment]
+
+
+@dataclass
+class StageMetrics:
+    """Resource usage and throughput of one pipeline stage.
+
+    Attributes:
+        name: Stage name (registry key).
+        status: ``"ok"`` or ``"failed"``.
+        pairs: Number of training pairs produced.
+        wall_s: Elapsed wall-clock seconds.
+        cpu_s: CPU seconds (user + system) of the process and of every
+               worker process the stage started and joined (workers are
+               counted only where ``resource`` is available).
+        peak_rss_delta_kb: Growth of the process peak RSS during the stage
+                           (``None`` where ``resource`` is unavailable).
+        worker_peak_rss_kb: Peak RSS of the largest worker process joined so
+                            far in the run, if the stage joined any; an upper
+                            bound when an earlier stage had a larger worker.
+        py_peak_alloc_kb: Peak traced Python allocation during the stage
+                          (only with ``trace_memory``).
+        output_bytes: UTF-8 size of all instruction + output strings.
+        profile_path: Path of the ``.pstats`` dump, if profiled.
+        error: Exception message for failed stages.
+    """
+
+    name: str
+    status: str = "ok"
+    pairs: int = 0
+    wall_s: float = 0.0
+    cpu_s: float = 0.0
+    peak_rss_delta_kb: Optional[int] = None
+    worker_peak_rss_kb: Optional[int] = None
+    py_peak_alloc_kb: Optional[int] = None
+    output_bytes: int = 0
+    profile_path: Optional[str] = None
+    error: Optional[str] = None
+
+    @property
+    def pairs_per_s(self) -> float:
+        """Pairs produced per wall-clock second."""
+        return self.pairs / self.wall_s if self.wall_s > 0 else 0.0
+
+    def record(self, pairs: list[tuple[str, str]]) -> None:
+        """Record the pairs a stage produced."""
+        self.pairs = len(pairs)
+        self.output_bytes = sum(
+            len(instruction.encode("utf-8")) + len(output.encode("utf-8"))
+            for instruction, output in pairs
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialise for the JSON run report."""
+        data = asdict(self)
+        data["wall_s"] = round(self.wall_s, 6)
+        data["cpu_s"] = round(self.cpu_s, 6)
+        data["pairs_per_s"] = round(self.pairs_per_s, 1)
+        return data
+
+
+def _rss_kb(maxrss: int) -> int:
+    # ru_maxrss is bytes on macOS, KiB on Linux
+    return maxrss // 1024 if sys.platform == "darwin" else maxrss
+
+
+def _max_rss_kb() -> Optional[int]:
+    """Return the process peak RSS in KiB, or ``None`` if unsupported."""
+    if resource is None:
+        return None
+    return _rss_kb(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+
+
+def _children_usage() -> tuple[float, Optional[int]]:
+    """CPU seconds and largest peak RSS (KiB) of all joined child processes.
+
+    Children count once they have exited and been waited for, e.g. the
+    workers of a ``ProcessPoolExecutor`` after its ``with`` block.
+    """
+    if resource is None:
+        return 0.0, None
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime, _rss_kb(usage.ru_maxrss)
+
+
+@contextmanager
+def measure_stage(
+    name: str,
+    *,
+    trace_memory: bool = False,
+    profile_path: Optional[Path] = None,
+) -> Iterator[StageMetrics]:
+    """Measure the enclosed block as pipeline stage *name*.
+
+    The yielded ``StageMetrics`` is completed on exit; call
+    ``metrics.record(pairs)`` inside the block.  Exceptions propagate after
+    the metrics are marked ``failed``.
+
+    Args:
+        name: Stage name.
+        trace_memory: Also trace the Python heap peak with ``tracemalloc``
+                      (adds noticeable overhead).
+        profile_path: If set, run the block under ``cProfile`` and dump
+                      the stats to this path.
+    """
+    metrics = StageMetrics(name=name)
+    rss_before = _max_rss_kb()
+    child_cpu_before, child_rss_before = _children_usage()
+    if trace_memory:
+        tracemalloc.start()
+    profiler = cProfile.Profile() if profile_path is not None else None
+
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    if profiler is not None:
+        profiler.enable()
+    try:
+        yield metrics
+    except Exception as exc:
+        metrics.status = "failed"
+        metrics.error = str(exc)
+        raise
+    finally:
+        if profiler is not None:
+            profiler.disable()
+        metrics.wall_s = time.perf_counter() - wall_start
+        child_cpu, child_rss = _children_usage()
+        metrics.cpu_s = time.process_time() - cpu_start + (child_cpu - child_cpu_before)
+        if child_cpu > child_cpu_before or child_rss != child_rss_before:
+            metrics.worker_peak_rss_kb = child_rss
+
+        if trace_memory:
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            metrics.py_peak_alloc_kb = peak // 1024
+
+        rss_after = _max_rss_kb()
+        if rss_before is not None and rss_after is not None:
+            metrics.peak_rss_delta_kb = rss_after - rss_before
+
+        if profiler is not None:
+            profile_path.parent.mkdir(parents=True, exist_ok=True)
+            profiler.dump_stats(str(profile_path))
+            metrics.profile_path = str(profile_path)
+
+
+def write_run_report(
+    path: Path,
+    stages: list[StageMetrics],
+    config: dict[str, Any],
+    exports: dict[str, Path],
+) -> dict[str, Any]:
+    """Write the JSON run report and return its contents.
+
+    Args:
+        path: Destination JSON file.
+        stages: Metrics for every stage that ran, in execution order.
+        config: Pipeline settings worth recording (seed, selection, ...).
+        exports: Label -> path of every file the run exported.
+    """
+    wall = sum(s.wall_s for s in stages)
+    pairs = sum(s.pairs for s in stages)
+    report: dict[str, Any] = {
+        "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "config": config,
+        "totals": {
+            "pairs": pairs,
+            "wall_s": round(wall, 6),
+            "cpu_s": round(sum(s.cpu_s for s in stages), 6),
+            "worker_peak_rss_kb": max(
+                (s.worker_peak_rss_kb for s in stages if s.worker_peak_rss_kb is not None),
+                default=None,
+            ),
+            "output_bytes": sum(s.output_bytes for s in stages),
+            "pairs_per_s": round(pairs / wall, 1) if wall > 0 else 0.0,
+            "failed_stages": [s.name for s in stages if s.status != "ok"],
+        },
+        "stages": [s.to_dict() for s in stages],
+        "exports": {
+            label: {"path": str(p), "bytes": p.stat().st_size}
+            for label, p in exports.items()
+            if p.exists()
+        },
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    return report
@@ -0,0 +1,73 @@
+"""Memoised, optionally process-parallel parsing for the normalizers.
+
+Both normalizers parse free text into plain tuples with a module-level
+``_parse`` function that raises ``ValueError`` on bad input.  A
+``MemoizedParser`` wraps such a function: results (and failure messages)
+are cached per distinct string, and very large batches can be spread over
+a process pool.
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, Generic, Optional, TypeVar, Union
+
+T = TypeVar("T")
+
+# Parsers by parse function.  Worker processes receive the (picklable)
+# module-level function; importing its module registers the parser there.
+_PARSERS: dict[Callable[[str], Any], MemoizedParser[Any]] = {}
+
+
+class MemoizedParser(Generic[T]):
+    """Memoised bulk front end for a ``str -> T`` parse function.
+
+    Args:
+        parse: Module-level parse function; raises ``ValueError`` for input
+               it cannot parse.
+        memo_size: Distinct strings kept in the memo.
+        parallel_min_items: Batches at least this large are split across a
+                            process pool when ``parse_many`` gets *workers*.
+    """
+
+    def __init__(
+        self, parse: Callable[[str], T], memo_size: int, parallel_min_items: int
+    ) -> None:
+        self.parse = parse
+        self.parallel_min_items = parallel_min_items
+        self.cached: Callable[[str], Union[T, str]] = lru_cache(maxsize=memo_size)(
+            self._parse_or_error
+        )
+        _PARSERS[parse] = self
+
+    def _parse_or_error(self, raw: str) -> Union[T, str]:
+        """``parse``, with a failure returned as its error text."""
+        try:
+            return self.parse(raw)
+        except ValueError as exc:
+            return str(exc)
+
+    def parse_many(self, items: list[str], workers: Optional[int] = None) -> list[Union[T, str]]:
+        """Memoised parse of every item, in order; failures are error texts.
+
+        Args:
+            items: Strings to parse.
+            workers: Process count for batches of at least
+                     ``parallel_min_items`` strings (``0`` = CPU count).
+                     ``None`` parses in-process.
+        """
+        if workers is None or len(items) < self.parallel_min_items:
+            return [self.cached(raw) for raw in items]
+        workers = workers or os.cpu_count() or 1
+        chunk = -(-len(items) // (workers * 4))
+        chunks = [items[i : i + chunk] for i in range(0, len(items), chunk)]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = pool.map(_parse_chunk, [self.parse] * len(chunks), chunks)
+            return [result for part in parts for result in part]
+
+
+def _parse_chunk(parse: Callable[[str], Any], items: list[str]) -> list[Any]:
+    """Worker-process entry point for ``MemoizedParser.parse_many``."""
+    return _PARSERS[parse].parse_many(items)
@@ -3,11 +3,19 @@
 Parses raw GD&T specification strings into structured dataclasses and
 validates them against ASME Y14.5 rules. Provides virtual condition
 calculation for MMC/LMC modifiers.
+
+Batch use (bulk import of drawing callouts) goes through ``normalize_many``
+/ ``validate_many``: well-formed frames are parsed by a single precompiled
+regex pass, results are memoised per distinct string, and very large
+batches can be spread over a process pool.
 """
 
 import re
 from dataclasses import dataclass, field
-from typing import Optional
+from functools import lru_cache
+from typing import Iterable, Optional, Sequence
+
+from training_pipeline.normalizers.bulk_parse import MemoizedParser
 
 
 @dataclass
@@ -79,10 +87,45 @@ ALL_CHARACTERISTICS = (
     | PROFILE_TOLERANCES
 )
 
+# Characteristics that must / must not reference datums (validation)
+_DATUM_REQUIRED = ORIENTATION_TOLERANCES | LOCATION_TOLERANCES | RUNOUT_TOLERANCES
+_RFS_ONLY = frozenset({"concentricity", "symmetry"})
+
+# Common aliases for characteristic names (first token, lower-cased,
+# hyphens replaced by underscores)
+_CHARACTERISTIC_ALIASES: dict[str, str] = {
+    "true_position": "position",
+    "true position": "position",
+    "gd&t_position": "position",
+    "perpendicular": "perpendicularity",
+    "parallel": "parallelism",
+    "circular_run_out": "circular_runout",
+    "total_run_out": "total_runout",
+}
+
 # Regex helpers
 _MODIFIER_PATTERN = re.compile(r"\b(MMC|LMC|RFS)\b", re.IGNORECASE)
 _TOLERANCE_PATTERN = re.compile(r"(\d+\.?\d*)")
 _DATUM_SPLIT = re.compile(r"[|,\s]+")
+_DIA_PATTERN = re.compile(r"\bDIA\b", re.IGNORECASE)
+_DATUM_TOKEN = re.compile(r"([A-Z])(?:\((M|L)\))?", re.IGNORECASE)
+
+# Single-pass parser for the canonical frame layout
+#   <characteristic> [DIA] <tolerance> [MMC|LMC|RFS] [datum [(M|L)] ...]
+# Anything else falls back to the step-by-step extraction, which gives the
+# same result for canonical input.
+_CANONICAL_FRAME = re.compile(
+    r"\s*(?P<char>(?!(?:dia|mmc|lmc|rfs)\s)[a-z_&\-]{2,})"
+    r"\s+(?:(?P<dia>DIA)\s+)?"
+    r"(?P<tol>\d+\.?\d*)"
+    r"(?:\s+(?P<mod>MMC|LMC|RFS))?"
+    r"(?P<datums>(?:[|,\s]+[A-Z](?:\([ML]\))?)*)"
+    r"[|,\s]*",
+    re.IGNORECASE,
+)
+
+# (characteristic, tolerance, zone shape, modifier, ((label, modifier, order), ...))
+_ParsedFrame = tuple[str, float, str, Optional[str], tuple[tuple[str, Optional[str], int], ...]]
 
 
 class GDTNormalizer:
@@ -113,42 +156,45 @@ class GDTNormalizer:
             ValueError: If the characteristic name or tolerance value
                         cannot be identified.
         """
-        text = raw_input.strip()
-
-        # -- characteristic (first token) --------------------------------
-        characteristic = self._extract_characteristic(text)
-
-        # -- tolerance zone shape ----------------------------------------
-        tolerance_zone_shape = "total"
-        if re.search(r"\bDIA\b", text, re.IGNORECASE):
-            tolerance_zone_shape = "cylindrical"
-            text = re.sub(r"\bDIA\b", "", text, flags=re.IGNORECASE)
-
-        # -- material modifier on tolerance ------------------------------
-        modifier_match = _MODIFIER_PATTERN.search(text)
-        material_modifier: Optional[str] = None
-        if modifier_match:
-            mod = modifier_match.group(1).upper()
-            material_modifier = mod if mod != "RFS" else None
-            text = text[: modifier_match.start()] + text[modifier_match.end() :]
-
-        # -- tolerance value ---------------------------------------------
-        tolerance_value = self._extract_tolerance(text, characteristic)
-
-        # -- datum references (everything after tolerance value) ----------
-        datum_references = self._extract_datums(text, characteristic, tolerance_value)
-
-        # -- applies_to heuristic ----------------------------------------
-        applies_to = "axis" if tolerance_zone_shape == "cylindrical" else "surface"
-
-        return GDTSpecification(
-            characteristic=characteristic,
-            tolerance_value=tolerance_value,
-            tolerance_zone_shape=tolerance_zone_shape,
-            datum_references=datum_references,
-            material_modifier=material_modifier,
-            applies_to=applies_to,
-        )
+        parsed = _PARSER.cached(raw_input)
+        if isinstance(parsed, str):
+            raise ValueError(parsed)
+        return _build_specification(parsed)
+
+    def normalize_many(
+        self,
+        raw_inputs: Iterable[str],
+        *,
+        strict: bool = False,
+        workers: Optional[int] = None,
+    ) -> list[Optional[GDTSpecification]]:
+        """Parse many GD&T strings.
+
+        Args:
+            raw_inputs: GD&T strings, e.g. legacy drawing callouts.
+            strict: Raise on the first unparseable string instead of
+                    returning ``None`` for it.
+            workers: Process count for batches of at least 50,000
+                     strings (``0`` = CPU count).
+                     ``None`` parses in-process.
+
+        Returns:
+            One ``GDTSpecification`` (or ``None``) per input, in order.
+
+        Raises:
+            ValueError: In strict mode, for the first unparseable string.
+        """
+        parsed = _PARSER.parse_many(list(raw_inputs), workers)
+
+        results: list[Optional[GDTSpecification]] = []
+        for frame in parsed:
+            if isinstance(frame, str):
+                if strict:
+                    raise ValueError(frame)
+                results.append(None)
+            else:
+                results.append(_build_specification(frame))
+        return results
 
     def validate_specification(self, spec: GDTSpecification) -> list[str]:
         """Validate a GDTSpecification against ASME Y14.5 rules.
@@ -173,20 +219,19 @@ class GDTNormalizer:
             )
 
         # Rule 3 -- orientation and location tolerances MUST reference datums
-        if spec.characteristic in (ORIENTATION_TOLERANCES | LOCATION_TOLERANCES):
-            if not spec.datum_references:
+        # Rule 4 -- runout tolerances MUST reference datums
+        if spec.characteristic in _DATUM_REQUIRED and not spec.datum_references:
+            if spec.characteristic in RUNOUT_TOLERANCES:
+                errors.append(
+                    f"Runout tolerance '{spec.characteristic}' requires at least one datum reference."
+                )
+            else:
                 errors.append(
                     f"'{spec.characteristic}' requires at least one datum reference."
                 )
 
-        # Rule 4 -- runout tolerances MUST reference datums
-        if spec.characteristic in RUNOUT_TOLERANCES and not spec.datum_references:
-            errors.append(
-                f"Runout tolerance '{spec.characteristic}' requires at least one datum reference."
-            )
-
         # Rule 5 -- concentricity and symmetry only allow RFS (no MMC/LMC)
-        if spec.characteristic in {"concentricity", "symmetry"}:
+        if spec.characteristic in _RFS_ONLY:
             if spec.material_modifier is not None:
                 errors.append(
                     f"'{spec.characteristic}' only allows RFS (no material modifier)."
@@ -201,8 +246,29 @@ class GDTNormalizer:
         if spec.characteristic not in ALL_CHARACTERISTICS:
             errors.append(f"Unrecognized characteristic: '{spec.characteristic}'.")
 
+        # Rule 7 -- each datum is referenced at most once per frame
+        labels = [dr.label for dr in spec.datum_references]
+        for label in dict.fromkeys(labels):
+            if labels.count(label) > 1:
+                errors.append(f"Datum '{label}' is referenced more than once.")
+
         return errors
 
+    def validate_many(
+        self, specs: Sequence[Optional[GDTSpecification]]
+    ) -> list[list[str]]:
+        """Validate many specifications (e.g. the output of ``normalize_many``).
+
+        Returns:
+            One error list per specification, in order.  ``None`` entries
+            (unparseable inputs) get a single parse error.
+        """
+        return [
+            ["Specification could not be parsed."] if spec is None
+            else self.validate_specification(spec)
+            for spec in specs
+        ]
+
     def calculate_virtual_condition(
         self,
         spec: GDTSpecification,
@@ -247,17 +313,7 @@ class GDTNormalizer:
     def _extract_characteristic(text: str) -> str:
         """Return the normalised characteristic name from *text*."""
         first_token = text.split()[0].lower().replace("-", "_")
-        # Allow common aliases
-        aliases: dict[str, str] = {
-            "true_position": "position",
-            "true position": "position",
-            "gd&t_position": "position",
-            "perpendicular": "perpendicularity",
-            "parallel": "parallelism",
-            "circular_run_out": "circular_runout",
-            "total_run_out": "total_runout",
-        }
-        return aliases.get(first_token, first_token)
+        return _CHARACTERISTIC_ALIASES.get(first_token, first_token)
 
     @staticmethod
     def _extract_tolerance(text: str, characteristic: str) -> float:
@@ -287,7 +343,7 @@ class GDTNormalizer:
             if not token:
                 continue
             # Accept single uppercase letter, optionally followed by (M) or (L)
-            m = re.match(r"^([A-Z])(?:\((M|L)\))?$", token, re.IGNORECASE)
+            m = _DATUM_TOKEN.fullmatch(token)
             if m:
                 label = m.group(1).upper()
                 mod = None
@@ -297,3 +353,101 @@ class GDTNormalizer:
                 order += 1
 
         return datums
+
+
+# ---------------------------------------------------------------------------
+# Parsing core (module level so it can be memoised and run in worker processes)
+# ---------------------------------------------------------------------------
+
+def _parse(raw_input: str) -> _ParsedFrame:
+    """Parse *raw_input* into a plain tuple.
+
+    Raises:
+        ValueError: If the characteristic or tolerance value is missing.
+    """
+    m = _CANONICAL_FRAME.fullmatch(raw_input)
+    if m is not None:
+        char, dia, tol, mod, datums = m.groups()
+        # "x-dia" style names contain a DIA/modifier word at a hyphen or
+        # ampersand boundary; the stepwise parser treats those as such.
+        if ("-" not in char and "&" not in char) or not (
+            _DIA_PATTERN.search(char) or _MODIFIER_PATTERN.search(char)
+        ):
+            first = char.lower().replace("-", "_")
+            mod = mod.upper() if mod else None
+            return (
+                _CHARACTERISTIC_ALIASES.get(first, first),
+                float(tol),
+                "cylindrical" if dia else "total",
+                mod if mod != "RFS" else None,
+                _parse_datums(datums),
+            )
+    return _parse_stepwise(raw_input)
+
+
+def _parse_stepwise(raw_input: str) -> _ParsedFrame:
+    """General parser for free-form strings the canonical pass rejects."""
+    text = raw_input.strip()
+    if not text:
+        raise ValueError("Empty GD&T specification.")
+
+    # -- characteristic (first token) --------------------------------
+    characteristic = GDTNormalizer._extract_characteristic(text)
+
+    # -- tolerance zone shape ----------------------------------------
+    tolerance_zone_shape = "total"
+    if _DIA_PATTERN.search(text):
+        tolerance_zone_shape = "cylindrical"
+        text = _DIA_PATTERN.sub("", text)
+
+    # -- material modifier on tolerance ------------------------------
+    modifier_match = _MODIFIER_PATTERN.search(text)
+    material_modifier: Optional[str] = None
+    if modifier_match:
+        mod = modifier_match.group(1).upper()
+        material_modifier = mod if mod != "RFS" else None
+        text = text[: modifier_match.start()] + text[modifier_match.end() :]
+
+    # -- tolerance value ---------------------------------------------
+    tolerance_value = GDTNormalizer._extract_tolerance(text, characteristic)
+
+    # -- datum references (everything after tolerance value) ----------
+    datums = GDTNormalizer._extract_datums(text, characteristic, tolerance_value)
+
+    return (
+        characteristic,
+        tolerance_value,
+        tolerance_zone_shape,
+        material_modifier,
+        tuple((d.label, d.modifier, d.order) for d in datums),
+    )
+
+
+@lru_cache(maxsize=4096)
+def _parse_datums(text: str) -> tuple[tuple[str, Optional[str], int], ...]:
+    """Datum tuples from the datum section of a canonical frame."""
+    return tuple(
+        (label.upper(), None if not flag else "MMC" if flag in "Mm" else "LMC", order)
+        for order, (label, flag) in enumerate(_DATUM_TOKEN.findall(text), 1)
+    )
+
+
+# Memoised per distinct input string; normalize_many batches of 50,000 or
+# more can use a process pool
+_PARSER: MemoizedParser[_ParsedFrame] = MemoizedParser(
+    _parse, memo_size=1 << 18, parallel_min_items=50_000
+)
+
+
+def _build_specification(parsed: _ParsedFrame) -> GDTSpecification:
+    """Fresh (mutable) specification from a cached parse tuple."""
+    characteristic, tolerance_value, shape, modifier, datums = parsed
+    # Positional arguments: this runs once per item in normalize_many.
+    return GDTSpecification(
+        characteristic,
+        tolerance_value,
+        shape,
+        [DatumReference(*datum) for datum in datums] if datums else [],
+        modifier,
+        "axis" if shape == "cylindrical" else "surface",
+    )
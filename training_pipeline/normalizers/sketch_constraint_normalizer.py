@@ -1,13 +1,22 @@
 """Sketch constraint normalizer.
 
 Parses natural-language sketch constraint descriptions into structured
-``SketchConstraint`` dataclasses and performs basic degrees-of-freedom
-analysis for fully-defined sketch checks.
+``SketchConstraint`` dataclasses and checks whether they fully define a
+sketch (numeric Jacobian rank, see ``engineering.sketch_dof``).
+
+``normalize_many`` / ``validate_many`` handle bulk input: parses are
+memoised per distinct string and very large batches can be spread over a
+process pool.
 """
 
 import re
 from dataclasses import dataclass
-from typing import Optional
+from typing import TYPE_CHECKING, Iterable, Optional, Sequence
+
+from training_pipeline.normalizers.bulk_parse import MemoizedParser
+
+if TYPE_CHECKING:
+    from engineering.sketch_dof import SketchEntity
 
 
 @dataclass
@@ -36,7 +45,8 @@ class SketchConstraint:
 
 
 # ---------------------------------------------------------------------------
-# Degrees of freedom consumed per constraint type
+# Nominal degrees of freedom consumed per constraint type (also the set of
+# recognised types; ``check_fully_defined`` computes the real count)
 # ---------------------------------------------------------------------------
 
 _DOF_MAP: dict[str, int] = {
@@ -58,6 +68,20 @@ _DOF_MAP: dict[str, int] = {
     "diameter": 1,
 }
 
+# Constraint kinds by arity (validation)
+_DIMENSION_TYPES = frozenset({"distance", "angle", "radius", "diameter"})
+_BINARY_TYPES = frozenset({
+    "perpendicular", "parallel", "tangent", "coincident", "concentric",
+    "equal", "collinear", "symmetric", "midpoint",
+})
+_UNARY_TYPES = frozenset({"horizontal", "vertical", "fixed"})
+_ENTITY_TYPES = frozenset({"line", "arc", "circle", "point", "spline"})
+
+# (ctype, entity1_type, entity1_name, entity2_type, entity2_name, value)
+_ParsedConstraint = tuple[
+    str, str, str, Optional[str], Optional[str], Optional[float]
+]
+
 # ---------------------------------------------------------------------------
 # Regex patterns for common natural-language constraint phrases
 # ---------------------------------------------------------------------------
@@ -115,74 +139,214 @@ class SketchConstraintNormalizer:
             ValueError: If the string cannot be parsed into any
                         recognised pattern.
         """
-        text = raw.strip()
-
-        # Try dimensional pattern first (most specific)
-        m = _DIM_PATTERN.search(text)
-        if m:
-            return SketchConstraint(
-                constraint_type=m.group("ctype").lower(),
-                entity1_type=m.group("e1_type").lower(),
-                entity1_name=m.group("e1_name"),
-                entity2_type=m.group("e2_type").lower() if m.group("e2_type") else None,
-                entity2_name=m.group("e2_name") if m.group("e2_name") else None,
-                value=float(m.group("value")),
-            )
-
-        # Try binary geometric constraint
-        m = _BINARY_PATTERN.search(text)
-        if m:
-            return SketchConstraint(
-                constraint_type=m.group("ctype").lower(),
-                entity1_type=m.group("e1_type").lower(),
-                entity1_name=m.group("e1_name"),
-                entity2_type=m.group("e2_type").lower(),
-                entity2_name=m.group("e2_name"),
-            )
-
-        # Try unary geometric constraint
-        m = _UNARY_PATTERN.search(text)
-        if m:
-            return SketchConstraint(
-                constraint_type=m.group("ctype").lower(),
-                entity1_type=m.group("e1_type").lower(),
-                entity1_name=m.group("e1_name"),
-            )
-
-        raise ValueError(f"Unable to parse sketch constraint: '{raw}'")
+        parsed = _PARSER.cached(raw)
+        if isinstance(parsed, str):
+            raise ValueError(parsed)
+        return _build_constraint(parsed)
+
+    def normalize_many(
+        self,
+        raws: Iterable[str],
+        *,
+        strict: bool = False,
+        workers: Optional[int] = None,
+    ) -> list[Optional[SketchConstraint]]:
+        """Parse many constraint descriptions.
+
+        Args:
+            raws: Natural-language constraint strings.
+            strict: Raise on the first unparseable string instead of
+                    returning ``None`` for it.
+            workers: Process count for batches of at least 20,000
+                     strings (``0`` = CPU count).
+                     ``None`` parses in-process.
+
+        Returns:
+            One ``SketchConstraint`` (or ``None``) per input, in order.
+
+        Raises:
+            ValueError: In strict mode, for the first unparseable string.
+        """
+        parsed = _PARSER.parse_many(list(raws), workers)
+
+        results: list[Optional[SketchConstraint]] = []
+        for fields in parsed:
+            if isinstance(fields, str):
+                if strict:
+                    raise ValueError(fields)
+                results.append(None)
+            else:
+                results.append(_build_constraint(fields))
+        return results
+
+    @staticmethod
+    def validate_constraint(constraint: SketchConstraint) -> list[str]:
+        """Check a constraint for internal consistency.
+
+        Returns:
+            A list of human-readable error strings; empty when valid.
+        """
+        errors: list[str] = []
+        ctype = constraint.constraint_type
+
+        if ctype not in _DOF_MAP:
+            errors.append(f"Unrecognized constraint type: '{ctype}'.")
+        if constraint.entity1_type not in _ENTITY_TYPES:
+            errors.append(f"Unrecognized entity type: '{constraint.entity1_type}'.")
+
+        if ctype in _BINARY_TYPES:
+            if not constraint.entity2_name:
+                errors.append(f"'{ctype}' requires a second entity.")
+            elif (
+                constraint.entity2_name == constraint.entity1_name
+                and constraint.entity2_type == constraint.entity1_type
+            ):
+                errors.append(
+                    f"'{ctype}' cannot relate {constraint.entity1_type} "
+                    f"'{constraint.entity1_name}' to itself."
+                )
+        elif ctype in _UNARY_TYPES and constraint.entity2_name:
+            errors.append(f"'{ctype}' applies to a single entity.")
+
+        if ctype in _DIMENSION_TYPES:
+            if constraint.value is None:
+                errors.append(f"'{ctype}' dimension requires a value.")
+            elif constraint.value <= 0 and ctype != "angle":
+                errors.append(f"'{ctype}' dimension must be positive.")
+            elif ctype == "angle" and not 0 < constraint.value < 360:
+                errors.append("Angle dimension must be between 0 and 360 degrees.")
+        elif constraint.value is not None:
+            errors.append(f"'{ctype}' relation does not take a value.")
+
+        return errors
+
+    def validate_many(
+        self, constraints: Sequence[Optional[SketchConstraint]]
+    ) -> list[list[str]]:
+        """Validate many constraints (e.g. the output of ``normalize_many``).
+
+        Returns:
+            One error list per constraint, in order.  ``None`` entries
+            (unparseable inputs) get a single parse error.
+        """
+        return [
+            ["Constraint could not be parsed."] if c is None
+            else self.validate_constraint(c)
+            for c in constraints
+        ]
 
     @staticmethod
     def check_fully_defined(
         constraints: list[SketchConstraint],
-        entity_count: int,
+        entity_count: Optional[int] = None,
+        entities: Optional[Sequence["SketchEntity"]] = None,
     ) -> dict:
-        """Estimate whether a set of constraints fully defines a sketch.
+        """Decide whether a set of constraints fully defines a sketch.
 
-        Each 2-D sketch entity starts with a certain number of degrees of
-        freedom (DOF). Constraints remove DOF. When the remaining DOF
-        reaches zero the sketch is fully defined.
-
-        This is a simplified heuristic -- the real solver in SolidWorks
-        considers redundancy, dependency, and geometric context.
+        Builds the constraint Jacobian (``engineering.sketch_dof``) with
+        the true DOF of every entity (point 2, line 4, circle 3, arc 5)
+        and takes its rank, so redundant constraints do not count twice.
 
         Args:
-            constraints: All constraints applied to the sketch.
-            entity_count: Number of independent sketch entities.
+            constraints: All constraints applied to the sketch, in order.
+            entity_count: Number of sketch entities; entities beyond those
+                          the constraints name are unconstrained points
+                          (2 DOF each).
+            entities: Entity geometry.  Without it the entities are
+                      inferred from the constraints at generic positions
+                      and conflicts are not reported.
 
         Returns:
             A dict with keys:
                 - ``is_fully_defined`` (bool)
-                - ``dof_remaining`` (int) -- estimated remaining DOF
-        """
-        # Simple model: each entity contributes 2 DOF (translation in x, y).
-        total_dof = entity_count * 2
+                - ``dof_remaining`` (int) -- exact remaining DOF
+                - ``redundant`` (list[int]) -- redundant constraint indices
+                - ``conflicting`` (list[int]) -- conflicting constraint indices
 
-        consumed = 0
-        for c in constraints:
-            consumed += _DOF_MAP.get(c.constraint_type, 1)
+        Raises:
+            ValueError: If a constraint names an unknown entity or relates
+                        entities it cannot constrain.
+        """
+        from engineering.sketch_dof import analyze_sketch, infer_entities
 
-        remaining = max(total_dof - consumed, 0)
+        result = analyze_sketch(constraints, entities)
+        named = len(entities) if entities is not None else len(infer_entities(constraints))
+        remaining = result.dof + 2 * max((entity_count or 0) - named, 0)
         return {
-            "is_fully_defined": remaining == 0,
+            "is_fully_defined": remaining == 0 and not result.conflicting,
             "dof_remaining": remaining,
+            "redundant": result.redundant,
+            "conflicting": result.conflicting,
         }
+
+
+# ---------------------------------------------------------------------------
+# Parsing core (module level so it can be memoised and run in worker processes)
+# ---------------------------------------------------------------------------
+
+def _parse(raw: str) -> _ParsedConstraint:
+    """Parse *raw* into a plain tuple of ``SketchConstraint`` fields.
+
+    Raises:
+        ValueError: If no pattern matches.
+    """
+    text = raw.strip()
+
+    # Try dimensional pattern first (most specific)
+    m = _DIM_PATTERN.search(text)
+    if m:
+        e2_type = m.group("e2_type")
+        return (
+            m.group("ctype").lower(),
+            m.group("e1_type").lower(),
+            m.group("e1_name"),
+            e2_type.lower() if e2_type else None,
+            m.group("e2_name") or None,
+            float(m.group("value")),
+        )
+
+    # Try binary geometric constraint
+    m = _BINARY_PATTERN.search(text)
+    if m:
+        return (
+            m.group("ctype").lower(),
+            m.group("e1_type").lower(),
+            m.group("e1_name"),
+            m.group("e2_type").lower(),
+            m.group("e2_name"),
+            None,
+        )
+
+    # Try unary geometric constraint
+    m = _UNARY_PATTERN.search(text)
+    if m:
+        return (
+            m.group("ctype").lower(),
+            m.group("e1_type").lower(),
+            m.group("e1_name"),
+            None,
+            None,
+            None,
+        )
+
+    raise ValueError(f"Unable to parse sketch constraint: '{raw}'")
+
+
+def _build_constraint(fields: _ParsedConstraint) -> SketchConstraint:
+    """Fresh (mutable) constraint from a cached parse tuple."""
+    ctype, e1_type, e1_name, e2_type, e2_name, value = fields
+    return SketchConstraint(
+        constraint_type=ctype,
+        entity1_type=e1_type,
+        entity1_name=e1_name,
+        entity2_type=e2_type,
+        entity2_name=e2_name,
+        value=value,
+    )
+
+
+# Memoised per distinct input string; normalize_many batches of 20,000 or
+# more can use a process pool
+_PARSER: MemoizedParser[_ParsedConstraint] = MemoizedParser(
+    _parse, memo_size=1 << 16, parallel_min_items=20_000
+)
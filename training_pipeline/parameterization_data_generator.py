@@ -14,16 +14,22 @@ Example:
 
 import json
 import itertools
-from typing import Dict, List, Any, Tuple
+from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import asdict
+
+import numpy as np
+
 from parameter_space import (
     ParameterSpace,
     ParameterAssignment,
+    ParameterAssignmentBatch,
     ParameterDefinition,
     ParameterDomain,
     ParameterConstraint,
 )
 from parameter_resolver import ParameterResolver
+from design_sampler import DesignSampler
+from feasible_sampler import FeasibleSampler
 
 
 class ParameterizationDataGenerator:
@@ -46,6 +52,9 @@ class ParameterizationDataGenerator:
         self,
         param_space: ParameterSpace,
         samples_per_parameter: int = 3,
+        budget: Optional[int] = None,
+        seed: int = 0,
+        sampler: Optional[FeasibleSampler] = None,
     ) -> List[Tuple[str, str]]:
         """
         Generate training pairs by sampling parameter space.
@@ -53,6 +62,14 @@ class ParameterizationDataGenerator:
         Args:
             param_space: ParameterSpace to explore
             samples_per_parameter: How many samples per discrete parameter
+            budget: Maximum number of combinations. None explores the full
+                Cartesian product; otherwise a pairwise-covering,
+                Latin-hypercube design of this size is used (see
+                DesignSampler), so output grows linearly with the budget.
+            seed: Seed for the budgeted design
+            sampler: Constraint-aware sampler for param_space. With a
+                budget, its feasible Sobol rows replace the grid designs;
+                without one, infeasible grid combinations are dropped.
 
         Returns:
             List of (instruction, code) tuples
@@ -70,22 +87,46 @@ class ParameterizationDataGenerator:
                 param_def, samples_per_parameter
             )
 
-        # Create Cartesian product of all parameter combinations
-        param_combinations = itertools.product(
-            *[
-                [(name, val) for val in sample_values[name]]
-                for name in param_names
-            ]
+        if sampler is not None and budget is not None:
+            # Feasible quasi-random rows instead of grid values
+            rows = sampler.sample_rows(budget)
+            param_combinations = (
+                [(name, row[name]) for name in param_names] for row in rows
+            )
+        elif budget is None:
+            # Create Cartesian product of all parameter combinations
+            param_combinations = itertools.product(
+                *[
+                    [(name, val) for val in sample_values[name]]
+                    for name in param_names
+                ]
+            )
+        else:
+            # Budgeted space-filling design over the same sample values
+            rows = DesignSampler(seed=seed).sample(sample_values, budget=budget)
+            param_combinations = (
+                [(name, row[name]) for name in param_names] for row in rows
+            )
+
+        # Collect combinations column-wise and validate them in one pass
+        batch = ParameterAssignmentBatch.from_rows(
+            param_space, (dict(combo) for combo in param_combinations)
         )
+        if sampler is not None and budget is None:
+            feasible = sampler.filter({
+                name: np.asarray(batch.get_column(name))
+                for name in batch.columns
+            })
+            batch = ParameterAssignmentBatch.from_columns(param_space, {
+                name: [v for v, ok in zip(batch.get_column(name), feasible) if ok]
+                for name in batch.columns
+            })
+        invalid = np.flatnonzero(batch.error_mask())
+        if invalid.size:
+            raise ValueError(batch.row_errors(int(invalid[0]))[0])
 
         # Generate training pair for each combination
-        for combo in param_combinations:
-            assignment = ParameterAssignment(param_space)
-
-            # Populate assignment
-            for param_name, value in combo:
-                assignment.set_value(param_name, value)
-
+        for assignment in batch.iter_assignments():
             # Generate instruction and code
             instruction = self._generate_instruction(assignment)
             code = self.resolver.resolve_assignment(assignment)
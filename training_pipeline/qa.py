@@ -0,0 +1,407 @@
+"""Dataset QA linter for generated training pairs.
+
+Checks every output before export, across a process pool:
+
+    unbalanced_delimiters   (error)    ( ) { } [ ] do not pair up outside
+                                       strings and comments
+    unknown_enum_member     (error)    ``swXxx_e.Member`` where the enum is
+                                       listed in full in the reference data
+                                       but the member is not
+    conflicting_duplicate   (error)    an instruction already seen with a
+                                       different output
+    unknown_member          (warning)  ``var.Member`` where ``var`` is an
+                                       interface listed in full that lacks
+                                       ``Member``
+    duplicate               (warning)  the same pair again
+
+The reference data is ``SolidWorksAPICollector``: its enum definitions and
+its interface methods and properties.  It covers a sample of the API, so
+only the owners it declares complete (``COMPLETE_OWNERS``) have their
+members checked; other enums and interfaces pass unchecked.  Every known
+identifier goes into an ``IdentifierTrie``; a precompiled regex pass
+extracts the identifiers of an output (with strings and comments blanked
+out) and each is resolved in the trie in time linear in its length, so one
+lint pass is linear in the size of the corpus.
+
+Usage (standalone, on an exported dataset)::
+
+    python -m training_pipeline.qa output/sw_training_data.jsonl --report qa.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+from bisect import bisect_left
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+TrainingPairs = list[tuple[str, str]]
+
+ERROR = "error"
+WARNING = "warning"
+
+# Outputs handed to each worker task
+_CHUNK_SIZE = 256
+
+# Violations kept per rule and stage in the report
+_MAX_SAMPLES = 5
+
+# Conventional variable names used without a declaration in the snippets
+_DEFAULT_VARIABLES = {
+    "swApp": "ISldWorks",
+    "modelDoc": "IModelDoc2",
+    "swModel": "IModelDoc2",
+    "swPart": "IPartDoc",
+    "featMgr": "IFeatureManager",
+    "swFeatMgr": "IFeatureManager",
+    "sketchMgr": "ISketchManager",
+    "skMgr": "ISketchManager",
+    "swSketchMgr": "ISketchManager",
+}
+
+# Strings, char literals and comments (blanked before identifier scans).
+# The lookahead rejects most positions before the alternation is tried.
+_NON_CODE = re.compile(
+    r"""(?=[/"'@$])"""
+    r"""(?://[^\n]*"""
+    r"""|/\*.*?\*/"""
+    r"""|\$?@"(?:[^"]|"")*\""""
+    r"""|@?\$"(?:[^"\\\n]|\\.)*\""""
+    r"""|"(?:[^"\\\n]|\\.)*\""""
+    r"""|'(?:\\.|[^'\\\n])')""",
+    re.DOTALL,
+)
+_DELIMITERS = re.compile(r"[(){}\[\]]")
+# Literal-first patterns: a leading \b makes every position a match attempt
+_ENUM_REF = re.compile(r"(sw[A-Za-z0-9]+_e)\.(\w+)")
+_DECLARATION = re.compile(r"([A-Z][A-Za-z0-9_]*) +([a-z_][A-Za-z0-9_]*) *[=;]")
+_MEMBER_ACCESS = re.compile(r"(?<![\w.])([a-z_][A-Za-z0-9_]*)\.([A-Za-z_][A-Za-z0-9_]*)")
+_CLOSING = {")": "(", "}": "{", "]": "["}
+
+
+@dataclass(frozen=True)
+class Violation:
+    """One QA finding on one pair.
+
+    Attributes:
+        rule: Rule name (see the module docstring).
+        severity: ``"error"`` or ``"warning"``.
+        detail: The offending identifier or delimiter.
+    """
+
+    rule: str
+    severity: str
+    detail: str
+
+
+# ---------------------------------------------------------------------------
+# Known identifiers
+# ---------------------------------------------------------------------------
+
+class IdentifierTrie:
+    """Character trie over dotted API identifiers.
+
+    Each complete identifier carries a kind (``enum_member``, ``member``).
+    Owners (enum types or interfaces) in *complete_owners* have every member
+    in the trie, so a name missing under them is unknown; under any other
+    owner a missing name proves nothing.  Lookups are memoized, since a
+    corpus repeats the same few thousand identifiers many times over.
+    """
+
+    __slots__ = ("_root", "_lookups", "size", "complete_owners")
+
+    def __init__(
+        self,
+        identifiers: Iterable[tuple[str, str]] = (),
+        complete_owners: Iterable[str] = (),
+    ) -> None:
+        self._root: dict[Optional[str], Any] = {}
+        self._lookups: dict[str, Optional[dict[Optional[str], Any]]] = {}
+        self.size = 0
+        self.complete_owners = frozenset(complete_owners)
+        for name, kind in identifiers:
+            self.insert(name, kind)
+
+    def insert(self, name: str, kind: str) -> None:
+        node = self._root
+        for char in name:
+            node = node.setdefault(char, {})
+        self._lookups.clear()
+        if None not in node:
+            self.size += 1
+        node[None] = kind
+
+    def _node(self, text: str) -> Optional[dict[Optional[str], Any]]:
+        try:
+            return self._lookups[text]
+        except KeyError:
+            pass
+        node = self._root
+        for char in text:
+            node = node.get(char)
+            if node is None:
+                break
+        self._lookups[text] = node
+        return node
+
+    def kind(self, name: str) -> Optional[str]:
+        """Kind of a complete identifier, or None if unknown."""
+        node = self._node(name)
+        return None if node is None else node.get(None)
+
+    def is_complete(self, owner: str) -> bool:
+        """True if every member of *owner* is in the trie."""
+        return owner in self.complete_owners
+
+
+def build_catalog(collector: Any = None) -> IdentifierTrie:
+    """Trie of the enum members and interface members of the reference data."""
+    if collector is None:
+        from training_pipeline.collectors.solidworks_api_collector import SolidWorksAPICollector
+        collector = SolidWorksAPICollector()
+    return IdentifierTrie(
+        (
+            (snippet.name, "enum_member" if snippet.item_type == "enum" else "member")
+            for snippet in collector.collect_all()
+            if "." in snippet.name
+        ),
+        collector.COMPLETE_OWNERS,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Per-output checks
+# ---------------------------------------------------------------------------
+
+def check_output(output: str, catalog: IdentifierTrie) -> list[Violation]:
+    """Run the per-pair rules on one output."""
+    violations: list[Violation] = []
+    code = _NON_CODE.sub(" ", output)
+
+    stack: list[str] = []
+    for delimiter in _DELIMITERS.findall(code):
+        if delimiter in "({[":
+            stack.append(delimiter)
+        elif not stack or stack.pop() != _CLOSING[delimiter]:
+            violations.append(Violation("unbalanced_delimiters", ERROR, f"unmatched '{delimiter}'"))
+            stack.clear()
+            break
+    else:
+        if stack:
+            violations.append(Violation("unbalanced_delimiters", ERROR, f"unclosed '{stack[-1]}'"))
+
+    seen: set[str] = set()
+    for enum_type, member in _ENUM_REF.findall(code):
+        name = f"{enum_type}.{member}"
+        if name in seen:
+            continue
+        seen.add(name)
+        if catalog.is_complete(enum_type) and catalog.kind(name) != "enum_member":
+            violations.append(Violation("unknown_enum_member", ERROR, name))
+
+    variables = dict(_DEFAULT_VARIABLES)
+    for type_name, variable in _DECLARATION.findall(code):
+        for interface in (type_name, "I" + type_name):
+            if catalog.is_complete(interface):
+                variables[variable] = interface
+                break
+        else:
+            variables.pop(variable, None)
+    for variable, member in _MEMBER_ACCESS.findall(code):
+        interface = variables.get(variable)
+        if interface is None or not catalog.is_complete(interface):
+            continue
+        name = f"{interface}.{member}"
+        if name not in seen and catalog.kind(name) is None:
+            seen.add(name)
+            violations.append(Violation("unknown_member", WARNING, name))
+    return violations
+
+
+_WORKER_CATALOG: Optional[IdentifierTrie] = None
+
+
+def _init_worker() -> None:
+    global _WORKER_CATALOG
+    _WORKER_CATALOG = build_catalog()
+
+
+def _check_chunk(outputs: list[str]) -> list[list[Violation]]:
+    """Worker-process entry point for ``lint_pairs``."""
+    return [check_output(output, _WORKER_CATALOG) for output in outputs]
+
+
+# ---------------------------------------------------------------------------
+# Corpus lint
+# ---------------------------------------------------------------------------
+
+@dataclass
+class QAReport:
+    """Violations of a linted corpus.
+
+    Attributes:
+        violations: Pair index -> violations (clean pairs are absent).
+        stages: Stage name -> ``[start, stop)`` range of its pairs.
+        total: Number of pairs linted.
+        known_identifiers: Size of the reference catalog.
+    """
+
+    violations: dict[int, list[Violation]] = field(default_factory=dict)
+    stages: dict[str, tuple[int, int]] = field(default_factory=dict)
+    total: int = 0
+    known_identifiers: int = 0
+
+    def failing(self, strict: bool = False) -> set[int]:
+        """Indices of pairs with an error (any violation if *strict*)."""
+        return {
+            index for index, found in self.violations.items()
+            if strict or any(v.severity == ERROR for v in found)
+        }
+
+    def by_stage(self, pairs: Optional[TrainingPairs] = None) -> dict[str, dict[str, Any]]:
+        """Per-stage pair counts, rule counts and sample violations."""
+        summary: dict[str, dict[str, Any]] = {}
+        for stage, (start, stop) in self.stages.items():
+            rules: Counter[str] = Counter()
+            samples: dict[str, list[dict[str, Any]]] = {}
+            errors = warnings = 0
+            for index in range(start, stop):
+                found = self.violations.get(index)
+                if not found:
+                    continue
+                if any(v.severity == ERROR for v in found):
+                    errors += 1
+                else:
+                    warnings += 1
+                for violation in found:
+                    rules[violation.rule] += 1
+                    bucket = samples.setdefault(violation.rule, [])
+                    if len(bucket) < _MAX_SAMPLES:
+                        sample = {"index": index, "detail": violation.detail}
+                        if pairs is not None:
+                            sample["instruction"] = pairs[index][0]
+                        bucket.append(sample)
+            summary[stage] = {
+                "pairs": stop - start,
+                "with_errors": errors,
+                "with_warnings_only": warnings,
+                "rules": dict(rules),
+                "samples": samples,
+            }
+        return summary
+
+    def to_dict(self, pairs: Optional[TrainingPairs] = None) -> dict[str, Any]:
+        """Serialise for the JSON QA report."""
+        rules: Counter[str] = Counter(v.rule for found in self.violations.values() for v in found)
+        return {
+            "pairs": self.total,
+            "known_identifiers": self.known_identifiers,
+            "with_errors": len(self.failing()),
+            "with_violations": len(self.violations),
+            "rules": dict(rules),
+            "stages": self.by_stage(pairs),
+        }
+
+
+def lint_pairs(
+    pairs: TrainingPairs,
+    stages: Optional[dict[str, tuple[int, int]]] = None,
+    workers: Optional[int] = None,
+) -> QAReport:
+    """Lint *pairs* and return the report.
+
+    Args:
+        pairs: ``(instruction, output)`` pairs.
+        stages: Stage name -> ``[start, stop)`` range, for the per-generator
+                report (default: one ``all`` range).
+        workers: Process count (``None`` = ``os.cpu_count()``; ``1`` =
+                 lint in the calling process).
+    """
+    outputs = [output for _, output in pairs]
+    chunks = [outputs[i:i + _CHUNK_SIZE] for i in range(0, len(outputs), _CHUNK_SIZE)]
+    workers = workers or os.cpu_count() or 1
+    catalog = build_catalog()
+
+    if workers == 1 or len(chunks) <= 1:
+        results = [[check_output(output, catalog) for output in chunk] for chunk in chunks]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(chunks)),
+            initializer=_init_worker,
+        ) as pool:
+            results = list(pool.map(_check_chunk, chunks))
+
+    report = QAReport(
+        stages=dict(stages or {"all": (0, len(pairs))}),
+        total=len(pairs),
+        known_identifiers=catalog.size,
+    )
+    for index, found in enumerate(found for chunk in results for found in chunk):
+        if found:
+            report.violations[index] = found
+
+    # Duplicates need the whole corpus: first occurrence wins
+    first_index: dict[str, int] = {}
+    for index, (instruction, output) in enumerate(pairs):
+        key = " ".join(instruction.split())
+        first = first_index.setdefault(key, index)
+        if first == index:
+            continue
+        if pairs[first][1] == output:
+            violation = Violation("duplicate", WARNING, instruction[:80])
+        else:
+            violation = Violation("conflicting_duplicate", ERROR, instruction[:80])
+        report.violations.setdefault(index, []).append(violation)
+    return report
+
+
+def drop_failing(pairs: TrainingPairs, report: QAReport, strict: bool = False) -> TrainingPairs:
+    """Pairs without errors (without any violation if *strict*)."""
+    failing = report.failing(strict)
+    return [pair for index, pair in enumerate(pairs) if index not in failing]
+
+
+def shift_range(start: int, stop: int, dropped: list[int]) -> tuple[int, int]:
+    """``[start, stop)`` of the original pairs after removing *dropped* (sorted)."""
+    return start - bisect_left(dropped, start), stop - bisect_left(dropped, stop)
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def main() -> None:
+    """Lint an exported Alpaca JSON or JSONL dataset."""
+    parser = argparse.ArgumentParser(description="Lint generated SolidWorks training pairs")
+    parser.add_argument("dataset", type=Path, help="sw_training_data.json or .jsonl")
+    parser.add_argument("--report", type=Path, default=None, help="Write the JSON report here")
+    parser.add_argument("--workers", type=int, default=None, help="Processes (default: CPU count)")
+    args = parser.parse_args()
+
+    with open(args.dataset, encoding="utf-8") as f:
+        if args.dataset.suffix == ".jsonl":
+            records = [json.loads(line) for line in f]
+        else:
+            records = json.load(f)
+    pairs = [(r["instruction"], r["output"]) for r in records]
+
+    report = lint_pairs(pairs, workers=args.workers)
+    summary = report.to_dict(pairs)
+    print(f"[OK] Linted {report.total} pairs: {summary['with_errors']} with errors, "
+          f"{summary['with_violations']} with any violation")
+    for rule, count in sorted(summary["rules"].items()):
+        print(f"  {rule:<24} {count:>6}")
+    if args.report is not None:
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
+        print(f"[OK] Report --> {args.report}")
+
+
+if __name__ == "__main__":
+    main()
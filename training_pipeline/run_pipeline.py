@@ -14,11 +14,14 @@ from __future__ import annotations
 import argparse
 import json
 import os
+import signal
 import sys
 import textwrap
 import traceback
+from functools import partial
+from itertools import groupby
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 # ---------------------------------------------------------------------------
 # Ensure the project root is on sys.path so relative imports resolve
@@ -49,6 +52,16 @@ from training_pipeline.normalizers.sketch_constraint_normalizer import (
 )
 from training_pipeline.generators.gdt_code_generator import GDTCodeGenerator
 from training_pipeline.generators.sketch_code_generator import SketchCodeGenerator
+from training_pipeline.code_templates import CodeTemplate
+from training_pipeline.design_sampler import DesignSampler
+from training_pipeline.instrumentation import StageMetrics, measure_stage, write_run_report
+from training_pipeline.stages import StageSpec, discover_plugins, select_stages, stage
+from training_pipeline.work_units import WorkSpace, run_work_space, section_space
+
+# numpy, the QA linter, checkpoints and the distributed queue are imported
+# where they are used, so a plain run of a few stages stays light
+if TYPE_CHECKING:
+    from training_pipeline.qa import QAReport
 
 
 # ---------------------------------------------------------------------------
@@ -124,7 +137,8 @@ DATUM_CONFIGS_WITH_MOD = [
     ],
 ]
 
-# Combined workflow templates
+# Combined workflow templates.  Each template is sampled with a
+# pairwise-covering design of ``budget`` rows (see DesignSampler).
 COMBINED_TEMPLATES = [
     {
         "desc": "Create a fully-defined circular hole at ({cx}, {cy}) with diameter {dia}mm, "
@@ -135,6 +149,7 @@ COMBINED_TEMPLATES = [
         "tol": [0.05, 0.1, 0.2, 0.25, 0.5],
         "mod": ["MMC", "LMC", None],
         "datums": ["A, B, C", "A, B"],
+        "budget": 150,
     },
     {
         "desc": "Create a rectangular pocket {w}mm x {h}mm at ({cx}, {cy}) with depth {d}mm "
@@ -146,6 +161,7 @@ COMBINED_TEMPLATES = [
         "d": [5, 10, 15],
         "tol": [0.02, 0.05, 0.1],
         "datum": ["A", "B"],
+        "budget": 120,
     },
     {
         "desc": "Draw a slot of width {w}mm and length {l}mm centered at ({cx}, {cy}), "
@@ -156,10 +172,261 @@ COMBINED_TEMPLATES = [
         "cy": [0, 10],
         "tol": [0.05, 0.1, 0.2],
         "datums": ["A, B", "A, B, C"],
+        "budget": 100,
     },
 ]
 
 
+def _datum_ref_lines(datums: str, indent: str = "") -> str:
+    """Build ``SetFrameDatumRef2`` calls for a comma-separated datum list.
+
+    Lines after the first are prefixed with *indent* so the fragment can be
+    interpolated into an indented code template.
+    """
+    labels = [d.strip() for d in datums.split(",")]
+    lines = [
+        f'gtol.SetFrameDatumRef2(0, {slot}, "{label}", '
+        f'(int)swGDTModifyingSymbol_e.swGDTModifyingSymbolNone);'
+        for slot, label in enumerate(labels)
+    ]
+    return ("\n" + indent).join(lines)
+
+
+_COMBINED_HOLE_CODE = CodeTemplate("""\
+            // Step 1: Select the Front Plane and open a sketch
+            modelDoc.Extension.SelectByID2(
+                "Front Plane", "PLANE", 0, 0, 0,
+                false, 0, null, 0);
+            SketchManager skMgr = modelDoc.SketchManager;
+            skMgr.InsertSketch(true);
+
+            // Step 2: Draw a circle at ({cx}, {cy}) with diameter {dia}mm
+            ISketchSegment seg = skMgr.CreateCircle(
+                {cx_m}, {cy_m}, 0,
+                {cx_r}, {cy_m}, 0);
+
+            // Step 3: Add diameter dimension
+            modelDoc.Extension.SelectByID2(
+                "", "SKETCHSEGMENT", {cx_r}, {cy_m}, 0,
+                false, 0, null, 0);
+            Dimension dim = (Dimension)modelDoc.AddDiameterDimension2(
+                {cx_m}, {cy_r}, 0);
+            dim.SystemValue = {dia_m};
+
+            // Step 4: Close the sketch and cut-extrude through all
+            skMgr.InsertSketch(true);
+            IFeature cut = modelDoc.FeatureManager.FeatureCut4(
+                true, false, false,
+                (int)swEndConditions_e.swEndCondThroughAll, 0,
+                0, 0,
+                false, false, false, false, 0, 0,
+                false, false, false, false, false,
+                false, false, 0, 0, false, false);
+
+            // Step 5: Apply position tolerance {tol}mm{mod_str}
+            // Select the hole face
+            Face2 holeFace = (Face2)selMgr.GetSelectedObject6(1, -1);
+            Gtol gtol = (Gtol)modelDoc.InsertGtol();
+            gtol.SetFrameSymbol2(0,
+                (int)swGDTCharacteristic_e.swGDTPosition);
+            gtol.SetFrameValues3(0, {tol_m},
+                (int)swGDTToleranceZoneShape_e.swGDTToleranceZoneDiameter,
+                (int){mod_enum});
+
+            // Step 6: Set datum references ({datums})
+            {datum_code}
+
+            gtol.SetDisplay(true);
+            modelDoc.EditRebuild3();
+""")
+
+_COMBINED_POCKET_CODE = CodeTemplate("""\
+            // Step 1: Open sketch on Front Plane
+            modelDoc.Extension.SelectByID2(
+                "Front Plane", "PLANE", 0, 0, 0,
+                false, 0, null, 0);
+            SketchManager skMgr = modelDoc.SketchManager;
+            skMgr.InsertSketch(true);
+
+            // Step 2: Draw rectangle {w}mm x {h}mm at ({cx}, {cy})
+            skMgr.CreateCornerRectangle(
+                {x1}, {y1}, 0,
+                {x2}, {y2}, 0);
+
+            // Step 3: Add width dimension
+            modelDoc.Extension.SelectByID2(
+                "", "SKETCHSEGMENT", {cx_m}, {y1}, 0,
+                false, 0, null, 0);
+            Dimension wDim = (Dimension)modelDoc.AddDimension2(
+                {cx_m}, {y1_off}, 0);
+            wDim.SystemValue = {w_m};
+
+            // Step 4: Add height dimension
+            modelDoc.Extension.SelectByID2(
+                "", "SKETCHSEGMENT", {x1}, {cy_m}, 0,
+                false, 0, null, 0);
+            Dimension hDim = (Dimension)modelDoc.AddDimension2(
+                {x1_off}, {cy_m}, 0);
+            hDim.SystemValue = {h_m};
+
+            // Step 5: Close sketch and cut-extrude {d}mm
+            skMgr.InsertSketch(true);
+            IFeature pocket = modelDoc.FeatureManager.FeatureCut4(
+                true, false, false,
+                (int)swEndConditions_e.swEndCondBlind, 0,
+                {d_m}, 0,
+                false, false, false, false, 0, 0,
+                false, false, false, false, false,
+                false, false, 0, 0, false, false);
+
+            // Step 6: Apply perpendicularity tolerance {tol}mm to datum {datum}
+            Gtol gtol = (Gtol)modelDoc.InsertGtol();
+            gtol.SetFrameSymbol2(0,
+                (int)swGDTCharacteristic_e.swGDTPerpendicularity);
+            gtol.SetFrameValues3(0, {tol_m},
+                (int)swGDTToleranceZoneShape_e.swGDTToleranceZoneLinear,
+                (int)swGDTModifyingSymbol_e.swGDTModifyingSymbolNone);
+            gtol.SetFrameDatumRef2(0, 0, "{datum}",
+                (int)swGDTModifyingSymbol_e.swGDTModifyingSymbolNone);
+            gtol.SetDisplay(true);
+            modelDoc.EditRebuild3();
+""")
+
+_COMBINED_SLOT_CODE = CodeTemplate("""\
+            // Step 1: Open sketch on Top Plane
+            modelDoc.Extension.SelectByID2(
+                "Top Plane", "PLANE", 0, 0, 0,
+                false, 0, null, 0);
+            SketchManager skMgr = modelDoc.SketchManager;
+            skMgr.InsertSketch(true);
+
+            // Step 2: Draw slot (width={w}mm, length={l}mm)
+            // Two lines and two arcs forming a slot
+            double halfL = {half_l};
+            double halfW = {half_w};
+
+            // Top line
+            skMgr.CreateLine(
+                {cx_m} - halfL, {cy_m} + halfW, 0,
+                {cx_m} + halfL, {cy_m} + halfW, 0);
+            // Bottom line
+            skMgr.CreateLine(
+                {cx_m} - halfL, {cy_m} - halfW, 0,
+                {cx_m} + halfL, {cy_m} - halfW, 0);
+            // Left arc
+            skMgr.Create3PointArc(
+                {cx_m} - halfL, {cy_m} + halfW, 0,
+                {cx_m} - halfL, {cy_m} - halfW, 0,
+                {cx_m} - halfL - halfW, {cy_m}, 0);
+            // Right arc
+            skMgr.Create3PointArc(
+                {cx_m} + halfL, {cy_m} - halfW, 0,
+                {cx_m} + halfL, {cy_m} + halfW, 0,
+                {cx_m} + halfL + halfW, {cy_m}, 0);
+
+            // Step 3: Close sketch
+            skMgr.InsertSketch(true);
+
+            // Step 4: Apply profile of a surface tolerance {tol}mm
+            Gtol gtol = (Gtol)modelDoc.InsertGtol();
+            gtol.SetFrameSymbol2(0,
+                (int)swGDTCharacteristic_e.swGDTSurfaceProfile);
+            gtol.SetFrameValues3(0, {tol_m},
+                (int)swGDTToleranceZoneShape_e.swGDTToleranceZoneLinear,
+                (int)swGDTModifyingSymbol_e.swGDTModifyingSymbolNone);
+
+            // Step 5: Set datum references ({datums})
+            {datum_code}
+
+            gtol.SetDisplay(true);
+            modelDoc.EditRebuild3();
+""")
+
+
+_DIRECTION_DIMENSION_CODE = CodeTemplate("""\
+    // Add {direction} dimension of {val_mm}mm
+    // Select two sketch points
+    modelDoc.Extension.SelectByID2(
+        "Point1", "SKETCHPOINT", 0, 0, 0, false, 0, null, 0);
+    modelDoc.Extension.SelectByID2(
+        "Point2", "SKETCHPOINT", 0, 0, 0, true, 0, null, 0);
+
+    // Create the {direction} dimension
+    Dimension dim = (Dimension)modelDoc.AddDimension2(0, 0, 0);
+    if (dim != null)
+    {{
+        dim.SystemValue = {val_m};
+    }}
+    modelDoc.ClearSelection2(true);
+""")
+
+
+# ---------------------------------------------------------------------------
+# Work-unit renderers (module level so worker processes can unpickle them)
+# ---------------------------------------------------------------------------
+
+def _render_sketch_items(
+    generator: SketchCodeGenerator, items: list[tuple], verbose: bool = False
+) -> list[tuple[str, str]]:
+    """Render a chunk of ``TrainingPipeline.sketch_work_space`` items."""
+    pairs: list[tuple[str, str]] = []
+    for kind, *args in items:
+        if kind == "constraint":
+            constraint, label = args
+            try:
+                pairs.append(generator.generate_training_pair(constraint))
+            except Exception as exc:
+                if verbose:
+                    print(f"    [FAIL] Sketch {label}: {exc}")
+
+        elif kind == "tolerance":
+            entity_name, dim_type, val_mm, tol_plus, tol_minus = args
+            instruction = (
+                f"Add a {dim_type} of {val_mm}mm "
+                f"(+{tol_plus}/-{tol_minus}) "
+                f"to '{entity_name}' in SolidWorks."
+            )
+            try:
+                code = generator.generate_dimension(
+                    entity_name, dim_type, val_mm / 1000.0,
+                    tolerance_plus=tol_plus / 1000.0,
+                    tolerance_minus=tol_minus / 1000.0,
+                )
+                pairs.append((instruction, code))
+            except Exception as exc:
+                if verbose:
+                    print(f"    [FAIL] Sketch tol-dim {dim_type}/{entity_name}: {exc}")
+
+        else:
+            direction, val_mm = args
+            instruction = (
+                f"Add a {direction} dimension of {val_mm}mm "
+                f"between two points in the active SolidWorks sketch."
+            )
+            code = _DIRECTION_DIMENSION_CODE(
+                direction=direction, val_mm=val_mm, val_m=val_mm / 1000.0,
+            )
+            pairs.append((instruction, code))
+    return pairs
+
+
+def _render_combined_rows(_state: None, items: list[tuple[int, dict]]) -> list[tuple[str, str]]:
+    """Render a chunk of ``TrainingPipeline.combined_work_space`` items.
+
+    Consecutive rows of the same template are rendered column-wise.
+    """
+    renderers = [
+        TrainingPipeline._combined_hole_pairs,
+        TrainingPipeline._combined_pocket_pairs,
+        TrainingPipeline._combined_slot_pairs,
+    ]
+    pairs: list[tuple[str, str]] = []
+    for index, group in groupby(items, key=lambda item: item[0]):
+        rows = [row for _, row in group]
+        pairs.extend(renderers[index](**{key: [row[key] for row in rows] for key in rows[0]}))
+    return pairs
+
+
 # ---------------------------------------------------------------------------
 # Pipeline
 # ---------------------------------------------------------------------------
@@ -176,19 +443,73 @@ class TrainingPipeline:
         output_dir: str = "output",
         export_format: str = "both",
         verbose: bool = False,
+        packed: bool = False,
+        tokenizer: str = "Qwen/Qwen2.5-Coder-7B",
+        sequence_len: int = 2048,
+        tokenize_workers: Optional[int] = None,
+        seed: int = 0,
+        combined_budget: Optional[int] = None,
+        only: Optional[list[str]] = None,
+        skip: Optional[list[str]] = None,
+        profile: bool = False,
+        trace_memory: bool = False,
+        stage_workers: int = 1,
+        resume: bool = False,
+        checkpoint: bool = True,
+        qa_lint: bool = False,
+        qa_drop: bool = False,
+        qa_strict: bool = False,
+        qa_workers: Optional[int] = None,
     ):
         self.output_dir = Path(output_dir)
         self.export_format = export_format
         self.verbose = verbose
 
+        # Pre-tokenized / pre-packed export settings
+        self.packed = packed
+        self.tokenizer = tokenizer
+        self.sequence_len = sequence_len
+        self.tokenize_workers = tokenize_workers
+
+        # Sampling: seed for budgeted designs and an optional per-template
+        # budget override for the combined workflow templates
+        self.seed = seed
+        self.combined_budget = combined_budget
+
+        # Stage selection (names or categories, see training_pipeline.stages)
+        self.only = only
+        self.skip = skip
+
+        # Instrumentation: per-stage cProfile dumps and tracemalloc peaks
+        self.profile = profile
+        self.trace_memory = trace_memory
+
+        # Processes per chunked stage (see training_pipeline.work_units)
+        self.stage_workers = stage_workers
+
+        # Per-stage checkpoints in <output_dir>/checkpoints; resume reuses
+        # stages completed under the same configuration hash
+        self.resume = resume
+        self.checkpoint = checkpoint or resume
+        # Hash of generation_config(), computed by run() only when checkpointing
+        self.config_hash: Optional[str] = None
+
+        # Dataset QA before export (see training_pipeline.qa); drop removes
+        # pairs with errors, or with any violation when strict
+        self.qa_lint = qa_lint or qa_drop
+        self.qa_drop = qa_drop
+        self.qa_strict = qa_strict
+        self.qa_workers = qa_workers
+
         # Sub-components
         self.api_collector = SolidWorksAPICollector()
         self.gdt_collector = GDTStandardCollector()
         self.gdt_generator = GDTCodeGenerator()
         self.sketch_generator = SketchCodeGenerator()
 
-        # Counters for summary
+        # Counters and resource metrics per stage for summary / run report
         self.counts: dict[str, int] = {}
+        self.metrics: dict[str, StageMetrics] = {}
 
     # ------------------------------------------------------------------
     # Main entry point
@@ -202,229 +523,108 @@ class TrainingPipeline:
         print(f"[->] Output directory : {self.output_dir}")
         print(f"[->] Export format    : {self.export_format}")
         print(f"[->] Verbose          : {self.verbose}")
+        if self.only or self.skip:
+            print(f"[->] Only / skip      : {self.only or '-'} / {self.skip or '-'}")
         print("-" * 70)
 
         all_pairs: list[tuple[str, str]] = []
+        checkpoints = None
+        if self.checkpoint:
+            from training_pipeline.checkpoints import CheckpointStore, config_hash
 
-        # ---- Stage 1: SolidWorks API training data ---------------------
-        print("\n[->] Stage 1/15: Generating SolidWorks API training data...")
-        try:
-            api_pairs = self.generate_api_training_data()
-            self.counts["solidworks_api"] = len(api_pairs)
-            all_pairs.extend(api_pairs)
-            print(f"  [OK] Generated {len(api_pairs)} API training pairs")
-        except Exception as exc:
-            self.counts["solidworks_api"] = 0
-            print(f"  [FAIL] API data generation failed: {exc}")
-            if self.verbose:
-                traceback.print_exc()
-
-        # ---- Stage 2: GD&T training data -------------------------------
-        print("\n[->] Stage 2/15: Generating GD&T training data...")
-        try:
-            gdt_pairs = self.generate_gdt_training_data()
-            self.counts["gdt"] = len(gdt_pairs)
-            all_pairs.extend(gdt_pairs)
-            print(f"  [OK] Generated {len(gdt_pairs)} GD&T training pairs")
-        except Exception as exc:
-            self.counts["gdt"] = 0
-            print(f"  [FAIL] GD&T data generation failed: {exc}")
-            if self.verbose:
-                traceback.print_exc()
-
-        # ---- Stage 3: Sketch constraint training data ------------------
-        print("\n[->] Stage 3/15: Generating sketch constraint training data...")
-        try:
-            sketch_pairs = self.generate_sketch_training_data()
-            self.counts["sketch"] = len(sketch_pairs)
-            all_pairs.extend(sketch_pairs)
-            print(f"  [OK] Generated {len(sketch_pairs)} sketch training pairs")
-        except Exception as exc:
-            self.counts["sketch"] = 0
-            print(f"  [FAIL] Sketch data generation failed: {exc}")
-            if self.verbose:
-                traceback.print_exc()
-
-        # ---- Stage 4: Combined multi-step training data ----------------
-        print("\n[->] Stage 4/15: Generating combined multi-step training data...")
-        try:
-            combined_pairs = self.generate_combined_training_data()
-            self.counts["combined"] = len(combined_pairs)
-            all_pairs.extend(combined_pairs)
-            print(f"  [OK] Generated {len(combined_pairs)} combined training pairs")
-        except Exception as exc:
-            self.counts["combined"] = 0
-            print(f"  [FAIL] Combined data generation failed: {exc}")
-            if self.verbose:
-                traceback.print_exc()
-
-        # ---- Stage 5: Feature code training data -------------------------
-        print("\n[->] Stage 5/15: Generating feature code training data...")
-        try:
-            feature_pairs = self.generate_feature_training_data()
-            self.counts["feature_code"] = len(feature_pairs)
-            all_pairs.extend(feature_pairs)
-            print(f"  [OK] Generated {len(feature_pairs)} feature code training pairs")
-        except Exception as exc:
-            self.counts["feature_code"] = 0
-            print(f"  [FAIL] Feature code data generation failed: {exc}")
-            if self.verbose:
-                traceback.print_exc()
-
-        # ---- Stage 6: Drawing & configuration training data --------------
-        print("\n[->] Stage 6/15: Generating drawing & configuration training data...")
-        try:
-            drawing_config_pairs = self.generate_drawing_config_training_data()
-            self.counts["drawing_config"] = len(drawing_config_pairs)
-            all_pairs.extend(drawing_config_pairs)
-            print(f"  [OK] Generated {len(drawing_config_pairs)} drawing/config training pairs")
-        except Exception as exc:
-            self.counts["drawing_config"] = 0
-            print(f"  [FAIL] Drawing/config data generation failed: {exc}")
-            if self.verbose:
-                traceback.print_exc()
-
-        # ---- Stage 7: Advanced training data -----------------------------
-        print("\n[->] Stage 7/15: Generating advanced training data...")
-        try:
-            advanced_pairs = self.generate_advanced_training_data()
-            self.counts["advanced"] = len(advanced_pairs)
-            all_pairs.extend(advanced_pairs)
-            print(f"  [OK] Generated {len(advanced_pairs)} advanced training pairs")
-        except Exception as exc:
-            self.counts["advanced"] = 0
-            print(f"  [FAIL] Advanced data generation failed: {exc}")
-            if self.verbose:
-                traceback.print_exc()
-
-        # ---- Stage 8: Assembly mates training data -----------------------
-        print("\n[->] Stage 8/15: Generating assembly mates training data...")
-        try:
-            mates_pairs = self.generate_assembly_mates_training_data()
-            self.counts["assembly_mates"] = len(mates_pairs)
-            all_pairs.extend(mates_pairs)
-            print(f"  [OK] Generated {len(mates_pairs)} assembly mates training pairs")
-        except Exception as exc:
-            self.counts["assembly_mates"] = 0
-            print(f"  [FAIL] Assembly mates data generation failed: {exc}")
-            if self.verbose:
-                traceback.print_exc()
-
-        # ---- Stage 9: Fastener training data -----------------------------
-        print("\n[->] Stage 9/15: Generating fastener training data...")
-        try:
-            fastener_pairs = self.generate_fastener_training_data()
-            self.counts["fasteners"] = len(fastener_pairs)
-            all_pairs.extend(fastener_pairs)
-            print(f"  [OK] Generated {len(fastener_pairs)} fastener training pairs")
-        except Exception as exc:
-            self.counts["fasteners"] = 0
-            print(f"  [FAIL] Fastener data generation failed: {exc}")
-            if self.verbose:
-                traceback.print_exc()
-
-        # ---- Stage 10: Shaft & power transmission training data ----------
-        print("\n[->] Stage 10/15: Generating shaft & power transmission training data...")
-        try:
-            shaft_pairs = self.generate_shaft_power_training_data()
-            self.counts["shaft_power_trans"] = len(shaft_pairs)
-            all_pairs.extend(shaft_pairs)
-            print(f"  [OK] Generated {len(shaft_pairs)} shaft/power transmission training pairs")
-        except Exception as exc:
-            self.counts["shaft_power_trans"] = 0
-            print(f"  [FAIL] Shaft/power transmission data generation failed: {exc}")
-            if self.verbose:
-                traceback.print_exc()
-
-        # ---- Stage 11: BOM & properties training data --------------------
-        print("\n[->] Stage 11/15: Generating BOM & properties training data...")
-        try:
-            bom_pairs = self.generate_bom_properties_training_data()
-            self.counts["bom_properties"] = len(bom_pairs)
-            all_pairs.extend(bom_pairs)
-            print(f"  [OK] Generated {len(bom_pairs)} BOM/properties training pairs")
-        except Exception as exc:
-            self.counts["bom_properties"] = 0
-            print(f"  [FAIL] BOM/properties data generation failed: {exc}")
-            if self.verbose:
-                traceback.print_exc()
-
-        # ---- Stage 12: Interference & clearance training data ------------
-        print("\n[->] Stage 12/15: Generating interference & clearance training data...")
-        try:
-            intf_pairs = self.generate_interference_training_data()
-            self.counts["interference_clearance"] = len(intf_pairs)
-            all_pairs.extend(intf_pairs)
-            print(f"  [OK] Generated {len(intf_pairs)} interference/clearance training pairs")
-        except Exception as exc:
-            self.counts["interference_clearance"] = 0
-            print(f"  [FAIL] Interference/clearance data generation failed: {exc}")
-            if self.verbose:
-                traceback.print_exc()
-
-        # ---- Stage 13: Motion study training data ------------------------
-        print("\n[->] Stage 13/15: Generating motion study training data...")
-        try:
-            motion_pairs = self.generate_motion_study_training_data()
-            self.counts["motion_study"] = len(motion_pairs)
-            all_pairs.extend(motion_pairs)
-            print(f"  [OK] Generated {len(motion_pairs)} motion study training pairs")
-        except Exception as exc:
-            self.counts["motion_study"] = 0
-            print(f"  [FAIL] Motion study data generation failed: {exc}")
-            if self.verbose:
-                traceback.print_exc()
-
-        # ---- Stage 14: Expanded scenarios --------------------------------
-        print("\n[->] Stage 14/15: Generating expanded scenario training data...")
-        try:
-            scenario_pairs = self.generate_expanded_scenarios_training_data()
-            self.counts["expanded_scenarios"] = len(scenario_pairs)
-            all_pairs.extend(scenario_pairs)
-            print(f"  [OK] Generated {len(scenario_pairs)} expanded scenario training pairs")
-        except Exception as exc:
-            self.counts["expanded_scenarios"] = 0
-            print(f"  [FAIL] Expanded scenarios generation failed: {exc}")
-            if self.verbose:
-                traceback.print_exc()
-
-        # ---- Stage 15: Expanded API coverage -----------------------------
-        print("\n[->] Stage 15/15: Generating expanded API coverage training data...")
-        try:
-            api_cov_pairs = self.generate_expanded_api_coverage_training_data()
-            self.counts["expanded_api_coverage"] = len(api_cov_pairs)
-            all_pairs.extend(api_cov_pairs)
-            print(f"  [OK] Generated {len(api_cov_pairs)} expanded API coverage training pairs")
-        except Exception as exc:
-            self.counts["expanded_api_coverage"] = 0
-            print(f"  [FAIL] Expanded API coverage generation failed: {exc}")
-            if self.verbose:
-                traceback.print_exc()
-
-        # ---- Export ----------------------------------------------------
-        print("\n" + "-" * 70)
-        print("[->] Exporting training data...")
-        self.output_dir.mkdir(parents=True, exist_ok=True)
+            checkpoints = CheckpointStore(self.output_dir / "checkpoints")
+            self.config_hash = config_hash(self.generation_config())
 
-        if self.export_format in ("alpaca", "both"):
-            alpaca_path = self.output_dir / "sw_training_data.json"
-            self.export_alpaca(all_pairs, alpaca_path)
-            print(f"  [OK] Alpaca JSON --> {alpaca_path}")
+        # ---- Generation stages -----------------------------------------
+        stages = self.selected_stages()
+        try:
+            for index, spec in enumerate(stages, 1):
+                print(
+                    f"\n[->] Stage {index}/{len(stages)}: "
+                    f"Generating {spec.title} training data..."
+                )
+                resumed = (
+                    checkpoints.load(spec.name, self.config_hash)
+                    if checkpoints is not None and self.resume else None
+                )
+                if resumed is not None:
+                    stage_pairs, self.metrics[spec.name] = resumed
+                    self.counts[spec.name] = len(stage_pairs)
+                    all_pairs.extend(stage_pairs)
+                    print(
+                        f"  [OK] Resumed {len(stage_pairs)} {spec.title} "
+                        f"training pairs from checkpoint"
+                    )
+                    continue
 
-        if self.export_format in ("jsonl", "both"):
-            jsonl_path = self.output_dir / "sw_training_data.jsonl"
-            self.export_jsonl(all_pairs, jsonl_path)
-            print(f"  [OK] JSONL       --> {jsonl_path}")
+                profile_path = (
+                    self.output_dir / "profiles" / f"{spec.name}.pstats"
+                    if self.profile else None
+                )
+                metrics = StageMetrics(name=spec.name)
+                try:
+                    with measure_stage(
+                        spec.name,
+                        trace_memory=self.trace_memory,
+                        profile_path=profile_path,
+                    ) as metrics:
+                        stage_pairs = spec.run(self)
+                        metrics.record(stage_pairs)
+                    self.counts[spec.name] = len(stage_pairs)
+                    all_pairs.extend(stage_pairs)
+                    print(
+                        f"  [OK] Generated {len(stage_pairs)} {spec.title} "
+                        f"training pairs ({metrics.wall_s:.2f}s, "
+                        f"{metrics.pairs_per_s:,.0f} pairs/s)"
+                    )
+                except Exception as exc:
+                    self.counts[spec.name] = 0
+                    print(f"  [FAIL] {spec.title} data generation failed: {exc}")
+                    if self.verbose:
+                        traceback.print_exc()
+                else:
+                    if checkpoints is not None:
+                        checkpoints.save(spec.name, self.config_hash, stage_pairs, metrics)
+                self.metrics[spec.name] = metrics
+        except BaseException:
+            # Interrupted (Ctrl+C, SIGTERM, fatal error): keep what finished
+            self.export_partial(all_pairs)
+            raise
+
+        # ---- QA and export ---------------------------------------------
+        if self.qa_lint:
+            all_pairs, _ = self.apply_qa(all_pairs)
+        exports = self.export_all(all_pairs)
+        if self.qa_lint:
+            exports["qa"] = self.output_dir / "sw_training_qa_report.json"
+
+        report_path = self.output_dir / "sw_training_run_report.json"
+        self.write_report(report_path, exports)
+        print(f"  [OK] Run report  --> {report_path}")
+        if self.profile:
+            print(f"  [OK] Profiles    --> {self.output_dir / 'profiles'}")
 
         # ---- Summary ---------------------------------------------------
         self.print_summary(all_pairs)
 
         return all_pairs
 
+    def selected_stages(self) -> list[StageSpec]:
+        """Return the stages to run after applying ``only`` / ``skip``."""
+        discover_plugins()
+        return select_stages(self.only, self.skip)
+
     # ------------------------------------------------------------------
     # Stage 1: SolidWorks API
     # ------------------------------------------------------------------
 
+    @stage(
+        "solidworks_api",
+        title="SolidWorks API",
+        category="api",
+        expected_pairs=87,
+        order=1,
+    )
     def generate_api_training_data(self) -> list[tuple[str, str]]:
         """Generate training pairs from SolidWorks COM API reference data.
 
@@ -522,6 +722,13 @@ class TrainingPipeline:
     # Stage 2: GD&T
     # ------------------------------------------------------------------
 
+    @stage(
+        "gdt",
+        title="GD&T",
+        category="gdt",
+        expected_pairs=413,
+        order=2,
+    )
     def generate_gdt_training_data(self) -> list[tuple[str, str]]:
         """Generate training pairs from GD&T standards.
 
@@ -734,15 +941,15 @@ class TrainingPipeline:
     # Stage 3: Sketch constraints
     # ------------------------------------------------------------------
 
-    def generate_sketch_training_data(self) -> list[tuple[str, str]]:
-        """Generate training pairs for all sketch constraint and dimension types.
+    def sketch_work_space(self) -> WorkSpace:
+        """Iteration space of the sketch stage: one work item per pair.
 
-        Covers:
-          - All 13 geometric constraint types with varying entity pairings
-          - Dimension types: distance, radius, diameter, angle
-          - Dimensions with bilateral tolerances
+        Items are ``("constraint", SketchConstraint, label)``,
+        ``("tolerance", entity, dim_type, value_mm, plus, minus)`` and
+        ``("direction", direction, value_mm)``, rendered by
+        ``_render_sketch_items``.
         """
-        pairs: list[tuple[str, str]] = []
+        items: list[tuple] = []
 
         # -- Unary constraints (horizontal, vertical, fixed) -------------
         unary_types = ["horizontal", "vertical", "fixed"]
@@ -762,17 +969,7 @@ class TrainingPipeline:
                             entity1_type=etype,
                             entity1_name=ename,
                         )
-                        try:
-                            pair = self.sketch_generator.generate_training_pair(
-                                constraint
-                            )
-                            pairs.append(pair)
-                        except Exception as exc:
-                            if self.verbose:
-                                print(
-                                    f"    [FAIL] Sketch unary "
-                                    f"{ctype}/{etype}/{ename}: {exc}"
-                                )
+                        items.append(("constraint", constraint, f"unary {ctype}/{etype}/{ename}"))
 
         # -- Binary constraints ------------------------------------------
         binary_types = [
@@ -797,7 +994,7 @@ class TrainingPipeline:
                     continue
                 if ctype == "tangent" and e1_type == "point":
                     continue
-                # Generate pairs for each name combination
+                # One item for each name combination
                 for e1_name in e1_names:
                     for e2_name in e2_names:
                         if e1_name == e2_name:
@@ -809,17 +1006,7 @@ class TrainingPipeline:
                             entity2_type=e2_type,
                             entity2_name=e2_name,
                         )
-                        try:
-                            pair = self.sketch_generator.generate_training_pair(
-                                constraint
-                            )
-                            pairs.append(pair)
-                        except Exception as exc:
-                            if self.verbose:
-                                print(
-                                    f"    [FAIL] Sketch binary "
-                                    f"{ctype}/{e1_type}-{e2_type}: {exc}"
-                                )
+                        items.append(("constraint", constraint, f"binary {ctype}/{e1_type}-{e2_type}"))
 
         # -- Dimension examples ------------------------------------------
         dim_entities = {
@@ -851,15 +1038,7 @@ class TrainingPipeline:
                         entity1_name=entity_name,
                         value=val_m,
                     )
-                    try:
-                        pair = self.sketch_generator.generate_training_pair(constraint)
-                        pairs.append(pair)
-                    except Exception as exc:
-                        if self.verbose:
-                            print(
-                                f"    [FAIL] Sketch dim "
-                                f"{dim_type}/{entity_name}/{val_mm}: {exc}"
-                            )
+                    items.append(("constraint", constraint, f"dim {dim_type}/{entity_name}/{val_mm}"))
 
         # -- Dimension with tolerances -----------------------------------
         tol_combos = [
@@ -873,389 +1052,203 @@ class TrainingPipeline:
         for entity_name in ["Line1", "Line2", "Circle1", "Circle2", "Arc1", "Arc2"]:
             for dim_type in ["distance", "radius", "diameter"]:
                 for val_mm in [10.0, 20.0, 25.0, 50.0]:
-                    val_m = val_mm / 1000.0
                     for tol_plus, tol_minus in tol_combos:
-                        tol_plus_m = tol_plus / 1000.0
-                        tol_minus_m = tol_minus / 1000.0
-
-                        instruction = (
-                            f"Add a {dim_type} of {val_mm}mm "
-                            f"(+{tol_plus}/-{tol_minus}) "
-                            f"to '{entity_name}' in SolidWorks."
-                        )
-                        try:
-                            code = self.sketch_generator.generate_dimension(
-                                entity_name, dim_type, val_m,
-                                tolerance_plus=tol_plus_m,
-                                tolerance_minus=tol_minus_m,
-                            )
-                            pairs.append((instruction, code))
-                        except Exception as exc:
-                            if self.verbose:
-                                print(
-                                    f"    [FAIL] Sketch tol-dim "
-                                    f"{dim_type}/{entity_name}: {exc}"
-                                )
+                        items.append(("tolerance", entity_name, dim_type, val_mm, tol_plus, tol_minus))
 
         # -- Horizontal / Vertical dimension shortcuts -------------------
         for direction in ["horizontal", "vertical"]:
             for val_mm in DEFAULT_DIM_VALUES_MM:
-                val_m = val_mm / 1000.0
-                instruction = (
-                    f"Add a {direction} dimension of {val_mm}mm "
-                    f"between two points in the active SolidWorks sketch."
-                )
-                code = textwrap.dedent(f"""\
-                    // Add {direction} dimension of {val_mm}mm
-                    // Select two sketch points
-                    modelDoc.Extension.SelectByID2(
-                        "Point1", "SKETCHPOINT", 0, 0, 0, false, 0, null, 0);
-                    modelDoc.Extension.SelectByID2(
-                        "Point2", "SKETCHPOINT", 0, 0, 0, true, 0, null, 0);
-
-                    // Create the {direction} dimension
-                    Dimension dim = (Dimension)modelDoc.AddDimension2(0, 0, 0);
-                    if (dim != null)
-                    {{
-                        dim.SystemValue = {val_m};
-                    }}
-                    modelDoc.ClearSelection2(true);
-                """)
-                pairs.append((instruction, code))
+                items.append(("direction", direction, val_mm))
 
-        return pairs
+        return WorkSpace(
+            items=items,
+            render=partial(_render_sketch_items, verbose=self.verbose),
+            setup=SketchCodeGenerator,
+        )
+
+    @stage(
+        "sketch",
+        title="sketch constraint",
+        category="sketch",
+        expected_pairs=1219,
+        order=3,
+        space=sketch_work_space,
+    )
+    def generate_sketch_training_data(self) -> list[tuple[str, str]]:
+        """Generate training pairs for all sketch constraint and dimension types.
+
+        Covers:
+          - All 13 geometric constraint types with varying entity pairings
+          - Dimension types: distance, radius, diameter, angle
+          - Dimensions with bilateral tolerances
+        """
+        return run_work_space(self.sketch_work_space(), self.stage_workers, "sketch")
 
     # ------------------------------------------------------------------
     # Stage 4: Combined multi-step examples
     # ------------------------------------------------------------------
 
+    def combined_work_space(self) -> WorkSpace:
+        """Iteration space of the combined stage: one sampled design row
+        per item, as ``(template_index, values)``."""
+        items = [
+            (index, row)
+            for index, tpl in enumerate(COMBINED_TEMPLATES)
+            for row in self._sample_template(tpl)
+        ]
+        return WorkSpace(items=items, render=_render_combined_rows)
+
+    @stage(
+        "combined",
+        title="combined multi-step",
+        category="sketch",
+        expected_pairs=370,
+        order=4,
+        space=combined_work_space,
+    )
     def generate_combined_training_data(self) -> list[tuple[str, str]]:
         """Generate multi-step training pairs combining sketch + GD&T.
 
         These examples teach the model to generate complete workflows that
         involve creating geometry, adding constraints, dimensions, and
         applying GD&T tolerances.
+
+        Each template's value lists are sampled with ``DesignSampler``
+        rather than walked as a Cartesian product: every pair of values
+        (e.g. each tolerance with each modifier) is covered, and the
+        number of pairs equals the template budget.
         """
-        pairs: list[tuple[str, str]] = []
+        return run_work_space(self.combined_work_space(), self.stage_workers, "combined")
+
+    def _sample_template(self, tpl: dict) -> list[dict]:
+        """Draw a budgeted, pairwise-covering design from a combined template."""
+        factors = {
+            key: values
+            for key, values in tpl.items()
+            if key not in ("desc", "budget")
+        }
+        budget = tpl["budget"] if self.combined_budget is None else self.combined_budget
+        return DesignSampler(seed=self.seed).sample(factors, budget=budget)
 
-        # ---- Template 1: Circular hole with position tolerance ---------
-        tpl = COMBINED_TEMPLATES[0]
-        count = 0
-        for cx in tpl["cx"]:
-            for cy in tpl["cy"]:
-                for dia in tpl["dia"][:4]:  # Use more diameter variants
-                    for tol in tpl["tol"][:4]:
-                        for mod in tpl["mod"]:
-                            for datums_str in tpl["datums"]:
-                                mod_str = f" at {mod}" if mod else ""
-                                instruction = (
-                                    f"Create a fully-defined circular hole "
-                                    f"at ({cx}, {cy}) with diameter {dia}mm, "
-                                    f"position tolerance {tol}mm{mod_str} "
-                                    f"relative to datums {datums_str} in "
-                                    f"SolidWorks."
-                                )
-                                cx_m = cx / 1000.0
-                                cy_m = cy / 1000.0
-                                r_m = (dia / 2.0) / 1000.0
-                                tol_m = tol / 1000.0
-
-                                datum_labels = [
-                                    d.strip()
-                                    for d in datums_str.split(",")
-                                ]
-                                datum_refs = [
-                                    DatumReference(
-                                        label=lbl, modifier=None, order=i + 1
-                                    )
-                                    for i, lbl in enumerate(datum_labels)
-                                ]
-
-                                mod_enum = (
-                                    f"swGDTModifyingSymbol_e.swGDTModifyingSymbol{mod}"
-                                    if mod
-                                    else "swGDTModifyingSymbol_e."
-                                         "swGDTModifyingSymbolNone"
-                                )
+    @staticmethod
+    def _combined_hole_pairs(
+        cx: list[float], cy: list[float], dia: list[float], tol: list[float],
+        mod: list[Optional[str]], datums: list[str],
+    ) -> list[tuple[str, str]]:
+        """Circular holes with position tolerance (template 1), one per row."""
+        import numpy as np
+
+        mod_str = [f" at {m}" if m else "" for m in mod]
+        instructions = [
+            f"Create a fully-defined circular hole "
+            f"at ({x}, {y}) with diameter {d}mm, "
+            f"position tolerance {t}mm{ms} "
+            f"relative to datums {dt} in "
+            f"SolidWorks."
+            for x, y, d, t, ms, dt in zip(cx, cy, dia, tol, mod_str, datums)
+        ]
+        cx_m = np.asarray(cx, dtype=float) / 1000.0
+        cy_m = np.asarray(cy, dtype=float) / 1000.0
+        r_m = (np.asarray(dia, dtype=float) / 2.0) / 1000.0
+
+        codes = _COMBINED_HOLE_CODE.render_batch({
+            "cx": cx, "cy": cy, "dia": dia, "tol": tol, "datums": datums,
+            "mod_str": mod_str,
+            "cx_m": cx_m,
+            "cy_m": cy_m,
+            "cx_r": cx_m + r_m,
+            "cy_r": cy_m + r_m,
+            "dia_m": np.asarray(dia, dtype=float) / 1000.0,
+            "tol_m": np.asarray(tol, dtype=float) / 1000.0,
+            "mod_enum": [
+                f"swGDTModifyingSymbol_e.swGDTModifyingSymbol{m}"
+                if m
+                else "swGDTModifyingSymbol_e.swGDTModifyingSymbolNone"
+                for m in mod
+            ],
+            "datum_code": [_datum_ref_lines(d, indent=" " * 12) for d in datums],
+        })
+        return list(zip(instructions, codes))
 
-                                datum_code_lines = []
-                                for dr in datum_refs:
-                                    slot = dr.order - 1
-                                    datum_code_lines.append(
-                                        f'gtol.SetFrameDatumRef2(0, {slot}, '
-                                        f'"{dr.label}", '
-                                        f'(int)swGDTModifyingSymbol_e.'
-                                        f'swGDTModifyingSymbolNone);'
-                                    )
-                                datum_code = "\n".join(datum_code_lines)
-
-                                code = textwrap.dedent(f"""\
-                                    // Step 1: Select the Front Plane and open a sketch
-                                    modelDoc.Extension.SelectByID2(
-                                        "Front Plane", "PLANE", 0, 0, 0,
-                                        false, 0, null, 0);
-                                    SketchManager skMgr = modelDoc.SketchManager;
-                                    skMgr.InsertSketch(true);
-
-                                    // Step 2: Draw a circle at ({cx}, {cy}) with diameter {dia}mm
-                                    ISketchSegment seg = skMgr.CreateCircle(
-                                        {cx_m}, {cy_m}, 0,
-                                        {cx_m + r_m}, {cy_m}, 0);
-
-                                    // Step 3: Add diameter dimension
-                                    modelDoc.Extension.SelectByID2(
-                                        "", "SKETCHSEGMENT", {cx_m + r_m}, {cy_m}, 0,
-                                        false, 0, null, 0);
-                                    Dimension dim = (Dimension)modelDoc.AddDiameterDimension2(
-                                        {cx_m}, {cy_m + r_m}, 0);
-                                    dim.SystemValue = {dia / 1000.0};
-
-                                    // Step 4: Close the sketch and cut-extrude through all
-                                    skMgr.InsertSketch(true);
-                                    IFeature cut = modelDoc.FeatureManager.FeatureCut4(
-                                        true, false, false,
-                                        (int)swEndConditions_e.swEndCondThroughAll, 0,
-                                        0, 0,
-                                        false, false, false, false, 0, 0,
-                                        false, false, false, false, false,
-                                        false, false, 0, 0, false, false);
-
-                                    // Step 5: Apply position tolerance {tol}mm{mod_str}
-                                    // Select the hole face
-                                    Face2 holeFace = (Face2)selMgr.GetSelectedObject6(1, -1);
-                                    Gtol gtol = (Gtol)modelDoc.InsertGtol();
-                                    gtol.SetFrameSymbol2(0,
-                                        (int)swGDTCharacteristic_e.swGDTPosition);
-                                    gtol.SetFrameValues3(0, {tol_m},
-                                        (int)swGDTToleranceZoneShape_e.swGDTToleranceZoneDiameter,
-                                        (int){mod_enum});
-
-                                    // Step 6: Set datum references ({datums_str})
-                                    {datum_code}
-
-                                    gtol.SetDisplay(true);
-                                    modelDoc.EditRebuild3();
-                                """)
-                                pairs.append((instruction, code))
-                                count += 1
-                                # Cap at reasonable count per template
-                                if count >= 150:
-                                    break
-                            if count >= 150:
-                                break
-                        if count >= 150:
-                            break
-                    if count >= 150:
-                        break
-                if count >= 150:
-                    break
-            if count >= 150:
-                break
-
-        # ---- Template 2: Rectangular pocket with perpendicularity ------
-        tpl2 = COMBINED_TEMPLATES[1]
-        count2 = 0
-        for w in tpl2["w"]:
-            for h in tpl2["h"][:2]:
-                for cx in tpl2["cx"][:2]:
-                    for cy in tpl2["cy"][:2]:
-                        for d in tpl2["d"][:2]:
-                            for tol in tpl2["tol"]:
-                                for datum in tpl2["datum"]:
-                                    instruction = (
-                                        f"Create a rectangular pocket "
-                                        f"{w}mm x {h}mm at ({cx}, {cy}) "
-                                        f"with depth {d}mm and "
-                                        f"perpendicularity tolerance "
-                                        f"{tol}mm to datum {datum} "
-                                        f"in SolidWorks."
-                                    )
-                                    w_m = w / 1000.0
-                                    h_m = h / 1000.0
-                                    cx_m = cx / 1000.0
-                                    cy_m = cy / 1000.0
-                                    d_m = d / 1000.0
-                                    tol_m = tol / 1000.0
-
-                                    x1 = cx_m - w_m / 2
-                                    y1 = cy_m - h_m / 2
-                                    x2 = cx_m + w_m / 2
-                                    y2 = cy_m + h_m / 2
-
-                                    code = textwrap.dedent(f"""\
-                                        // Step 1: Open sketch on Front Plane
-                                        modelDoc.Extension.SelectByID2(
-                                            "Front Plane", "PLANE", 0, 0, 0,
-                                            false, 0, null, 0);
-                                        SketchManager skMgr = modelDoc.SketchManager;
-                                        skMgr.InsertSketch(true);
-
-                                        // Step 2: Draw rectangle {w}mm x {h}mm at ({cx}, {cy})
-                                        skMgr.CreateCornerRectangle(
-                                            {x1}, {y1}, 0,
-                                            {x2}, {y2}, 0);
-
-                                        // Step 3: Add width dimension
-                                        modelDoc.Extension.SelectByID2(
-                                            "", "SKETCHSEGMENT", {cx_m}, {y1}, 0,
-                                            false, 0, null, 0);
-                                        Dimension wDim = (Dimension)modelDoc.AddDimension2(
-                                            {cx_m}, {y1 - 0.005}, 0);
-                                        wDim.SystemValue = {w_m};
-
-                                        // Step 4: Add height dimension
-                                        modelDoc.Extension.SelectByID2(
-                                            "", "SKETCHSEGMENT", {x1}, {cy_m}, 0,
-                                            false, 0, null, 0);
-                                        Dimension hDim = (Dimension)modelDoc.AddDimension2(
-                                            {x1 - 0.005}, {cy_m}, 0);
-                                        hDim.SystemValue = {h_m};
-
-                                        // Step 5: Close sketch and cut-extrude {d}mm
-                                        skMgr.InsertSketch(true);
-                                        IFeature pocket = modelDoc.FeatureManager.FeatureCut4(
-                                            true, false, false,
-                                            (int)swEndConditions_e.swEndCondBlind, 0,
-                                            {d_m}, 0,
-                                            false, false, false, false, 0, 0,
-                                            false, false, false, false, false,
-                                            false, false, 0, 0, false, false);
-
-                                        // Step 6: Apply perpendicularity tolerance {tol}mm to datum {datum}
-                                        Gtol gtol = (Gtol)modelDoc.InsertGtol();
-                                        gtol.SetFrameSymbol2(0,
-                                            (int)swGDTCharacteristic_e.swGDTPerpendicularity);
-                                        gtol.SetFrameValues3(0, {tol_m},
-                                            (int)swGDTToleranceZoneShape_e.swGDTToleranceZoneLinear,
-                                            (int)swGDTModifyingSymbol_e.swGDTModifyingSymbolNone);
-                                        gtol.SetFrameDatumRef2(0, 0, "{datum}",
-                                            (int)swGDTModifyingSymbol_e.swGDTModifyingSymbolNone);
-                                        gtol.SetDisplay(true);
-                                        modelDoc.EditRebuild3();
-                                    """)
-                                    pairs.append((instruction, code))
-                                    count2 += 1
-                                    if count2 >= 120:
-                                        break
-                                if count2 >= 120:
-                                    break
-                            if count2 >= 120:
-                                break
-                        if count2 >= 120:
-                            break
-                    if count2 >= 120:
-                        break
-                if count2 >= 120:
-                    break
-            if count2 >= 120:
-                break
-
-        # ---- Template 3: Slot with profile tolerance -------------------
-        tpl3 = COMBINED_TEMPLATES[2]
-        count3 = 0
-        for w in tpl3["w"]:
-            for l in tpl3["l"][:2]:
-                for cx in tpl3["cx"]:
-                    for cy in tpl3["cy"]:
-                        for tol in tpl3["tol"]:
-                            for datums_str in tpl3["datums"]:
-                                instruction = (
-                                    f"Draw a slot of width {w}mm and "
-                                    f"length {l}mm centered at ({cx}, {cy}), "
-                                    f"with profile tolerance {tol}mm to "
-                                    f"datums {datums_str} in SolidWorks."
-                                )
-                                w_m = w / 1000.0
-                                l_m = l / 1000.0
-                                cx_m = cx / 1000.0
-                                cy_m = cy / 1000.0
-                                r_m = w_m / 2
-                                tol_m = tol / 1000.0
-
-                                datum_labels = [
-                                    d.strip()
-                                    for d in datums_str.split(",")
-                                ]
-                                datum_lines = []
-                                for i, lbl in enumerate(datum_labels):
-                                    datum_lines.append(
-                                        f'gtol.SetFrameDatumRef2(0, {i}, '
-                                        f'"{lbl}", '
-                                        f'(int)swGDTModifyingSymbol_e.'
-                                        f'swGDTModifyingSymbolNone);'
-                                    )
-                                datum_code = "\n".join(datum_lines)
-
-                                code = textwrap.dedent(f"""\
-                                    // Step 1: Open sketch on Top Plane
-                                    modelDoc.Extension.SelectByID2(
-                                        "Top Plane", "PLANE", 0, 0, 0,
-                                        false, 0, null, 0);
-                                    SketchManager skMgr = modelDoc.SketchManager;
-                                    skMgr.InsertSketch(true);
-
-                                    // Step 2: Draw slot (width={w}mm, length={l}mm)
-                                    // Two lines and two arcs forming a slot
-                                    double halfL = {l_m / 2};
-                                    double halfW = {w_m / 2};
-
-                                    // Top line
-                                    skMgr.CreateLine(
-                                        {cx_m} - halfL, {cy_m} + halfW, 0,
-                                        {cx_m} + halfL, {cy_m} + halfW, 0);
-                                    // Bottom line
-                                    skMgr.CreateLine(
-                                        {cx_m} - halfL, {cy_m} - halfW, 0,
-                                        {cx_m} + halfL, {cy_m} - halfW, 0);
-                                    // Left arc
-                                    skMgr.Create3PointArc(
-                                        {cx_m} - halfL, {cy_m} + halfW, 0,
-                                        {cx_m} - halfL, {cy_m} - halfW, 0,
-                                        {cx_m} - halfL - halfW, {cy_m}, 0);
-                                    // Right arc
-                                    skMgr.Create3PointArc(
-                                        {cx_m} + halfL, {cy_m} - halfW, 0,
-                                        {cx_m} + halfL, {cy_m} + halfW, 0,
-                                        {cx_m} + halfL + halfW, {cy_m}, 0);
-
-                                    // Step 3: Close sketch
-                                    skMgr.InsertSketch(true);
-
-                                    // Step 4: Apply profile of a surface tolerance {tol}mm
-                                    Gtol gtol = (Gtol)modelDoc.InsertGtol();
-                                    gtol.SetFrameSymbol2(0,
-                                        (int)swGDTCharacteristic_e.swGDTSurfaceProfile);
-                                    gtol.SetFrameValues3(0, {tol_m},
-                                        (int)swGDTToleranceZoneShape_e.swGDTToleranceZoneLinear,
-                                        (int)swGDTModifyingSymbol_e.swGDTModifyingSymbolNone);
-
-                                    // Step 5: Set datum references ({datums_str})
-                                    {datum_code}
-
-                                    gtol.SetDisplay(true);
-                                    modelDoc.EditRebuild3();
-                                """)
-                                pairs.append((instruction, code))
-                                count3 += 1
-                                if count3 >= 100:
-                                    break
-                            if count3 >= 100:
-                                break
-                        if count3 >= 100:
-                            break
-                    if count3 >= 100:
-                        break
-                if count3 >= 100:
-                    break
-            if count3 >= 100:
-                break
+    @staticmethod
+    def _combined_pocket_pairs(
+        w: list[float], h: list[float], cx: list[float], cy: list[float],
+        d: list[float], tol: list[float], datum: list[str],
+    ) -> list[tuple[str, str]]:
+        """Rectangular pockets with perpendicularity (template 2), one per row."""
+        import numpy as np
+
+        instructions = [
+            f"Create a rectangular pocket "
+            f"{pw}mm x {ph}mm at ({x}, {y}) "
+            f"with depth {pd}mm and "
+            f"perpendicularity tolerance "
+            f"{t}mm to datum {dt} "
+            f"in SolidWorks."
+            for pw, ph, x, y, pd, t, dt in zip(w, h, cx, cy, d, tol, datum)
+        ]
+        w_m = np.asarray(w, dtype=float) / 1000.0
+        h_m = np.asarray(h, dtype=float) / 1000.0
+        cx_m = np.asarray(cx, dtype=float) / 1000.0
+        cy_m = np.asarray(cy, dtype=float) / 1000.0
+
+        x1 = cx_m - w_m / 2
+        y1 = cy_m - h_m / 2
+
+        codes = _COMBINED_POCKET_CODE.render_batch({
+            "w": w, "h": h, "cx": cx, "cy": cy, "d": d, "tol": tol, "datum": datum,
+            "w_m": w_m,
+            "h_m": h_m,
+            "cx_m": cx_m,
+            "cy_m": cy_m,
+            "d_m": np.asarray(d, dtype=float) / 1000.0,
+            "tol_m": np.asarray(tol, dtype=float) / 1000.0,
+            "x1": x1,
+            "y1": y1,
+            "x2": cx_m + w_m / 2,
+            "y2": cy_m + h_m / 2,
+            "x1_off": x1 - 0.005,
+            "y1_off": y1 - 0.005,
+        })
+        return list(zip(instructions, codes))
 
-        return pairs
+    @staticmethod
+    def _combined_slot_pairs(
+        w: list[float], l: list[float], cx: list[float], cy: list[float],
+        tol: list[float], datums: list[str],
+    ) -> list[tuple[str, str]]:
+        """Slots with profile tolerance (template 3), one per row."""
+        import numpy as np
+
+        instructions = [
+            f"Draw a slot of width {sw}mm and "
+            f"length {sl}mm centered at ({x}, {y}), "
+            f"with profile tolerance {t}mm to "
+            f"datums {dt} in SolidWorks."
+            for sw, sl, x, y, t, dt in zip(w, l, cx, cy, tol, datums)
+        ]
+        codes = _COMBINED_SLOT_CODE.render_batch({
+            "w": w, "l": l, "tol": tol, "datums": datums,
+            "half_l": np.asarray(l, dtype=float) / 1000.0 / 2,
+            "half_w": np.asarray(w, dtype=float) / 1000.0 / 2,
+            "cx_m": np.asarray(cx, dtype=float) / 1000.0,
+            "cy_m": np.asarray(cy, dtype=float) / 1000.0,
+            "tol_m": np.asarray(tol, dtype=float) / 1000.0,
+            "datum_code": [_datum_ref_lines(d, indent=" " * 12) for d in datums],
+        })
+        return list(zip(instructions, codes))
 
     # ------------------------------------------------------------------
     # Stage 5: Feature code generation
     # ------------------------------------------------------------------
 
+    @stage(
+        "feature_code",
+        title="feature code",
+        category="feature",
+        expected_pairs=304,
+        order=5,
+    )
     def generate_feature_training_data(self) -> list[tuple[str, str]]:
         """Generate training pairs for SolidWorks feature operations.
 
@@ -1279,6 +1272,13 @@ class TrainingPipeline:
     # Stage 6: Drawing & configuration code generation
     # ------------------------------------------------------------------
 
+    @stage(
+        "drawing_config",
+        title="drawing & configuration",
+        category="drawing",
+        expected_pairs=200,
+        order=6,
+    )
     def generate_drawing_config_training_data(self) -> list[tuple[str, str]]:
         """Generate training pairs for drawing views and configuration management.
 
@@ -1311,6 +1311,13 @@ class TrainingPipeline:
     # Stage 7: Advanced training data generation
     # ------------------------------------------------------------------
 
+    @stage(
+        "advanced",
+        title="advanced",
+        category="feature",
+        expected_pairs=200,
+        order=7,
+    )
     def generate_advanced_training_data(self) -> list[tuple[str, str]]:
         """Generate advanced training pairs covering complex SolidWorks workflows.
 
@@ -1334,6 +1341,13 @@ class TrainingPipeline:
     # Stage 14: Expanded scenarios
     # ------------------------------------------------------------------
 
+    @stage(
+        "expanded_scenarios",
+        title="expanded scenario",
+        category="feature",
+        expected_pairs=184,
+        order=14,
+    )
     def generate_expanded_scenarios_training_data(self) -> list[tuple[str, str]]:
         from training_pipeline.generators.expanded_scenarios_generator import ExpandedScenariosGenerator
         generator = ExpandedScenariosGenerator()
@@ -1346,6 +1360,13 @@ class TrainingPipeline:
     # Stage 15: Expanded API coverage
     # ------------------------------------------------------------------
 
+    @stage(
+        "expanded_api_coverage",
+        title="expanded API coverage",
+        category="api",
+        expected_pairs=91,
+        order=15,
+    )
     def generate_expanded_api_coverage_training_data(self) -> list[tuple[str, str]]:
         from training_pipeline.generators.expanded_api_coverage_generator import ExpandedAPICoverageGenerator
         generator = ExpandedAPICoverageGenerator()
@@ -1358,10 +1379,21 @@ class TrainingPipeline:
     # Stage 8: Assembly mates
     # ------------------------------------------------------------------
 
-    def generate_assembly_mates_training_data(self) -> list[tuple[str, str]]:
+    def assembly_mates_work_space(self) -> WorkSpace:
+        """Iteration space of the assembly mates stage: one generator section per item."""
         from training_pipeline.generators.assembly_mates_generator import AssemblyMatesGenerator
-        generator = AssemblyMatesGenerator()
-        pairs = generator.generate_all()
+        return section_space(AssemblyMatesGenerator)
+
+    @stage(
+        "assembly_mates",
+        title="assembly mates",
+        category="assembly",
+        expected_pairs=420,
+        order=8,
+        space=assembly_mates_work_space,
+    )
+    def generate_assembly_mates_training_data(self) -> list[tuple[str, str]]:
+        pairs = run_work_space(self.assembly_mates_work_space(), self.stage_workers, "assembly_mates")
         if self.verbose:
             print(f"    [->] AssemblyMatesGenerator produced {len(pairs)} pairs")
         return pairs
@@ -1370,6 +1402,13 @@ class TrainingPipeline:
     # Stage 9: Fasteners
     # ------------------------------------------------------------------
 
+    @stage(
+        "fasteners",
+        title="fastener",
+        category="machine_design",
+        expected_pairs=327,
+        order=9,
+    )
     def generate_fastener_training_data(self) -> list[tuple[str, str]]:
         from training_pipeline.generators.fastener_generator import FastenerGenerator
         generator = FastenerGenerator()
@@ -1382,6 +1421,13 @@ class TrainingPipeline:
     # Stage 10: Shaft & power transmission
     # ------------------------------------------------------------------
 
+    @stage(
+        "shaft_power_trans",
+        title="shaft & power transmission",
+        category="machine_design",
+        expected_pairs=507,
+        order=10,
+    )
     def generate_shaft_power_training_data(self) -> list[tuple[str, str]]:
         from training_pipeline.generators.shaft_power_transmission_generator import ShaftPowerTransmissionGenerator
         generator = ShaftPowerTransmissionGenerator()
@@ -1394,6 +1440,13 @@ class TrainingPipeline:
     # Stage 11: BOM & properties
     # ------------------------------------------------------------------
 
+    @stage(
+        "bom_properties",
+        title="BOM & properties",
+        category="assembly",
+        expected_pairs=240,
+        order=11,
+    )
     def generate_bom_properties_training_data(self) -> list[tuple[str, str]]:
         from training_pipeline.generators.bom_properties_generator import BomPropertiesGenerator
         generator = BomPropertiesGenerator()
@@ -1406,10 +1459,21 @@ class TrainingPipeline:
     # Stage 12: Interference & clearance
     # ------------------------------------------------------------------
 
-    def generate_interference_training_data(self) -> list[tuple[str, str]]:
+    def interference_work_space(self) -> WorkSpace:
+        """Iteration space of the interference & clearance stage: one generator section per item."""
         from training_pipeline.generators.interference_clearance_generator import InterferenceClearanceGenerator
-        generator = InterferenceClearanceGenerator()
-        pairs = generator.generate_all()
+        return section_space(InterferenceClearanceGenerator)
+
+    @stage(
+        "interference_clearance",
+        title="interference & clearance",
+        category="assembly",
+        expected_pairs=121,
+        order=12,
+        space=interference_work_space,
+    )
+    def generate_interference_training_data(self) -> list[tuple[str, str]]:
+        pairs = run_work_space(self.interference_work_space(), self.stage_workers, "interference_clearance")
         if self.verbose:
             print(f"    [->] InterferenceClearanceGenerator produced {len(pairs)} pairs")
         return pairs
@@ -1418,6 +1482,13 @@ class TrainingPipeline:
     # Stage 13: Motion study
     # ------------------------------------------------------------------
 
+    @stage(
+        "motion_study",
+        title="motion study",
+        category="assembly",
+        expected_pairs=222,
+        order=13,
+    )
     def generate_motion_study_training_data(self) -> list[tuple[str, str]]:
         from training_pipeline.generators.motion_study_generator import MotionStudyGenerator
         generator = MotionStudyGenerator()
@@ -1430,6 +1501,118 @@ class TrainingPipeline:
     # Export
     # ------------------------------------------------------------------
 
+    def generation_config(self) -> dict:
+        """Settings and code that shape the generated pairs (the checkpoint hash)."""
+        from training_pipeline.checkpoints import code_version
+
+        return {
+            "seed": self.seed,
+            "combined_budget": self.combined_budget,
+            "code_version": code_version(),
+        }
+
+    def apply_qa(
+        self, all_pairs: list[tuple[str, str]]
+    ) -> tuple[list[tuple[str, str]], QAReport]:
+        """Lint *all_pairs* per stage, write the QA report and apply ``qa_drop``.
+
+        Stage ranges follow ``self.counts``, which holds the stages in the
+        order their pairs were appended.
+
+        Returns:
+            ``(pairs, report)`` -- the kept pairs and the report on the
+            pairs passed in.
+        """
+        from training_pipeline import qa
+
+        print("\n" + "-" * 70)
+        print(f"[->] QA: linting {len(all_pairs)} training pairs...")
+        ranges: dict[str, tuple[int, int]] = {}
+        start = 0
+        for name, count in self.counts.items():
+            ranges[name] = (start, start + count)
+            start += count
+
+        report = qa.lint_pairs(all_pairs, ranges, self.qa_workers)
+        failing = report.failing(self.qa_strict)
+        summary = report.to_dict(all_pairs)
+        summary["dropped"] = len(failing) if self.qa_drop else 0
+
+        print(f"  {'Stage':<30} {'Pairs':>8} {'Errors':>8} {'Warnings':>9}")
+        for name, entry in summary["stages"].items():
+            status = "[FAIL]" if entry["with_errors"] else "[OK]"
+            print(
+                f"  {name:<30} {entry['pairs']:>8} {entry['with_errors']:>8} "
+                f"{entry['with_warnings_only']:>9}  {status}"
+            )
+        for rule, count in sorted(summary["rules"].items()):
+            print(f"  [!] {rule:<26} {count:>6}")
+
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        report_path = self.output_dir / "sw_training_qa_report.json"
+        with open(report_path, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
+        print(f"  [OK] QA report   --> {report_path}")
+
+        if not self.qa_drop or not failing:
+            return all_pairs, report
+        dropped = sorted(failing)
+        for name, (start, stop) in report.stages.items():
+            new_start, new_stop = qa.shift_range(start, stop, dropped)
+            self.counts[name] = new_stop - new_start
+        print(f"  [OK] Dropped {len(dropped)} failing pairs")
+        return qa.drop_failing(all_pairs, report, self.qa_strict), report
+
+    def export_partial(self, all_pairs: list[tuple[str, str]]) -> dict[str, Path]:
+        """Export the stages completed so far to ``<output_dir>/partial``."""
+        partial_dir = self.output_dir / "partial"
+        print(
+            f"\n[!] Run interrupted -- exporting {len(all_pairs)} pairs "
+            f"from completed stages to {partial_dir}"
+        )
+        partial_dir.mkdir(parents=True, exist_ok=True)
+        exports: dict[str, Path] = {}
+        if self.export_format in ("alpaca", "both"):
+            exports["alpaca"] = partial_dir / "sw_training_data.json"
+            self.export_alpaca(all_pairs, exports["alpaca"])
+        if self.export_format in ("jsonl", "both"):
+            exports["jsonl"] = partial_dir / "sw_training_data.jsonl"
+            self.export_jsonl(all_pairs, exports["jsonl"])
+        self.write_report(partial_dir / "sw_training_run_report.json", exports)
+        for label, path in exports.items():
+            print(f"  [OK] Partial {label:<6}--> {path}")
+        return exports
+
+    def export_all(self, all_pairs: list[tuple[str, str]]) -> dict[str, Path]:
+        """Write every configured export and return label -> path."""
+        print("\n" + "-" * 70)
+        print("[->] Exporting training data...")
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        exports: dict[str, Path] = {}
+
+        if self.export_format in ("alpaca", "both"):
+            alpaca_path = self.output_dir / "sw_training_data.json"
+            self.export_alpaca(all_pairs, alpaca_path)
+            exports["alpaca"] = alpaca_path
+            print(f"  [OK] Alpaca JSON --> {alpaca_path}")
+
+        if self.export_format in ("jsonl", "both"):
+            jsonl_path = self.output_dir / "sw_training_data.jsonl"
+            self.export_jsonl(all_pairs, jsonl_path)
+            exports["jsonl"] = jsonl_path
+            print(f"  [OK] JSONL       --> {jsonl_path}")
+
+        if self.packed:
+            packed_path = self.output_dir / "packed"
+            meta = self.export_packed(all_pairs, packed_path)
+            exports["packed_tokens"] = packed_path / "tokens.npy"
+            print(
+                f"  [OK] Packed      --> {packed_path} "
+                f"({meta['num_sequences']} x {meta['sequence_len']} tokens, "
+                f"{meta['packing_efficiency']:.1%} utilisation)"
+            )
+        return exports
+
     @staticmethod
     def export_alpaca(
         pairs: list[tuple[str, str]], filepath: Path
@@ -1463,34 +1646,185 @@ class TrainingPipeline:
                 }
                 f.write(json.dumps(record, ensure_ascii=False) + "\n")
 
+    def export_packed(
+        self, pairs: list[tuple[str, str]], dirpath: Path
+    ) -> dict:
+        """Export pre-tokenized, pre-packed NumPy arrays for training.
+
+        See ``training_pipeline.exporters.packed_dataset`` for the layout.
+        numpy / transformers are only imported when this target is used.
+        """
+        from training_pipeline.exporters.packed_dataset import build_packed_dataset
+
+        return build_packed_dataset(
+            pairs,
+            dirpath,
+            tokenizer_name=self.tokenizer,
+            sequence_len=self.sequence_len,
+            workers=self.tokenize_workers,
+        )
+
+    def write_report(self, path: Path, exports: dict[str, Path]) -> dict:
+        """Write the per-stage JSON run report (see ``instrumentation``)."""
+        config = {
+            "export_format": self.export_format,
+            "seed": self.seed,
+            "combined_budget": self.combined_budget,
+            "only": self.only,
+            "skip": self.skip,
+            "packed": self.packed,
+            "profile": self.profile,
+            "trace_memory": self.trace_memory,
+            "resume": self.resume,
+            "qa": self.qa_lint,
+            "qa_drop": self.qa_drop,
+            "qa_strict": self.qa_strict,
+            "config_hash": self.config_hash,
+        }
+        return write_run_report(path, list(self.metrics.values()), config, exports)
+
     def print_summary(self, pairs: list[tuple[str, str]]) -> None:
         """Print a summary of generated training data."""
+        stages = {spec.name: spec for spec in self.selected_stages()}
+
         print("\n" + "=" * 70)
         print("  PIPELINE SUMMARY")
         print("=" * 70)
-        print(f"  {'Category':<30} {'Count':>10}")
-        print("  " + "-" * 42)
+        print(
+            f"  {'Category':<30} {'Count':>10} {'Expected':>10} "
+            f"{'Time (s)':>10} {'Pairs/s':>10}"
+        )
+        print("  " + "-" * 75)
         for category, count in self.counts.items():
-            status = "[OK]" if count > 0 else "[FAIL]"
-            print(f"  {category:<30} {count:>10}  {status}")
-        print("  " + "-" * 42)
-        print(f"  {'TOTAL':<30} {len(pairs):>10}")
+            expected = stages[category].expected_pairs if category in stages else 0
+            if count == 0:
+                status = "[FAIL]"
+            elif count < expected:
+                status = "[!]"
+            else:
+                status = "[OK]"
+            metrics = self.metrics.get(category, StageMetrics(name=category))
+            print(
+                f"  {category:<30} {count:>10} {expected:>10} "
+                f"{metrics.wall_s:>10.2f} {metrics.pairs_per_s:>10,.0f}  {status}"
+            )
+        total_wall = sum(m.wall_s for m in self.metrics.values())
+        print("  " + "-" * 75)
+        print(
+            f"  {'TOTAL':<30} {len(pairs):>10} "
+            f"{sum(s.expected_pairs for s in stages.values()):>10} "
+            f"{total_wall:>10.2f} "
+            f"{(len(pairs) / total_wall if total_wall > 0 else 0.0):>10,.0f}"
+        )
         print("=" * 70)
 
-        if len(pairs) >= 4000:
-            print(f"  [OK] Target of 4000+ pairs reached ({len(pairs)} pairs)")
+        target = sum(spec.expected_pairs for spec in stages.values())
+        if len(pairs) >= target:
+            print(f"  [OK] Expected pair count reached ({len(pairs)} >= {target})")
         else:
             print(
-                f"  [!] Below target of 4000 pairs "
-                f"({len(pairs)} generated, need {4000 - len(pairs)} more)"
+                f"  [!] Below expected pair count "
+                f"({len(pairs)} generated, need {target - len(pairs)} more)"
             )
         print()
 
 
+# ---------------------------------------------------------------------------
+# Distributed mode
+# ---------------------------------------------------------------------------
+
+def run_distributed(
+    pipeline: TrainingPipeline,
+    role: str,
+    queue_dir: Path,
+    chunk_size: Optional[int] = None,
+    lease_s: Optional[float] = None,
+    max_attempts: Optional[int] = None,
+    worker_id: Optional[str] = None,
+) -> None:
+    """Run one distributed role (see ``training_pipeline.distributed``).
+
+    ``plan`` records *pipeline*'s seed, budget and stage selection with the
+    work units; ``work`` and ``merge`` take those settings from the queue,
+    so every host renders the same iteration spaces.  *chunk_size*,
+    *lease_s* and *max_attempts* default to the ``distributed`` module's
+    ``DEFAULT_*`` values.
+    """
+    from training_pipeline import distributed, qa
+
+    queue = distributed.WorkQueue(queue_dir)
+    try:
+        if role == "plan":
+            units = distributed.plan(queue, pipeline, chunk_size or distributed.DEFAULT_CHUNK_SIZE)
+            stages = len({u.stage for u in units})
+            print(f"[OK] Planned {len(units)} work units over {stages} stages --> {queue_dir}")
+            return
+
+        if role == "status":
+            counts = queue.counts()
+            print("  " + "  ".join(f"{status}: {n}" for status, n in counts.items()))
+            for unit in queue.units():
+                if unit["status"] == "failed" or unit["error"]:
+                    print(f"  [FAIL] {unit['stage']}[{unit['start']}:{unit['stop'] or ''}] "
+                          f"(attempts {unit['attempts']}): {unit['error']}")
+            return
+
+        config = queue.config
+        pipeline.seed = config["seed"]
+        pipeline.combined_budget = config["combined_budget"]
+        pipeline.only = config["only"]
+        pipeline.skip = config["skip"]
+
+        if role == "work":
+            done = distributed.run_worker(
+                queue,
+                pipeline,
+                worker_id,
+                lease_s or distributed.DEFAULT_LEASE_S,
+                max_attempts or distributed.DEFAULT_MAX_ATTEMPTS,
+            )
+            print(f"[OK] Worker finished: {done} units completed")
+            return
+
+        pairs, metrics, index = distributed.merge(queue)
+        pipeline.metrics = metrics
+        pipeline.counts = {name: m.pairs for name, m in metrics.items()}
+        if pipeline.qa_lint:
+            kept, report = pipeline.apply_qa(pairs)
+            if len(kept) != len(pairs):
+                # Keep the index ranges pointing into the exported pairs
+                dropped = sorted(report.failing(pipeline.qa_strict))
+                for entry in index["stages"] + index["shards"]:
+                    entry["start"], entry["stop"] = qa.shift_range(
+                        entry["start"], entry["stop"], dropped
+                    )
+            pairs = kept
+        exports = pipeline.export_all(pairs)
+        if pipeline.qa_lint:
+            exports["qa"] = pipeline.output_dir / "sw_training_qa_report.json"
+
+        index_path = pipeline.output_dir / "sw_training_index.json"
+        with open(index_path, "w", encoding="utf-8") as f:
+            json.dump(index, f, indent=2)
+        exports["index"] = index_path
+        print(f"  [OK] Index       --> {index_path}")
+
+        report_path = pipeline.output_dir / "sw_training_run_report.json"
+        pipeline.write_report(report_path, exports)
+        print(f"  [OK] Run report  --> {report_path}")
+        pipeline.print_summary(pairs)
+    finally:
+        queue.close()
+
+
 # ---------------------------------------------------------------------------
 # CLI entry point
 # ---------------------------------------------------------------------------
 
+def _terminate(signum: int, frame: object) -> None:
+    raise SystemExit(128 + signum)
+
+
 def main() -> None:
     """Parse arguments and run the training pipeline."""
     parser = argparse.ArgumentParser(
@@ -1501,6 +1835,16 @@ def main() -> None:
               python -m training_pipeline.run_pipeline
               python -m training_pipeline.run_pipeline --output-dir data --format alpaca
               python -m training_pipeline.run_pipeline --verbose
+              python -m training_pipeline.run_pipeline --packed --sequence-len 2048
+              python -m training_pipeline.run_pipeline --only gdt sketch
+              python -m training_pipeline.run_pipeline --skip assembly --list-stages
+              python -m training_pipeline.run_pipeline --only sketch --profile
+              python -m training_pipeline.run_pipeline --stage-workers 8
+              python -m training_pipeline.run_pipeline --resume
+              python -m training_pipeline.run_pipeline --qa --qa-drop
+              python -m training_pipeline.run_pipeline --distributed plan --queue /mnt/runs/r1
+              python -m training_pipeline.run_pipeline --distributed work --queue /mnt/runs/r1
+              python -m training_pipeline.run_pipeline --distributed merge --queue /mnt/runs/r1
         """),
     )
     parser.add_argument(
@@ -1519,8 +1863,162 @@ def main() -> None:
         action="store_true",
         help="Print detailed progress and error traces",
     )
+    parser.add_argument(
+        "--packed",
+        action="store_true",
+        help="Also write pre-tokenized, pre-packed NumPy arrays to <output-dir>/packed",
+    )
+    parser.add_argument(
+        "--tokenizer",
+        default="Qwen/Qwen2.5-Coder-7B",
+        help="Tokenizer for --packed (default: Qwen/Qwen2.5-Coder-7B)",
+    )
+    parser.add_argument(
+        "--sequence-len",
+        type=int,
+        default=2048,
+        help="Packed sequence length for --packed (default: 2048)",
+    )
+    parser.add_argument(
+        "--tokenize-workers",
+        type=int,
+        default=None,
+        help="Tokenizer processes for --packed (default: CPU count)",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="Seed for budgeted parameter sampling (default: 0)",
+    )
+    parser.add_argument(
+        "--combined-budget",
+        type=int,
+        default=None,
+        help="Pairs per combined workflow template (default: per-template budget)",
+    )
+    parser.add_argument(
+        "--only",
+        nargs="+",
+        metavar="STAGE",
+        default=None,
+        help="Run only these stages (stage names or categories)",
+    )
+    parser.add_argument(
+        "--skip",
+        nargs="+",
+        metavar="STAGE",
+        default=None,
+        help="Skip these stages (stage names or categories)",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Dump a cProfile .pstats file per stage to <output-dir>/profiles",
+    )
+    parser.add_argument(
+        "--trace-memory",
+        action="store_true",
+        help="Record each stage's peak Python allocation with tracemalloc (slower)",
+    )
+    parser.add_argument(
+        "--stage-workers",
+        type=int,
+        default=1,
+        help="Processes for chunked stages: sketch, combined, assembly mates, "
+             "interference (default: 1; 0 = CPU count)",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Reuse stages checkpointed in <output-dir>/checkpoints under the same "
+             "seed and budgets",
+    )
+    parser.add_argument(
+        "--no-checkpoint",
+        action="store_true",
+        help="Do not write per-stage checkpoints",
+    )
+    parser.add_argument(
+        "--qa",
+        action="store_true",
+        help="Lint the pairs before export and write <output-dir>/sw_training_qa_report.json",
+    )
+    parser.add_argument(
+        "--qa-drop",
+        action="store_true",
+        help="Drop pairs that fail QA from the export (implies --qa)",
+    )
+    parser.add_argument(
+        "--qa-strict",
+        action="store_true",
+        help="Treat QA warnings (identifiers missing from the reference data) as failures",
+    )
+    parser.add_argument(
+        "--qa-workers",
+        type=int,
+        default=None,
+        help="Processes for --qa (default: CPU count)",
+    )
+    parser.add_argument(
+        "--distributed",
+        choices=["plan", "work", "merge", "status"],
+        default=None,
+        help="Distributed role over the shared --queue directory: plan the work "
+             "units, work on them, merge the shards into the export, or show progress",
+    )
+    parser.add_argument(
+        "--queue",
+        type=Path,
+        default=None,
+        help="Shared run directory for --distributed (local or lock-safe filesystem)",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=None,
+        help="Work items per unit for --distributed plan (default: 256)",
+    )
+    parser.add_argument(
+        "--lease-seconds",
+        type=float,
+        default=None,
+        help="Unit lease for --distributed work (default: 300)",
+    )
+    parser.add_argument(
+        "--max-attempts",
+        type=int,
+        default=None,
+        help="Claims per unit before --distributed work marks it failed (default: 3)",
+    )
+    parser.add_argument(
+        "--worker-id",
+        default=None,
+        help="Worker name for --distributed work (default: <host>-<pid>)",
+    )
+    parser.add_argument(
+        "--list-stages",
+        action="store_true",
+        help="List registered stages and exit",
+    )
 
     args = parser.parse_args()
+    if args.distributed and args.queue is None:
+        parser.error("--distributed requires --queue")
+    if args.combined_budget is not None and args.combined_budget < 1:
+        parser.error("--combined-budget must be at least 1")
+
+    discover_plugins()
+    try:
+        selected = select_stages(args.only, args.skip)
+    except ValueError as exc:
+        parser.error(str(exc))
+
+    if args.list_stages:
+        print(f"  {'Stage':<26} {'Category':<16} {'Expected':>8}")
+        for spec in selected:
+            print(f"  {spec.name:<26} {spec.category:<16} {spec.expected_pairs:>8}")
+        return
 
     # Resolve output directory relative to project root
     output_path = Path(args.output_dir)
@@ -1531,8 +2029,39 @@ def main() -> None:
         output_dir=str(output_path),
         export_format=args.format,
         verbose=args.verbose,
+        packed=args.packed,
+        tokenizer=args.tokenizer,
+        sequence_len=args.sequence_len,
+        tokenize_workers=args.tokenize_workers,
+        seed=args.seed,
+        combined_budget=args.combined_budget,
+        only=args.only,
+        skip=args.skip,
+        profile=args.profile,
+        trace_memory=args.trace_memory,
+        stage_workers=args.stage_workers,
+        resume=args.resume,
+        checkpoint=not args.no_checkpoint,
+        qa_lint=args.qa,
+        qa_drop=args.qa_drop,
+        qa_strict=args.qa_strict,
+        qa_workers=args.qa_workers,
     )
 
+    if args.distributed:
+        run_distributed(
+            pipeline,
+            args.distributed,
+            args.queue,
+            chunk_size=args.chunk_size,
+            lease_s=args.lease_seconds,
+            max_attempts=args.max_attempts,
+            worker_id=args.worker_id,
+        )
+        return
+
+    # Preemption (SIGTERM) unwinds like Ctrl+C, so the partial export runs
+    signal.signal(signal.SIGTERM, _terminate)
     pairs = pipeline.run()
 
     print(f"[->] Done. Generated {len(pairs)} training pairs total.")
@@ -0,0 +1,172 @@
+"""Stage registry for the training data pipeline.
+
+Built-in stages are ``TrainingPipeline`` methods registered with the
+``@stage`` decorator.  Third-party generator packages can add stages
+through the ``swse.training_stages`` entry-point group; the entry point
+should resolve to either a generator class exposing ``generate_all()`` or a
+zero-argument callable returning ``(instruction, output)`` pairs::
+
+    [project.entry-points."swse.training_stages"]
+    cam_toolpaths = "swse_cam.generator:CamToolpathGenerator"
+
+Only stage metadata is held at registration time.  Generator modules are
+imported when a stage actually runs, so ``--only gdt`` never imports the
+large assembly or interference generators.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from importlib.metadata import entry_points
+from typing import Any, Callable, Iterable, Optional
+
+ENTRY_POINT_GROUP = "swse.training_stages"
+
+TrainingPairs = list[tuple[str, str]]
+
+
+@dataclass(frozen=True)
+class StageSpec:
+    """Metadata and runner for one pipeline stage.
+
+    Attributes:
+        name: Unique key used for counts, reports and ``--only``/``--skip``.
+        title: Human-readable label for progress output.
+        category: Coarse grouping (``api``, ``gdt``, ``sketch``, ...);
+                  also accepted by ``--only``/``--skip``.
+        expected_pairs: Pair count the stage is expected to produce.
+        order: Sort key that fixes the execution order.
+        run: Callable taking the pipeline instance and returning pairs.
+        space: Optional callable taking the pipeline instance and returning
+               the stage's ``WorkSpace`` (chunkable stages only; see
+               ``training_pipeline.work_units``).
+    """
+
+    name: str
+    title: str
+    category: str
+    expected_pairs: int
+    order: int
+    run: Callable[[Any], TrainingPairs]
+    space: Optional[Callable[[Any], Any]] = None
+
+
+_REGISTRY: dict[str, StageSpec] = {}
+
+
+def register(spec: StageSpec) -> None:
+    """Add *spec* to the registry.
+
+    Raises:
+        ValueError: If a stage with the same name is already registered.
+    """
+    if spec.name in _REGISTRY:
+        raise ValueError(f"Duplicate pipeline stage name: '{spec.name}'")
+    _REGISTRY[spec.name] = spec
+
+
+def stage(
+    name: str,
+    *,
+    title: str,
+    category: str,
+    expected_pairs: int = 0,
+    order: int = 100,
+    space: Optional[Callable[[Any], Any]] = None,
+) -> Callable[[Callable[[Any], TrainingPairs]], Callable[[Any], TrainingPairs]]:
+    """Decorator registering a ``TrainingPipeline`` method as a stage.
+
+    The method is returned unchanged and can still be called directly.
+    Chunkable stages also pass *space*, the method returning their
+    ``WorkSpace``; the stage method then renders it with
+    ``run_work_space``.
+    """
+    def decorator(func: Callable[[Any], TrainingPairs]) -> Callable[[Any], TrainingPairs]:
+        register(StageSpec(
+            name=name,
+            title=title,
+            category=category,
+            expected_pairs=expected_pairs,
+            order=order,
+            run=func,
+            space=space,
+        ))
+        return func
+
+    return decorator
+
+
+def discover_plugins() -> None:
+    """Register stages advertised under the ``swse.training_stages`` group.
+
+    Entry points are not loaded here -- only when the stage runs.
+    """
+    eps: Any = entry_points()
+    if hasattr(eps, "select"):
+        group: Iterable[Any] = eps.select(group=ENTRY_POINT_GROUP)
+    else:  # Python 3.9
+        group = eps.get(ENTRY_POINT_GROUP, [])
+
+    for ep in group:
+        if ep.name in _REGISTRY:
+            continue
+        register(StageSpec(
+            name=ep.name,
+            title=ep.name.replace("_", " "),
+            category="plugin",
+            expected_pairs=0,
+            order=1000,
+            run=_plugin_runner(ep),
+        ))
+
+
+def _plugin_runner(ep: Any) -> Callable[[Any], TrainingPairs]:
+    """Wrap an entry point in a runner that loads it on first use."""
+    def run(pipeline: Any) -> TrainingPairs:
+        target = ep.load()
+        if isinstance(target, type):
+            return target().generate_all()
+        return target()
+
+    return run
+
+
+def all_stages() -> list[StageSpec]:
+    """Return every registered stage in execution order."""
+    return sorted(_REGISTRY.values(), key=lambda s: (s.order, s.name))
+
+
+def select_stages(
+    only: Optional[Iterable[str]] = None,
+    skip: Optional[Iterable[str]] = None,
+) -> list[StageSpec]:
+    """Filter the registry by stage name or category.
+
+    Args:
+        only: If given, keep only stages whose name or category is listed.
+        skip: Drop stages whose name or category is listed.
+
+    Returns:
+        Selected stages in execution order.
+
+    Raises:
+        ValueError: If a selector matches no stage name or category.
+    """
+    stages = all_stages()
+    known = {s.name for s in stages} | {s.category for s in stages}
+    only_set = set(only or ())
+    skip_set = set(skip or ())
+
+    unknown = (only_set | skip_set) - known
+    if unknown:
+        raise ValueError(
+            f"Unknown stage(s): {', '.join(sorted(unknown))}. "
+            f"Valid stages/categories: {', '.join(sorted(known))}"
+        )
+
+    if only_set:
+        stages = [s for s in stages if s.name in only_set or s.category in only_set]
+    return [
+        s for s in stages
+        if s.name not in skip_set and s.category not in skip_set
+    ]
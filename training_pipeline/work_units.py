@@ -0,0 +1,160 @@
+"""Chunked, process-parallel execution of a single pipeline stage.
+
+Stage-level selection (``--only`` / ``--skip``) does not help when one
+stage dominates the run.  A stage can instead declare its iteration space
+as a ``WorkSpace`` -- an ordered list of picklable work items and a
+module-level function rendering a chunk of them -- and let
+``run_work_space`` split the items into ``WorkUnit`` ranges, render the
+ranges across a process pool and concatenate the results in item order::
+
+    space = WorkSpace(
+        items=[("perpendicular", "Line1", "Line2"), ...],
+        render=_render_constraints,        # (state, items) -> pairs
+        setup=SketchCodeGenerator,         # run once per worker process
+    )
+    pairs = run_work_space(space, workers=8)
+
+The output does not depend on the worker count: ``workers=1`` renders all
+items in the calling process, and any other count yields the same pairs
+in the same order.
+
+Generators built from hand-written sections (one method per topic) use
+``section_space``: each section is one work item.
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, Sequence
+
+TrainingPairs = list[tuple[str, str]]
+
+# Chunks per worker: enough for load balancing across uneven items
+_CHUNKS_PER_WORKER = 4
+
+
+@dataclass(frozen=True)
+class WorkSpace:
+    """Iteration space of a chunkable stage.
+
+    Attributes:
+        items: Picklable work items, in output order.
+        render: Module-level ``(state, items) -> pairs`` function (or a
+                ``functools.partial`` of one) rendering a chunk of items.
+        setup: Picklable zero-argument callable building the per-process
+               state passed to *render* (e.g. a generator class).
+    """
+
+    items: Sequence[Any]
+    render: Callable[[Any, Sequence[Any]], TrainingPairs]
+    setup: Optional[Callable[[], Any]] = None
+
+    def state(self) -> Any:
+        """Build the state *render* expects."""
+        return self.setup() if self.setup is not None else None
+
+    def render_range(self, start: int, stop: int, state: Any = None) -> TrainingPairs:
+        """Render items ``[start, stop)`` in the calling process."""
+        if state is None:
+            state = self.state()
+        return self.render(state, self.items[start:stop])
+
+
+@dataclass(frozen=True)
+class WorkUnit:
+    """A contiguous range of one stage's work items.
+
+    Attributes:
+        stage: Stage name.
+        start: First item index (inclusive).
+        stop: Last item index (exclusive).
+    """
+
+    stage: str
+    start: int
+    stop: int
+
+
+def partition(stage: str, size: int, chunks: int) -> list[WorkUnit]:
+    """Split ``range(size)`` into at most *chunks* near-equal units."""
+    chunks = max(1, min(chunks, size))
+    step, extra = divmod(size, chunks)
+    units = []
+    start = 0
+    for k in range(chunks):
+        stop = start + step + (1 if k < extra else 0)
+        if stop > start:
+            units.append(WorkUnit(stage, start, stop))
+        start = stop
+    return units
+
+
+# ---------------------------------------------------------------------------
+# Process pool
+# ---------------------------------------------------------------------------
+
+_STATE: Any = None
+
+
+def _init_worker(setup: Optional[Callable[[], Any]]) -> None:
+    global _STATE
+    _STATE = setup() if setup is not None else None
+
+
+def _render_chunk(args: tuple[Callable[[Any, Sequence[Any]], TrainingPairs], Sequence[Any]]) -> TrainingPairs:
+    """Worker-process entry point for ``run_work_space``."""
+    render, items = args
+    return render(_STATE, items)
+
+
+def run_work_space(
+    space: WorkSpace,
+    workers: Optional[int] = 1,
+    stage: str = "",
+) -> TrainingPairs:
+    """Render every item of *space*, preserving item order.
+
+    Args:
+        space: The stage's iteration space.
+        workers: Process count (``1`` = render in the calling process;
+                 ``None`` or ``0`` = ``os.cpu_count()``).
+        stage: Stage name recorded on the work units.
+    """
+    workers = workers or os.cpu_count() or 1
+    units = partition(stage, len(space.items), workers * _CHUNKS_PER_WORKER)
+
+    if workers == 1 or len(units) <= 1:
+        state = space.state()
+        results = [space.render_range(u.start, u.stop, state) for u in units]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(units)),
+            initializer=_init_worker,
+            initargs=(space.setup,),
+        ) as pool:
+            results = list(pool.map(
+                _render_chunk,
+                [(space.render, space.items[u.start:u.stop]) for u in units],
+            ))
+
+    return [pair for chunk in results for pair in chunk]
+
+
+# ---------------------------------------------------------------------------
+# Section-based generators
+# ---------------------------------------------------------------------------
+
+def render_sections(generator: Any, sections: Sequence[str]) -> TrainingPairs:
+    """Run the named section methods of *generator* in order."""
+    return [pair for name in sections for pair in getattr(generator, name)()]
+
+
+def section_space(generator_cls: type) -> WorkSpace:
+    """One work item per entry of ``generator_cls.SECTIONS``."""
+    return WorkSpace(
+        items=tuple(generator_cls.SECTIONS),
+        render=render_sections,
+        setup=generator_cls,
+    )